@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     Attributes:
         DATABASE_URL: Database connection URL
         REDIS_URL: Redis connection URL
+        REDIS_POOL_SIZE: Initial cap on shared Redis connections (grows adaptively)
         JWT_SECRET: Secret key for JWT tokens
         GOOGLE_API_KEY: Google API key for services
         BAMBOOHR_API_KEY: BambooHR API key
@@ -23,6 +24,13 @@ class Settings(BaseSettings):
         WORKDAY_CLIENT_SECRET: Workday OAuth client secret
         WORKDAY_TENANT_URL: Workday tenant base URL
         HRIS_PROVIDER: HRIS provider (bamboohr/workday/custom_db)
+        HRIS_MIRROR_ENABLED: Serve external HRIS reads from the local mirror
+        HRIS_MIRROR_SYNC_INTERVAL_SECONDS: Seconds between background mirror syncs
+        HRIS_MIRROR_MAX_STALENESS_SECONDS: Oldest mirror age served before falling back
+        HRIS_CACHE_ENABLED: Wrap the HRIS connector in a read-through TTL cache
+        HRIS_CACHE_SHARED: Also share HRIS cache entries across workers via Redis
+        VENDOR_HTTP_POOL_SIZE: Per-host vendor connection cap (adaptive sizing only grows it)
+        VENDOR_HTTP_MAX_RETRIES: Retries for 429/5xx/timeouts on vendor requests
         LOG_LEVEL: Logging level
         DEBUG: Debug mode flag
         PORT: Server port
@@ -33,6 +41,10 @@ class Settings(BaseSettings):
         MAX_ITERATIONS: Maximum iterations for agent loops
         PII_ENABLED: Enable PII detection and masking
         RATE_LIMIT_PER_MINUTE: Rate limit for API requests
+        EVENT_BUS_ASYNC: Dispatch event bus handlers on a worker pool
+        EVENT_BUS_WORKERS: Number of event bus dispatch workers
+        EVENT_BUS_QUEUE_SIZE: Capacity of each event bus worker queue
+        EVENT_BUS_OVERFLOW: Overflow policy (block/drop_newest/drop_oldest)
     """
 
     # Database
@@ -40,6 +52,7 @@ class Settings(BaseSettings):
     
     # Cache
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_POOL_SIZE: int = 20
     
     # Security
     JWT_SECRET: str = "your-secret-key-change-in-production"
@@ -57,6 +70,13 @@ class Settings(BaseSettings):
     
     # HRIS Configuration
     HRIS_PROVIDER: Literal["bamboohr", "workday", "custom_db"] = "bamboohr"
+    HRIS_MIRROR_ENABLED: bool = False
+    HRIS_MIRROR_SYNC_INTERVAL_SECONDS: int = 300
+    HRIS_MIRROR_MAX_STALENESS_SECONDS: int = 900
+    HRIS_CACHE_ENABLED: bool = False
+    HRIS_CACHE_SHARED: bool = False
+    VENDOR_HTTP_POOL_SIZE: int = 20
+    VENDOR_HTTP_MAX_RETRIES: int = 3
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -93,6 +113,12 @@ class Settings(BaseSettings):
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 500
+
+    # Event Bus
+    EVENT_BUS_ASYNC: bool = False
+    EVENT_BUS_WORKERS: int = 4
+    EVENT_BUS_QUEUE_SIZE: int = 1000
+    EVENT_BUS_OVERFLOW: Literal["block", "drop_newest", "drop_oldest"] = "block"
     
     model_config = ConfigDict(
         extra="ignore",
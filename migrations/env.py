@@ -29,11 +29,21 @@ from src.core.database import (
     Conversation,
     ConversationMessage,
 )
-from src.repositories.workflow_repository import WorkflowModel, WorkflowStepModel
+from src.repositories.workflow_repository import (
+    WorkflowModel,
+    WorkflowStepModel,
+    WorkflowInstanceModel,
+    WorkflowEventModel,
+)
 from src.repositories.notification_repository import NotificationModel, NotificationPreferenceModel
 from src.repositories.gdpr_repository import ConsentRecordModel, DSARRequestModel, RetentionPolicyModel
 from src.repositories.document_repository import DocumentTemplateModel, GeneratedDocumentModel
 from src.repositories.bias_repository import BiasIncidentModel, BiasAuditReportModel
+from src.repositories.hris_mirror_repository import (
+    HRISMirrorEmployeeModel,
+    HRISMirrorRecordModel,
+    HRISSyncStateModel,
+)
 from src.repositories.dashboard_repository import DashboardModel, DashboardWidgetModel, MetricSnapshotModel
 
 # Get Alembic config
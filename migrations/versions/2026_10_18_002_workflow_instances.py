@@ -0,0 +1,72 @@
+"""Durable WorkflowEngine store.
+
+Revision ID: 002_workflow_instances
+Revises: 001_initial
+Create Date: 2026-10-18
+
+Adds workflow_instances (serialized ApprovalWorkflow plus query columns and an
+optimistic-concurrency version) and workflow_events (per-workflow audit trail).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "002_workflow_instances"
+down_revision = "001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ── workflow_instances ────────────────────────────────
+    op.create_table(
+        "workflow_instances",
+        sa.Column("workflow_id", sa.String(64), primary_key=True),
+        sa.Column("entity_type", sa.String(100), nullable=False),
+        sa.Column("entity_id", sa.String(255), nullable=False),
+        sa.Column("created_by", sa.String(255), nullable=False),
+        sa.Column("state", sa.String(50), nullable=False),
+        sa.Column("current_approver_id", sa.String(255), nullable=True),
+        sa.Column("escalation_due_at", sa.DateTime(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_workflow_instances_state_approver",
+        "workflow_instances",
+        ["state", "current_approver_id"],
+    )
+    op.create_index(
+        "ix_workflow_instances_creator_state", "workflow_instances", ["created_by", "state"]
+    )
+    op.create_index(
+        "ix_workflow_instances_escalation_due_at", "workflow_instances", ["escalation_due_at"]
+    )
+
+    # ── workflow_events ───────────────────────────────────
+    op.create_table(
+        "workflow_events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "workflow_id",
+            sa.String(64),
+            sa.ForeignKey("workflow_instances.workflow_id"),
+            nullable=False,
+        ),
+        sa.Column("event_type", sa.String(100), nullable=False),
+        sa.Column("actor", sa.String(255), nullable=False),
+        sa.Column("details", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_workflow_events_workflow_id", "workflow_events", ["workflow_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workflow_events_workflow_id", "workflow_events")
+    op.drop_table("workflow_events")
+    op.drop_index("ix_workflow_instances_escalation_due_at", "workflow_instances")
+    op.drop_index("ix_workflow_instances_creator_state", "workflow_instances")
+    op.drop_index("ix_workflow_instances_state_approver", "workflow_instances")
+    op.drop_table("workflow_instances")
@@ -0,0 +1,76 @@
+"""HRIS read replica.
+
+Revision ID: 003_hris_mirror
+Revises: 002_workflow_instances
+Create Date: 2026-10-18
+
+Adds hris_mirror_employees (serialized connector employees plus search
+columns), hris_mirror_records (per-employee leave balances and benefits) and
+hris_sync_state (per-source delta cursor and sync bookkeeping).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "003_hris_mirror"
+down_revision = "002_workflow_instances"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ── hris_mirror_employees ─────────────────────────────
+    op.create_table(
+        "hris_mirror_employees",
+        sa.Column("source", sa.String(50), primary_key=True),
+        sa.Column("employee_id", sa.String(255), primary_key=True),
+        sa.Column("first_name", sa.String(100), nullable=False),
+        sa.Column("last_name", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("department", sa.String(255), nullable=False),
+        sa.Column("job_title", sa.String(255), nullable=False),
+        sa.Column("manager_id", sa.String(255), nullable=True),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("synced_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_hris_mirror_employees_source_department",
+        "hris_mirror_employees",
+        ["source", "department"],
+    )
+    op.create_index(
+        "ix_hris_mirror_employees_source_manager",
+        "hris_mirror_employees",
+        ["source", "manager_id"],
+    )
+
+    # ── hris_mirror_records ───────────────────────────────
+    op.create_table(
+        "hris_mirror_records",
+        sa.Column("source", sa.String(50), primary_key=True),
+        sa.Column("employee_id", sa.String(255), primary_key=True),
+        sa.Column("kind", sa.String(50), primary_key=True),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("synced_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+
+    # ── hris_sync_state ───────────────────────────────────
+    op.create_table(
+        "hris_sync_state",
+        sa.Column("source", sa.String(50), primary_key=True),
+        sa.Column("cursor", sa.String(255), nullable=True),
+        sa.Column("last_synced_at", sa.DateTime(), nullable=True),
+        sa.Column("last_full_sync_at", sa.DateTime(), nullable=True),
+        sa.Column("employee_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.String(1000), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("hris_sync_state")
+    op.drop_table("hris_mirror_records")
+    op.drop_index("ix_hris_mirror_employees_source_manager", "hris_mirror_employees")
+    op.drop_index("ix_hris_mirror_employees_source_department", "hris_mirror_employees")
+    op.drop_table("hris_mirror_employees")
@@ -0,0 +1,51 @@
+"""Indexed audit log queries.
+
+Revision ID: 004_audit_log_query
+Revises: 003_hris_mirror
+Create Date: 2026-10-18
+
+Adds the columns the audit log store writes (actor, status, ip_address,
+entry_id) and composite (filter, timestamp, id) indexes used for keyset
+pagination of audit_logs.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "004_audit_log_query"
+down_revision = "003_hris_mirror"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_audit_logs_timestamp_id", ["timestamp", "id"]),
+    ("ix_audit_logs_actor_timestamp", ["actor", "timestamp", "id"]),
+    ("ix_audit_logs_action_timestamp", ["action", "timestamp", "id"]),
+    (
+        "ix_audit_logs_resource_timestamp",
+        ["resource_type", "resource_id", "timestamp", "id"],
+    ),
+    ("ix_audit_logs_status_timestamp", ["status", "timestamp", "id"]),
+]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("audit_logs") as batch:
+        batch.add_column(sa.Column("actor", sa.String(255), nullable=True))
+        batch.add_column(
+            sa.Column("status", sa.String(20), nullable=False, server_default="success")
+        )
+        batch.add_column(sa.Column("ip_address", sa.String(45), nullable=True))
+        batch.add_column(sa.Column("entry_id", sa.String(36), nullable=True))
+    for name, columns in INDEXES:
+        op.create_index(name, "audit_logs", columns)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, "audit_logs")
+    with op.batch_alter_table("audit_logs") as batch:
+        batch.drop_column("entry_id")
+        batch.drop_column("ip_address")
+        batch.drop_column("status")
+        batch.drop_column("actor")
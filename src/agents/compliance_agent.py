@@ -7,6 +7,7 @@ Integrates DSARRepository, PIIStripper, MultiJurisdictionEngine, and
 NotificationService into an automated compliance pipeline.
 """
 
+import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -14,6 +15,7 @@ from uuid import uuid4
 
 from .base_agent import BaseAgent, BaseAgentState
 from ..connectors.hris_interface import HRISConnector
+from ..core.dsar_discovery import DSARDiscoveryEngine
 from ..core.multi_jurisdiction import MultiJurisdictionEngine, Jurisdiction
 from ..core.notifications import (
     NotificationService,
@@ -51,6 +53,7 @@ class ComplianceAgent(BaseAgent):
         pii_stripper: Optional[PIIStripper] = None,
         dsar_repository: Optional[DSARRepository] = None,
         gdpr_repository: Optional[GDPRRepository] = None,
+        discovery_engine: Optional[DSARDiscoveryEngine] = None,
     ):
         """
         Initialize Compliance Agent.
@@ -63,8 +66,10 @@ class ComplianceAgent(BaseAgent):
             pii_stripper: PII detection and masking service
             dsar_repository: Repository for persisting DSAR requests to database
             gdpr_repository: Repository for consent records
+            discovery_engine: DSAR discovery engine; falls back to HRIS lookups
         """
         self.hris_connector = hris_connector
+        self.discovery_engine = discovery_engine
         self.compliance_engine = compliance_engine or MultiJurisdictionEngine()
         self.notification_service = notification_service or NotificationService()
         self.pii_stripper = pii_stripper or PIIStripper()
@@ -640,6 +645,20 @@ class ComplianceAgent(BaseAgent):
             "training_records": [],
         }
 
+        if self.discovery_engine:
+            try:
+                _, records = self.discovery_engine.collect(employee_id)
+                for category, items in records.items():
+                    locations = data_locations.setdefault(category, [])
+                    for item in items:
+                        record = {k: v for k, v in item.items() if k != "_source"}
+                        locations.append(
+                            f"{item['_source']}: {json.dumps(record, default=str, sort_keys=True)}"
+                        )
+                return data_locations
+            except Exception as e:
+                logger.warning(f"Data discovery engine error: {e}")
+
         if self.hris_connector:
             try:
                 emp = self.hris_connector.get_employee(employee_id)
@@ -173,14 +173,22 @@ class EmployeeInfoAgent(BaseAgent):
                     if managers:
                         manager = managers[0]
                         org_nodes = self.hris_connector.get_org_chart()
-                        # Filter for this manager's reports
-                        reports = [
-                            n for n in org_nodes if getattr(n, "manager_id", None) == manager.id
-                        ]
+                        # Locate the manager's node, then load every report in one batch call
+                        stack = list(org_nodes)
+                        report_ids: List[str] = []
+                        while stack:
+                            node = stack.pop()
+                            if getattr(node, "employee_id", None) == manager.id:
+                                report_ids = [r.employee_id for r in node.direct_reports]
+                                break
+                            stack.extend(getattr(node, "direct_reports", []))
+                        reports = (
+                            self.hris_connector.get_employees(report_ids) if report_ids else {}
+                        )
                         return {
                             "manager": manager.dict(),
                             "direct_reports": [
-                                r.dict() if hasattr(r, "dict") else str(r) for r in reports
+                                reports[rid].dict() for rid in report_ids if rid in reports
                             ],
                             "count": len(reports),
                             "source": f"HRIS/manager/{manager.id}",
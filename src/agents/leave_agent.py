@@ -16,6 +16,41 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+def _summarize_balances(leave_balances: List[Any]) -> tuple:
+    """
+    Summarize leave balances as available = total - used - pending per type.
+
+    Args:
+        leave_balances: LeaveBalance objects for one employee
+
+    Returns:
+        Tuple of (total available days, per-type breakdown list)
+    """
+    total_balance = 0.0
+    balance_summary = []
+
+    for balance in leave_balances:
+        leave_type = getattr(balance, "leave_type", "Unknown")
+        total = getattr(balance, "total_days", 0)
+        used = getattr(balance, "used_days", 0)
+        pending = getattr(balance, "pending_days", 0)
+        available = total - used - pending
+
+        total_balance += available
+
+        balance_summary.append(
+            {
+                "leave_type": leave_type,
+                "total": total,
+                "used": used,
+                "pending": pending,
+                "available": available,
+            }
+        )
+
+    return total_balance, balance_summary
+
+
 class LeaveAgent(BaseAgent):
     """
     Specialist agent for leave and attendance management.
@@ -72,12 +107,17 @@ class LeaveAgent(BaseAgent):
         tools = {}
 
         # Tool 1: Balance Calculator
-        def balance_calculator(employee_id: str) -> Dict[str, Any]:
+        def balance_calculator(
+            employee_id: str,
+            team_member_ids: Optional[List[str]] = None,
+        ) -> Dict[str, Any]:
             """
             Calculate available leave balance.
 
             Args:
                 employee_id: Employee ID
+                team_member_ids: Optional team member IDs (manager view); their
+                    balances are fetched in one batch call
 
             Returns:
                 Leave balance breakdown by type
@@ -89,41 +129,42 @@ class LeaveAgent(BaseAgent):
                 logger.info(f"BALANCE_CALCULATOR: Getting balance for {employee_id}")
 
                 # Get leave balances from HRIS
-                leave_balances = self.hris_connector.get_leave_balance(employee_id)
+                if team_member_ids:
+                    team_balances = self.hris_connector.get_leave_balances(
+                        [employee_id] + list(team_member_ids)
+                    )
+                    leave_balances = team_balances.get(str(employee_id), [])
+                else:
+                    team_balances = {}
+                    leave_balances = self.hris_connector.get_leave_balance(employee_id)
 
                 if not leave_balances:
                     return {"error": f"No leave balance found for employee {employee_id}"}
 
-                # Calculate summary
-                total_balance = 0.0
-                balance_summary = []
-
-                for balance in leave_balances:
-                    leave_type = getattr(balance, "leave_type", "Unknown")
-                    total = getattr(balance, "total_days", 0)
-                    used = getattr(balance, "used_days", 0)
-                    pending = getattr(balance, "pending_days", 0)
-                    available = total - used - pending
+                total_balance, balance_summary = _summarize_balances(leave_balances)
 
-                    total_balance += available
-
-                    balance_summary.append(
-                        {
-                            "leave_type": leave_type,
-                            "total": total,
-                            "used": used,
-                            "pending": pending,
-                            "available": available,
-                        }
-                    )
-
-                return {
+                result = {
                     "employee_id": employee_id,
                     "total_available": total_balance,
                     "balance_by_type": balance_summary,
                     "as_of": datetime.now().isoformat(),
                     "source": "HRIS",
                 }
+                if team_member_ids:
+                    team = []
+                    for member_id in team_member_ids:
+                        member_total, member_summary = _summarize_balances(
+                            team_balances.get(str(member_id), [])
+                        )
+                        team.append(
+                            {
+                                "employee_id": member_id,
+                                "total_available": member_total,
+                                "balance_by_type": member_summary,
+                            }
+                        )
+                    result["team"] = team
+                return result
 
             except Exception as e:
                 logger.error(f"BALANCE_CALCULATOR failed: {e}")
@@ -17,7 +17,12 @@ from pydantic import BaseModel, Field, validator
 
 from src.agents.base_agent import BaseAgent, BaseAgentState, UserContext
 from src.core.rbac import check_permission, get_data_scope, DataScope
-from src.core.workflow_engine import WorkflowEngine, WorkflowTemplate, ApprovalMode
+from src.core.workflow_engine import (
+    ApprovalMode,
+    WorkflowEngine,
+    WorkflowTemplate,
+    get_workflow_engine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -162,10 +167,11 @@ class LeaveRequestAgent(BaseAgent):
 
         Args:
             llm: Language model instance
-            workflow_engine: Workflow engine for approval workflows
+            workflow_engine: Workflow engine for approval workflows (defaults to
+                the shared engine, durable once the database is initialized)
         """
         self.llm = llm
-        self.workflow_engine = workflow_engine or WorkflowEngine()
+        self._workflow_engine = workflow_engine
         self.leave_requests: Dict[str, LeaveRequest] = {}
         self.leave_balances: Dict[str, Dict[LeaveType, LeaveBalance]] = {}
         self.team_calendar: Dict[str, List[LeaveRequest]] = {}
@@ -186,7 +192,19 @@ class LeaveRequestAgent(BaseAgent):
             ],
             approval_mode=ApprovalMode.SEQUENTIAL,
         )
-        self.leave_approval_template_id = self.workflow_engine.register_template(template)
+        # Registered on whichever engine workflow_engine resolves to
+        self._leave_approval_template = template
+        self.leave_approval_template_id = template.template_id
+
+    @property
+    def workflow_engine(self) -> WorkflowEngine:
+        """Engine for approval workflows, with the leave template registered."""
+        engine = self._workflow_engine or get_workflow_engine()
+        template = getattr(self, "_leave_approval_template", None)
+        if template is not None and template.template_id not in engine.templates:
+            # The shared engine is replaced once the database is initialized
+            engine.register_template(template)
+        return engine
 
     def get_tools(self) -> Dict[str, Any]:
         """Return available tools for this agent."""
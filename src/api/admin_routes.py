@@ -7,11 +7,13 @@ Iteration 8 Wave 1 - ADM-001
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.core.audit_log_store import AuditLogStore, InMemoryAuditLogStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -169,13 +171,19 @@ class AdminService:
     Provides functionality for managing users, roles, audit logs, and system configuration.
     """
 
-    def __init__(self, config: Optional[AdminConfig] = None, audit_logger: Optional[Any] = None):
+    def __init__(
+        self,
+        config: Optional[AdminConfig] = None,
+        audit_logger: Optional[Any] = None,
+        audit_store: Optional[AuditLogStore] = None,
+    ):
         """
         Initialize admin service.
 
         Args:
             config: AdminConfig object with settings
             audit_logger: Logger for audit trail (optional)
+            audit_store: Indexed audit log store (in-memory if None)
         """
         self.config = config or AdminConfig()
         self.audit_logger = audit_logger
@@ -183,7 +191,8 @@ class AdminService:
         # In-memory storage
         self._users: Dict[UUID, UserRecord] = {}
         self._roles: Dict[UUID, RoleDefinition] = {}
-        self._audit_logs: List[AuditLogEntry] = []
+        self._audit_logs = audit_store if audit_store is not None else InMemoryAuditLogStore()
+        self._audit_purged_at: Optional[datetime] = None
         self._system_config: Dict[str, SystemConfig] = {}
         self._start_time = datetime.utcnow()
 
@@ -263,9 +272,12 @@ class AdminService:
             )
             self._audit_logs.append(entry)
 
-            # Trim old logs based on retention policy
-            cutoff_date = datetime.utcnow() - timedelta(days=self.config.audit_log_retention_days)
-            self._audit_logs = [log for log in self._audit_logs if log.timestamp >= cutoff_date]
+            # Trim old logs based on retention policy, at most once an hour
+            now = entry.timestamp
+            if self._audit_purged_at is None or now - self._audit_purged_at >= timedelta(hours=1):
+                cutoff_date = now - timedelta(days=self.config.audit_log_retention_days)
+                self._audit_logs.purge_before(cutoff_date)
+                self._audit_purged_at = now
 
             logger.info(
                 "Audit logged: %s on %s by %s (status: %s)", action, resource, user_id, status
@@ -668,56 +680,46 @@ class AdminService:
         end_date: Optional[datetime] = None,
         page: int = 1,
         per_page: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        Get audit logs with filtering and pagination.
+        Get audit logs with filtering and pagination, newest first.
 
         Args:
-            filters: Filter criteria (user_id, action, resource)
+            filters: Filter criteria (user_id, action, resource, status)
             start_date: Start date for filtering
             end_date: End date for filtering
-            page: Page number (1-based)
+            page: Page number (1-based, ignored when cursor is given)
             per_page: Items per page
+            cursor: next_cursor of the previous page (keyset pagination)
 
         Returns:
-            Dictionary with audit logs and pagination metadata
+            Dictionary with audit logs, pagination metadata and next_cursor
+
+        Raises:
+            ValueError: If cursor is malformed
         """
         try:
-            logs = list(self._audit_logs)
-
-            # Apply date filters
-            if start_date:
-                logs = [l for l in logs if l.timestamp >= start_date]
-            if end_date:
-                logs = [l for l in logs if l.timestamp <= end_date]
-
-            # Apply filters
-            if filters:
-                if "user_id" in filters:
-                    logs = [l for l in logs if l.user_id == filters["user_id"]]
-                if "action" in filters:
-                    logs = [l for l in logs if l.action == filters["action"]]
-                if "resource" in filters:
-                    logs = [l for l in logs if l.resource == filters["resource"]]
-                if "status" in filters:
-                    logs = [l for l in logs if l.status == filters["status"]]
-
-            # Sort by timestamp descending
-            logs.sort(key=lambda x: x.timestamp, reverse=True)
-
-            total = len(logs)
-            start_idx = (page - 1) * per_page
-            end_idx = start_idx + per_page
-            paginated_logs = logs[start_idx:end_idx]
+            result = self._audit_logs.query(
+                filters,
+                start_date,
+                end_date,
+                limit=per_page,
+                cursor=cursor,
+                offset=(page - 1) * per_page,
+                with_total=True,
+            )
+            total = result.total
 
             return {
-                "entries": paginated_logs,
+                "entries": result.entries,
                 "pagination": PaginationMeta(
                     page=page,
                     per_page=per_page,
                     total=total,
                     total_pages=(total + per_page - 1) // per_page,
                 ),
+                "next_cursor": result.next_cursor,
             }
         except Exception as e:
             logger.error("Failed to get audit logs: %s", str(e))
@@ -741,44 +743,58 @@ class AdminService:
             ValueError: If format unsupported
         """
         try:
-            if format not in ["json", "csv"]:
-                raise ValueError(f"Unsupported format: {format}")
-
-            logs = [l for l in self._audit_logs if start_date <= l.timestamp <= end_date]
-
-            if format == "json":
-                data = [l.model_dump() for l in logs]
-            else:  # csv
-                data = []
-                for log in logs:
-                    data.append(
-                        {
-                            "timestamp": log.timestamp.isoformat(),
-                            "user_id": log.user_id,
-                            "action": log.action,
-                            "resource": log.resource,
-                            "status": log.status,
-                        }
-                    )
+            data = list(self.iter_audit_export(start_date, end_date, format))
 
             self._log_audit(
                 user_id="SYSTEM",
                 action="audit_exported",
                 resource="audit_logs",
-                details={"format": format, "log_count": len(logs)},
+                details={"format": format, "log_count": len(data)},
             )
 
-            logger.info("Audit logs exported: %d entries in %s format", len(logs), format)
+            logger.info("Audit logs exported: %d entries in %s format", len(data), format)
             return {
                 "data": data,
                 "format": format,
-                "count": len(logs),
+                "count": len(data),
                 "exported_at": datetime.utcnow().isoformat(),
             }
         except Exception as e:
             logger.error("Failed to export audit logs: %s", str(e))
             raise
 
+    def iter_audit_export(
+        self, start_date: datetime, end_date: datetime, format: str = "json"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream audit log export rows, oldest first, without loading the range.
+
+        Args:
+            start_date: Start date for export
+            end_date: End date for export
+            format: Export format (json, csv)
+
+        Yields:
+            One export row per audit log entry
+
+        Raises:
+            ValueError: If format unsupported
+        """
+        if format not in ["json", "csv"]:
+            raise ValueError(f"Unsupported format: {format}")
+
+        for log in self._audit_logs.iter_entries(start=start_date, end=end_date):
+            if format == "json":
+                yield log.model_dump()
+            else:  # csv
+                yield {
+                    "timestamp": log.timestamp.isoformat(),
+                    "user_id": log.user_id,
+                    "action": log.action,
+                    "resource": log.resource,
+                    "status": log.status,
+                }
+
     def get_system_config(self, category: Optional[str] = None) -> List[SystemConfig]:
         """
         Get system configuration entries.
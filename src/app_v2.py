@@ -182,12 +182,9 @@ def health_check_database() -> bool:
 def health_check_redis() -> bool:
     """Check Redis connectivity."""
     try:
-        import redis  # type: ignore[import-untyped]
-        from config.settings import get_settings
+        from src.core.connection_pool import get_pool_manager
 
-        settings = get_settings()
-        client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-        client.ping()
+        get_pool_manager().redis_client().ping()
         logger.info("✅ Redis health check passed")
         return True
     except Exception as e:
@@ -1034,6 +1031,21 @@ def create_app():
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
 
+    # Move event handlers off the request thread if configured
+    try:
+        from config.settings import get_settings
+        from src.core.event_bus import EventBus
+
+        settings = get_settings()
+        if settings.EVENT_BUS_ASYNC:
+            EventBus.instance().configure_async(
+                max_workers=settings.EVENT_BUS_WORKERS,
+                queue_size=settings.EVENT_BUS_QUEUE_SIZE,
+                overflow_policy=settings.EVENT_BUS_OVERFLOW,
+            )
+    except Exception as e:
+        logger.error(f"Failed to configure event bus: {e}")
+
     # Register API blueprints
     register_api_v2()
     register_legacy_api()
@@ -6,14 +6,13 @@ using the REST API to interact with employee, leave, and benefits data.
 """
 
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from urllib.parse import urlencode
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .hris_interface import (
     HRISConnector,
@@ -22,6 +21,7 @@ from .hris_interface import (
     LeaveRequest,
     OrgNode,
     BenefitsPlan,
+    EmployeeChangeSet,
     EmployeeStatus,
     LeaveType,
     LeaveStatus,
@@ -31,7 +31,10 @@ from .hris_interface import (
     AuthenticationError,
     NotFoundError,
     RateLimitError,
+    unique_ids,
 )
+from .http_client import VendorHTTPClient, get_http_client
+from .org_index import OrgEntry, OrgIndex
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +49,36 @@ class BambooHRConnector(HRISConnector):
 
     BASE_URL = "https://api.bamboohr.com/api/gateway.php"
 
-    def __init__(self, api_key: str, subdomain: str):
+    EMPLOYEE_FIELDS = [
+        "firstName",
+        "lastName",
+        "department",
+        "jobTitle",
+        "supervisor",
+        "hireDate",
+        "status",
+        "workEmail",
+        "mobilePhone",
+        "location",
+    ]
+
+    # Batches larger than this are served by one custom report instead of
+    # per-employee requests
+    bulk_report_threshold = 10
+
+    # Seconds between /employees/changed deltas applied to the org index
+    org_index_refresh_seconds = 300
+
+    def __init__(
+        self, api_key: str, subdomain: str, http_client: Optional[VendorHTTPClient] = None
+    ):
         """
         Initialize BambooHR connector.
 
         Args:
             api_key: BambooHR API key
             subdomain: BambooHR subdomain (e.g., 'company' for company.bamboohr.com)
+            http_client: Shared HTTP client (defaults to the process-wide client)
 
         Raises:
             ValueError: If api_key or subdomain is empty
@@ -64,33 +90,13 @@ class BambooHRConnector(HRISConnector):
 
         self.api_key = api_key
         self.subdomain = subdomain
-        self._session = self._create_session()
+        self._http = http_client or get_http_client()
+        self._org_index: Optional[OrgIndex] = None
+        self._org_cursor: Optional[str] = None
+        self._org_refreshed_at = 0.0
+        self._org_lock = threading.Lock()
         self.last_health_error: str = ""
 
-    def _create_session(self) -> requests.Session:
-        """
-        Create requests session with retry strategy.
-
-        Returns:
-            Configured requests.Session with retry logic
-        """
-        session = requests.Session()
-        session.auth = (self.api_key, "x")
-        session.headers.update({"Accept": "application/json"})
-
-        # Configure retry strategy for rate limits and transient errors
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session
-
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make API request with logging and error handling.
@@ -111,17 +117,21 @@ class BambooHRConnector(HRISConnector):
             ConnectorError: For other API errors
         """
         url = f"{self.BASE_URL}/{self.subdomain}/v1{endpoint}"
+        headers = {"Accept": "application/json", **kwargs.pop("headers", {})}
         start_time = time.time()
 
         try:
             logger.debug(f"Making {method} request to {endpoint}")
-            response = self._session.request(method, url, **kwargs)
+            # The shared client paces and retries 429/5xx before we see the response
+            response = self._http.request(
+                method, url, auth=(self.api_key, "x"), headers=headers, **kwargs
+            )
             duration = time.time() - start_time
             logger.info(f"{method} {endpoint} - {response.status_code} ({duration:.2f}s)")
 
             # Handle rate limiting
             if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
+                retry_after = int(float(response.headers.get("Retry-After", 60)))
                 logger.warning(f"Rate limited. Retry after {retry_after}s")
                 raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after}s")
 
@@ -164,19 +174,7 @@ class BambooHRConnector(HRISConnector):
             NotFoundError: If employee does not exist
             ConnectionError: If unable to connect
         """
-        fields = [
-            "firstName",
-            "lastName",
-            "department",
-            "jobTitle",
-            "supervisor",
-            "hireDate",
-            "status",
-            "workEmail",
-            "mobilePhone",
-            "location",
-        ]
-        params = {"fields": ",".join(fields)}
+        params = {"fields": ",".join(self.EMPLOYEE_FIELDS)}
 
         try:
             data = self._make_request("GET", f"/employees/{employee_id}/", params=params)
@@ -185,6 +183,41 @@ class BambooHRConnector(HRISConnector):
 
         return self._map_employee(data)
 
+    def get_employees(self, employee_ids: Iterable[str]) -> Dict[str, Employee]:
+        """
+        Retrieve several employees from BambooHR.
+
+        Batches above ``bulk_report_threshold`` are fetched with a single
+        custom report (POST /reports/custom) covering every employee, which
+        costs one request instead of one per ID; smaller batches fan out.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> Employee; unknown IDs are omitted
+
+        Raises:
+            ConnectionError: If unable to connect
+        """
+        ids = unique_ids(employee_ids)
+        if len(ids) <= self.bulk_report_threshold:
+            return super().get_employees(ids)
+
+        wanted = set(ids)
+        data = self._make_request(
+            "POST",
+            "/reports/custom",
+            params={"format": "JSON", "onlyCurrent": "false"},
+            json={"title": "Employee batch", "fields": ["id"] + self.EMPLOYEE_FIELDS},
+        )
+        employees: Dict[str, Employee] = {}
+        for emp_data in data.get("employees", []):
+            if str(emp_data.get("id")) in wanted:
+                employee = self._map_employee(emp_data)
+                employees[employee.id] = employee
+        return employees
+
     def search_employees(self, filters: Dict[str, Any]) -> List[Employee]:
         """
         Search for employees in BambooHR directory.
@@ -330,6 +363,10 @@ class BambooHRConnector(HRISConnector):
         """
         Get organization chart from BambooHR.
 
+        Served from the org index (see org_index); with a department, only
+        its members are included, rooted at those whose supervisor is
+        outside the department.
+
         Args:
             department: Optional department filter
 
@@ -339,41 +376,55 @@ class BambooHRConnector(HRISConnector):
         Raises:
             ConnectionError: If unable to connect
         """
+        return self.org_index().org_chart(department)
+
+    def org_index(self) -> OrgIndex:
+        """
+        Get the org index, built from the directory on first use.
+
+        Afterwards it is kept current by applying /employees/changed deltas
+        at most every ``org_index_refresh_seconds``, instead of reloading the
+        full directory.
+
+        Returns:
+            OrgIndex over the BambooHR directory
+
+        Raises:
+            ConnectionError: If the initial directory load fails
+        """
+        with self._org_lock:
+            now = time.time()
+            if self._org_index is None:
+                self._org_index = self._load_org_index()
+                self._org_refreshed_at = now
+            elif now - self._org_refreshed_at >= self.org_index_refresh_seconds:
+                self._org_refreshed_at = now
+                try:
+                    changes = self.get_employee_changes(self._org_cursor)
+                    self._org_index.apply_changes(changes)
+                    self._org_cursor = changes.cursor
+                except ConnectorError as e:
+                    logger.warning(f"Org index refresh failed; serving previous index: {e}")
+            return self._org_index
+
+    def _load_org_index(self) -> OrgIndex:
+        """Build the org index from /employees/directory."""
+        self._org_cursor = datetime.utcnow().replace(microsecond=0).isoformat()
         try:
             data = self._make_request("GET", "/employees/directory")
         except NotFoundError:
-            return []
-
-        # Build employee map
-        employees = {emp["id"]: emp for emp in data.get("employees", [])}
-
-        # Build hierarchy
-        org_nodes = {}
-        for emp_id, emp_data in employees.items():
-            org_nodes[emp_id] = OrgNode(
-                employee_id=emp_id,
-                name=f"{emp_data.get('firstName', '')} {emp_data.get('lastName', '')}",
-                title=emp_data.get("jobTitle", ""),
-                department=emp_data.get("department", ""),
-                direct_reports=[],
+            return OrgIndex()
+
+        return OrgIndex(
+            OrgEntry(
+                employee_id=str(emp["id"]),
+                name=f"{emp.get('firstName', '')} {emp.get('lastName', '')}",
+                title=emp.get("jobTitle", ""),
+                department=emp.get("department", ""),
+                manager_id=str(emp["supervisor"]) if emp.get("supervisor") else None,
             )
-
-        # Populate direct reports
-        for emp_id, emp_data in employees.items():
-            manager_id = emp_data.get("supervisor")
-            if manager_id and manager_id in org_nodes:
-                org_nodes[manager_id].direct_reports.append(org_nodes[emp_id])
-
-        # Filter by department if specified
-        roots = [
-            node
-            for node in org_nodes.values()
-            if not employees.get(node.employee_id, {}).get("supervisor")
-        ]
-        if department:
-            roots = [node for node in roots if node.department == department]
-
-        return roots
+            for emp in data.get("employees", [])
+        )
 
     def get_benefits(self, employee_id: str) -> List[BenefitsPlan]:
         """
@@ -408,6 +459,45 @@ class BambooHRConnector(HRISConnector):
 
         return plans
 
+    def get_employee_changes(self, since: str) -> Optional[EmployeeChangeSet]:
+        """
+        Get employees changed since a cursor via /employees/changed.
+
+        Args:
+            since: ISO-8601 timestamp of the previous sync
+
+        Returns:
+            EmployeeChangeSet with updated active employees, the IDs of
+            deleted or no longer active employees, and the server-provided
+            cursor
+
+        Raises:
+            ConnectionError: If unable to connect
+        """
+        data = self._make_request("GET", "/employees/changed", params={"since": since})
+
+        changed_ids: List[str] = []
+        deleted_ids: List[str] = []
+        updated: List[Employee] = []
+        for emp_id, change in (data.get("employees") or {}).items():
+            if str(change.get("action", "")).lower() == "deleted":
+                deleted_ids.append(str(emp_id))
+            else:
+                changed_ids.append(str(emp_id))
+
+        # The bulk path also returns former employees; like the directory, a
+        # change set only carries current ones
+        found = self.get_employees(changed_ids)
+        for emp_id in changed_ids:
+            employee = found.get(emp_id)
+            if employee is not None and employee.status == EmployeeStatus.ACTIVE:
+                updated.append(employee)
+            else:
+                deleted_ids.append(emp_id)
+
+        cursor = data.get("latest") or datetime.utcnow().replace(microsecond=0).isoformat()
+        return EmployeeChangeSet(updated=updated, deleted_ids=deleted_ids, cursor=cursor)
+
     def health_check(self) -> bool:
         """
         Check if connector can reach BambooHR API.
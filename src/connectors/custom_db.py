@@ -2,16 +2,20 @@
 HRIS-003: Custom Database HRIS Connector implementation.
 
 This module implements the HRISConnector interface for external databases,
-using SQLAlchemy for database abstraction and read-only SQL queries.
+using SQLAlchemy for database abstraction and read-only SQL queries. Large
+result sets are streamed from server-side cursors, and statement text is
+built once per connector and reused.
 """
 
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, Callable, Hashable, Iterable, Iterator
 
-from sqlalchemy import create_engine, text, event
+from sqlalchemy import bindparam, create_engine, text, event
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import TextClause
 
 from .hris_interface import (
     HRISConnector,
@@ -27,6 +31,7 @@ from .hris_interface import (
     ConnectorError,
     ConnectionError,
     NotFoundError,
+    unique_ids,
 )
 
 logger = logging.getLogger(__name__)
@@ -40,6 +45,25 @@ class CustomDBConnector(HRISConnector):
     abstraction. All queries are read-only with parameterized statements.
     """
 
+    # Max IDs bound into one IN (...) clause; stays below common driver
+    # parameter limits (SQLite 999, Oracle 1000)
+    batch_size = 500
+
+    # Rows fetched per round trip when streaming large result sets
+    fetch_size = 1000
+
+    # Recursion cap for org chart queries; guards against cyclic source data
+    # (e.g. duplicated employee IDs)
+    max_org_depth = 50
+
+    # Filter key -> (schema_mapping key, default column) for search_employees
+    SEARCH_FILTERS = (
+        ("department", "department_column", "department"),
+        ("status", "status_column", "status"),
+        ("location", "location_column", "location"),
+        ("job_title", "job_title_column", "job_title"),
+    )
+
     def __init__(self, connection_string: str, schema_mapping: Dict[str, str]):
         """
         Initialize Custom DB connector.
@@ -76,6 +100,8 @@ class CustomDBConnector(HRISConnector):
 
         self.connection_string = connection_string
         self.schema_mapping = schema_mapping
+        # Statements built from schema_mapping, keyed by query shape
+        self._statements: Dict[Hashable, TextClause] = {}
 
         try:
             self.engine = create_engine(
@@ -133,11 +159,13 @@ class CustomDBConnector(HRISConnector):
         if not table or not id_col:
             raise ConnectorError("schema_mapping missing employee_table or id_column")
 
-        query = f"SELECT * FROM {table} WHERE {id_col} = :emp_id LIMIT 1"
+        stmt = self._statement(
+            "employee", lambda: f"SELECT * FROM {table} WHERE {id_col} = :emp_id LIMIT 1"
+        )
 
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(text(query), {"emp_id": employee_id})
+                result = conn.execute(stmt, {"emp_id": employee_id})
                 row = result.fetchone()
 
                 if not row:
@@ -149,15 +177,18 @@ class CustomDBConnector(HRISConnector):
             logger.error(f"Database query failed: {e}")
             raise ConnectionError(f"Database query failed: {e}")
 
-    def search_employees(self, filters: Dict[str, Any]) -> List[Employee]:
+    def iter_employees(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[Employee]:
         """
-        Search employees in database with filters.
+        Stream employees matching filters from a server-side cursor.
+
+        Rows are fetched ``fetch_size`` at a time and mapped as they are
+        yielded, so memory stays flat regardless of table size.
 
         Args:
             filters: Filter dictionary (e.g., {"department": "Sales"})
 
-        Returns:
-            List of Employee objects
+        Yields:
+            Employee objects
 
         Raises:
             ConnectionError: If unable to connect to database
@@ -166,47 +197,43 @@ class CustomDBConnector(HRISConnector):
         if not table:
             raise ConnectorError("schema_mapping missing employee_table")
 
-        # Build WHERE clause from filters
-        where_conditions = []
-        params = {}
-
-        if filters.get("department"):
-            dept_col = self.schema_mapping.get("department_column", "department")
-            where_conditions.append(f"{dept_col} = :department")
-            params["department"] = filters["department"]
-
-        if filters.get("status"):
-            status_col = self.schema_mapping.get("status_column", "status")
-            where_conditions.append(f"{status_col} = :status")
-            params["status"] = filters["status"]
-
-        if filters.get("location"):
-            loc_col = self.schema_mapping.get("location_column", "location")
-            where_conditions.append(f"{loc_col} = :location")
-            params["location"] = filters["location"]
+        filters = filters or {}
+        params = {name: filters[name] for name, _, _ in self.SEARCH_FILTERS if filters.get(name)}
+
+        def build() -> str:
+            conditions = [
+                f"{self.schema_mapping.get(column_key, default)} = :{name}"
+                for name, column_key, default in self.SEARCH_FILTERS
+                if name in params
+            ]
+            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            return f"SELECT * FROM {table} WHERE {where_clause}"
+
+        stmt = self._statement(("search", tuple(params)), build)
+        for row in self._stream(stmt, params):
+            yield self._map_employee_row(row)
+
+    def search_employees(
+        self, filters: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[Employee]:
+        """
+        Search employees in database with filters.
 
-        if filters.get("job_title"):
-            title_col = self.schema_mapping.get("job_title_column", "job_title")
-            where_conditions.append(f"{title_col} = :job_title")
-            params["job_title"] = filters["job_title"]
+        Args:
+            filters: Filter dictionary (e.g., {"department": "Sales"})
+            limit: Maximum number of employees to return (default: all)
 
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        query = f"SELECT * FROM {table} WHERE {where_clause}"
+        Returns:
+            List of Employee objects
 
+        Raises:
+            ConnectionError: If unable to connect to database
+        """
+        employees = self.iter_employees(filters)
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(text(query), params)
-                rows = result.fetchall()
-
-                employees = []
-                for row in rows:
-                    employees.append(self._map_employee_row(row))
-
-                return employees
-
-        except SQLAlchemyError as e:
-            logger.error(f"Database query failed: {e}")
-            raise ConnectionError(f"Database query failed: {e}")
+            return list(islice(employees, limit))
+        finally:
+            employees.close()
 
     def get_leave_balance(self, employee_id: str) -> List[LeaveBalance]:
         """
@@ -227,29 +254,16 @@ class CustomDBConnector(HRISConnector):
             return []
 
         # Assume standard column names if not specified
-        query = f"""
-            SELECT * FROM {table}
-            WHERE employee_id = :emp_id
-        """
+        stmt = self._statement(
+            "leave_balance", lambda: f"SELECT * FROM {table} WHERE employee_id = :emp_id"
+        )
 
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(text(query), {"emp_id": employee_id})
+                result = conn.execute(stmt, {"emp_id": employee_id})
                 rows = result.fetchall()
 
-                balances = []
-                for row in rows:
-                    balance = LeaveBalance(
-                        employee_id=employee_id,
-                        leave_type=LeaveType(row[2].lower()) if len(row) > 2 else LeaveType.PTO,
-                        total_days=float(row[3] or 0) if len(row) > 3 else 0.0,
-                        used_days=float(row[4] or 0) if len(row) > 4 else 0.0,
-                        pending_days=float(row[5] or 0) if len(row) > 5 else 0.0,
-                        available_days=float(row[6] or 0) if len(row) > 6 else 0.0,
-                    )
-                    balances.append(balance)
-
-                return balances
+                return [self._map_leave_balance_row(row, employee_id) for row in rows]
 
         except SQLAlchemyError as e:
             logger.error(f"Database query failed: {e}")
@@ -279,18 +293,21 @@ class CustomDBConnector(HRISConnector):
             logger.warning("leave_requests_table not in schema_mapping")
             return []
 
-        where_clause = "employee_id = :emp_id"
         params = {"emp_id": employee_id}
-
         if status:
-            where_clause += " AND status = :status"
             params["status"] = status
 
-        query = f"SELECT * FROM {table} WHERE {where_clause}"
+        def build() -> str:
+            where_clause = "employee_id = :emp_id"
+            if status:
+                where_clause += " AND status = :status"
+            return f"SELECT * FROM {table} WHERE {where_clause}"
+
+        stmt = self._statement(("leave_requests", bool(status)), build)
 
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(text(query), params)
+                result = conn.execute(stmt, params)
                 rows = result.fetchall()
 
                 requests_list = []
@@ -336,6 +353,11 @@ class CustomDBConnector(HRISConnector):
         """
         Get organization chart using recursive CTE.
 
+        With a department, the CTE is anchored at the department's heads
+        (members whose manager is outside the department or absent), so only
+        their subtrees are computed. Rows are streamed in level order and
+        linked to their already-built managers in a single pass.
+
         Args:
             department: Optional department filter
 
@@ -347,88 +369,38 @@ class CustomDBConnector(HRISConnector):
         """
         table = self.schema_mapping.get("employee_table")
         id_col = self.schema_mapping.get("id_column")
-        manager_col = self.schema_mapping.get("manager_id_column", "manager_id")
-        first_name_col = self.schema_mapping.get("first_name_column", "first_name")
-        last_name_col = self.schema_mapping.get("last_name_column", "last_name")
-        title_col = self.schema_mapping.get("job_title_column", "job_title")
-        dept_col = self.schema_mapping.get("department_column", "department")
 
         if not table or not id_col:
             raise ConnectorError("schema_mapping missing employee_table or id_column")
 
-        # PostgreSQL recursive CTE for hierarchy
-        # This needs to be adapted for other databases
-        query = f"""
-            WITH RECURSIVE org_tree AS (
-                SELECT
-                    {id_col},
-                    {first_name_col},
-                    {last_name_col},
-                    {title_col},
-                    {dept_col},
-                    {manager_col},
-                    0 as level
-                FROM {table}
-                WHERE {manager_col} IS NULL
-                
-                UNION ALL
-                
-                SELECT
-                    e.{id_col},
-                    e.{first_name_col},
-                    e.{last_name_col},
-                    e.{title_col},
-                    e.{dept_col},
-                    e.{manager_col},
-                    ot.level + 1
-                FROM {table} e
-                INNER JOIN org_tree ot ON e.{manager_col} = ot.{id_col}
+        scoped = department is not None
+        stmt = self._statement(("org_chart", scoped), lambda: self._org_chart_sql(scoped))
+        params: Dict[str, Any] = {"max_depth": self.max_org_depth}
+        if scoped:
+            params["department"] = department
+
+        node_map: Dict[str, OrgNode] = {}
+        roots: List[OrgNode] = []
+        for row in self._stream(stmt, params):
+            emp_id = str(row[0])
+            if emp_id in node_map:
+                continue  # duplicated ID in the source table
+            node = OrgNode(
+                employee_id=emp_id,
+                name=f"{row[1]} {row[2]}",
+                title=row[3] or "",
+                department=row[4] or "",
+                direct_reports=[],
             )
-            SELECT * FROM org_tree
-            ORDER BY level, {id_col}
-        """
-
-        try:
-            with self.engine.connect() as conn:
-                result = conn.execute(text(query))
-                rows = result.fetchall()
-
-                # Build hierarchy from flat result
-                node_map = {}
-                for row in rows:
-                    emp_id = str(row[0])
-                    node = OrgNode(
-                        employee_id=emp_id,
-                        name=f"{row[1]} {row[2]}",
-                        title=row[3] or "",
-                        department=row[4] or "",
-                        direct_reports=[],
-                    )
-                    node_map[emp_id] = node
-
-                # Build parent-child relationships
-                for row in rows:
-                    emp_id = str(row[0])
-                    manager_id = str(row[5]) if row[5] else None
+            node_map[emp_id] = node
 
-                    if manager_id and manager_id in node_map:
-                        node_map[manager_id].direct_reports.append(node_map[emp_id])
+            manager = node_map.get(str(row[5])) if row[6] > 0 else None
+            if manager is not None:
+                manager.direct_reports.append(node)
+            else:
+                roots.append(node)
 
-                # Get roots and apply department filter if needed
-                roots = [
-                    node
-                    for node in node_map.values()
-                    if not any(node in parent.direct_reports for parent in node_map.values())
-                ]
-
-                if department:
-                    roots = [node for node in roots if node.department == department]
-
-                return roots
-
-        except SQLAlchemyError as e:
-            logger.error(f"Database query failed: {e}")
-            raise ConnectionError(f"Database query failed: {e}")
+        return roots
 
     def get_benefits(self, employee_id: str) -> List[BenefitsPlan]:
         """
@@ -448,30 +420,20 @@ class CustomDBConnector(HRISConnector):
             logger.warning("benefits_table not in schema_mapping")
             return []
 
-        query = f"""
-            SELECT * FROM {table}
-            WHERE employee_id = :emp_id
-        """
+        stmt = self._statement(
+            "benefits", lambda: f"SELECT * FROM {table} WHERE employee_id = :emp_id"
+        )
 
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(text(query), {"emp_id": employee_id})
+                result = conn.execute(stmt, {"emp_id": employee_id})
                 rows = result.fetchall()
 
                 plans = []
                 for row in rows:
-                    try:
-                        plan = BenefitsPlan(
-                            id=str(row[0]),  # id
-                            name=row[1] or "",  # name
-                            plan_type=PlanType(row[2].lower()),  # plan_type
-                            coverage_level=row[3] or "Employee",  # coverage_level
-                            employee_cost=float(row[4] or 0),  # employee_cost
-                            employer_cost=float(row[5] or 0),  # employer_cost
-                        )
+                    plan = self._map_benefits_row(row)
+                    if plan is not None:
                         plans.append(plan)
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Error mapping benefits row: {e}")
 
                 return plans
 
@@ -479,6 +441,102 @@ class CustomDBConnector(HRISConnector):
             logger.error(f"Database query failed: {e}")
             raise ConnectionError(f"Database query failed: {e}")
 
+    def get_employees(self, employee_ids: Iterable[str]) -> Dict[str, Employee]:
+        """
+        Retrieve several employees with ``WHERE id IN (...)`` queries.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> Employee; unknown IDs are omitted
+
+        Raises:
+            ConnectionError: If unable to connect to database
+        """
+        table = self.schema_mapping.get("employee_table")
+        id_col = self.schema_mapping.get("id_column")
+
+        if not table or not id_col:
+            raise ConnectorError("schema_mapping missing employee_table or id_column")
+
+        stmt = self._statement(
+            "employees_in",
+            lambda: f"SELECT * FROM {table} WHERE {id_col} IN :ids",
+            expanding=("ids",),
+        )
+        employees: Dict[str, Employee] = {}
+        for row in self._select_in(stmt, employee_ids):
+            employee = self._map_employee_row(row)
+            employees[employee.id] = employee
+        return employees
+
+    def get_leave_balances(self, employee_ids: Iterable[str]) -> Dict[str, List[LeaveBalance]]:
+        """
+        Get leave balances for several employees with ``IN (...)`` queries.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> LeaveBalance list (empty for IDs with no rows)
+
+        Raises:
+            ConnectionError: If unable to connect to database
+        """
+        table = self.schema_mapping.get("leave_balance_table")
+        ids = unique_ids(employee_ids)
+        balances: Dict[str, List[LeaveBalance]] = {employee_id: [] for employee_id in ids}
+        if not table:
+            logger.warning("leave_balance_table not in schema_mapping")
+            return balances
+
+        stmt = self._statement(
+            "leave_balances_in",
+            lambda: f"SELECT * FROM {table} WHERE employee_id IN :ids",
+            expanding=("ids",),
+        )
+        for row in self._select_in(stmt, ids):
+            employee_id = str(row._mapping["employee_id"])
+            try:
+                balances.setdefault(employee_id, []).append(
+                    self._map_leave_balance_row(row, employee_id)
+                )
+            except (IndexError, ValueError) as e:
+                logger.warning(f"Error mapping leave balance row: {e}")
+        return balances
+
+    def get_benefits_bulk(self, employee_ids: Iterable[str]) -> Dict[str, List[BenefitsPlan]]:
+        """
+        Get benefits plans for several employees with ``IN (...)`` queries.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> BenefitsPlan list (empty for IDs with no rows)
+
+        Raises:
+            ConnectionError: If unable to connect to database
+        """
+        table = self.schema_mapping.get("benefits_table")
+        ids = unique_ids(employee_ids)
+        plans: Dict[str, List[BenefitsPlan]] = {employee_id: [] for employee_id in ids}
+        if not table:
+            logger.warning("benefits_table not in schema_mapping")
+            return plans
+
+        stmt = self._statement(
+            "benefits_in",
+            lambda: f"SELECT * FROM {table} WHERE employee_id IN :ids",
+            expanding=("ids",),
+        )
+        for row in self._select_in(stmt, ids):
+            plan = self._map_benefits_row(row)
+            if plan is not None:
+                plans.setdefault(str(row._mapping["employee_id"]), []).append(plan)
+        return plans
+
     def health_check(self) -> bool:
         """
         Check if connector can reach database.
@@ -505,6 +563,175 @@ class CustomDBConnector(HRISConnector):
     # Helper Methods
     # ========================================================================
 
+    def _statement(
+        self, key: Hashable, build: Callable[[], str], expanding: Iterable[str] = ()
+    ) -> TextClause:
+        """
+        Get a cached statement, building its SQL text on first use.
+
+        Table and column names come from schema_mapping, which is fixed for
+        the connector's lifetime, so each query shape is built only once.
+
+        Args:
+            key: Query shape (name plus anything that changes the SQL)
+            build: Returns the SQL text
+            expanding: Parameters bound as expanding IN lists
+
+        Returns:
+            TextClause ready to execute
+        """
+        stmt = self._statements.get(key)
+        if stmt is None:
+            stmt = text(build())
+            if expanding:
+                stmt = stmt.bindparams(*(bindparam(name, expanding=True) for name in expanding))
+            self._statements[key] = stmt
+        return stmt
+
+    def _stream(self, stmt: TextClause, params: Dict[str, Any]) -> Iterator[Any]:
+        """
+        Yield rows from a server-side cursor, ``fetch_size`` rows per round trip.
+
+        The connection is returned to the pool when the generator is
+        exhausted or closed.
+
+        Args:
+            stmt: Statement to execute
+            params: Bind parameters
+
+        Yields:
+            Result rows
+
+        Raises:
+            ConnectionError: If the query fails
+        """
+        try:
+            with self.engine.connect() as conn:
+                result = conn.execution_options(yield_per=self.fetch_size).execute(stmt, params)
+                yield from result
+        except SQLAlchemyError as e:
+            logger.error(f"Database query failed: {e}")
+            raise ConnectionError(f"Database query failed: {e}")
+
+    def _org_chart_sql(self, scoped: bool) -> str:
+        """
+        Build the recursive org chart CTE.
+
+        Rows carry (id, first name, last name, title, department, manager id,
+        level) and come back in level order.
+
+        Args:
+            scoped: Anchor at the heads of :department instead of top-level
+                employees
+
+        Returns:
+            SQL text
+        """
+        table = self.schema_mapping.get("employee_table")
+        id_col = self.schema_mapping.get("id_column")
+        manager_col = self.schema_mapping.get("manager_id_column", "manager_id")
+        first_name_col = self.schema_mapping.get("first_name_column", "first_name")
+        last_name_col = self.schema_mapping.get("last_name_column", "last_name")
+        title_col = self.schema_mapping.get("job_title_column", "job_title")
+        dept_col = self.schema_mapping.get("department_column", "department")
+        columns = (
+            f"{id_col}, {first_name_col}, {last_name_col}, {title_col}, {dept_col}, {manager_col}"
+        )
+        if scoped:
+            anchor = (
+                f"{dept_col} = :department AND ({manager_col} IS NULL OR {manager_col} NOT IN "
+                f"(SELECT {id_col} FROM {table} WHERE {dept_col} = :department "
+                f"AND {id_col} IS NOT NULL))"
+            )
+        else:
+            anchor = f"{manager_col} IS NULL"
+        return f"""
+            WITH RECURSIVE org_tree AS (
+                SELECT {columns}, 0 AS level
+                FROM {table}
+                WHERE {anchor}
+
+                UNION ALL
+
+                SELECT
+                    e.{id_col},
+                    e.{first_name_col},
+                    e.{last_name_col},
+                    e.{title_col},
+                    e.{dept_col},
+                    e.{manager_col},
+                    ot.level + 1
+                FROM {table} e
+                INNER JOIN org_tree ot ON e.{manager_col} = ot.{id_col}
+                WHERE ot.level < :max_depth
+            )
+            SELECT * FROM org_tree
+            ORDER BY level, {id_col}
+        """
+
+    def _select_in(self, stmt: TextClause, employee_ids: Iterable[str]) -> List[Any]:
+        """
+        Run a query with an expanding ``:ids`` parameter, batch_size IDs at a time.
+
+        Args:
+            stmt: Statement containing ``IN :ids``
+            employee_ids: Employee IDs to bind
+
+        Returns:
+            Rows from every chunk
+
+        Raises:
+            ConnectionError: If unable to connect to database
+        """
+        ids = unique_ids(employee_ids)
+        if not ids:
+            return []
+
+        rows: List[Any] = []
+        try:
+            with self.engine.connect() as conn:
+                for start in range(0, len(ids), self.batch_size):
+                    chunk = ids[start : start + self.batch_size]
+                    rows.extend(conn.execute(stmt, {"ids": chunk}).fetchall())
+        except SQLAlchemyError as e:
+            logger.error(f"Database query failed: {e}")
+            raise ConnectionError(f"Database query failed: {e}")
+        return rows
+
+    @staticmethod
+    def _map_leave_balance_row(row: Any, employee_id: str) -> LeaveBalance:
+        """
+        Map a leave balance row (id, employee_id, leave_type, total, used,
+        pending, available) to a LeaveBalance.
+
+        Raises:
+            IndexError, ValueError: If the row cannot be mapped
+        """
+        return LeaveBalance(
+            employee_id=employee_id,
+            leave_type=LeaveType(row[2].lower()) if len(row) > 2 else LeaveType.PTO,
+            total_days=float(row[3] or 0) if len(row) > 3 else 0.0,
+            used_days=float(row[4] or 0) if len(row) > 4 else 0.0,
+            pending_days=float(row[5] or 0) if len(row) > 5 else 0.0,
+            available_days=float(row[6] or 0) if len(row) > 6 else 0.0,
+        )
+
+    @staticmethod
+    def _map_benefits_row(row: Any) -> Optional[BenefitsPlan]:
+        """Map a benefits row to a BenefitsPlan, or None if it cannot be mapped."""
+        try:
+            return BenefitsPlan(
+                id=str(row[0]),  # id
+                name=row[1] or "",  # name
+                plan_type=PlanType(row[2].lower()),  # plan_type
+                coverage_level=row[3] or "Employee",  # coverage_level
+                employee_cost=float(row[4] or 0),  # employee_cost
+                employer_cost=float(row[5] or 0),  # employer_cost
+            )
+        except (ValueError, IndexError) as e:
+            logger.warning(f"Error mapping benefits row: {e}")
+            return None
+
     def _map_employee_row(self, row: Any) -> Employee:
         """
         Map database row to Employee model.
@@ -156,12 +156,60 @@ def _create_connector() -> Tuple[HRISConnector, Dict[str, Any]]:
     )
 
 
+def _wrap_connector(
+    connector: HRISConnector, resolution: Dict[str, Any]
+) -> Tuple[HRISConnector, Dict[str, Any]]:
+    """Layer the local mirror and the read-through cache over the connector when enabled."""
+    settings = get_settings()
+    resolution = {**resolution, "mirrored": False, "cached": False}
+
+    if getattr(settings, "HRIS_MIRROR_ENABLED", False) and resolution["resolved_provider"] in {
+        "bamboohr",
+        "workday",
+    }:
+        from src.connectors.hris_mirror import HRISSyncService, MirroredHRISConnector
+
+        sync_service = HRISSyncService(connector, source=resolution["resolved_provider"])
+        sync_service.start(settings.HRIS_MIRROR_SYNC_INTERVAL_SECONDS)
+        connector = MirroredHRISConnector(
+            connector,
+            sync_service=sync_service,
+            max_staleness_seconds=settings.HRIS_MIRROR_MAX_STALENESS_SECONDS,
+        )
+        resolution["mirrored"] = True
+
+    if getattr(settings, "HRIS_CACHE_ENABLED", False):
+        from src.connectors.hris_cache import CachingHRISConnector
+
+        cache_manager = None
+        if getattr(settings, "HRIS_CACHE_SHARED", False):
+            from src.core.cache import get_cache_manager
+
+            cache_manager = get_cache_manager(settings.REDIS_URL)
+        connector = CachingHRISConnector(
+            connector,
+            cache_manager=cache_manager,
+            namespace=resolution["resolved_provider"],
+        )
+        resolution["cached"] = True
+
+    return connector, resolution
+
+
+def _stop_background_sync(connector: Optional[HRISConnector]) -> None:
+    """Stop the mirror sync thread of a connector being replaced."""
+    sync_service = getattr(connector, "sync_service", None)
+    if sync_service is not None:
+        sync_service.stop(timeout=0)
+
+
 def get_hris_connector(force_refresh: bool = False) -> HRISConnector:
     """Get active HRIS connector instance."""
     global _cached_connector, _cached_resolution
 
     if force_refresh or _cached_connector is None or _cached_resolution is None:
-        _cached_connector, _cached_resolution = _create_connector()
+        _stop_background_sync(_cached_connector)
+        _cached_connector, _cached_resolution = _wrap_connector(*_create_connector())
     return _cached_connector
 
 
@@ -175,5 +223,6 @@ def get_hris_connector_resolution(force_refresh: bool = False) -> Dict[str, Any]
 def reset_hris_connector_cache() -> None:
     """Clear connector cache (useful in tests after env changes)."""
     global _cached_connector, _cached_resolution
+    _stop_background_sync(_cached_connector)
     _cached_connector = None
     _cached_resolution = None
@@ -0,0 +1,451 @@
+"""
+HRIS-006: Read-through caching layer for HRIS connectors.
+
+CachingHRISConnector wraps any HRISConnector and caches its read methods with
+per-method policies:
+
+- ``ttl``: entries younger than this are served directly
+- ``stale_ttl``: for this long after ``ttl`` an entry is still served, while a
+  background refresh fetches a new value (stale-while-revalidate)
+- ``negative_ttl``: how long "not found" answers (NotFoundError or None) are
+  remembered
+
+Entries live in a bounded in-process LRU. When a CacheManager is supplied it is
+used as a shared second tier, so several workers reuse each other's lookups.
+A successful ``submit_leave_request`` invalidates that employee's balances and
+leave requests. Batch reads (``get_employees`` ...) share the per-ID entries of
+the single-ID methods and send only the misses to the wrapped connector.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .hris_interface import (
+    BenefitsPlan,
+    Employee,
+    EmployeeChangeSet,
+    HRISConnector,
+    LeaveBalance,
+    LeaveRequest,
+    LeaveStatus,
+    NotFoundError,
+    OrgNode,
+    unique_ids,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching rules for one connector method (all durations in seconds)."""
+
+    ttl: float
+    stale_ttl: float = 0.0
+    negative_ttl: float = 0.0
+
+
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "get_employee": CachePolicy(ttl=300, stale_ttl=600, negative_ttl=60),
+    "get_leave_balance": CachePolicy(ttl=60, stale_ttl=120, negative_ttl=30),
+    "get_benefits": CachePolicy(ttl=3600, stale_ttl=3600, negative_ttl=300),
+    "get_leave_requests": CachePolicy(ttl=30, negative_ttl=30),
+    "search_employees": CachePolicy(ttl=120, stale_ttl=240),
+    "get_org_chart": CachePolicy(ttl=600, stale_ttl=1200),
+}
+
+# Return model per cached method: (model class, returns a list)
+_RETURN_TYPES: Dict[str, Tuple[Type[BaseModel], bool]] = {
+    "get_employee": (Employee, False),
+    "get_leave_balance": (LeaveBalance, True),
+    "get_benefits": (BenefitsPlan, True),
+    "get_leave_requests": (LeaveRequest, True),
+    "search_employees": (Employee, True),
+    "get_org_chart": (OrgNode, True),
+}
+
+_MISSING = "missing"
+_VALUE = "value"
+_COUNTERS = ("hits", "stale_hits", "negative_hits", "misses", "refreshes", "refresh_errors")
+
+
+@dataclass
+class _Entry:
+    kind: str  # _VALUE or _MISSING
+    value: Any
+    stored_at: float
+    error: Optional[str] = None
+
+
+class CachingHRISConnector(HRISConnector):
+    """
+    HRISConnector decorator adding read-through TTL caching.
+
+    Attributes:
+        connector: Wrapped connector
+        policies: CachePolicy per cached method name
+        namespace: Key prefix for the shared cache tier
+    """
+
+    def __init__(
+        self,
+        connector: HRISConnector,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        cache_manager: Optional[Any] = None,
+        namespace: Optional[str] = None,
+        max_entries: int = 10000,
+        refresh_workers: int = 2,
+    ) -> None:
+        """
+        Initialize caching connector.
+
+        Args:
+            connector: Connector to wrap
+            policies: Overrides for DEFAULT_CACHE_POLICIES (methods absent from
+                the merged mapping are not cached)
+            cache_manager: Optional CacheManager used as a shared second tier
+            namespace: Key prefix for the shared tier (defaults to the
+                wrapped connector's class name)
+            max_entries: Capacity of the in-process LRU
+            refresh_workers: Threads used for background refreshes
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.connector = connector
+        self.policies: Dict[str, CachePolicy] = {**DEFAULT_CACHE_POLICIES, **(policies or {})}
+        self.cache_manager = cache_manager
+        self.namespace = namespace or connector.__class__.__name__.lower()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self._refresh_workers = refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats: Dict[str, Dict[str, int]] = {}
+        # Bumped on every invalidation so in-flight loads cannot resurrect stale data
+        self._invalidation_seq = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose attributes of the wrapped connector (last_health_error, sync_service, ...)
+        if name == "connector":
+            raise AttributeError(name)
+        return getattr(self.connector, name)
+
+    # ----- cached reads -----
+
+    def get_employee(self, employee_id: str) -> Optional[Employee]:
+        return self._cached("get_employee", (employee_id,), str(employee_id))
+
+    def search_employees(self, filters: Dict[str, Any]) -> List[Employee]:
+        key = json.dumps(filters, sort_keys=True, default=str)
+        return self._cached("search_employees", (filters,), key)
+
+    def get_leave_balance(self, employee_id: str) -> List[LeaveBalance]:
+        return self._cached("get_leave_balance", (employee_id,), str(employee_id))
+
+    def get_leave_requests(
+        self, employee_id: str, status: Optional[str] = None
+    ) -> List[LeaveRequest]:
+        return self._cached(
+            "get_leave_requests", (employee_id, status), f"{employee_id}:{status or ''}"
+        )
+
+    def get_org_chart(self, department: Optional[str] = None) -> List[OrgNode]:
+        return self._cached("get_org_chart", (department,), department or "")
+
+    def get_benefits(self, employee_id: str) -> List[BenefitsPlan]:
+        return self._cached("get_benefits", (employee_id,), str(employee_id))
+
+    # ----- cached batch reads (share entries with the single-ID methods) -----
+
+    def get_employees(self, employee_ids: Iterable[str]) -> Dict[str, Employee]:
+        return self._cached_batch("get_employee", "get_employees", employee_ids)
+
+    def get_leave_balances(self, employee_ids: Iterable[str]) -> Dict[str, List[LeaveBalance]]:
+        return self._cached_batch("get_leave_balance", "get_leave_balances", employee_ids)
+
+    def get_benefits_bulk(self, employee_ids: Iterable[str]) -> Dict[str, List[BenefitsPlan]]:
+        return self._cached_batch("get_benefits", "get_benefits_bulk", employee_ids)
+
+    # ----- writes -----
+
+    def submit_leave_request(self, request: LeaveRequest) -> LeaveRequest:
+        result = self.connector.submit_leave_request(request)
+        self.invalidate_employee(request.employee_id)
+        return result
+
+    def get_employee_changes(self, since: str) -> Optional[EmployeeChangeSet]:
+        return self.connector.get_employee_changes(since)
+
+    def health_check(self) -> bool:
+        return self.connector.health_check()
+
+    # ----- cache management -----
+
+    def invalidate(self, method: str, arg_key: str = "") -> None:
+        """
+        Drop one cached entry.
+
+        Args:
+            method: Cached method name
+            arg_key: Argument key (employee ID, department, ...)
+        """
+        key = self._key(method, arg_key)
+        with self._lock:
+            self._invalidation_seq += 1
+            self._entries.pop(key, None)
+        if self.cache_manager is not None:
+            self.cache_manager.delete(key)
+        self._count(method, "invalidations")
+
+    def invalidate_employee(self, employee_id: str) -> None:
+        """
+        Drop cached leave data for an employee after a write.
+
+        Args:
+            employee_id: Employee ID
+        """
+        self.invalidate("get_leave_balance", str(employee_id))
+        for status in [""] + [s.value for s in LeaveStatus]:
+            self.invalidate("get_leave_requests", f"{employee_id}:{status}")
+
+    def clear(self) -> None:
+        """Drop every in-process entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-method cache metrics.
+
+        Returns:
+            Dict of method -> counters (hits, stale_hits, negative_hits,
+            misses, refreshes, refresh_errors, invalidations) plus hit_rate
+        """
+        with self._lock:
+            stats = {method: dict(counters) for method, counters in self._stats.items()}
+            stats["_cache"] = {"entries": len(self._entries), "max_entries": self.max_entries}
+        for method, counters in stats.items():
+            if method == "_cache":
+                continue
+            served = counters["hits"] + counters["stale_hits"] + counters["negative_hits"]
+            total = served + counters["misses"]
+            counters["hit_rate"] = round(served / total, 4) if total else 0.0
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop the background refresh pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ----- internals -----
+
+    def _cached(self, method: str, args: tuple, arg_key: str) -> Any:
+        policy = self.policies.get(method)
+        fetch = getattr(self.connector, method)
+        if policy is None:
+            return fetch(*args)
+
+        key = self._key(method, arg_key)
+        entry = self._lookup(method, key)
+        state = self._classify(entry, policy)
+        if state is not None:
+            self._count(method, state)
+            if state == "stale_hits":
+                self._schedule_refresh(method, key, fetch, args)
+            return self._serve(entry)
+
+        self._count(method, "misses")
+        return self._serve(self._load(method, key, fetch, args))
+
+    def _cached_batch(self, method: str, batch_method: str, employee_ids: Iterable[str]) -> Dict:
+        """Serve a batch from per-ID entries and fetch only the misses in one batch call."""
+        ids = unique_ids(employee_ids)
+        policy = self.policies.get(method)
+        if policy is None:
+            return getattr(self.connector, batch_method)(ids)
+
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        for emp_id in ids:
+            key = self._key(method, emp_id)
+            entry = self._lookup(method, key)
+            state = self._classify(entry, policy)
+            if state is None:
+                missing.append(emp_id)
+                continue
+            self._count(method, state)
+            if state == "stale_hits":
+                self._schedule_refresh(method, key, getattr(self.connector, method), (emp_id,))
+            if entry.kind == _VALUE:
+                results[emp_id] = self._serve(entry)
+
+        if missing:
+            seq = self._invalidation_seq
+            fetched = getattr(self.connector, batch_method)(missing)
+            now = time.time()
+            # Batches omit unknown IDs; list methods raise NotFoundError for them
+            # one ID at a time, so their negative entries must replay that
+            returns_list = _RETURN_TYPES[method][1]
+            for emp_id in missing:
+                self._count(method, "misses")
+                value = fetched.get(emp_id)
+                if value is not None:
+                    entry = _Entry(_VALUE, value, now)
+                elif returns_list:
+                    entry = _Entry(_MISSING, None, now, error=f"Employee not found: {emp_id}")
+                else:
+                    entry = _Entry(_MISSING, None, now)
+                if (entry.kind == _VALUE or policy.negative_ttl > 0) and (
+                    seq == self._invalidation_seq
+                ):
+                    self._store(method, self._key(method, emp_id), entry)
+                if value is not None:
+                    results[emp_id] = self._serve(entry)
+
+        return {emp_id: results[emp_id] for emp_id in ids if emp_id in results}
+
+    @staticmethod
+    def _classify(entry: Optional[_Entry], policy: CachePolicy) -> Optional[str]:
+        """Name the counter an entry is served under, or None if it must be reloaded."""
+        if entry is None:
+            return None
+        age = time.time() - entry.stored_at
+        if entry.kind == _MISSING:
+            return "negative_hits" if age < policy.negative_ttl else None
+        if age < policy.ttl:
+            return "hits"
+        if age < policy.ttl + policy.stale_ttl:
+            return "stale_hits"
+        return None
+
+    def _load(self, method: str, key: str, fetch: Callable, args: tuple) -> _Entry:
+        """Call the wrapped connector and store the outcome."""
+        seq = self._invalidation_seq
+        try:
+            value = fetch(*args)
+        except NotFoundError as e:
+            entry = _Entry(_MISSING, None, time.time(), error=str(e))
+        else:
+            kind = _MISSING if value is None else _VALUE
+            entry = _Entry(kind, value, time.time())
+
+        policy = self.policies[method]
+        if (entry.kind == _VALUE or policy.negative_ttl > 0) and seq == self._invalidation_seq:
+            self._store(method, key, entry)
+        return entry
+
+    def _schedule_refresh(self, method: str, key: str, fetch: Callable, args: tuple) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers, thread_name_prefix="hris-cache-refresh"
+                )
+            executor = self._executor
+
+        def refresh() -> None:
+            try:
+                self._load(method, key, fetch, args)
+                self._count(method, "refreshes")
+            except Exception as e:
+                # Keep serving the stale entry; the next read past stale_ttl retries inline
+                self._count(method, "refresh_errors")
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(refresh)
+
+    def _lookup(self, method: str, key: str) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.cache_manager is None:
+            return None
+        raw = self.cache_manager.get(key)
+        if not raw:
+            return None
+        try:
+            entry = self._decode(method, raw)
+        except Exception as e:
+            logger.warning(f"Discarding undecodable cache entry {key}: {e}")
+            return None
+        self._store_local(key, entry)
+        return entry
+
+    def _store(self, method: str, key: str, entry: _Entry) -> None:
+        self._store_local(key, entry)
+        if self.cache_manager is not None:
+            policy = self.policies[method]
+            lifetime = (
+                policy.negative_ttl if entry.kind == _MISSING else policy.ttl + policy.stale_ttl
+            )
+            self.cache_manager.set(key, self._encode(entry), ttl=max(int(lifetime), 1))
+
+    def _store_local(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _serve(entry: _Entry) -> Any:
+        """Return a cached value; copies keep callers from mutating the cache."""
+        if entry.kind == _MISSING:
+            if entry.error is not None:
+                raise NotFoundError(entry.error)
+            return None
+        value = entry.value
+        if isinstance(value, list):
+            return [item.model_copy() if isinstance(item, BaseModel) else item for item in value]
+        if isinstance(value, BaseModel):
+            return value.model_copy()
+        return value
+
+    @staticmethod
+    def _encode(entry: _Entry) -> Dict[str, Any]:
+        value = entry.value
+        if isinstance(value, list):
+            value = [v.model_dump(mode="json") if isinstance(v, BaseModel) else v for v in value]
+        elif isinstance(value, BaseModel):
+            value = value.model_dump(mode="json")
+        return {"kind": entry.kind, "value": value, "at": entry.stored_at, "error": entry.error}
+
+    @staticmethod
+    def _decode(method: str, raw: Dict[str, Any]) -> _Entry:
+        value = raw.get("value")
+        if raw["kind"] == _VALUE:
+            model, is_list = _RETURN_TYPES[method]
+            if is_list:
+                value = [model.model_validate(v) for v in value]
+            else:
+                value = model.model_validate(value)
+        return _Entry(raw["kind"], value, float(raw["at"]), error=raw.get("error"))
+
+    def _key(self, method: str, arg_key: str) -> str:
+        return f"hris:{self.namespace}:{method}:{arg_key}"
+
+    def _count(self, method: str, counter: str) -> None:
+        with self._lock:
+            counters = self._stats.get(method)
+            if counters is None:
+                counters = {name: 0 for name in _COUNTERS}
+                counters["invalidations"] = 0
+                self._stats[method] = counters
+            counters[counter] += 1
@@ -6,9 +6,10 @@ providing a unified interface for interacting with different HR information syst
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================================
@@ -170,10 +171,33 @@ class BenefitsPlan(BaseModel):
     model_config = ConfigDict(use_enum_values=False)
 
 
+class EmployeeChangeSet(BaseModel):
+    """Employees changed since a sync cursor."""
+
+    updated: List[Employee] = Field(default_factory=list, description="Created or updated")
+    deleted_ids: List[str] = Field(default_factory=list, description="Removed employee IDs")
+    cursor: str = Field(..., description="Cursor to pass to the next delta request")
+
+
 # ============================================================================
 # Abstract Base Class
 # ============================================================================
 
+T = TypeVar("T")
+
+
+def unique_ids(employee_ids: Iterable[Any]) -> List[str]:
+    """
+    Normalize a batch of employee IDs to unique strings, keeping first-seen order.
+
+    Args:
+        employee_ids: Employee IDs (any type convertible to str)
+
+    Returns:
+        De-duplicated list of string IDs
+    """
+    return list(dict.fromkeys(str(employee_id) for employee_id in employee_ids))
+
 
 class HRISConnector(ABC):
     """
@@ -181,8 +205,16 @@ class HRISConnector(ABC):
 
     This class defines the interface that all HRIS connector implementations
     must follow, ensuring consistent interaction with different HR systems.
+
+    The batch methods (``get_employees``, ``get_leave_balances``,
+    ``get_benefits_bulk``) default to a concurrent fan-out over the single-ID
+    methods; connectors override them with vendor bulk endpoints or set-based
+    queries where available.
     """
 
+    # Concurrent single-ID calls issued by the default batch implementations
+    batch_max_workers: int = 8
+
     @abstractmethod
     def get_employee(self, employee_id: str) -> Optional[Employee]:
         """
@@ -305,6 +337,103 @@ class HRISConnector(ABC):
         """
         pass
 
+    def get_employees(self, employee_ids: Iterable[str]) -> Dict[str, Employee]:
+        """
+        Retrieve several employees at once.
+
+        Args:
+            employee_ids: Employee IDs to retrieve
+
+        Returns:
+            Dict of employee ID -> Employee; IDs that do not exist are omitted
+
+        Raises:
+            ConnectionError: If unable to connect to HRIS
+            AuthenticationError: If authentication fails
+        """
+        found = self._fan_out(self.get_employee, employee_ids)
+        return {emp_id: emp for emp_id, emp in found.items() if emp is not None}
+
+    def get_leave_balances(self, employee_ids: Iterable[str]) -> Dict[str, List[LeaveBalance]]:
+        """
+        Get leave balances for several employees at once.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> LeaveBalance list; IDs that do not exist
+            are omitted
+
+        Raises:
+            ConnectionError: If unable to connect to HRIS
+        """
+        return self._fan_out(self.get_leave_balance, employee_ids)
+
+    def get_benefits_bulk(self, employee_ids: Iterable[str]) -> Dict[str, List[BenefitsPlan]]:
+        """
+        Get benefits plans for several employees at once.
+
+        Args:
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> BenefitsPlan list; IDs that do not exist
+            are omitted
+
+        Raises:
+            ConnectionError: If unable to connect to HRIS
+        """
+        return self._fan_out(self.get_benefits, employee_ids)
+
+    def _fan_out(self, fetch: Callable[[str], T], employee_ids: Iterable[str]) -> Dict[str, T]:
+        """
+        Call a single-ID method for every ID, concurrently when there are several.
+
+        NotFoundError drops the ID from the result; any other error is
+        re-raised, as it would be from a plain loop.
+
+        Args:
+            fetch: Single-ID connector method
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> fetch result, in input order
+        """
+        ids = unique_ids(employee_ids)
+
+        def call(employee_id: str) -> Optional[T]:
+            try:
+                return fetch(employee_id)
+            except NotFoundError:
+                return None
+
+        if len(ids) <= 1 or self.batch_max_workers <= 1:
+            results = [call(employee_id) for employee_id in ids]
+        else:
+            workers = min(self.batch_max_workers, len(ids))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hris-batch") as pool:
+                results = list(pool.map(call, ids))
+
+        return {
+            employee_id: result for employee_id, result in zip(ids, results) if result is not None
+        }
+
+    def get_employee_changes(self, since: str) -> Optional[EmployeeChangeSet]:
+        """
+        Get employees changed since a cursor (optional capability).
+
+        Connectors whose vendor API exposes change feeds override this so
+        mirrors can sync incrementally.
+
+        Args:
+            since: Cursor returned by the previous call (ISO-8601 timestamp)
+
+        Returns:
+            EmployeeChangeSet, or None if delta sync is not supported
+        """
+        return None
+
     @abstractmethod
     def health_check(self) -> bool:
         """
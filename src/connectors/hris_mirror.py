@@ -0,0 +1,507 @@
+"""
+HRIS-005: Local HRIS read replica.
+
+HRISSyncService bulk-pulls employees, org structure (manager links), leave
+balances and benefits from any HRISConnector into local mirror tables. It
+uses the connector's delta feed (``get_employee_changes``) when the vendor
+supports one and falls back to a full pull otherwise.
+
+MirroredHRISConnector wraps a vendor connector: reads are answered from the
+mirror while the last successful sync is within ``max_staleness_seconds``,
+and fall through to the vendor when the mirror is stale or unavailable.
+Writes such as ``submit_leave_request`` always go to the vendor.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from .hris_interface import (
+    BenefitsPlan,
+    ConnectorError,
+    Employee,
+    EmployeeChangeSet,
+    HRISConnector,
+    LeaveBalance,
+    LeaveRequest,
+    OrgNode,
+    unique_ids,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LEAVE_BALANCES = "leave_balances"
+BENEFITS = "benefits"
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _source_name(connector: HRISConnector) -> str:
+    """Derive a mirror source name from a connector class (BambooHRConnector -> bamboohr)."""
+    name = connector.__class__.__name__
+    if name.endswith("Connector"):
+        name = name[: -len("Connector")]
+    return name.lower()
+
+
+class HRISSyncService:
+    """
+    Bulk sync of one HRISConnector into the local mirror.
+
+    Attributes:
+        connector: Vendor connector to pull from
+        source: Mirror source name the rows are stored under
+        batch_size: Rows per write transaction
+        sync_details: Also mirror leave balances and benefits
+    """
+
+    def __init__(
+        self,
+        connector: HRISConnector,
+        source: Optional[str] = None,
+        repository: Optional[Any] = None,
+        batch_size: int = 500,
+        sync_details: bool = True,
+    ) -> None:
+        """
+        Initialize sync service.
+
+        Args:
+            connector: Vendor connector to pull from
+            source: Mirror source name (defaults to the connector class name)
+            repository: HRISMirrorRepository (created on demand if None)
+            batch_size: Rows per write transaction
+            sync_details: Also mirror leave balances and benefits
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.connector = connector
+        self.source = source or _source_name(connector)
+        self.batch_size = batch_size
+        self.sync_details = sync_details
+        self._repository = repository
+        self._sync_lock = threading.Lock()
+        self._last_synced_at: Optional[datetime] = None
+        self._state_loaded = False
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def repository(self):
+        """HRISMirrorRepository backing the mirror."""
+        if self._repository is None:
+            from src.repositories.hris_mirror_repository import HRISMirrorRepository
+
+            self._repository = HRISMirrorRepository()
+        return self._repository
+
+    @property
+    def last_synced_at(self) -> Optional[datetime]:
+        """Completion time of the last successful sync (None if never synced)."""
+        if not self._state_loaded:
+            self.reload_state()
+        return self._last_synced_at
+
+    def reload_state(self) -> Optional[datetime]:
+        """
+        Re-read sync bookkeeping (picks up syncs run by other processes).
+
+        Returns:
+            Completion time of the last successful sync
+        """
+        try:
+            state = self.repository.get_sync_state(self.source)
+        except Exception as e:
+            logger.warning(f"Could not read HRIS sync state for {self.source}: {e}")
+            return self._last_synced_at
+        self._state_loaded = True
+        if state and state["last_synced_at"]:
+            if self._last_synced_at is None or state["last_synced_at"] > self._last_synced_at:
+                self._last_synced_at = state["last_synced_at"]
+        return self._last_synced_at
+
+    def is_fresh(self, max_staleness_seconds: float) -> bool:
+        """
+        Check whether the mirror is within the staleness bound.
+
+        Args:
+            max_staleness_seconds: Maximum acceptable age of the last sync
+
+        Returns:
+            True if the last successful sync is recent enough
+        """
+        bound = timedelta(seconds=max_staleness_seconds)
+        now = datetime.utcnow()
+        last = self.last_synced_at
+        if last is not None and now - last <= bound:
+            return True
+        # Another process may have synced since we last looked
+        last = self.reload_state()
+        return last is not None and now - last <= bound
+
+    def sync(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Pull changes from the connector into the mirror.
+
+        Runs a delta sync from the stored cursor when the connector supports
+        one, otherwise (or when ``full`` is set) a full pull that also removes
+        employees no longer returned by the vendor.
+
+        Args:
+            full: Force a full sync
+
+        Returns:
+            Summary dict with source, mode, employees_synced, employees_deleted,
+            records_synced and duration_seconds
+
+        Raises:
+            ConnectorError: If the sync fails (the previous cursor is kept)
+        """
+        with self._sync_lock:
+            started = datetime.utcnow()
+            state = self.repository.get_sync_state(self.source)
+            cursor = None if full or not state else state["cursor"]
+
+            try:
+                changes = self.connector.get_employee_changes(cursor) if cursor else None
+                if changes is None:
+                    mode = "full"
+                    employees = self.connector.search_employees({})
+                    returned = {employee.id for employee in employees}
+                    deleted_ids = [
+                        emp_id
+                        for emp_id in self.repository.list_employee_ids(self.source)
+                        if emp_id not in returned
+                    ]
+                    next_cursor = started.replace(microsecond=0).isoformat()
+                else:
+                    mode = "delta"
+                    employees = changes.updated
+                    deleted_ids = changes.deleted_ids
+                    next_cursor = changes.cursor
+
+                for chunk in _chunks(employees, self.batch_size):
+                    self.repository.upsert_employees(
+                        self.source, [e.model_dump(mode="json") for e in chunk], started
+                    )
+                for chunk in _chunks(deleted_ids, self.batch_size):
+                    self.repository.delete_employees(self.source, chunk)
+
+                records = 0
+                if self.sync_details:
+                    records = self._sync_details([e.id for e in employees], started)
+
+                finished = datetime.utcnow()
+                self.repository.save_sync_state(
+                    self.source, next_cursor, finished, full=(mode == "full")
+                )
+            except Exception as e:
+                logger.error(f"HRIS sync failed for {self.source}: {e}")
+                try:
+                    self.repository.save_sync_state(self.source, None, None, error=str(e))
+                except Exception as state_error:
+                    logger.error(f"Could not record HRIS sync failure: {state_error}")
+                raise ConnectorError(f"HRIS sync failed for {self.source}: {e}")
+
+            self._last_synced_at = finished
+            self._state_loaded = True
+            summary = {
+                "source": self.source,
+                "mode": mode,
+                "employees_synced": len(employees),
+                "employees_deleted": len(deleted_ids),
+                "records_synced": records,
+                "duration_seconds": (finished - started).total_seconds(),
+            }
+            logger.info(f"HRIS sync complete: {summary}")
+            return summary
+
+    def refresh_employee_records(self, employee_id: str) -> None:
+        """
+        Re-mirror one employee's leave balances and benefits.
+
+        Args:
+            employee_id: Employee ID
+        """
+        self._sync_details([employee_id], datetime.utcnow())
+
+    def start(self, interval_seconds: float) -> None:
+        """
+        Run sync periodically on a background thread.
+
+        Args:
+            interval_seconds: Seconds between sync runs
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_periodic,
+            args=(interval_seconds, self._stop_event),
+            name=f"hris-sync-{self.source}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"HRIS sync for {self.source} scheduled every {interval_seconds}s")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the periodic sync thread.
+
+        Args:
+            timeout: Max seconds to wait for a running sync to finish
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run_periodic(self, interval_seconds: float, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                self.sync()
+            except ConnectorError:
+                pass  # already logged and recorded; retry next interval
+            stop_event.wait(interval_seconds)
+
+    def _sync_details(self, employee_ids: Iterable[str], synced_at: datetime) -> int:
+        """Mirror leave balances and benefits for the given employees."""
+        written = 0
+        for chunk in _chunks(list(employee_ids), self.batch_size):
+            try:
+                balances = {
+                    employee_id: [b.model_dump(mode="json") for b in items]
+                    for employee_id, items in self.connector.get_leave_balances(chunk).items()
+                }
+                benefits = {
+                    employee_id: [p.model_dump(mode="json") for p in items]
+                    for employee_id, items in self.connector.get_benefits_bulk(chunk).items()
+                }
+            except Exception as e:
+                logger.warning(f"Skipping HRIS details for {len(chunk)} employees: {e}")
+                continue
+            written += self.repository.replace_records(
+                self.source, LEAVE_BALANCES, balances, synced_at
+            )
+            written += self.repository.replace_records(self.source, BENEFITS, benefits, synced_at)
+        return written
+
+
+class MirroredHRISConnector(HRISConnector):
+    """
+    HRISConnector that reads from the local mirror with bounded staleness.
+
+    Attributes:
+        connector: Vendor connector used for writes and stale/missing reads
+        sync_service: HRISSyncService maintaining the mirror
+        max_staleness_seconds: Oldest acceptable mirror age for reads
+        stats: mirror_hits / vendor_reads counters
+    """
+
+    def __init__(
+        self,
+        connector: HRISConnector,
+        sync_service: Optional[HRISSyncService] = None,
+        max_staleness_seconds: float = 900,
+    ) -> None:
+        """
+        Initialize mirrored connector.
+
+        Args:
+            connector: Vendor connector to wrap
+            sync_service: Sync service for the mirror (created if None)
+            max_staleness_seconds: Oldest acceptable mirror age for reads
+        """
+        self.connector = connector
+        self.sync_service = sync_service or HRISSyncService(connector)
+        self.max_staleness_seconds = max_staleness_seconds
+        self.stats = {"mirror_hits": 0, "vendor_reads": 0}
+
+    @property
+    def source(self) -> str:
+        """Mirror source name."""
+        return self.sync_service.source
+
+    @property
+    def last_health_error(self) -> str:
+        """Health error reported by the wrapped connector."""
+        return getattr(self.connector, "last_health_error", "")
+
+    def sync_now(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Run a sync immediately.
+
+        Args:
+            full: Force a full sync
+
+        Returns:
+            Sync summary from HRISSyncService.sync
+        """
+        return self.sync_service.sync(full=full)
+
+    # ----- reads -----
+
+    def get_employee(self, employee_id: str) -> Optional[Employee]:
+        payload = self._mirror_read(lambda repo: repo.get_employee(self.source, str(employee_id)))
+        if payload is not None:
+            return Employee.model_validate(payload)
+
+        # Not mirrored yet (e.g. hired since the last sync): ask the vendor
+        employee = self._vendor_read(self.connector.get_employee, employee_id)
+        if employee is not None and self._is_fresh():
+            try:
+                self.sync_service.repository.upsert_employees(
+                    self.source, [employee.model_dump(mode="json")], datetime.utcnow()
+                )
+            except Exception as e:
+                logger.warning(f"Could not mirror employee {employee_id}: {e}")
+        return employee
+
+    def search_employees(self, filters: Dict[str, Any]) -> List[Employee]:
+        payloads = self._mirror_read(lambda repo: repo.search_employees(self.source, filters))
+        if payloads is not None:
+            return [Employee.model_validate(p) for p in payloads]
+        return self._vendor_read(self.connector.search_employees, filters)
+
+    def get_leave_balance(self, employee_id: str) -> List[LeaveBalance]:
+        payloads = self._mirror_read(
+            lambda repo: repo.get_records(self.source, LEAVE_BALANCES, str(employee_id))
+        )
+        if payloads is not None:
+            return [LeaveBalance.model_validate(p) for p in payloads]
+        return self._vendor_read(self.connector.get_leave_balance, employee_id)
+
+    def get_benefits(self, employee_id: str) -> List[BenefitsPlan]:
+        payloads = self._mirror_read(
+            lambda repo: repo.get_records(self.source, BENEFITS, str(employee_id))
+        )
+        if payloads is not None:
+            return [BenefitsPlan.model_validate(p) for p in payloads]
+        return self._vendor_read(self.connector.get_benefits, employee_id)
+
+    def get_employees(self, employee_ids: Iterable[str]) -> Dict[str, Employee]:
+        ids = unique_ids(employee_ids)
+        payloads = self._mirror_read(lambda repo: repo.get_employees(self.source, ids)) or {}
+        employees = {emp_id: Employee.model_validate(p) for emp_id, p in payloads.items()}
+
+        missing = [emp_id for emp_id in ids if emp_id not in employees]
+        if missing:
+            fetched = self._vendor_read(self.connector.get_employees, missing)
+            if fetched and self._is_fresh():
+                # Mirror is fresh but lacks these employees (e.g. new hires)
+                try:
+                    self.sync_service.repository.upsert_employees(
+                        self.source,
+                        [e.model_dump(mode="json") for e in fetched.values()],
+                        datetime.utcnow(),
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not mirror {len(fetched)} employees: {e}")
+            employees.update(fetched)
+        return {emp_id: employees[emp_id] for emp_id in ids if emp_id in employees}
+
+    def get_leave_balances(self, employee_ids: Iterable[str]) -> Dict[str, List[LeaveBalance]]:
+        return self._records_bulk(
+            LEAVE_BALANCES, LeaveBalance, self.connector.get_leave_balances, employee_ids
+        )
+
+    def get_benefits_bulk(self, employee_ids: Iterable[str]) -> Dict[str, List[BenefitsPlan]]:
+        return self._records_bulk(
+            BENEFITS, BenefitsPlan, self.connector.get_benefits_bulk, employee_ids
+        )
+
+    def get_org_chart(self, department: Optional[str] = None) -> List[OrgNode]:
+        rows = self._mirror_read(lambda repo: repo.get_org_rows(self.source, department))
+        if rows is not None:
+            return self._build_org_chart(rows)
+        return self._vendor_read(self.connector.get_org_chart, department)
+
+    def get_leave_requests(
+        self, employee_id: str, status: Optional[str] = None
+    ) -> List[LeaveRequest]:
+        # Leave requests change constantly and are not mirrored
+        return self.connector.get_leave_requests(employee_id, status)
+
+    # ----- writes -----
+
+    def submit_leave_request(self, request: LeaveRequest) -> LeaveRequest:
+        result = self.connector.submit_leave_request(request)
+        # Pending days changed at the vendor; refresh the mirrored balances
+        try:
+            self.sync_service.refresh_employee_records(request.employee_id)
+        except Exception as e:
+            logger.warning(f"Could not refresh mirrored balances for {request.employee_id}: {e}")
+        return result
+
+    def get_employee_changes(self, since: str) -> Optional[EmployeeChangeSet]:
+        return self.connector.get_employee_changes(since)
+
+    def health_check(self) -> bool:
+        return self.connector.health_check()
+
+    # ----- internals -----
+
+    def _is_fresh(self) -> bool:
+        return self.sync_service.is_fresh(self.max_staleness_seconds)
+
+    def _mirror_read(self, query):
+        """Run a mirror query if the mirror is fresh; None means 'ask the vendor'."""
+        if not self._is_fresh():
+            return None
+        try:
+            result = query(self.sync_service.repository)
+        except Exception as e:
+            logger.warning(f"HRIS mirror read failed for {self.source}, using vendor: {e}")
+            return None
+        if result is not None:
+            self.stats["mirror_hits"] += 1
+        return result
+
+    def _records_bulk(self, kind: str, model, vendor_fetch, employee_ids: Iterable[str]):
+        """Serve a batch of per-employee collections, asking the vendor only for gaps."""
+        ids = unique_ids(employee_ids)
+        payloads = (
+            self._mirror_read(lambda repo: repo.get_records_bulk(self.source, kind, ids)) or {}
+        )
+        records = {
+            emp_id: [model.model_validate(p) for p in items] for emp_id, items in payloads.items()
+        }
+        missing = [emp_id for emp_id in ids if emp_id not in records]
+        if missing:
+            records.update(self._vendor_read(vendor_fetch, missing))
+        return {emp_id: records[emp_id] for emp_id in ids if emp_id in records}
+
+    def _vendor_read(self, fn, *args):
+        self.stats["vendor_reads"] += 1
+        return fn(*args)
+
+    @staticmethod
+    def _build_org_chart(rows: List[Dict[str, Any]]) -> List[OrgNode]:
+        """Build the org hierarchy from mirrored (employee, manager) rows."""
+        nodes: Dict[str, OrgNode] = {}
+        for row in rows:
+            nodes[row["employee_id"]] = OrgNode(
+                employee_id=row["employee_id"],
+                name=f"{row['first_name']} {row['last_name']}".strip(),
+                title=row["job_title"],
+                department=row["department"],
+                direct_reports=[],
+            )
+
+        roots = []
+        for row in rows:
+            node = nodes[row["employee_id"]]
+            manager = nodes.get(row["manager_id"]) if row["manager_id"] else None
+            if manager is None:
+                roots.append(node)
+            else:
+                manager.direct_reports.append(node)
+        return roots
@@ -0,0 +1,540 @@
+"""
+HRIS-007: Shared HTTP client for vendor connectors.
+
+VendorHTTPClient is the transport used by the Workday, BambooHR and Payroll
+connectors:
+
+- one keep-alive ``requests.Session`` per host, leased from the shared
+  ConnectionPoolManager so every connector draws on the same bounded pool
+- a per-host token bucket (HostRateLimiter) that paces requests to the
+  vendor's quota as reported by ``X-RateLimit-*`` headers, and pauses every
+  caller of the host while a ``Retry-After`` is in force
+- retries with exponential backoff and full jitter for 429, 5xx, timeouts
+  and connection errors
+- ``fetch_many`` for concurrent requests, bounded by the pool size
+- per-host request metrics
+
+Status handling beyond retries (404, 401, ...) stays with the connectors,
+which map responses to their own exception types.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from config.settings import get_settings
+from src.core.connection_pool import (
+    ConnectionPoolManager,
+    PoolConfig,
+    PoolType,
+    get_pool_manager,
+)
+from src.middleware.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Header spellings used by the supported vendors
+_REMAINING_HEADERS = ("X-RateLimit-Remaining", "X-Rate-Limit-Remaining")
+_LIMIT_HEADERS = ("X-RateLimit-Limit", "X-Rate-Limit-Limit")
+_RESET_HEADERS = ("X-RateLimit-Reset", "X-Rate-Limit-Reset")
+
+# Reset values above this are epoch timestamps; smaller values are seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _header(headers: Mapping[str, str], names: Iterable[str]) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta seconds or HTTP date).
+
+    Args:
+        value: Header value
+        now: Current epoch time (defaults to time.time())
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at - (now if now is not None else time.time()), 0.0)
+
+
+def host_key(url: str) -> str:
+    """Scheme and host of a URL (``https://api.example.com``)."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+@dataclass
+class HTTPRequest:
+    """One request for VendorHTTPClient.fetch_many."""
+
+    method: str
+    url: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class HostRateLimiter:
+    """
+    Thread-safe token bucket for one host, fed by the vendor's rate limit headers.
+
+    Without header data the bucket runs at ``rate_per_second`` (or unthrottled
+    when None). Once the vendor reports remaining quota and a reset time, the
+    sustained rate becomes remaining / seconds-until-reset, so concurrent
+    callers spend the quota evenly across the window instead of exhausting
+    it early.
+    """
+
+    def __init__(self, rate_per_second: Optional[float] = None, burst: int = 10) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            rate_per_second: Configured ceiling (None = limited only by headers)
+            burst: Token bucket capacity
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._bucket = TokenBucket(burst, rate_per_second) if rate_per_second else None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait_for = self._wait_time(time.time())
+                if wait_for <= 0:
+                    if self._remaining is not None:
+                        self._remaining -= 1
+                    return waited
+            wait_for = max(wait_for, 0.001)
+            time.sleep(wait_for)
+            waited += wait_for
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Adjust pacing from response headers.
+
+        Args:
+            headers: Response headers (X-RateLimit-* / X-Rate-Limit-*, Retry-After)
+        """
+        now = time.time()
+        remaining = _header(headers, _REMAINING_HEADERS)
+        reset = _header(headers, _RESET_HEADERS)
+        retry_after = parse_retry_after(headers.get("Retry-After"), now)
+        with self._lock:
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if remaining is None:
+                return
+            try:
+                self._remaining = int(float(remaining))
+            except ValueError:
+                return
+            if reset is not None:
+                try:
+                    reset_value = float(reset)
+                except ValueError:
+                    reset_value = None
+                if reset_value is not None:
+                    self._reset_at = (
+                        reset_value if reset_value > _EPOCH_THRESHOLD else now + reset_value
+                    )
+            self._repace(now)
+
+    def block_for(self, seconds: float) -> None:
+        """
+        Pause every caller of this host.
+
+        Args:
+            seconds: Pause length
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + seconds)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get limiter state for metrics.
+
+        Returns:
+            Dict with remaining quota, reset time, current rate and block time
+        """
+        with self._lock:
+            return {
+                "remaining": self._remaining,
+                "reset_at": self._reset_at,
+                "rate_per_second": self._bucket.refill_rate if self._bucket else None,
+                "blocked_for": max(self._blocked_until - time.time(), 0.0),
+            }
+
+    # ----- internals (call with the lock held) -----
+
+    def _wait_time(self, now: float) -> float:
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        if self._reset_at is not None and self._reset_at <= now:
+            # Window rolled over: quota is unknown until the next response
+            self._remaining = None
+            self._reset_at = None
+            self._repace(now)
+        if self._remaining is not None and self._remaining <= 0:
+            return (self._reset_at - now) if self._reset_at else 1.0
+        if self._bucket is None or self._bucket.consume():
+            return 0.0
+        return (1 - self._bucket.tokens) / self._bucket.refill_rate
+
+    def _repace(self, now: float) -> None:
+        rate = self.rate_per_second
+        if self._remaining is not None and self._reset_at is not None and self._reset_at > now:
+            quota_rate = max(self._remaining, 1) / (self._reset_at - now)
+            rate = min(rate, quota_rate) if rate else quota_rate
+        if rate is None:
+            self._bucket = None
+        elif self._bucket is None:
+            self._bucket = TokenBucket(self.burst, rate)
+        else:
+            self._bucket._refill()
+            self._bucket.refill_rate = rate
+
+
+class VendorHTTPClient:
+    """
+    Pooled, rate-limit-aware HTTP client shared by vendor connectors.
+
+    Attributes:
+        pool_size: Max keep-alive connections per host (also the fetch_many
+            concurrency ceiling)
+        max_retries: Retries after the first attempt for retryable failures
+        timeout: Default request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 20,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 30.0,
+        default_rate_per_second: Optional[float] = None,
+        burst: int = 10,
+        pool_manager: Optional[ConnectionPoolManager] = None,
+    ) -> None:
+        """
+        Initialize client.
+
+        Args:
+            pool_size: Max keep-alive connections per host
+            max_retries: Retries after the first attempt
+            backoff_base: Seconds; the backoff ceiling doubles per attempt
+            backoff_max: Upper bound on one backoff sleep
+            timeout: Default request timeout in seconds
+            default_rate_per_second: Rate ceiling for hosts without configure_host
+            burst: Token bucket capacity for new hosts
+            pool_manager: Shared pool manager with an HTTP pool; by default the
+                client gets a private one capped at pool_size
+        """
+        if pool_size <= 0:
+            raise ValueError("pool_size must be positive")
+        if pool_manager is None:
+            pool_manager = ConnectionPoolManager(
+                [
+                    PoolConfig(
+                        pool_type=PoolType.HTTP,
+                        connection_string="http://localhost",
+                        min_connections=1,
+                        max_connections=pool_size,
+                        max_overflow=0,
+                    )
+                ]
+            )
+        if not pool_manager.is_initialized(PoolType.HTTP):
+            pool_manager.initialize_pool(PoolType.HTTP)
+        self._pool = pool_manager
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.default_rate_per_second = default_rate_per_second
+        self.burst = burst
+        self._limiters: Dict[str, HostRateLimiter] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    # ----- per-host resources -----
+
+    def configure_host(
+        self, url: str, rate_per_second: Optional[float] = None, burst: Optional[int] = None
+    ) -> HostRateLimiter:
+        """
+        Set a host's rate ceiling (e.g. a vendor's documented limit).
+
+        Args:
+            url: Any URL on the host
+            rate_per_second: Sustained request rate (None = headers only)
+            burst: Token bucket capacity
+
+        Returns:
+            The host's new limiter
+        """
+        limiter = HostRateLimiter(rate_per_second, burst or self.burst)
+        with self._lock:
+            self._limiters[host_key(url)] = limiter
+        return limiter
+
+    def limiter_for(self, url: str) -> HostRateLimiter:
+        """
+        Get the rate limiter of a URL's host.
+
+        Args:
+            url: Any URL on the host
+
+        Returns:
+            HostRateLimiter shared by every caller of the host
+        """
+        key = host_key(url)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = HostRateLimiter(self.default_rate_per_second, self.burst)
+                self._limiters[key] = limiter
+            return limiter
+
+    def session_for(self, url: str) -> requests.Session:
+        """
+        Get the pooled keep-alive session of a URL's host.
+
+        Args:
+            url: Any URL on the host
+
+        Returns:
+            requests.Session shared through the pool manager
+        """
+        return self._pool.http_session(url)
+
+    # ----- requests -----
+
+    def request(
+        self, method: str, url: str, max_retries: Optional[int] = None, **kwargs
+    ) -> requests.Response:
+        """
+        Send a request, pacing it through the host limiter and retrying transient failures.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            max_retries: Per-call override of the client's max_retries
+            **kwargs: Passed to requests (params, json, headers, auth, timeout, ...)
+
+        Returns:
+            The final requests.Response (callers check the status code)
+
+        Raises:
+            requests.exceptions.RequestException: If the request still fails
+                with a timeout or connection error after all retries
+        """
+        key = host_key(url)
+        limiter = self.limiter_for(url)
+        kwargs.setdefault("timeout", self.timeout)
+        max_retries = self.max_retries if max_retries is None else max_retries
+
+        attempt = 0
+        while True:
+            waited = limiter.acquire()
+            started = time.time()
+            try:
+                # Hold the lease only for the attempt itself, not the backoff sleep
+                with self._pool.get_connection(PoolType.HTTP, url) as session:
+                    response = session.request(method, url, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                self._record(key, started, waited, error=True)
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url} failed ({e}); retrying in {delay:.2f}s")
+            else:
+                self._record(key, started, waited, status=response.status_code)
+                limiter.update(response.headers)
+                if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                if response.status_code == 429:
+                    # Pause every caller of the host, not just this thread
+                    limiter.block_for(delay)
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}; retrying in {delay:.2f}s"
+                )
+            attempt += 1
+            self._count(key, "retries")
+            time.sleep(delay)
+
+    def fetch_many(
+        self,
+        requests_: Iterable[HTTPRequest],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[requests.Response, Exception]]:
+        """
+        Send requests concurrently.
+
+        Concurrency is bounded by ``max_concurrency`` (default pool_size) and
+        each request still passes through its host's limiter, so a large
+        fan-out runs at the vendor's quota without exceeding it.
+
+        Args:
+            requests_: Requests to send
+            max_concurrency: Max requests in flight
+
+        Returns:
+            One Response or raised exception per request, in input order
+        """
+        items = list(requests_)
+        if not items:
+            return []
+
+        def send(item: HTTPRequest) -> Union[requests.Response, Exception]:
+            try:
+                return self.request(item.method, item.url, **item.kwargs)
+            except Exception as e:
+                return e
+
+        workers = min(max_concurrency or self.pool_size, self.pool_size, len(items))
+        if workers <= 1:
+            return [send(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vendor-http") as pool:
+            return list(pool.map(send, items))
+
+    # ----- metrics -----
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-host request metrics.
+
+        Returns:
+            Dict of host -> requests, errors, retries, rate_limited,
+            status counts, avg/max latency (ms), throttle wait and limiter state
+        """
+        with self._lock:
+            stats = {host: dict(counters) for host, counters in self._stats.items()}
+            limiters = dict(self._limiters)
+        for host, counters in stats.items():
+            requests_sent = counters["requests"]
+            counters["avg_latency_ms"] = (
+                round(counters.pop("latency_total") * 1000 / requests_sent, 2)
+                if requests_sent
+                else 0.0
+            )
+            counters["max_latency_ms"] = round(counters.pop("latency_max") * 1000, 2)
+            counters["throttle_wait_seconds"] = round(counters["throttle_wait_seconds"], 3)
+            if host in limiters:
+                counters["limiter"] = limiters[host].get_state()
+        return stats
+
+    def close(self) -> None:
+        """Close every pooled session; later requests open new ones."""
+        self._pool.drain_pool(PoolType.HTTP)
+        self._pool.initialize_pool(PoolType.HTTP)
+
+    # ----- internals -----
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    def _record(
+        self,
+        host: str,
+        started: float,
+        waited: float,
+        status: Optional[int] = None,
+        error: bool = False,
+    ) -> None:
+        latency = time.time() - started
+        with self._lock:
+            counters = self._counters(host)
+            counters["requests"] += 1
+            counters["throttle_wait_seconds"] += waited
+            counters["latency_total"] += latency
+            counters["latency_max"] = max(counters["latency_max"], latency)
+            if error or (status is not None and status >= 500):
+                counters["errors"] += 1
+            if status == 429:
+                counters["rate_limited"] += 1
+            if status is not None:
+                bucket = f"status_{status // 100}xx"
+                counters[bucket] = counters.get(bucket, 0) + 1
+
+    def _count(self, host: str, counter: str) -> None:
+        with self._lock:
+            self._counters(host)[counter] += 1
+
+    def _counters(self, host: str) -> Dict[str, float]:
+        counters = self._stats.get(host)
+        if counters is None:
+            counters = {
+                "requests": 0,
+                "errors": 0,
+                "retries": 0,
+                "rate_limited": 0,
+                "throttle_wait_seconds": 0.0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+            }
+            self._stats[host] = counters
+        return counters
+
+
+_http_client: Optional[VendorHTTPClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> VendorHTTPClient:
+    """
+    Get or create the process-wide vendor HTTP client.
+
+    Returns:
+        VendorHTTPClient shared by all connectors
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            settings = get_settings()
+            _http_client = VendorHTTPClient(
+                pool_size=getattr(settings, "VENDOR_HTTP_POOL_SIZE", 20),
+                max_retries=getattr(settings, "VENDOR_HTTP_MAX_RETRIES", 3),
+                pool_manager=get_pool_manager(),
+            )
+        return _http_client
@@ -6,8 +6,9 @@ enabling AI agents to query real employee, leave, benefits, and org data.
 """
 
 import logging
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from sqlalchemy import text
 
@@ -22,7 +23,9 @@ from .hris_interface import (
     LeaveType,
     OrgNode,
     PlanType,
+    unique_ids,
 )
+from .org_index import OrgEntry, OrgIndex
 
 logger = logging.getLogger(__name__)
 
@@ -62,9 +65,17 @@ class LocalDBConnector(HRISConnector):
     with both PostgreSQL (production) and SQLite (development).
     """
 
+    # Max IDs bound into one IN (...) clause; stays below common driver
+    # parameter limits (SQLite 999, Oracle 1000)
+    batch_size = 500
+
     def __init__(self):
         """Initialize — session factory is imported lazily to avoid circular deps."""
         self._session_factory = None
+        self._org_index: Optional[OrgIndex] = None
+        # (max(updated_at), row count) of the employees table when last synced
+        self._org_state: Optional[tuple] = None
+        self._org_lock = threading.Lock()
 
     def _get_session(self):
         """Lazy import of SessionLocal to avoid circular imports at module load."""
@@ -129,27 +140,7 @@ class LocalDBConnector(HRISConnector):
             bal = session.query(DBBalance).filter_by(employee_id=int(employee_id)).first()
             if not bal:
                 return []
-
-            balances = []
-            for leave_type, total_attr, used_attr in [
-                ("vacation", "vacation_total", "vacation_used"),
-                ("sick", "sick_total", "sick_used"),
-                ("personal", "personal_total", "personal_used"),
-            ]:
-                total = getattr(bal, total_attr, 0) or 0
-                used = getattr(bal, used_attr, 0) or 0
-                balances.append(
-                    LeaveBalance(
-                        employee_id=str(employee_id),
-                        leave_type=_map_leave_type(leave_type),
-                        total_days=total,
-                        used_days=used,
-                        pending_days=0,
-                        available_days=total - used,
-                    )
-                )
-
-            return balances
+            return self._to_leave_balances(bal)
         finally:
             session.close()
 
@@ -224,40 +215,52 @@ class LocalDBConnector(HRISConnector):
     # ------------------------------------------------------------------
 
     def get_org_chart(self, department: Optional[str] = None) -> List[OrgNode]:
+        return self.org_index().org_chart(department, exact=False)
+
+    def org_index(self) -> OrgIndex:
+        """
+        Get the org index, applying employee rows changed since the last call.
+
+        A max(updated_at)/count/sum(id) probe detects changes; rows updated
+        since the previous probe are upserted (or removed once no longer
+        active), and indexed employees whose rows no longer exist are removed,
+        so a hard delete is caught even when an insert keeps the count level.
+
+        Returns:
+            OrgIndex over active employees
+        """
+        from sqlalchemy import func
+
         from src.core.database import Employee as DBEmployee
 
         session = self._get_session()
         try:
-            query = session.query(DBEmployee).filter_by(status="active")
-            if department:
-                query = query.filter(DBEmployee.department.ilike(f"%{department}%"))
-
-            employees = query.all()
-
-            # Build parent -> children mapping
-            children_map: Dict[int, List] = {}
-            emp_map: Dict[int, Any] = {}
-            for e in employees:
-                emp_map[e.id] = e
-                parent_id = e.manager_id or 0
-                children_map.setdefault(parent_id, []).append(e)
-
-            def build_node(emp) -> OrgNode:
-                direct = children_map.get(emp.id, [])
-                return OrgNode(
-                    employee_id=str(emp.id),
-                    name=f"{emp.first_name} {emp.last_name}",
-                    title=emp.role_level.replace("_", " ").title(),
-                    department=emp.department,
-                    direct_reports=[build_node(c) for c in direct],
+            with self._org_lock:
+                state = tuple(
+                    session.query(
+                        func.max(DBEmployee.updated_at),
+                        func.count(DBEmployee.id),
+                        func.sum(DBEmployee.id),
+                    ).one()
                 )
-
-            # Return top-level nodes (no manager or manager not in result set)
-            roots = []
-            for e in employees:
-                if e.manager_id is None or e.manager_id not in emp_map:
-                    roots.append(build_node(e))
-            return roots
+                previous = self._org_state
+                if self._org_index is None or previous is None:
+                    active = session.query(DBEmployee).filter_by(status="active").all()
+                    self._org_index = OrgIndex(self._to_org_entry(e) for e in active)
+                elif state != previous:
+                    query = session.query(DBEmployee)
+                    if previous[0] is not None:
+                        query = query.filter(DBEmployee.updated_at >= previous[0])
+                    for emp in query.all():
+                        if emp.status == "active":
+                            self._org_index.upsert(self._to_org_entry(emp))
+                        else:
+                            self._org_index.remove(str(emp.id))
+                    existing = {str(emp_id) for (emp_id,) in session.query(DBEmployee.id)}
+                    for employee_id in [e for e in self._org_index if e not in existing]:
+                        self._org_index.remove(employee_id)
+                self._org_state = state
+                return self._org_index
         finally:
             session.close()
 
@@ -270,26 +273,87 @@ class LocalDBConnector(HRISConnector):
 
         session = self._get_session()
         try:
-            enrollments = (
-                session.query(BenefitsEnrollment)
-                .filter_by(employee_id=int(employee_id), status="active")
+            rows = (
+                session.query(BenefitsEnrollment, DBPlan)
+                .join(DBPlan, DBPlan.id == BenefitsEnrollment.plan_id)
+                .filter(
+                    BenefitsEnrollment.employee_id == int(employee_id),
+                    BenefitsEnrollment.status == "active",
+                )
                 .all()
             )
+            return [self._to_benefits_plan(enr, plan) for enr, plan in rows]
+        finally:
+            session.close()
 
-            plans = []
-            for enr in enrollments:
-                plan = session.query(DBPlan).filter_by(id=enr.plan_id).first()
-                if plan:
-                    plans.append(
-                        BenefitsPlan(
-                            id=str(plan.id),
-                            name=plan.plan_name,
-                            plan_type=_map_plan_type(plan.plan_type),
-                            coverage_level=enr.coverage_level,
-                            employee_cost=plan.monthly_cost or 0,
-                            employer_cost=(plan.monthly_cost or 0) * 0.8,
-                        )
-                    )
+    # ------------------------------------------------------------------
+    # Batch Operations
+    # ------------------------------------------------------------------
+
+    def get_employees(self, employee_ids: Iterable[str]) -> Dict[str, Employee]:
+        from src.core.database import Employee as DBEmployee
+
+        ids = self._int_ids(employee_ids)
+        if not ids:
+            return {}
+        session = self._get_session()
+        try:
+            rows = self._select_in(session.query(DBEmployee), DBEmployee.id, ids)
+            return {str(emp.id): self._to_employee_model(emp) for emp in rows}
+        finally:
+            session.close()
+
+    def get_leave_balances(self, employee_ids: Iterable[str]) -> Dict[str, List[LeaveBalance]]:
+        from src.core.database import Employee as DBEmployee, LeaveBalance as DBBalance
+
+        ids = self._int_ids(employee_ids)
+        if not ids:
+            return {}
+        session = self._get_session()
+        try:
+            # Outer join from employees so unknown IDs are omitted and
+            # employees without a balance row still get an empty list
+            query = session.query(DBEmployee.id, DBBalance).outerjoin(
+                DBBalance, DBBalance.employee_id == DBEmployee.id
+            )
+            rows = self._select_in(query, DBEmployee.id, ids)
+            balances: Dict[str, List[LeaveBalance]] = {}
+            for emp_id, bal in rows:
+                # Mirror get_leave_balance, which reads the first row per employee
+                if not balances.get(str(emp_id)):
+                    balances[str(emp_id)] = self._to_leave_balances(bal) if bal else []
+            return balances
+        finally:
+            session.close()
+
+    def get_benefits_bulk(self, employee_ids: Iterable[str]) -> Dict[str, List[BenefitsPlan]]:
+        from sqlalchemy import and_
+
+        from src.core.database import BenefitsEnrollment, BenefitsPlan as DBPlan
+        from src.core.database import Employee as DBEmployee
+
+        ids = self._int_ids(employee_ids)
+        if not ids:
+            return {}
+        session = self._get_session()
+        try:
+            query = (
+                session.query(DBEmployee.id, BenefitsEnrollment, DBPlan)
+                .outerjoin(
+                    BenefitsEnrollment,
+                    and_(
+                        BenefitsEnrollment.employee_id == DBEmployee.id,
+                        BenefitsEnrollment.status == "active",
+                    ),
+                )
+                .outerjoin(DBPlan, DBPlan.id == BenefitsEnrollment.plan_id)
+            )
+            rows = self._select_in(query, DBEmployee.id, ids)
+            plans: Dict[str, List[BenefitsPlan]] = {}
+            for emp_id, enr, plan in rows:
+                enrolled = plans.setdefault(str(emp_id), [])
+                if enr is not None and plan is not None:
+                    enrolled.append(self._to_benefits_plan(enr, plan))
             return plans
         finally:
             session.close()
@@ -311,6 +375,64 @@ class LocalDBConnector(HRISConnector):
     # Helper
     # ------------------------------------------------------------------
 
+    def _select_in(self, query: Any, column: Any, ids: List[int]) -> List[Any]:
+        """Run a query filtered by ``column IN (...)``, batch_size IDs at a time."""
+        rows: List[Any] = []
+        for start in range(0, len(ids), self.batch_size):
+            chunk = ids[start : start + self.batch_size]
+            rows.extend(query.filter(column.in_(chunk)).all())
+        return rows
+
+    @staticmethod
+    def _int_ids(employee_ids: Iterable[str]) -> List[int]:
+        """Convert batch IDs to integer primary keys, skipping non-numeric IDs."""
+        return [int(emp_id) for emp_id in unique_ids(employee_ids) if emp_id.strip().isdigit()]
+
+    @staticmethod
+    def _to_leave_balances(bal) -> List[LeaveBalance]:
+        """Expand a LeaveBalance row into one model per leave type."""
+        balances = []
+        for leave_type, total_attr, used_attr in [
+            ("vacation", "vacation_total", "vacation_used"),
+            ("sick", "sick_total", "sick_used"),
+            ("personal", "personal_total", "personal_used"),
+        ]:
+            total = getattr(bal, total_attr, 0) or 0
+            used = getattr(bal, used_attr, 0) or 0
+            balances.append(
+                LeaveBalance(
+                    employee_id=str(bal.employee_id),
+                    leave_type=_map_leave_type(leave_type),
+                    total_days=total,
+                    used_days=used,
+                    pending_days=0,
+                    available_days=total - used,
+                )
+            )
+        return balances
+
+    @staticmethod
+    def _to_benefits_plan(enr, plan) -> BenefitsPlan:
+        """Convert an enrollment and its plan row to the HRIS BenefitsPlan model."""
+        return BenefitsPlan(
+            id=str(plan.id),
+            name=plan.name,
+            plan_type=_map_plan_type(plan.plan_type),
+            coverage_level=enr.coverage_level,
+            employee_cost=plan.premium_monthly or 0,
+            employer_cost=(plan.premium_monthly or 0) * 0.8,
+        )
+
+    @staticmethod
+    def _to_org_entry(emp) -> OrgEntry:
+        return OrgEntry(
+            employee_id=str(emp.id),
+            name=f"{emp.first_name} {emp.last_name}",
+            title=emp.role_level.replace("_", " ").title(),
+            department=emp.department,
+            manager_id=str(emp.manager_id) if emp.manager_id else None,
+        )
+
     @staticmethod
     def _to_employee_model(emp) -> Employee:
         """Convert a SQLAlchemy Employee row to the HRIS Employee pydantic model."""
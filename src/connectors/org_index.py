@@ -0,0 +1,409 @@
+"""
+HRIS-009: In-memory org-chart index.
+
+OrgIndex keeps the reporting hierarchy (Employee.manager_id links) in memory
+so org chart and reporting-chain questions do not rebuild the tree from the
+full directory on every call.
+
+Nodes carry Euler-tour labels: a pre-order position (``tin``) and subtree
+size, so that
+
+- "is X in Y's reporting chain" is an interval check, O(1)
+- span of control (direct or total) is O(1)
+- the descendants of Y are a contiguous slice of the pre-order, O(k)
+- chain of command walks manager links, O(depth)
+
+Updates apply in place to the entries, direct-report lists and department
+sets, and attribute-only changes (name, title, department) never touch the
+labels. The labels themselves are not maintained incrementally: any
+structural change (new employee, manager change, removal) marks them stale,
+and the next query that needs them relabels the whole hierarchy, O(n). That
+cost is paid once however many updates arrived in between, so apply deltas
+as a batch (apply_changes) rather than interleaving single moves with
+chain or span queries. Only the requested subtree is serialized to OrgNode
+models.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .hris_interface import Employee, EmployeeChangeSet, OrgNode
+
+
+@dataclass
+class OrgEntry:
+    """One employee's position in the hierarchy."""
+
+    employee_id: str
+    name: str
+    title: str = ""
+    department: str = ""
+    manager_id: Optional[str] = None
+
+    @classmethod
+    def from_employee(cls, employee: Employee) -> "OrgEntry":
+        """Build an entry from an Employee model."""
+        return cls(
+            employee_id=employee.id,
+            name=f"{employee.first_name} {employee.last_name}".strip(),
+            title=employee.job_title,
+            department=employee.department,
+            manager_id=employee.manager_id or None,
+        )
+
+
+class OrgIndex:
+    """
+    Reporting hierarchy with Euler-tour labels.
+
+    Structural updates invalidate all labels, which are rebuilt in full on
+    the next labeled query (see module docstring). Thread-safe; readers and
+    writers share one lock.
+    """
+
+    def __init__(self, entries: Iterable[OrgEntry] = ()) -> None:
+        """
+        Initialize index.
+
+        Args:
+            entries: Initial employees
+        """
+        self._entries: Dict[str, OrgEntry] = {}
+        # manager ID -> ordered set of direct report IDs (dict keys keep order)
+        self._children: Dict[str, Dict[str, None]] = {}
+        self._departments: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+        self._order: List[str] = []
+        self._tin: Dict[str, int] = {}
+        self._size: Dict[str, int] = {}
+        self._roots: List[str] = []
+        self._stale = True
+        self.relabel_count = 0
+
+        for entry in entries:
+            self._link(entry)
+
+    @classmethod
+    def from_employees(cls, employees: Iterable[Employee]) -> "OrgIndex":
+        """
+        Build an index from Employee models.
+
+        Args:
+            employees: Employees to index
+
+        Returns:
+            OrgIndex
+        """
+        return cls(OrgEntry.from_employee(employee) for employee in employees)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, employee_id: object) -> bool:
+        return employee_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def get(self, employee_id: str) -> Optional[OrgEntry]:
+        """Get an employee's entry, or None if not indexed."""
+        return self._entries.get(employee_id)
+
+    # ----- updates -----
+
+    def upsert(self, entry: OrgEntry) -> None:
+        """
+        Add an employee or update their attributes and manager.
+
+        Args:
+            entry: New state of the employee
+        """
+        with self._lock:
+            current = self._entries.get(entry.employee_id)
+            if current is not None and current.manager_id == entry.manager_id:
+                if current.department != entry.department:
+                    self._unindex_department(current)
+                    self._departments.setdefault(entry.department, set()).add(entry.employee_id)
+                self._entries[entry.employee_id] = entry
+                return
+            if current is not None:
+                self._unlink(current)
+            self._link(entry)
+
+    def remove(self, employee_id: str) -> bool:
+        """
+        Remove an employee. Their direct reports become top-level nodes.
+
+        Args:
+            employee_id: Employee to remove
+
+        Returns:
+            True if the employee was indexed
+        """
+        with self._lock:
+            entry = self._entries.get(employee_id)
+            if entry is None:
+                return False
+            self._unlink(entry)
+            return True
+
+    def apply_changes(self, changes: EmployeeChangeSet) -> None:
+        """
+        Apply a connector delta (updated employees and deleted IDs).
+
+        Args:
+            changes: Change set from HRISConnector.get_employee_changes
+        """
+        with self._lock:
+            for employee in changes.updated:
+                self.upsert(OrgEntry.from_employee(employee))
+            for employee_id in changes.deleted_ids:
+                self.remove(employee_id)
+
+    # ----- queries -----
+
+    def manager_of(self, employee_id: str) -> Optional[str]:
+        """Get the indexed manager of an employee, or None for top-level nodes."""
+        entry = self._entries.get(employee_id)
+        if entry is None or entry.manager_id not in self._entries:
+            return None
+        return entry.manager_id
+
+    def chain_of_command(self, employee_id: str) -> List[str]:
+        """
+        Get an employee's managers, nearest first.
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            Manager IDs up to the top of the hierarchy (empty if unknown)
+        """
+        with self._lock:
+            chain: List[str] = []
+            seen = {employee_id}
+            manager_id = self.manager_of(employee_id)
+            while manager_id is not None and manager_id not in seen:
+                chain.append(manager_id)
+                seen.add(manager_id)
+                manager_id = self.manager_of(manager_id)
+            return chain
+
+    def is_in_chain(self, employee_id: str, manager_id: str) -> bool:
+        """
+        Check whether an employee reports to a manager, directly or indirectly.
+
+        Args:
+            employee_id: Employee ID
+            manager_id: Candidate manager ID
+
+        Returns:
+            True if manager_id is above employee_id in the hierarchy
+        """
+        with self._lock:
+            if employee_id == manager_id or employee_id not in self._entries:
+                return False
+            if manager_id not in self._entries:
+                return False
+            self._ensure_labels()
+            start = self._tin[manager_id]
+            return start < self._tin[employee_id] < start + self._size[manager_id]
+
+    def direct_reports(self, employee_id: str) -> List[str]:
+        """Get an employee's direct report IDs."""
+        with self._lock:
+            return list(self._children.get(employee_id, ()))
+
+    def descendants(self, employee_id: str) -> List[str]:
+        """
+        Get everyone in an employee's reporting subtree, in pre-order.
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            Descendant IDs (excluding the employee)
+        """
+        with self._lock:
+            if employee_id not in self._entries:
+                return []
+            self._ensure_labels()
+            start = self._tin[employee_id]
+            return self._order[start + 1 : start + self._size[employee_id]]
+
+    def span_of_control(self, employee_id: str, include_indirect: bool = False) -> int:
+        """
+        Count an employee's reports.
+
+        Args:
+            employee_id: Employee ID
+            include_indirect: Count the whole subtree instead of direct reports
+
+        Returns:
+            Number of reports
+        """
+        with self._lock:
+            if employee_id not in self._entries:
+                return 0
+            if not include_indirect:
+                return len(self._children.get(employee_id, ()))
+            self._ensure_labels()
+            return self._size[employee_id] - 1
+
+    def subtree(self, employee_id: str, max_depth: Optional[int] = None) -> Optional[OrgNode]:
+        """
+        Serialize one employee's subtree.
+
+        Args:
+            employee_id: Root of the subtree
+            max_depth: Levels of reports to include (None = all)
+
+        Returns:
+            OrgNode, or None if the employee is not indexed
+        """
+        with self._lock:
+            if employee_id not in self._entries:
+                return None
+            return self._build(employee_id, max_depth, None, set())
+
+    def org_chart(self, department: Optional[str] = None, exact: bool = True) -> List[OrgNode]:
+        """
+        Serialize the org chart, optionally limited to one department.
+
+        With a department, only its members are included, rooted at the
+        members whose manager is outside the department.
+
+        Args:
+            department: Optional department filter
+            exact: Match the department name exactly; otherwise a
+                case-insensitive substring match
+
+        Returns:
+            Top-level OrgNode objects
+        """
+        with self._lock:
+            self._ensure_labels()
+            if department is None:
+                return [self._build(root, None, None, set()) for root in self._roots]
+
+            members: Set[str] = set()
+            for name, ids in self._departments.items():
+                if name == department or (not exact and department.lower() in name.lower()):
+                    members.update(ids)
+            heads = sorted(
+                (emp_id for emp_id in members if self._entries[emp_id].manager_id not in members),
+                key=self._tin.__getitem__,
+            )
+            seen: Set[str] = set()
+            return [self._build(head, None, members.__contains__, seen) for head in heads]
+
+    # ----- internals (call with the lock held) -----
+
+    def _link(self, entry: OrgEntry) -> None:
+        self._entries[entry.employee_id] = entry
+        self._departments.setdefault(entry.department, set()).add(entry.employee_id)
+        if entry.manager_id:
+            self._children.setdefault(entry.manager_id, {})[entry.employee_id] = None
+        self._stale = True
+
+    def _unlink(self, entry: OrgEntry) -> None:
+        del self._entries[entry.employee_id]
+        self._unindex_department(entry)
+        if entry.manager_id:
+            siblings = self._children.get(entry.manager_id)
+            if siblings is not None:
+                siblings.pop(entry.employee_id, None)
+                if not siblings:
+                    del self._children[entry.manager_id]
+        self._stale = True
+
+    def _unindex_department(self, entry: OrgEntry) -> None:
+        members = self._departments.get(entry.department)
+        if members is not None:
+            members.discard(entry.employee_id)
+            if not members:
+                del self._departments[entry.department]
+
+    def _ensure_labels(self) -> None:
+        # Full relabel: moving one subtree would still shift every later interval
+        if not self._stale:
+            return
+        self._order = []
+        self._tin = {}
+        self._size = {}
+        self._roots = [
+            emp_id
+            for emp_id, entry in self._entries.items()
+            if not entry.manager_id or entry.manager_id not in self._entries
+        ]
+        for root in self._roots:
+            self._label_from(root)
+        # Anything left sits on a manager cycle; break it at an arbitrary node
+        for emp_id in self._entries:
+            if emp_id not in self._tin:
+                self._roots.append(emp_id)
+                self._label_from(emp_id)
+        self._stale = False
+        self.relabel_count += 1
+
+    def _label_from(self, root: str) -> None:
+        # Iterative DFS: (node, finished?) so deep hierarchies cannot hit the recursion limit
+        stack = [(root, False)]
+        while stack:
+            emp_id, finished = stack.pop()
+            if finished:
+                self._size[emp_id] = len(self._order) - self._tin[emp_id]
+                continue
+            if emp_id in self._tin:
+                continue
+            self._tin[emp_id] = len(self._order)
+            self._order.append(emp_id)
+            stack.append((emp_id, True))
+            children = self._children.get(emp_id, {})
+            stack.extend((child, False) for child in reversed(list(children)))
+
+    def _build(
+        self,
+        root: str,
+        max_depth: Optional[int],
+        include: Optional[Callable[[str], bool]],
+        seen: Set[str],
+    ) -> OrgNode:
+        # Iterative post-order: (node, parent, depth left, finished?); a node is
+        # created once all its reports are, so deep hierarchies cannot hit the
+        # recursion limit
+        reports: Dict[Optional[str], List[OrgNode]] = {None: []}
+        stack: List[Tuple[str, Optional[str], Optional[int], bool]] = [
+            (root, None, max_depth, False)
+        ]
+        while stack:
+            emp_id, parent, depth, finished = stack.pop()
+            if finished:
+                entry = self._entries[emp_id]
+                reports[parent].append(
+                    OrgNode(
+                        employee_id=entry.employee_id,
+                        name=entry.name,
+                        title=entry.title,
+                        department=entry.department,
+                        direct_reports=reports.pop(emp_id),
+                    )
+                )
+                continue
+            if parent is not None and emp_id in seen:
+                continue
+            seen.add(emp_id)
+            reports[emp_id] = []
+            stack.append((emp_id, parent, depth, True))
+            if depth is None or depth > 0:
+                next_depth = None if depth is None else depth - 1
+                children = [
+                    child
+                    for child in self._children.get(emp_id, ())
+                    if include is None or include(child)
+                ]
+                stack.extend((child, emp_id, next_depth, False) for child in reversed(children))
+        return reports[None][0]
@@ -0,0 +1,141 @@
+"""
+HRIS-008: Paginated iteration for vendor list endpoints.
+
+iter_records follows a vendor's pagination until the last page and yields
+raw records one at a time. The next page is requested in the background
+while the caller works through the current one, so a long listing costs
+roughly one round trip per page of caller time rather than two.
+
+Two pagination styles are recognised:
+
+- cursor: the response carries a token for the next page
+  (``next_cursor``, ``nextCursor``, ``next_page_token``, ``nextPageToken``
+  or ``paging.next_cursor``), sent back as ``cursor_param``
+- offset: the response carries ``total`` and pages are requested with
+  ``offset``/``limit`` until it is reached
+
+A response with neither is treated as the only page.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CURSOR_FIELDS = ("next_cursor", "nextCursor", "next_page_token", "nextPageToken")
+
+DEFAULT_PAGE_SIZE = 100
+
+# Stop following a vendor that keeps handing out pages (repeating cursors etc.)
+MAX_PAGES = 10_000
+
+PageFetcher = Callable[[Dict[str, Any]], Any]
+
+
+def page_items(response: Any) -> List[Dict[str, Any]]:
+    """
+    Extract the records of one page.
+
+    Args:
+        response: Parsed JSON page (``{"data": [...]}`` or a bare list)
+
+    Returns:
+        List of raw records
+    """
+    if isinstance(response, dict):
+        return response.get("data") or []
+    return response or []
+
+
+def next_page_params(
+    response: Any,
+    params: Dict[str, Any],
+    received: int,
+    cursor_param: str = "cursor",
+) -> Optional[Dict[str, Any]]:
+    """
+    Work out the query parameters of the page after ``response``.
+
+    Args:
+        response: Parsed JSON page
+        params: Query parameters that produced it
+        received: Number of records on the page
+        cursor_param: Query parameter that carries a vendor cursor
+
+    Returns:
+        Parameters for the next request, or None on the last page
+    """
+    if not isinstance(response, dict) or received == 0:
+        return None
+
+    cursor = next((response[name] for name in CURSOR_FIELDS if response.get(name)), None)
+    if cursor is None and isinstance(response.get("paging"), dict):
+        cursor = response["paging"].get("next_cursor")
+    if cursor:
+        if cursor == params.get(cursor_param):
+            logger.warning(f"Vendor repeated pagination cursor {cursor!r}; stopping")
+            return None
+        return {**params, cursor_param: cursor}
+
+    total = response.get("total")
+    if total is None:
+        return None
+    offset = int(params.get("offset", 0)) + received
+    if offset >= int(total):
+        return None
+    return {**params, "offset": offset}
+
+
+def iter_records(
+    fetch: PageFetcher,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor_param: str = "cursor",
+    prefetch: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every record of a paginated listing.
+
+    Args:
+        fetch: Callable taking query params and returning one parsed page
+        params: Query parameters of the first request
+        page_size: Records per page (sent as ``limit``)
+        cursor_param: Query parameter that carries a vendor cursor
+        prefetch: Request the next page while the current one is consumed
+
+    Yields:
+        Raw records, in vendor order
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    params = {**(params or {}), "limit": page_size}
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch") if prefetch else None
+    )
+    pending: Optional[Future] = None
+    try:
+        response = fetch(params)
+        for _ in range(MAX_PAGES):
+            items = page_items(response)
+            following = next_page_params(response, params, len(items), cursor_param)
+            if following is not None and executor is not None:
+                pending = executor.submit(fetch, following)
+
+            yield from items
+
+            if following is None:
+                return
+            if pending is not None:
+                response = pending.result()
+                pending = None
+            else:
+                response = fetch(following)
+            params = following
+        logger.warning(f"Stopped paginating after {MAX_PAGES} pages")
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
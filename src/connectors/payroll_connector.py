@@ -3,21 +3,28 @@ PAYROLL-001: Read-only Payroll Data Connector implementation.
 
 This module implements payroll data retrieval from Workday, ADP, Paychex, and
 generic HTTP APIs. Includes OAuth2 authentication, rate limiting, retry logic,
-and provider-specific field mapping. Read-only operations only.
+and provider-specific field mapping. History is streamed page by page via
+iter_payroll_history. Bulk analytics (get_payroll_summaries, get_tax_summaries,
+get_deduction_breakdowns) pull history into a PayrollColumnStore and aggregate
+it locally. Read-only operations only.
 """
 
 import logging
 import time
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from pydantic import BaseModel, Field, ConfigDict
 
+from .http_client import VendorHTTPClient, get_http_client
+from .pagination import DEFAULT_PAGE_SIZE, iter_records
+from .payroll_store import PayrollColumnStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,12 +110,33 @@ class PayrollConnector:
     All operations are read-only.
     """
 
-    def __init__(self, config: PayrollConfig) -> None:
+    DEFAULT_HEADERS = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+    # Top-level fields of a flat tax summary response that are not tax lines
+    TAX_SUMMARY_FIELDS = frozenset(
+        {"employee_id", "employeeId", "year", "taxYear", "currency", "totalTaxes", "total_taxes"}
+    )
+
+    # Seconds the analytics store may serve an employee's data before the
+    # newest pay periods are pulled again
+    analytics_refresh_seconds = 300
+
+    def __init__(
+        self,
+        config: PayrollConfig,
+        http_client: Optional[VendorHTTPClient] = None,
+        store: Optional[PayrollColumnStore] = None,
+    ) -> None:
         """
         Initialize payroll connector.
 
         Args:
             config: PayrollConfig instance with provider and credentials
+            http_client: Shared HTTP client (defaults to the process-wide client)
+            store: Columnar store for payroll analytics (defaults to a new one)
 
         Raises:
             ValueError: If config is invalid or credentials missing
@@ -118,42 +146,18 @@ class PayrollConnector:
 
         self.config = config
         self.provider = config.provider
-        self._session = self._create_session()
+        self._http = http_client or get_http_client()
+        self._auth_headers: Dict[str, str] = {}
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
         self._rate_limit_remaining = 1000
         self._rate_limit_reset_at: Optional[datetime] = None
         self._request_times: List[datetime] = []
+        self.store = store or PayrollColumnStore()
+        self._store_refreshed: Dict[str, float] = {}
 
         logger.info(f"PayrollConnector initialized for provider: {self.provider}")
 
-    def _create_session(self) -> requests.Session:
-        """
-        Create requests session with retry strategy.
-
-        Returns:
-            Configured requests.Session with retry logic
-        """
-        session = requests.Session()
-        session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
-
-        retry_strategy = Retry(
-            total=self.config.retry_attempts,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session
-
     def authenticate(self) -> bool:
         """
         Authenticate with payroll provider using OAuth2 or API key.
@@ -168,7 +172,7 @@ class PayrollConnector:
             if self.config.client_id and self.config.client_secret:
                 return self._authenticate_oauth2()
             elif self.config.api_key:
-                self._session.headers.update({"Authorization": f"Bearer {self.config.api_key}"})
+                self._auth_headers = {"Authorization": f"Bearer {self.config.api_key}"}
                 logger.info("Authenticated with API key")
                 return True
             else:
@@ -213,7 +217,9 @@ class PayrollConnector:
 
         try:
             logger.debug(f"Requesting OAuth2 token from {token_url}")
-            response = self._session.post(token_url, data=payload, timeout=self.config.timeout)
+            response = self._http.session_for(token_url).post(
+                token_url, data=payload, timeout=self.config.timeout
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -221,7 +227,7 @@ class PayrollConnector:
             expires_in = data.get("expires_in", 3600)
             self._token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)
 
-            self._session.headers.update({"Authorization": f"Bearer {self._access_token}"})
+            self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
 
             logger.info("Successfully obtained OAuth2 access token")
             return True
@@ -234,7 +240,11 @@ class PayrollConnector:
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
-        Make HTTP GET request to payroll API with retry logic.
+        Make HTTP GET request to payroll API through the shared HTTP client.
+
+        The client paces requests to the provider's advertised quota and
+        retries 429, 5xx, timeouts and connection errors up to
+        ``config.retry_attempts`` attempts in total.
 
         Args:
             endpoint: API endpoint path
@@ -248,56 +258,40 @@ class PayrollConnector:
         """
         url = f"{self.config.base_url}/{endpoint}"
         params = params or {}
+        headers = {**self.DEFAULT_HEADERS, **self._auth_headers}
 
-        for attempt in range(self.config.retry_attempts):
-            try:
-                logger.debug(f"GET {url} (attempt {attempt + 1}/{self.config.retry_attempts})")
-                response = self._session.get(url, params=params, timeout=self.config.timeout)
+        try:
+            logger.debug(f"GET {url}")
+            response = self._http.request(
+                "GET",
+                url,
+                max_retries=max(self.config.retry_attempts - 1, 0),
+                params=params,
+                headers=headers,
+                timeout=self.config.timeout,
+            )
+        except requests.exceptions.Timeout as e:
+            raise ValueError(f"Request timeout after {self.config.retry_attempts} attempts: {e}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise ValueError(f"Failed to fetch payroll data: {e}")
 
-                # Update rate limit info
-                if "X-Rate-Limit-Remaining" in response.headers:
-                    self._rate_limit_remaining = int(response.headers["X-Rate-Limit-Remaining"])
+        # Update rate limit info
+        if "X-Rate-Limit-Remaining" in response.headers:
+            self._rate_limit_remaining = int(response.headers["X-Rate-Limit-Remaining"])
 
-                if response.status_code == 429:
-                    wait_seconds = min(2**attempt, 60)
-                    logger.warning(f"Rate limited, retrying in {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
+        if response.status_code == 429:
+            raise ValueError("Rate limit exceeded")
 
-                if response.status_code >= 500:
-                    if attempt < self.config.retry_attempts - 1:
-                        wait_seconds = min(2**attempt, 60)
-                        logger.warning(
-                            f"Server error ({response.status_code}), retrying in {wait_seconds}s"
-                        )
-                        time.sleep(wait_seconds)
-                        continue
-                    else:
-                        raise ValueError(f"Server error: {response.status_code}")
-
-                response.raise_for_status()
-                return response.json() if response.content else {}
-
-            except requests.exceptions.Timeout as e:
-                if attempt < self.config.retry_attempts - 1:
-                    wait_seconds = min(2**attempt, 60)
-                    logger.warning(f"Request timeout, retrying in {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
-                raise ValueError(
-                    f"Request timeout after {self.config.retry_attempts} attempts: {e}"
-                )
-
-            except requests.exceptions.RequestException as e:
-                if attempt < self.config.retry_attempts - 1:
-                    wait_seconds = min(2**attempt, 60)
-                    logger.warning(f"Connection error, retrying in {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
-                logger.error(f"Request failed: {e}")
-                raise ValueError(f"Failed to fetch payroll data: {e}")
+        if response.status_code >= 500:
+            raise ValueError(f"Server error: {response.status_code}")
 
-        raise ValueError(f"Failed after {self.config.retry_attempts} attempts")
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise ValueError(f"Failed to fetch payroll data: {e}")
+        return response.json() if response.content else {}
 
     def _map_provider_fields(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -432,8 +426,49 @@ class PayrollConnector:
             logger.error(f"Error fetching payroll record: {e}")
             raise ValueError(f"Failed to fetch payroll record: {e}")
 
+    def iter_payroll_history(
+        self,
+        employee_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[PayrollRecord]:
+        """
+        Stream payroll history for employee over date range, page by page.
+
+        Follows the provider's next-page cursor (or offset/total) and fetches
+        the next page while the current one is consumed.
+
+        Args:
+            employee_id: Employee ID
+            start_date: Start date for history
+            end_date: End date for history
+            page_size: Records per request
+
+        Yields:
+            PayrollRecord objects; unparseable records are skipped
+
+        Raises:
+            ValueError: If a page request fails
+        """
+        logger.debug(f"Streaming payroll history for {employee_id} from {start_date} to {end_date}")
+        endpoint = f"payroll/employees/{employee_id}/history"
+        params = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        }
+        for item in iter_records(lambda p: self._make_request(endpoint, p), params, page_size):
+            try:
+                yield PayrollRecord(**self._map_provider_fields(item))
+            except Exception as e:
+                logger.warning(f"Failed to parse payroll record: {e}")
+
     def get_payroll_history(
-        self, employee_id: str, start_date: datetime, end_date: datetime
+        self,
+        employee_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
     ) -> List[PayrollRecord]:
         """
         Retrieve payroll history for employee over date range.
@@ -442,34 +477,15 @@ class PayrollConnector:
             employee_id: Employee ID
             start_date: Start date for history
             end_date: End date for history
+            limit: Maximum number of records to return (default: all)
 
         Returns:
             List of PayrollRecord objects
         """
         try:
-            logger.debug(
-                f"Fetching payroll history for {employee_id} from {start_date} to {end_date}"
-            )
-            response = self._make_request(
-                f"payroll/employees/{employee_id}/history",
-                params={
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                },
+            records = list(
+                islice(self.iter_payroll_history(employee_id, start_date, end_date), limit)
             )
-
-            records = []
-            data_list = response.get("data", []) if isinstance(response, dict) else response
-
-            for item in data_list:
-                try:
-                    mapped = self._map_provider_fields(item)
-                    record = PayrollRecord(**mapped)
-                    records.append(record)
-                except Exception as e:
-                    logger.warning(f"Failed to parse payroll record: {e}")
-                    continue
-
             logger.info(f"Retrieved {len(records)} payroll records for {employee_id}")
             return records
 
@@ -488,6 +504,12 @@ class PayrollConnector:
         Returns:
             PayrollSummary or None if not found
         """
+        start, end = self._year_range(year)
+        if self._store_is_fresh(employee_id, start, end):
+            totals = self.store.summaries(start, end, [employee_id]).get(employee_id)
+            if totals:
+                return PayrollSummary(employee_id=employee_id, period=f"{year}", **totals)
+
         try:
             logger.debug(f"Fetching payroll summary for {employee_id} for year {year}")
             response = self._make_request(
@@ -525,6 +547,12 @@ class PayrollConnector:
         Returns:
             Dictionary of deduction types and amounts
         """
+        period_start = self._period_start(pay_period)
+        if period_start is not None and self._store_is_fresh(
+            employee_id, period_start, period_start
+        ):
+            return self.store.period_deductions(period_start, [employee_id]).get(employee_id, {})
+
         try:
             logger.debug(f"Fetching deduction breakdown for {employee_id} in {pay_period}")
             response = self._make_request(
@@ -548,15 +576,44 @@ class PayrollConnector:
             year: Year for tax summary
 
         Returns:
-            Dictionary with tax information
+            {"employee_id", "year", "total_taxes", "taxes"} whether served from
+            the payroll store or the provider, or an empty dict if not found
         """
+        start, end = self._year_range(year)
+        if self._store_is_fresh(employee_id, start, end):
+            taxes = self.store.tax_totals(start, end, [employee_id]).get(employee_id)
+            if taxes is not None:
+                return self._tax_summary(employee_id, year, taxes)
+
         try:
             logger.debug(f"Fetching tax summary for {employee_id} for year {year}")
             response = self._make_request(
                 f"payroll/employees/{employee_id}/taxes", params={"year": year}
             )
 
-            tax_summary = response if isinstance(response, dict) else {}
+            if not isinstance(response, dict) or not response:
+                logger.warning(f"No tax summary found for {employee_id}")
+                return {}
+
+            lines = response.get("taxes")
+            if not isinstance(lines, dict):
+                # Some providers return the tax lines at the top level
+                lines = {
+                    name: amount
+                    for name, amount in response.items()
+                    if name not in self.TAX_SUMMARY_FIELDS
+                }
+            taxes = {}
+            for name, amount in lines.items():
+                try:
+                    taxes[name] = float(amount)
+                except (TypeError, ValueError):
+                    logger.debug(f"Skipping non-numeric tax field {name!r} for {employee_id}")
+            tax_summary = self._tax_summary(employee_id, year, taxes)
+            for total_field in ("totalTaxes", "total_taxes"):
+                if total_field in response:
+                    tax_summary["total_taxes"] = float(response[total_field])
+                    break
             logger.info(f"Retrieved tax summary for {employee_id}")
             return tax_summary
 
@@ -564,6 +621,176 @@ class PayrollConnector:
             logger.error(f"Error fetching tax summary: {e}")
             return {}
 
+    # ========================================================================
+    # Bulk analytics (columnar store)
+    # ========================================================================
+
+    def refresh_payroll_store(
+        self,
+        employee_ids: Iterable[str],
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        force: bool = False,
+    ) -> int:
+        """
+        Pull payroll history for many employees into the analytics store.
+
+        Employees whose history already covers the range are refreshed
+        incrementally, from their newest stored pay period onward, and are
+        skipped entirely within analytics_refresh_seconds of their last pull
+        unless force is set. Employees are pulled concurrently.
+
+        Args:
+            employee_ids: Employees to pull
+            start_date: Start of the range the store must cover
+            end_date: End of the range (default: now)
+            force: Pull even if the employee was refreshed recently
+
+        Returns:
+            Number of records written to the store
+        """
+        end_date = min(end_date or datetime.utcnow(), datetime.utcnow())
+        now = time.time()
+        pulls: List[Tuple[str, datetime]] = []
+
+        for employee_id in dict.fromkeys(employee_ids):
+            covered = self.store.covers(employee_id, start_date, end_date)
+            recent = now - self._store_refreshed.get(employee_id, 0.0) < (
+                self.analytics_refresh_seconds
+            )
+            if covered and recent and not force:
+                continue
+            coverage = self.store.coverage(employee_id)
+            if coverage is None or coverage[0] > start_date.date():
+                pulls.append((employee_id, start_date))
+                continue
+            latest = self.store.latest_period_start(employee_id)
+            if covered and latest is not None and latest > end_date.date():
+                # Newer periods are stored, so nothing in this range can change
+                self._store_refreshed[employee_id] = now
+                continue
+            since = latest or min(coverage[1], end_date.date())
+            pulls.append((employee_id, datetime.combine(since, datetime.min.time())))
+
+        if not pulls:
+            return 0
+
+        def pull(employee_id: str, since: datetime) -> List[PayrollRecord]:
+            return list(self.iter_payroll_history(employee_id, since, end_date))
+
+        written = 0
+        workers = max(1, min(self._http.pool_size, len(pulls)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="payroll-store") as pool:
+            futures = [(pool.submit(pull, emp_id, since), emp_id, since) for emp_id, since in pulls]
+            for future, employee_id, since in futures:
+                try:
+                    records = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to refresh payroll history for {employee_id}: {e}")
+                    continue
+                written += self.store.upsert(records)
+                self.store.mark_covered(employee_id, since, end_date)
+                self._store_refreshed[employee_id] = now
+
+        logger.info(f"Refreshed payroll store for {len(pulls)} employees ({written} records)")
+        return written
+
+    def get_payroll_summaries(
+        self, employee_ids: Iterable[str], year: int
+    ) -> Dict[str, PayrollSummary]:
+        """
+        Get payroll summaries for many employees for a year.
+
+        Args:
+            employee_ids: Employee IDs
+            year: Year for summaries
+
+        Returns:
+            Employee ID -> PayrollSummary (employees without records are omitted)
+        """
+        employee_ids = list(employee_ids)
+        start, end = self._year_range(year)
+        self.refresh_payroll_store(employee_ids, start, end)
+        return {
+            employee_id: PayrollSummary(employee_id=employee_id, period=f"{year}", **totals)
+            for employee_id, totals in self.store.summaries(start, end, employee_ids).items()
+        }
+
+    def get_tax_summaries(
+        self, employee_ids: Iterable[str], year: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get tax summaries for many employees for a year.
+
+        Args:
+            employee_ids: Employee IDs
+            year: Year for tax summaries
+
+        Returns:
+            Employee ID -> {"employee_id", "year", "total_taxes", "taxes"}
+            (employees without records are omitted)
+        """
+        employee_ids = list(employee_ids)
+        start, end = self._year_range(year)
+        self.refresh_payroll_store(employee_ids, start, end)
+        return {
+            employee_id: self._tax_summary(employee_id, year, taxes)
+            for employee_id, taxes in self.store.tax_totals(start, end, employee_ids).items()
+        }
+
+    def get_deduction_breakdowns(
+        self, employee_ids: Iterable[str], pay_period: str
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Get deduction breakdowns for many employees for one pay period.
+
+        Args:
+            employee_ids: Employee IDs
+            pay_period: Pay period start date (YYYY-MM-DD)
+
+        Returns:
+            Employee ID -> {deduction type: amount} (employees without a
+            record in the period are omitted)
+
+        Raises:
+            ValueError: If pay_period is not a date
+        """
+        period_start = self._period_start(pay_period)
+        if period_start is None:
+            raise ValueError(f"Invalid pay period: {pay_period}")
+        employee_ids = list(employee_ids)
+        # Pull far enough ahead to include the whole period
+        self.refresh_payroll_store(employee_ids, period_start, period_start + timedelta(days=31))
+        return self.store.period_deductions(period_start, employee_ids)
+
+    def _store_is_fresh(self, employee_id: str, start: datetime, end: datetime) -> bool:
+        """Whether the store can answer for an employee's date range without a pull."""
+        if time.time() - self._store_refreshed.get(employee_id, 0.0) >= (
+            self.analytics_refresh_seconds
+        ):
+            return False
+        return self.store.covers(employee_id, start, min(end, datetime.utcnow()))
+
+    @staticmethod
+    def _year_range(year: int) -> Tuple[datetime, datetime]:
+        return datetime(year, 1, 1), datetime(year, 12, 31)
+
+    @staticmethod
+    def _period_start(pay_period: str) -> Optional[datetime]:
+        try:
+            return datetime.combine(date.fromisoformat(pay_period), datetime.min.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _tax_summary(employee_id: str, year: int, taxes: Dict[str, float]) -> Dict[str, Any]:
+        return {
+            "employee_id": employee_id,
+            "year": year,
+            "total_taxes": round(sum(taxes.values()), 2),
+            "taxes": taxes,
+        }
+
     def validate_connection(self) -> Dict[str, Any]:
         """
         Validate connection to payroll provider.
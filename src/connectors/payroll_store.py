@@ -0,0 +1,348 @@
+"""
+PAYROLL-002: Columnar payroll analytics store.
+
+PayrollColumnStore keeps pulled payroll history in NumPy column buffers (one
+row per employee pay period) so that year-end and compensation-equity
+analyses aggregate many employees in one vectorized pass instead of making a
+remote summary, tax or deduction call per employee per period.
+
+Layout:
+
+- fixed columns: employee code, period start/end (date ordinals), gross and
+  net pay
+- one float column per deduction type and per tax type, added as new types
+  appear; a record without a type holds 0.0
+- rows are keyed by (employee, period start); pulling a period again
+  overwrites its row, so refreshes can re-fetch the newest periods safely
+
+Buffers grow by doubling. Coverage (the date range pulled per employee) is
+tracked so callers can tell whether the store can answer a question locally.
+"""
+
+import threading
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .payroll_connector import PayrollRecord
+
+_INITIAL_CAPACITY = 1024
+
+
+def _ordinal(value: date) -> int:
+    return value.toordinal()
+
+
+class _CategoryColumns:
+    """Growable matrix of per-type amounts (deductions or taxes)."""
+
+    def __init__(self, capacity: int) -> None:
+        self.names: Dict[str, int] = {}
+        self.values = np.zeros((capacity, 0), dtype=np.float64)
+
+    def resize(self, capacity: int) -> None:
+        grown = np.zeros((capacity, self.values.shape[1]), dtype=np.float64)
+        grown[: self.values.shape[0]] = self.values
+        self.values = grown
+
+    def write(self, row: int, amounts: Dict[str, float]) -> None:
+        self.values[row] = 0.0
+        for name, amount in amounts.items():
+            column = self.names.get(name)
+            if column is None:
+                column = len(self.names)
+                self.names[name] = column
+                self.values = np.hstack(
+                    [self.values, np.zeros((self.values.shape[0], 1), dtype=np.float64)]
+                )
+            self.values[row, column] = float(amount or 0.0)
+
+    def totals(self, rows: np.ndarray, codes: np.ndarray, groups: int) -> np.ndarray:
+        """Sum each type per group; returns a (groups, types) matrix."""
+        out = np.zeros((groups, len(self.names)), dtype=np.float64)
+        for column in range(len(self.names)):
+            out[:, column] = np.bincount(codes, weights=self.values[rows, column], minlength=groups)
+        return out
+
+    def breakdown(self, totals: np.ndarray) -> Dict[str, float]:
+        return {
+            name: round(float(totals[column]), 2)
+            for name, column in self.names.items()
+            if totals[column]
+        }
+
+
+class PayrollColumnStore:
+    """
+    In-memory columnar store of payroll records with vectorized aggregations.
+
+    Thread-safe; readers and writers share one lock.
+    """
+
+    def __init__(self, initial_capacity: int = _INITIAL_CAPACITY) -> None:
+        """
+        Initialize store.
+
+        Args:
+            initial_capacity: Rows allocated up front
+        """
+        capacity = max(1, initial_capacity)
+        self._employee_ids: List[str] = []
+        self._employee_codes: Dict[str, int] = {}
+        self._rows: Dict[Tuple[int, int], int] = {}
+        self._size = 0
+
+        self._employee = np.zeros(capacity, dtype=np.int32)
+        self._start = np.zeros(capacity, dtype=np.int64)
+        self._end = np.zeros(capacity, dtype=np.int64)
+        self._gross = np.zeros(capacity, dtype=np.float64)
+        self._net = np.zeros(capacity, dtype=np.float64)
+        self._deductions = _CategoryColumns(capacity)
+        self._taxes = _CategoryColumns(capacity)
+
+        # employee ID -> (first, last) date ordinal pulled
+        self._coverage: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ----- loading -----
+
+    def upsert(self, records: Iterable["PayrollRecord"]) -> int:
+        """
+        Add records, replacing any stored row for the same employee and period.
+
+        Args:
+            records: Payroll records
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        with self._lock:
+            for record in records:
+                code = self._employee_code(record.employee_id)
+                start = _ordinal(record.pay_period_start)
+                row = self._rows.get((code, start))
+                if row is None:
+                    row = self._append_row()
+                    self._rows[(code, start)] = row
+                self._employee[row] = code
+                self._start[row] = start
+                self._end[row] = _ordinal(record.pay_period_end)
+                self._gross[row] = record.gross_pay
+                self._net[row] = record.net_pay
+                self._deductions.write(row, record.deductions)
+                self._taxes.write(row, record.taxes)
+                written += 1
+        return written
+
+    def mark_covered(self, employee_id: str, start: datetime, end: datetime) -> None:
+        """
+        Record that an employee's history was pulled for a date range.
+
+        A range that overlaps or adjoins the existing coverage extends it; a
+        disjoint range replaces it, since the gap between them was never pulled.
+
+        Args:
+            employee_id: Employee ID
+            start: First date pulled
+            end: Last date pulled
+        """
+        with self._lock:
+            first, last = _ordinal(start), _ordinal(end)
+            current = self._coverage.get(employee_id)
+            if current is not None and first <= current[1] + 1 and last >= current[0] - 1:
+                first, last = min(first, current[0]), max(last, current[1])
+            self._coverage[employee_id] = (first, last)
+
+    def coverage(self, employee_id: str) -> Optional[Tuple[date, date]]:
+        """Get the date range pulled for an employee, or None."""
+        current = self._coverage.get(employee_id)
+        if current is None:
+            return None
+        return date.fromordinal(current[0]), date.fromordinal(current[1])
+
+    def covers(self, employee_id: str, start: datetime, end: datetime) -> bool:
+        """Check whether an employee's pulled history spans a date range."""
+        current = self._coverage.get(employee_id)
+        return current is not None and current[0] <= _ordinal(start) and current[1] >= _ordinal(end)
+
+    def latest_period_start(self, employee_id: str) -> Optional[date]:
+        """
+        Get the start of an employee's newest stored pay period.
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            Period start date, or None if nothing is stored
+        """
+        with self._lock:
+            code = self._employee_codes.get(employee_id)
+            if code is None:
+                return None
+            starts = self._start[: self._size][self._employee[: self._size] == code]
+            return date.fromordinal(int(starts.max())) if starts.size else None
+
+    # ----- aggregations -----
+
+    def summaries(
+        self,
+        start: datetime,
+        end: datetime,
+        employee_ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Total pay, deductions and taxes per employee for periods ending in a range.
+
+        Args:
+            start: First period end date included
+            end: Last period end date included
+            employee_ids: Employees to include (default: all stored)
+
+        Returns:
+            Employee ID -> totals (total_gross, total_net, total_deductions,
+            total_taxes, records_count) for employees with records in range
+        """
+        with self._lock:
+            rows = self._select(start, end, employee_ids)
+            codes, groups = self._group_codes(rows)
+            counts = np.bincount(codes, minlength=groups)
+            gross = np.bincount(codes, weights=self._gross[rows], minlength=groups)
+            net = np.bincount(codes, weights=self._net[rows], minlength=groups)
+            deductions = self._deductions.totals(rows, codes, groups).sum(axis=1)
+            taxes = self._taxes.totals(rows, codes, groups).sum(axis=1)
+
+            return {
+                self._employee_ids[code]: {
+                    "total_gross": round(float(gross[code]), 2),
+                    "total_net": round(float(net[code]), 2),
+                    "total_deductions": round(float(deductions[code]), 2),
+                    "total_taxes": round(float(taxes[code]), 2),
+                    "records_count": int(counts[code]),
+                }
+                for code in np.flatnonzero(counts)
+            }
+
+    def tax_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        employee_ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Taxes by type per employee for periods ending in a range.
+
+        Args:
+            start: First period end date included
+            end: Last period end date included
+            employee_ids: Employees to include (default: all stored)
+
+        Returns:
+            Employee ID -> {tax type: amount} for employees with records in range
+        """
+        with self._lock:
+            rows = self._select(start, end, employee_ids)
+            return self._breakdowns(self._taxes, rows)
+
+    def deduction_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        employee_ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Deductions by type per employee for periods ending in a range.
+
+        Args:
+            start: First period end date included
+            end: Last period end date included
+            employee_ids: Employees to include (default: all stored)
+
+        Returns:
+            Employee ID -> {deduction type: amount} for employees with records in range
+        """
+        with self._lock:
+            rows = self._select(start, end, employee_ids)
+            return self._breakdowns(self._deductions, rows)
+
+    def period_deductions(
+        self, period_start: datetime, employee_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Deductions by type per employee for the pay period starting on a date.
+
+        Args:
+            period_start: Pay period start date
+            employee_ids: Employees to include (default: all stored)
+
+        Returns:
+            Employee ID -> {deduction type: amount} for employees paid in the period
+        """
+        with self._lock:
+            size = self._size
+            mask = self._start[:size] == _ordinal(period_start)
+            mask &= self._employee_mask(employee_ids)
+            return self._breakdowns(self._deductions, np.flatnonzero(mask))
+
+    # ----- internals (call with the lock held) -----
+
+    def _employee_code(self, employee_id: str) -> int:
+        code = self._employee_codes.get(employee_id)
+        if code is None:
+            code = len(self._employee_ids)
+            self._employee_ids.append(employee_id)
+            self._employee_codes[employee_id] = code
+        return code
+
+    def _append_row(self) -> int:
+        if self._size == len(self._gross):
+            capacity = len(self._gross) * 2
+            for name in ("_employee", "_start", "_end", "_gross", "_net"):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[: len(column)] = column
+                setattr(self, name, grown)
+            self._deductions.resize(capacity)
+            self._taxes.resize(capacity)
+        row = self._size
+        self._size += 1
+        return row
+
+    def _employee_mask(self, employee_ids: Optional[Iterable[str]]) -> np.ndarray:
+        size = self._size
+        if employee_ids is None:
+            return np.ones(size, dtype=bool)
+        codes = [
+            self._employee_codes[emp_id]
+            for emp_id in employee_ids
+            if emp_id in self._employee_codes
+        ]
+        return np.isin(self._employee[:size], np.asarray(codes, dtype=np.int32))
+
+    def _select(
+        self, start: datetime, end: datetime, employee_ids: Optional[Iterable[str]]
+    ) -> np.ndarray:
+        size = self._size
+        ends = self._end[:size]
+        mask = (ends >= _ordinal(start)) & (ends <= _ordinal(end))
+        mask &= self._employee_mask(employee_ids)
+        return np.flatnonzero(mask)
+
+    def _group_codes(self, rows: np.ndarray) -> Tuple[np.ndarray, int]:
+        return self._employee[rows], len(self._employee_ids)
+
+    def _breakdowns(
+        self, categories: _CategoryColumns, rows: np.ndarray
+    ) -> Dict[str, Dict[str, float]]:
+        codes, groups = self._group_codes(rows)
+        counts = np.bincount(codes, minlength=groups)
+        totals = categories.totals(rows, codes, groups)
+        return {
+            self._employee_ids[code]: categories.breakdown(totals[code])
+            for code in np.flatnonzero(counts)
+        }
@@ -3,18 +3,19 @@ HRIS-004: Workday HRIS Connector implementation.
 
 This module implements the HRISConnector interface for Workday,
 using OAuth2 authentication and REST API for employee, leave, and benefits data.
-Includes rate limiting, exponential backoff retry logic, and SOAP fallback capability.
+Requests go through the shared VendorHTTPClient (pooled connections,
+header-driven rate limiting and jittered retries); list endpoints are
+streamed page by page through iter_* methods. SOAP fallback capability.
 """
 
 import logging
 import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .hris_interface import (
     HRISConnector,
@@ -24,6 +25,7 @@ from .hris_interface import (
     LeaveRequest,
     OrgNode,
     BenefitsPlan,
+    EmployeeChangeSet,
     EmployeeStatus,
     LeaveType,
     LeaveStatus,
@@ -34,6 +36,8 @@ from .hris_interface import (
     NotFoundError,
     RateLimitError,
 )
+from .http_client import VendorHTTPClient, get_http_client
+from .pagination import DEFAULT_PAGE_SIZE, PageFetcher, iter_records
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -47,6 +51,11 @@ class WorkdayConnector(HRISConnector):
     Handles authentication, rate limiting, retries, and field mapping.
     """
 
+    DEFAULT_HEADERS = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
     def __init__(
         self,
         client_id: Optional[str] = None,
@@ -54,6 +63,7 @@ class WorkdayConnector(HRISConnector):
         tenant_url: Optional[str] = None,
         api_version: str = "v1",
         field_mappings: Optional[Dict[str, str]] = None,
+        http_client: Optional[VendorHTTPClient] = None,
     ):
         """
         Initialize Workday connector.
@@ -64,6 +74,7 @@ class WorkdayConnector(HRISConnector):
             tenant_url: Workday tenant URL (defaults from settings)
             api_version: API version (default: v1)
             field_mappings: Custom field mapping dict (Workday field -> model field)
+            http_client: Shared HTTP client (defaults to the process-wide client)
 
         Raises:
             ValueError: If required credentials are missing
@@ -81,7 +92,7 @@ class WorkdayConnector(HRISConnector):
                 "Set WORKDAY_CLIENT_ID, WORKDAY_CLIENT_SECRET, WORKDAY_TENANT_URL in settings."
             )
 
-        self._session = self._create_session()
+        self._http = http_client or get_http_client()
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
 
@@ -116,34 +127,6 @@ class WorkdayConnector(HRISConnector):
             "phone_number": "phone",
         }
 
-    def _create_session(self) -> requests.Session:
-        """
-        Create requests session with retry strategy.
-
-        Returns:
-            Configured requests.Session with retry logic
-        """
-        session = requests.Session()
-        session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
-
-        # Retry strategy for rate limits and transient errors
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session
-
     def _get_access_token(self) -> str:
         """
         Obtain OAuth2 access token using client_credentials grant.
@@ -171,7 +154,7 @@ class WorkdayConnector(HRISConnector):
 
         try:
             logger.debug(f"Requesting OAuth2 token from {token_url}")
-            response = self._session.post(token_url, data=payload, timeout=10)
+            response = self._http.session_for(token_url).post(token_url, data=payload, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -230,15 +213,18 @@ class WorkdayConnector(HRISConnector):
             logger.warning(f"Rate limit: {self._rate_limit_remaining} requests remaining")
 
     def _make_request(
-        self, method: str, endpoint: str, max_retries: int = 3, **kwargs
+        self, method: str, endpoint: str, max_retries: Optional[int] = None, **kwargs
     ) -> Dict[str, Any]:
         """
-        Make API request with exponential backoff retry logic.
+        Make API request through the shared HTTP client.
+
+        The client paces requests to Workday's advertised quota and retries
+        429, 5xx, timeouts and connection errors with jittered backoff.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (relative to tenant_url)
-            max_retries: Maximum retry attempts
+            max_retries: Maximum retry attempts (defaults to the client's setting)
             **kwargs: Additional arguments for requests
 
         Returns:
@@ -253,70 +239,46 @@ class WorkdayConnector(HRISConnector):
         self._refresh_token_if_needed()
         self._check_rate_limit()
 
-        headers = kwargs.pop("headers", {})
+        headers = {**self.DEFAULT_HEADERS, **kwargs.pop("headers", {})}
         headers["Authorization"] = f"Bearer {self._access_token}"
         kwargs["headers"] = headers
 
         url = f"{self.tenant_url}/ccx/{self.api_version}/{endpoint}"
         kwargs.setdefault("timeout", 30)
 
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"{method} {url} (attempt {attempt + 1}/{max_retries})")
-                response = self._session.request(method, url, **kwargs)
+        try:
+            logger.debug(f"{method} {url}")
+            response = self._http.request(method, url, max_retries=max_retries, **kwargs)
 
-                # Update rate limit info
-                self._handle_rate_limit_headers(response)
+            # Update rate limit info
+            self._handle_rate_limit_headers(response)
 
-                if response.status_code == 401:
-                    logger.error("Authentication failed")
-                    raise AuthenticationError("Workday authentication failed")
+            if response.status_code == 401:
+                logger.error("Authentication failed")
+                raise AuthenticationError("Workday authentication failed")
 
-                if response.status_code == 404:
-                    logger.warning(f"Resource not found: {endpoint}")
-                    raise NotFoundError(f"Resource not found: {endpoint}")
+            if response.status_code == 404:
+                logger.warning(f"Resource not found: {endpoint}")
+                raise NotFoundError(f"Resource not found: {endpoint}")
 
-                if response.status_code == 429:
-                    wait_seconds = min(2**attempt, 60)
-                    logger.warning(f"Rate limited, retrying in {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
+            if response.status_code == 429:
+                raise RateLimitError("Workday rate limit exceeded after retries")
 
-                if response.status_code >= 500:
-                    if attempt < max_retries - 1:
-                        wait_seconds = min(2**attempt, 60)
-                        logger.warning(
-                            f"Server error ({response.status_code}), retrying in {wait_seconds}s"
-                        )
-                        time.sleep(wait_seconds)
-                        continue
-                    else:
-                        raise ConnectionError(f"Server error: {response.status_code}")
-
-                response.raise_for_status()
-                return response.json() if response.content else {}
-
-            except requests.exceptions.Timeout as e:
-                if attempt < max_retries - 1:
-                    wait_seconds = min(2**attempt, 60)
-                    logger.warning(f"Request timeout, retrying in {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
-                raise ConnectionError(f"Request timeout after {max_retries} attempts: {e}")
+            if response.status_code >= 500:
+                raise ConnectionError(f"Server error: {response.status_code}")
 
-            except requests.exceptions.ConnectionError as e:
-                if attempt < max_retries - 1:
-                    wait_seconds = min(2**attempt, 60)
-                    logger.warning(f"Connection error, retrying in {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
-                raise ConnectionError(f"Unable to connect to Workday: {e}")
+            response.raise_for_status()
+            return response.json() if response.content else {}
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed: {e}")
-                raise ConnectionError(f"Request failed: {e}")
+        except requests.exceptions.Timeout as e:
+            raise ConnectionError(f"Request timeout: {e}")
 
-        raise ConnectionError(f"Failed after {max_retries} attempts")
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(f"Unable to connect to Workday: {e}")
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise ConnectionError(f"Request failed: {e}")
 
     def _soap_request(self, operation: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -423,40 +385,60 @@ class WorkdayConnector(HRISConnector):
             logger.error(f"Error fetching employee {employee_id}: {e}")
             raise ConnectionError(f"Error fetching employee: {e}")
 
-    def search_employees(self, filters: Dict[str, Any]) -> List[Employee]:
+    def _page_fetcher(self, endpoint: str) -> PageFetcher:
         """
-        Search for employees using filters.
+        Build a fetcher for one page of a list endpoint.
 
         Args:
-            filters: Filter criteria (e.g., {"department": "Sales"})
+            endpoint: API endpoint (relative to tenant_url)
 
         Returns:
-            List of matching Employee objects
+            Callable taking query params and returning the parsed page
         """
-        try:
-            # Build query params from filters
-            query_params = []
-            for key, value in filters.items():
-                query_params.append(f"{key}={value}")
+        return lambda params: self._make_request("GET", endpoint, params=params)
 
-            endpoint = "employees"
-            if query_params:
-                endpoint += "?" + "&".join(query_params)
+    def iter_employees(
+        self, filters: Optional[Dict[str, Any]] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[Employee]:
+        """
+        Stream employees matching filters across every result page.
 
-            logger.debug(f"Searching employees with filters: {filters}")
-            response = self._make_request("GET", endpoint)
+        Pages are requested with limit/offset and the next page is fetched
+        while the current one is consumed. Records are parsed as they are
+        yielded; unparseable records are skipped.
 
-            employees = []
-            data_list = response.get("data", []) if isinstance(response, dict) else response
+        Args:
+            filters: Filter criteria (e.g., {"department": "Sales"})
+            page_size: Records per request
 
-            for item in data_list:
-                try:
-                    employee = self._parse_employee(item)
-                    employees.append(employee)
-                except Exception as e:
-                    logger.warning(f"Failed to parse employee: {e}")
-                    continue
+        Yields:
+            Matching Employee objects
+
+        Raises:
+            ConnectorError: If a page request fails
+        """
+        logger.debug(f"Streaming employees with filters: {filters}")
+        for item in iter_records(self._page_fetcher("employees"), dict(filters or {}), page_size):
+            try:
+                yield self._parse_employee(item)
+            except Exception as e:
+                logger.warning(f"Failed to parse employee: {e}")
+
+    def search_employees(
+        self, filters: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[Employee]:
+        """
+        Search for employees using filters.
+
+        Args:
+            filters: Filter criteria (e.g., {"department": "Sales"})
+            limit: Maximum number of employees to return (default: all)
 
+        Returns:
+            List of matching Employee objects
+        """
+        try:
+            employees = list(islice(self.iter_employees(filters), limit))
             logger.info(f"Found {len(employees)} employees matching filters")
             return employees
 
@@ -513,8 +495,74 @@ class WorkdayConnector(HRISConnector):
             logger.error(f"Error fetching leave balance: {e}")
             return []
 
+    def _parse_leave_request(self, item: Dict[str, Any], employee_id: str) -> LeaveRequest:
+        """
+        Parse Workday leave request data into LeaveRequest model.
+
+        Args:
+            item: Raw leave request data from Workday API
+            employee_id: Employee the request belongs to
+
+        Returns:
+            LeaveRequest object
+        """
+        status_map = {
+            "pending": LeaveStatus.PENDING,
+            "approved": LeaveStatus.APPROVED,
+            "denied": LeaveStatus.DENIED,
+            "cancelled": LeaveStatus.CANCELLED,
+        }
+
+        leave_type_map = {
+            "pto": LeaveType.PTO,
+            "sick": LeaveType.SICK,
+            "personal": LeaveType.PERSONAL,
+            "unpaid": LeaveType.UNPAID,
+        }
+
+        return LeaveRequest(
+            id=item.get("id"),
+            employee_id=employee_id,
+            leave_type=leave_type_map.get(item.get("leave_type", "").lower(), LeaveType.OTHER),
+            start_date=datetime.fromisoformat(item.get("start_date")),
+            end_date=datetime.fromisoformat(item.get("end_date")),
+            status=status_map.get(item.get("status", "").lower(), LeaveStatus.PENDING),
+            reason=item.get("reason"),
+            approver_id=item.get("approver_id"),
+            submitted_at=datetime.fromisoformat(item.get("submitted_at")),
+        )
+
+    def iter_leave_requests(
+        self,
+        employee_id: str,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[LeaveRequest]:
+        """
+        Stream an employee's leave requests across every result page.
+
+        Args:
+            employee_id: The employee ID
+            status: Optional status filter
+            page_size: Records per request
+
+        Yields:
+            LeaveRequest objects; unparseable records are skipped
+
+        Raises:
+            ConnectorError: If a page request fails
+        """
+        params = {"status": status} if status else {}
+        logger.debug(f"Streaming leave requests for: {employee_id} (status: {status})")
+        fetch = self._page_fetcher(f"employees/{employee_id}/leave-requests")
+        for item in iter_records(fetch, params, page_size):
+            try:
+                yield self._parse_leave_request(item, employee_id)
+            except Exception as e:
+                logger.warning(f"Failed to parse leave request: {e}")
+
     def get_leave_requests(
-        self, employee_id: str, status: Optional[str] = None
+        self, employee_id: str, status: Optional[str] = None, limit: Optional[int] = None
     ) -> List[LeaveRequest]:
         """
         Get leave requests for an employee.
@@ -522,55 +570,13 @@ class WorkdayConnector(HRISConnector):
         Args:
             employee_id: The employee ID
             status: Optional status filter
+            limit: Maximum number of requests to return (default: all)
 
         Returns:
             List of LeaveRequest objects
         """
         try:
-            endpoint = f"employees/{employee_id}/leave-requests"
-            if status:
-                endpoint += f"?status={status}"
-
-            logger.debug(f"Fetching leave requests for: {employee_id} (status: {status})")
-            response = self._make_request("GET", endpoint)
-
-            requests_list = []
-            data_list = response.get("data", []) if isinstance(response, dict) else response
-
-            status_map = {
-                "pending": LeaveStatus.PENDING,
-                "approved": LeaveStatus.APPROVED,
-                "denied": LeaveStatus.DENIED,
-                "cancelled": LeaveStatus.CANCELLED,
-            }
-
-            leave_type_map = {
-                "pto": LeaveType.PTO,
-                "sick": LeaveType.SICK,
-                "personal": LeaveType.PERSONAL,
-                "unpaid": LeaveType.UNPAID,
-            }
-
-            for item in data_list:
-                try:
-                    leave_request = LeaveRequest(
-                        id=item.get("id"),
-                        employee_id=employee_id,
-                        leave_type=leave_type_map.get(
-                            item.get("leave_type", "").lower(), LeaveType.OTHER
-                        ),
-                        start_date=datetime.fromisoformat(item.get("start_date")),
-                        end_date=datetime.fromisoformat(item.get("end_date")),
-                        status=status_map.get(item.get("status", "").lower(), LeaveStatus.PENDING),
-                        reason=item.get("reason"),
-                        approver_id=item.get("approver_id"),
-                        submitted_at=datetime.fromisoformat(item.get("submitted_at")),
-                    )
-                    requests_list.append(leave_request)
-                except Exception as e:
-                    logger.warning(f"Failed to parse leave request: {e}")
-                    continue
-
+            requests_list = list(islice(self.iter_leave_requests(employee_id, status), limit))
             logger.info(f"Retrieved {len(requests_list)} leave requests for {employee_id}")
             return requests_list
 
@@ -711,6 +717,26 @@ class WorkdayConnector(HRISConnector):
             logger.error(f"Error fetching benefits: {e}")
             return []
 
+    def get_employee_changes(self, since: str) -> Optional[EmployeeChangeSet]:
+        """
+        Get employees updated since a cursor.
+
+        Workday keeps terminated workers with a terminated status, so the
+        change set never contains deletions.
+
+        Args:
+            since: ISO-8601 timestamp of the previous sync
+
+        Returns:
+            EmployeeChangeSet whose cursor is the request start time
+        """
+        cursor = datetime.utcnow().replace(microsecond=0).isoformat()
+        logger.debug(f"Fetching employees updated since {since}")
+        updated = list(self.iter_employees({"updated_since": since}))
+
+        logger.info(f"Found {len(updated)} employees updated since {since}")
+        return EmployeeChangeSet(updated=updated, cursor=cursor)
+
     def health_check(self) -> bool:
         """
         Check if connector can reach Workday system.
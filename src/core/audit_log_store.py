@@ -0,0 +1,463 @@
+"""
+COMP-006: Indexed audit log store.
+
+Audit entries are kept in (timestamp, sequence) order as they are appended,
+so reads never sort. Queries filter on user_id, action, resource and status
+plus a time range, and page by keyset: a cursor names the last entry
+returned and the next page continues strictly after it.
+
+InMemoryAuditLogStore keeps one sorted key list per distinct value of each
+filter field, and of each combination of fields once it has been queried; a
+query bisects the time range out of a single list, so page reads and counts
+are logarithmic in the log size. SqlAuditLogStore maps entries onto the audit_logs table, whose
+(filter, timestamp, id) composite indexes serve the same queries.
+"""
+
+import base64
+import logging
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AUDIT_FILTERS = ("user_id", "action", "resource", "status")
+
+# (timestamp, sequence number); the SQL store uses the row id as sequence
+AuditKey = Tuple[datetime, int]
+
+
+@dataclass
+class AuditPage:
+    """One page of audit entries."""
+
+    entries: List[Any]
+    next_cursor: Optional[str] = None  # None on the last page
+    total: Optional[int] = None  # all matches, when requested
+
+
+def encode_cursor(key: AuditKey) -> str:
+    raw = f"{key[0].isoformat()}|{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> AuditKey:
+    """
+    Decode a page cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        ts, seq = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(ts), int(seq)
+    except Exception as e:
+        raise ValueError(f"Invalid audit log cursor: {cursor!r}") from e
+
+
+def _applied(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Filters on supported fields (others are ignored)."""
+    return {name: filters[name] for name in AUDIT_FILTERS if filters and name in filters}
+
+
+class AuditLogStore:
+    """Append-only audit entries with indexed, keyset-paginated reads."""
+
+    def append(self, entry: Any) -> None:
+        raise NotImplementedError
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        descending: bool = True,
+        with_total: bool = False,
+    ) -> AuditPage:
+        """
+        Read one page of entries ordered by timestamp.
+
+        Args:
+            filters: Equality filters on user_id, action, resource, status
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            limit: Maximum entries to return
+            cursor: next_cursor of the previous page
+            offset: Entries to skip (ignored when a cursor is given)
+            descending: Newest first
+            with_total: Also count all matches (ignoring cursor and offset)
+
+        Returns:
+            AuditPage
+        """
+        raise NotImplementedError
+
+    def count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        raise NotImplementedError
+
+    def count_by(
+        self,
+        field: str,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[Any, int]:
+        """Number of matching entries per value of a filter field."""
+        raise NotImplementedError
+
+    def iter_entries(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        """Yield matching entries oldest first, reading batch_size at a time."""
+        raise NotImplementedError
+
+    def purge_before(self, cutoff: datetime) -> int:
+        """Drop entries with timestamp < cutoff; returns the number dropped."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class InMemoryAuditLogStore(AuditLogStore):
+    """
+    Entries with sorted key lists overall and per filter value.
+
+    Single-field filters read the per-field index. A combination of fields
+    gets its own composite index, built on first use and maintained on
+    append after that, so every query bisects one key list.
+
+    Thread-safe: appends, purges, index builds and reads share one lock, so
+    writers and report workers can use the store concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Any] = {}
+        self._values: Dict[int, Tuple[Any, ...]] = {}  # filter field values, AUDIT_FILTERS order
+        self._keys: List[AuditKey] = []
+        # (field, ...) -> (value, ...) -> keys; single fields are built eagerly
+        self._indexes: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], List[AuditKey]]] = {
+            (name,): {} for name in AUDIT_FILTERS
+        }
+        self._seq = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    def append(self, entry: Any) -> None:
+        values = tuple(getattr(entry, name) for name in AUDIT_FILTERS)
+        with self._lock:
+            self._seq += 1
+            key = (entry.timestamp, self._seq)
+            self._entries[self._seq] = entry
+            self._values[self._seq] = values
+            self._insert(self._keys, key)
+            for fields, index in self._indexes.items():
+                self._insert(index.setdefault(self._project(fields, values), []), key)
+
+    @staticmethod
+    def _insert(keys: List[AuditKey], key: AuditKey) -> None:
+        if not keys or key >= keys[-1]:
+            keys.append(key)
+        else:
+            insort(keys, key)
+
+    @staticmethod
+    def _project(fields: Tuple[str, ...], values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return tuple(values[AUDIT_FILTERS.index(name)] for name in fields)
+
+    def _index(self, fields: Tuple[str, ...]) -> Dict[Tuple[Any, ...], List[AuditKey]]:
+        """Index on fields, building it on first use (call with the lock held)."""
+        index = self._indexes.get(fields)
+        if index is None:
+            index = {}
+            for key in self._keys:
+                index.setdefault(self._project(fields, self._values[key[1]]), []).append(key)
+            # Published only once complete
+            self._indexes[fields] = index
+            logger.debug(f"Built audit log index on {fields} ({len(index)} values)")
+        return index
+
+    def _range(
+        self, filters: Dict[str, Any], start: Optional[datetime], end: Optional[datetime]
+    ) -> Tuple[List[AuditKey], int, int]:
+        """Key list for the filters and the [lo, hi) range of the time window in it."""
+        if filters:
+            fields = tuple(filters)  # AUDIT_FILTERS order, see _applied
+            keys = self._index(fields).get(tuple(filters.values()), [])
+        else:
+            keys = self._keys
+        lo = bisect_left(keys, (start, 0)) if start is not None else 0
+        hi = bisect_right(keys, (end, float("inf"))) if end is not None else len(keys)
+        return keys, lo, max(lo, hi)
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        descending: bool = True,
+        with_total: bool = False,
+    ) -> AuditPage:
+        with self._lock:
+            return self._query(
+                _applied(filters), start, end, limit, cursor, offset, descending, with_total
+            )
+
+    def _query(
+        self,
+        filters: Dict[str, Any],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: int,
+        cursor: Optional[str],
+        offset: int,
+        descending: bool,
+        with_total: bool,
+    ) -> AuditPage:
+        keys, lo, hi = self._range(filters, start, end)
+        total = hi - lo if with_total else None
+        if cursor is not None:
+            after = decode_cursor(cursor)
+            if descending:
+                hi = max(lo, min(hi, bisect_left(keys, after)))
+            else:
+                lo = min(hi, max(lo, bisect_right(keys, after)))
+            offset = 0
+        positions = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        selected = positions[offset : offset + limit]
+        more = len(positions) > offset + limit
+
+        entries = [self._entries[keys[p][1]] for p in selected]
+        next_cursor = encode_cursor(keys[selected[-1]]) if more and selected else None
+        return AuditPage(entries=entries, next_cursor=next_cursor, total=total)
+
+    def count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        with self._lock:
+            _, lo, hi = self._range(_applied(filters), start, end)
+            return hi - lo
+
+    def count_by(
+        self,
+        field: str,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[Any, int]:
+        filters = _applied(filters)
+        with self._lock:
+            if not filters:
+                # Bisect each value's key list rather than visiting entries
+                counts = {}
+                for (value,), keys in self._index((field,)).items():
+                    lo = bisect_left(keys, (start, 0)) if start is not None else 0
+                    hi = bisect_right(keys, (end, float("inf"))) if end is not None else len(keys)
+                    if hi > lo:
+                        counts[value] = hi - lo
+                return counts
+            keys, lo, hi = self._range(filters, start, end)
+            position = AUDIT_FILTERS.index(field)
+            return dict(Counter(self._values[seq][position] for _, seq in keys[lo:hi]))
+
+    def iter_entries(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        cursor = None
+        while True:
+            page = self.query(
+                filters, start, end, limit=batch_size, cursor=cursor, descending=False
+            )
+            yield from page.entries
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def purge_before(self, cutoff: datetime) -> int:
+        with self._lock:
+            return self._purge_before(cutoff)
+
+    def _purge_before(self, cutoff: datetime) -> int:
+        count = bisect_left(self._keys, (cutoff, 0))
+        if not count:
+            return 0
+        expired = self._keys[:count]
+        del self._keys[:count]
+        # Expired keys are the oldest in every index list they appear in
+        touched = set()
+        for _, seq in expired:
+            del self._entries[seq]
+            touched.add(self._values.pop(seq))
+        for fields, index in self._indexes.items():
+            for value in {self._project(fields, values) for values in touched}:
+                keys = index.get(value)
+                if keys is None:
+                    continue
+                del keys[: bisect_left(keys, (cutoff, 0))]
+                if not keys:
+                    del index[value]
+        return count
+
+
+def _split_resource(resource: str) -> Tuple[str, str]:
+    resource_type, _, resource_id = resource.partition(":")
+    return resource_type, resource_id
+
+
+class SqlAuditLogStore(AuditLogStore):
+    """
+    Entries stored as audit_logs rows through an AuditLogRepository.
+
+    user_id is stored in the actor column; resource "type:id" is split across
+    resource_type and resource_id. entry_factory turns a row back into an
+    entry from its field names (e.g. AuditLogEntry); callers such as
+    AdminService.iter_audit_export read entries by attribute.
+    """
+
+    def __init__(self, repository: Any, entry_factory: Callable[..., Any]) -> None:
+        self.repository = repository
+        self.entry_factory = entry_factory
+
+    def __len__(self) -> int:
+        return self.repository.count_matching()
+
+    def append(self, entry: Any) -> None:
+        resource_type, resource_id = _split_resource(entry.resource)
+        self.repository.append(
+            [
+                {
+                    "actor": entry.user_id,
+                    "action": entry.action,
+                    "resource_type": resource_type,
+                    "resource_id": resource_id,
+                    "status": entry.status,
+                    "details": entry.details,
+                    "ip_address": entry.ip_address,
+                    "entry_id": str(entry.entry_id),
+                    "timestamp": entry.timestamp,
+                }
+            ]
+        )
+
+    def _entry(self, row: Dict[str, Any]) -> Any:
+        resource = row["resource_type"]
+        if row["resource_id"]:
+            resource = f"{resource}:{row['resource_id']}"
+        fields = dict(
+            timestamp=row["timestamp"],
+            user_id=row["actor"],
+            action=row["action"],
+            resource=resource,
+            details=row["details"] or {},
+            ip_address=row["ip_address"],
+            status=row["status"],
+        )
+        if row["entry_id"]:
+            # Rows written outside the store have no entry ID
+            fields["entry_id"] = row["entry_id"]
+        return self.entry_factory(**fields)
+
+    @staticmethod
+    def _columns(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        columns = {}
+        for name, value in _applied(filters).items():
+            if name == "user_id":
+                columns["actor"] = value
+            elif name == "resource":
+                columns["resource_type"], columns["resource_id"] = _split_resource(value)
+            else:
+                columns[name] = value
+        return columns
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        descending: bool = True,
+        with_total: bool = False,
+    ) -> AuditPage:
+        columns = self._columns(filters)
+        after = decode_cursor(cursor) if cursor is not None else None
+        # One extra row tells whether another page follows
+        rows = self.repository.page(columns, start, end, after, limit + 1, offset, descending)
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return AuditPage(
+            entries=[self._entry(row) for row in rows],
+            next_cursor=encode_cursor((rows[-1]["timestamp"], rows[-1]["id"])) if more else None,
+            total=self.repository.count_matching(columns, start, end) if with_total else None,
+        )
+
+    def count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        return self.repository.count_matching(self._columns(filters), start, end)
+
+    def count_by(
+        self,
+        field: str,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[Any, int]:
+        columns = self._columns(filters)
+        if field == "resource":
+            counts: Dict[Any, int] = {}
+            grouped = self.repository.count_by(
+                ("resource_type", "resource_id"), columns, start, end
+            )
+            for (resource_type, resource_id), count in grouped.items():
+                resource = f"{resource_type}:{resource_id}" if resource_id else resource_type
+                counts[resource] = counts.get(resource, 0) + count
+            return counts
+        column = "actor" if field == "user_id" else field
+        grouped = self.repository.count_by((column,), columns, start, end)
+        return {key[0]: count for key, count in grouped.items()}
+
+    def iter_entries(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        for row in self.repository.stream(self._columns(filters), start, end, batch_size):
+            yield self._entry(row)
+
+    def purge_before(self, cutoff: datetime) -> int:
+        return self.repository.delete_before(cutoff)
@@ -12,10 +12,23 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.core.pay_equity import AdjustedGap, PayEquityEngine, PayGap
+from src.core.text_scanner import ScanRule, get_text_scanner
 
 logger = logging.getLogger(__name__)
 
+# Scanner categories for the auditor's rule sets
+SCAN_TERMS = "bias.terms"
+SCAN_PATTERNS = "bias.patterns"
+SCAN_STEREOTYPES = "bias.stereotypes"
+SCAN_EXCLUSIONARY = "bias.exclusionary"
+SCAN_CATEGORIES = (SCAN_TERMS, SCAN_PATTERNS, SCAN_STEREOTYPES, SCAN_EXCLUSIONARY)
+
+# (scanner category, rule name) pairs that matched a text
+Hits = Set[Tuple[str, str]]
+
 
 class ProtectedCategory(str, Enum):
     """Protected categories under employment law (EEO compliance)."""
@@ -234,6 +247,7 @@ class BiasAuditor:
         """Initialize bias auditor."""
         self.incidents: List[BiasIncident] = []
         self._compile_patterns()
+        self._register_scan_rules()
 
     def _compile_patterns(self) -> None:
         """Compile regex patterns for performance."""
@@ -256,6 +270,35 @@ class BiasAuditor:
                 re.compile(p, re.IGNORECASE) for p in patterns
             ]
 
+    def _register_scan_rules(self) -> None:
+        """Register the lexicon and pattern tables with the shared text scanner."""
+        rules = []
+        for category, lexicon in self.BIAS_LEXICON.items():
+            rules += [
+                ScanRule(SCAN_TERMS, f"{category.value}:{i}", re.escape(term), re.IGNORECASE)
+                for i, term in enumerate(lexicon.get("terms", []))
+            ]
+            rules += [
+                ScanRule(SCAN_PATTERNS, f"{category.value}:{i}", pattern, re.IGNORECASE)
+                for i, pattern in enumerate(lexicon.get("patterns", []))
+            ]
+        for category, patterns in self.STEREOTYPE_PATTERNS.items():
+            rules += [
+                ScanRule(SCAN_STEREOTYPES, f"{category.value}:{i}", pattern, re.IGNORECASE)
+                for i, pattern in enumerate(patterns)
+            ]
+        for group, patterns in self.EXCLUSIONARY_PATTERNS.items():
+            rules += [
+                ScanRule(SCAN_EXCLUSIONARY, f"{group}:{i}", pattern, re.IGNORECASE)
+                for i, pattern in enumerate(patterns)
+            ]
+        get_text_scanner().register(rules)
+
+    @staticmethod
+    def _scan(text: str, categories: Tuple[str, ...] = SCAN_CATEGORIES) -> Hits:
+        """Scan text once for the given rule sets and return the rules that matched."""
+        return {(span.category, span.rule) for span in get_text_scanner().scan(text, categories)}
+
     def scan_response(
         self,
         agent_type: str,
@@ -280,17 +323,18 @@ class BiasAuditor:
             )
         """
         incidents = []
+        hits = self._scan(response)
 
         # Check for biased language
-        language_incidents = self._check_biased_language(response)
+        language_incidents = self._check_biased_language(response, hits)
         incidents.extend(language_incidents)
 
         # Check for stereotypes
-        stereotype_incidents = self._check_stereotypes(response)
+        stereotype_incidents = self._check_stereotypes(response, hits)
         incidents.extend(stereotype_incidents)
 
         # Check for exclusionary patterns
-        exclusion_incidents = self._check_exclusionary_patterns(response)
+        exclusion_incidents = self._check_exclusionary_patterns(response, hits)
         incidents.extend(exclusion_incidents)
 
         # Enrich incidents with context
@@ -308,15 +352,22 @@ class BiasAuditor:
     def check_compensation_equity(
         self,
         data_points: List[Dict[str, Any]],
+        adjust_for: Optional[Sequence[str]] = None,
     ) -> List[BiasIncident]:
         """Check compensation data for equity issues.
 
         Analyzes compensation patterns to detect systematic bias in pay.
+        Employees are compared within peer groups (job title and level);
+        all groups are analyzed at once by a PayEquityEngine.
 
         Args:
             data_points: List of employee data with compensation info.
                         Expected fields: job_title, level, gender, race, age,
                         base_salary, bonus, total_comp
+            adjust_for: Also report regression-adjusted gaps across all peer
+                        groups, controlling for these numeric fields (e.g.
+                        ["tenure_years", "performance_rating"]; [] controls for
+                        peer group only)
 
         Returns:
             List of BiasIncident objects detecting equity issues
@@ -328,32 +379,36 @@ class BiasAuditor:
             ]
             incidents = auditor.check_compensation_equity(employees)
         """
-        incidents = []
+        incidents: List[BiasIncident] = []
 
         if not data_points:
             return incidents
 
-        # Group by job title and level
-        groups: Dict[str, List[Dict[str, Any]]] = {}
-        for point in data_points:
-            key = f"{point.get('job_title', 'unknown')}_{point.get('level', 'unknown')}"
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(point)
+        engine = PayEquityEngine(data_points, controls=adjust_for or ())
+        gender_gaps = engine.gaps("gender")
+        race_gaps = engine.gaps("race")
+        age_gaps = engine.gaps("age")
 
-        # Analyze each group for disparities
-        for group_key, group in groups.items():
-            # Check gender pay gap
-            gender_gap = self._check_gender_pay_gap(group)
-            incidents.extend(gender_gap)
-
-            # Check race pay gap
-            race_gap = self._check_race_pay_gap(group)
-            incidents.extend(race_gap)
+        # Per peer group: gender, then race, then age findings
+        for group in range(len(engine.groups)):
+            incidents.extend(
+                self._gender_gap_incident(gap) for gap in gender_gaps[group] if gap.gap_pct > 5
+            )
+            incidents.extend(
+                self._race_gap_incident(gap) for gap in race_gaps[group] if gap.gap_pct > 5
+            )
+            # ADEA concerns if younger paid significantly more
+            incidents.extend(
+                self._age_gap_incident(gap) for gap in age_gaps[group] if gap.ratio < 0.85
+            )
 
-            # Check age pay gap
-            age_gap = self._check_age_pay_gap(group)
-            incidents.extend(age_gap)
+        if adjust_for is not None:
+            for attribute in ("gender", "race", "age"):
+                incidents.extend(
+                    self._adjusted_gap_incident(gap)
+                    for gap in engine.adjusted_gaps(attribute)
+                    if gap.gap_pct > 5 and abs(gap.t_stat) >= 1.96
+                )
 
         for incident in incidents:
             incident.agent_type = "compensation"
@@ -452,15 +507,18 @@ class BiasAuditor:
 
         return incidents
 
-    def _check_biased_language(self, text: str) -> List[BiasIncident]:
+    def _check_biased_language(self, text: str, hits: Optional[Hits] = None) -> List[BiasIncident]:
         """Detect biased language in text.
 
         Args:
             text: Text to analyze
+            hits: Scanner matches for text (scanned here if not given)
 
         Returns:
             List of BiasIncident for detected biased language
         """
+        if hits is None:
+            hits = self._scan(text, (SCAN_TERMS, SCAN_PATTERNS))
         incidents = []
 
         for category in ProtectedCategory:
@@ -469,8 +527,8 @@ class BiasAuditor:
 
             # Check direct terms
             terms = self.BIAS_LEXICON[category].get("terms", [])
-            for term in terms:
-                if term.lower() in text.lower():
+            for i, term in enumerate(terms):
+                if (SCAN_TERMS, f"{category.value}:{i}") in hits:
                     incidents.append(
                         BiasIncident(
                             category=category,
@@ -487,9 +545,9 @@ class BiasAuditor:
             # Check regex patterns
             pattern_key = f"{category.value}_patterns"
             if pattern_key in self.compiled_patterns:
-                for pattern in self.compiled_patterns[pattern_key]:
-                    matches = pattern.findall(text)
-                    if matches:
+                for i, pattern in enumerate(self.compiled_patterns[pattern_key]):
+                    if (SCAN_PATTERNS, f"{category.value}:{i}") in hits:
+                        matches = pattern.findall(text)
                         incidents.append(
                             BiasIncident(
                                 category=category,
@@ -505,15 +563,18 @@ class BiasAuditor:
 
         return incidents
 
-    def _check_stereotypes(self, text: str) -> List[BiasIncident]:
+    def _check_stereotypes(self, text: str, hits: Optional[Hits] = None) -> List[BiasIncident]:
         """Detect stereotype patterns in text.
 
         Args:
             text: Text to analyze
+            hits: Scanner matches for text (scanned here if not given)
 
         Returns:
             List of BiasIncident for detected stereotypes
         """
+        if hits is None:
+            hits = self._scan(text, (SCAN_STEREOTYPES,))
         incidents = []
 
         for category in ProtectedCategory:
@@ -522,9 +583,9 @@ class BiasAuditor:
 
             pattern_key = f"{category.value}_stereotypes"
             if pattern_key in self.compiled_patterns:
-                for pattern in self.compiled_patterns[pattern_key]:
-                    matches = pattern.findall(text)
-                    if matches:
+                for i, pattern in enumerate(self.compiled_patterns[pattern_key]):
+                    if (SCAN_STEREOTYPES, f"{category.value}:{i}") in hits:
+                        matches = pattern.findall(text)
                         incidents.append(
                             BiasIncident(
                                 category=category,
@@ -541,23 +602,28 @@ class BiasAuditor:
 
         return incidents
 
-    def _check_exclusionary_patterns(self, text: str) -> List[BiasIncident]:
+    def _check_exclusionary_patterns(
+        self, text: str, hits: Optional[Hits] = None
+    ) -> List[BiasIncident]:
         """Detect exclusionary language patterns.
 
         Args:
             text: Text to analyze
+            hits: Scanner matches for text (scanned here if not given)
 
         Returns:
             List of BiasIncident for detected exclusionary patterns
         """
+        if hits is None:
+            hits = self._scan(text, (SCAN_EXCLUSIONARY,))
         incidents = []
 
         for pattern_category, patterns in self.EXCLUSIONARY_PATTERNS.items():
             pattern_key = f"exclusionary_{pattern_category}"
             if pattern_key in self.compiled_patterns:
-                for pattern in self.compiled_patterns[pattern_key]:
-                    matches = pattern.findall(text)
-                    if matches:
+                for i, pattern in enumerate(self.compiled_patterns[pattern_key]):
+                    if (SCAN_EXCLUSIONARY, f"{pattern_category}:{i}") in hits:
+                        matches = pattern.findall(text)
                         severity = (
                             BiasSeverity.CRITICAL
                             if "gendered" in pattern_category
@@ -579,153 +645,118 @@ class BiasAuditor:
 
         return incidents
 
-    def _check_gender_pay_gap(
-        self,
-        group: List[Dict[str, Any]],
-    ) -> List[BiasIncident]:
-        """Analyze gender pay gap in a peer group.
+    @staticmethod
+    def _gap_severity(gap_pct: float) -> BiasSeverity:
+        """Map a pay gap percentage to severity."""
+        if gap_pct > 15:
+            return BiasSeverity.CRITICAL
+        return BiasSeverity.HIGH if gap_pct > 10 else BiasSeverity.MEDIUM
+
+    def _gender_gap_incident(self, gap: PayGap) -> BiasIncident:
+        """Build the incident for a gender pay gap in a peer group.
 
         Args:
-            group: List of employee records in same role/level
+            gap: Female vs male mean pay in the group
 
         Returns:
-            List of BiasIncident if significant gap detected
+            BiasIncident describing the gap
         """
-        incidents = []
-
-        male_salaries = [
-            p.get("base_salary", 0) for p in group if p.get("gender", "").lower() == "m"
-        ]
-        female_salaries = [
-            p.get("base_salary", 0) for p in group if p.get("gender", "").lower() == "f"
-        ]
-
-        if male_salaries and female_salaries:
-            male_avg = sum(male_salaries) / len(male_salaries)
-            female_avg = sum(female_salaries) / len(female_salaries)
-
-            if male_avg > 0:
-                gap_pct = ((male_avg - female_avg) / male_avg) * 100
-
-                if gap_pct > 5:  # More than 5% gap
-                    severity = (
-                        BiasSeverity.CRITICAL
-                        if gap_pct > 15
-                        else BiasSeverity.HIGH if gap_pct > 10 else BiasSeverity.MEDIUM
-                    )
-                    incidents.append(
-                        BiasIncident(
-                            category=ProtectedCategory.GENDER,
-                            severity=severity,
-                            description=f"Gender pay gap detected: {gap_pct:.1f}%",
-                            evidence=f"Male avg: ${male_avg:.0f}, Female avg: ${female_avg:.0f}",
-                            recommendations=[
-                                "Conduct formal pay equity analysis",
-                                "Review compensation criteria for bias",
-                                "Consider pay adjustments for equity",
-                                "Document decision-making rationale",
-                            ],
-                        )
-                    )
-
-        return incidents
+        return BiasIncident(
+            category=ProtectedCategory.GENDER,
+            severity=self._gap_severity(gap.gap_pct),
+            description=f"Gender pay gap detected: {gap.gap_pct:.1f}%",
+            evidence=(
+                f"Male avg: ${gap.reference_mean:.0f}, Female avg: ${gap.comparison_mean:.0f}"
+            ),
+            recommendations=[
+                "Conduct formal pay equity analysis",
+                "Review compensation criteria for bias",
+                "Consider pay adjustments for equity",
+                "Document decision-making rationale",
+            ],
+        )
 
-    def _check_race_pay_gap(
-        self,
-        group: List[Dict[str, Any]],
-    ) -> List[BiasIncident]:
-        """Analyze race pay gap in a peer group.
+    def _race_gap_incident(self, gap: PayGap) -> BiasIncident:
+        """Build the incident for a race pay gap in a peer group.
 
         Args:
-            group: List of employee records in same role/level
+            gap: One race's mean pay vs the majority group's
 
         Returns:
-            List of BiasIncident if significant gap detected
+            BiasIncident describing the gap
         """
-        incidents = []
-
-        # Group by race
-        by_race: Dict[str, List[float]] = {}
-        for person in group:
-            race = person.get("race", "unknown")
-            salary = person.get("base_salary", 0)
-            if salary > 0:
-                if race not in by_race:
-                    by_race[race] = []
-                by_race[race].append(salary)
-
-        # Compare minority vs majority
-        if "white" in by_race or "majority" in by_race:
-            majority_key = "white" if "white" in by_race else "majority"
-            majority_avg = sum(by_race[majority_key]) / len(by_race[majority_key])
-
-            for minority_key, salaries in by_race.items():
-                if minority_key != majority_key and salaries:
-                    minority_avg = sum(salaries) / len(salaries)
-                    gap_pct = ((majority_avg - minority_avg) / majority_avg) * 100
-
-                    if gap_pct > 5:
-                        severity = (
-                            BiasSeverity.CRITICAL
-                            if gap_pct > 15
-                            else BiasSeverity.HIGH if gap_pct > 10 else BiasSeverity.MEDIUM
-                        )
-                        incidents.append(
-                            BiasIncident(
-                                category=ProtectedCategory.RACE,
-                                severity=severity,
-                                description=f"Race-based pay gap: {minority_key} vs {majority_key} ({gap_pct:.1f}%)",
-                                evidence=f"{majority_key} avg: ${majority_avg:.0f}, {minority_key} avg: ${minority_avg:.0f}",
-                                recommendations=[
-                                    "Conduct EEO audit",
-                                    "Review promotion patterns",
-                                    "Analyze hiring practices",
-                                    "Ensure objective evaluation criteria",
-                                ],
-                            )
-                        )
+        minority_key, majority_key = gap.comparison, gap.reference
+        return BiasIncident(
+            category=ProtectedCategory.RACE,
+            severity=self._gap_severity(gap.gap_pct),
+            description=(
+                f"Race-based pay gap: {minority_key} vs {majority_key} ({gap.gap_pct:.1f}%)"
+            ),
+            evidence=(
+                f"{majority_key} avg: ${gap.reference_mean:.0f}, "
+                f"{minority_key} avg: ${gap.comparison_mean:.0f}"
+            ),
+            recommendations=[
+                "Conduct EEO audit",
+                "Review promotion patterns",
+                "Analyze hiring practices",
+                "Ensure objective evaluation criteria",
+            ],
+        )
 
-        return incidents
+    def _age_gap_incident(self, gap: PayGap) -> BiasIncident:
+        """Build the incident for an age pay disparity in a peer group.
 
-    def _check_age_pay_gap(
-        self,
-        group: List[Dict[str, Any]],
-    ) -> List[BiasIncident]:
-        """Analyze age-based pay disparities.
+        ADEA concerns arise when younger employees are paid significantly more.
 
         Args:
-            group: List of employee records in same role/level
+            gap: 40-and-over vs under-40 mean pay in the group
 
         Returns:
-            List of BiasIncident if significant disparity detected
+            BiasIncident describing the disparity
         """
-        incidents = []
-
-        # Group by age ranges
-        young = [p.get("base_salary", 0) for p in group if p.get("age", 0) < 40]
-        old = [p.get("base_salary", 0) for p in group if p.get("age", 0) >= 40]
+        return BiasIncident(
+            category=ProtectedCategory.AGE,
+            severity=BiasSeverity.HIGH,
+            description="Potential age discrimination in compensation",
+            evidence=(
+                f"Younger (< 40) avg: ${gap.reference_mean:.0f}, "
+                f"Older (>= 40) avg: ${gap.comparison_mean:.0f}"
+            ),
+            recommendations=[
+                "Review ADEA compliance",
+                "Analyze tenure vs compensation correlation",
+                "Ensure objective criteria",
+            ],
+        )
 
-        if young and old:
-            young_avg = sum(young) / len(young)
-            old_avg = sum(old) / len(old)
+    def _adjusted_gap_incident(self, gap: AdjustedGap) -> BiasIncident:
+        """Build the incident for a significant regression-adjusted pay gap.
 
-            # ADEA concerns if younger paid significantly more
-            if young_avg > 0 and (old_avg / young_avg) < 0.85:
-                incidents.append(
-                    BiasIncident(
-                        category=ProtectedCategory.AGE,
-                        severity=BiasSeverity.HIGH,
-                        description="Potential age discrimination in compensation",
-                        evidence=f"Younger (< 40) avg: ${young_avg:.0f}, Older (>= 40) avg: ${old_avg:.0f}",
-                        recommendations=[
-                            "Review ADEA compliance",
-                            "Analyze tenure vs compensation correlation",
-                            "Ensure objective criteria",
-                        ],
-                    )
-                )
+        Args:
+            gap: Adjusted gap across all peer groups
 
-        return incidents
+        Returns:
+            BiasIncident describing the gap
+        """
+        controls = ", ".join(["job title and level", *gap.controls])
+        return BiasIncident(
+            category=ProtectedCategory(gap.attribute),
+            severity=self._gap_severity(gap.gap_pct),
+            description=(
+                f"Adjusted {gap.attribute} pay gap: {gap.comparison} vs {gap.reference} "
+                f"({gap.gap_pct:.1f}%)"
+            ),
+            evidence=(
+                f"Controlling for {controls}: n={gap.observations}, "
+                f"coefficient={gap.coefficient:.4f}, t={gap.t_stat:.2f}"
+            ),
+            recommendations=[
+                "Conduct formal pay equity analysis",
+                "Investigate pay differences not explained by role, level or controls",
+                "Consider pay adjustments for equity",
+            ],
+        )
 
     def _generate_recommendations(
         self,
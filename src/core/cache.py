@@ -6,6 +6,8 @@ import json
 import logging
 from typing import Any, Optional
 
+from src.core.connection_pool import get_pool_manager
+
 try:
     import redis
     from redis.asyncio import Redis as AsyncRedis
@@ -44,14 +46,8 @@ class CacheManager:
             return
 
         try:
-            # Parse redis URL and create connection
-            self.client = redis.from_url(
-                self.redis_url,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_keepalive=True,
-                health_check_interval=30,
-            )
+            # Shared client from the pool manager (decoded responses, bounded pool)
+            self.client = get_pool_manager().redis_client(self.redis_url)
             # Test connection
             self.client.ping()
             logger.info("Connected to Redis successfully")
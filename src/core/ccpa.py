@@ -8,11 +8,14 @@ consumer rights management, data inventory, opt-out of sale, and disclosure requ
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.core.dsar_discovery import DSARDiscoveryEngine
+from src.core.retention import RetentionExecutor
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,6 +104,19 @@ class DataInventoryItem(BaseModel):
     model_config = ConfigDict(use_enum_values=False)
 
 
+# Discovery category -> (CCPA category, business purpose) for inventory items
+DISCOVERY_CATEGORIES: Dict[str, Tuple[CCPADataCategory, str]] = {
+    "employment_records": (CCPADataCategory.PROFESSIONAL, "Employment Administration"),
+    "leave_records": (CCPADataCategory.PROFESSIONAL, "Leave Administration"),
+    "benefits_data": (CCPADataCategory.FINANCIAL, "Benefits Administration"),
+    "performance_records": (CCPADataCategory.PROFESSIONAL, "Performance Management"),
+    "chat_history": (CCPADataCategory.INTERNET_ACTIVITY, "HR Assistant Support"),
+    "activity_logs": (CCPADataCategory.INTERNET_ACTIVITY, "Security and Compliance"),
+    "notifications": (CCPADataCategory.PERSONAL_INFO, "Employee Communications"),
+    "documents": (CCPADataCategory.PROFESSIONAL, "HR Knowledge Base"),
+}
+
+
 class CCPAConfig(BaseModel):
     """CCPA compliance configuration."""
 
@@ -136,16 +152,27 @@ class CCPAComplianceService:
     and compliance reporting for California Consumer Privacy Act requirements.
     """
 
-    def __init__(self, config: Optional[CCPAConfig] = None, audit_logger: Optional[Any] = None):
+    def __init__(
+        self,
+        config: Optional[CCPAConfig] = None,
+        audit_logger: Optional[Any] = None,
+        discovery: Optional[DSARDiscoveryEngine] = None,
+        retention_executor: Optional[RetentionExecutor] = None,
+    ):
         """
         Initialize CCPA compliance service.
 
         Args:
             config: CCPAConfig object with compliance settings
             audit_logger: Logger for audit trail (optional)
+            discovery: DSAR discovery engine used to build data inventories (optional)
+            retention_executor: Executor that carries out deletion requests (optional;
+                without one, deletions are only queued)
         """
         self.config = config or CCPAConfig()
         self.audit_logger = audit_logger
+        self.discovery = discovery
+        self.retention_executor = retention_executor
 
         # In-memory storage
         self._requests: Dict[str, CCPARequest] = {}
@@ -428,7 +455,10 @@ class CCPAComplianceService:
 
     def _init_data_inventory(self, consumer_id: str) -> List[DataInventoryItem]:
         """
-        Initialize default data inventory for a consumer.
+        Initialize data inventory for a consumer.
+
+        With a discovery engine, lists every source holding records about the
+        consumer; otherwise returns the default inventory.
 
         Args:
             consumer_id: Consumer ID
@@ -436,6 +466,20 @@ class CCPAComplianceService:
         Returns:
             List of DataInventoryItem objects
         """
+        if self.discovery is not None:
+            report = self.discovery.discover(consumer_id)
+            items = []
+            for summary in report.sources:
+                if not summary.records:
+                    continue
+                category, purpose = DISCOVERY_CATEGORIES.get(
+                    summary.category, (CCPADataCategory.PERSONAL_INFO, "Employment Administration")
+                )
+                items.append(
+                    DataInventoryItem(category=category, source=summary.source, purpose=purpose)
+                )
+            return items
+
         return [
             DataInventoryItem(
                 category=CCPADataCategory.PERSONAL_INFO,
@@ -806,7 +850,6 @@ class CCPAComplianceService:
             Dictionary with deletion results
         """
         try:
-            # Simulate deletion process
             result = {
                 "consumer_id": consumer_id,
                 "action": "deletion_queued",
@@ -819,6 +862,14 @@ class CCPAComplianceService:
                 ],
             }
 
+            if self.retention_executor is not None:
+                report = self.retention_executor.erase(consumer_id)
+                result["action"] = "deleted"
+                result["status"] = "completed" if report.completed else "in_progress"
+                result["deleted_records"] = report.deleted_records
+                result["anonymized_records"] = report.anonymized_records
+                result["vector_chunks"] = report.vector_chunks
+
             self._log_audit_trail(
                 action="data_deletion_initiated",
                 consumer_id=consumer_id,
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, create_engine
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -104,26 +104,44 @@ class AuthSession(Base, TimestampMixin):
 class AuditLog(Base):
     """Audit log model for tracking user actions.
 
+    Every query filter is paired with (timestamp, id) in a composite index, so
+    filtered, time-ordered pages are read by keyset from a single index.
+
     Attributes:
         id: Primary key
-        user_id: FK to Employee
+        user_id: FK to Employee (NULL for actors that are not employees)
+        actor: ID of the acting principal as logged (admin user, SYSTEM, ...)
         action: Action type (create/read/update/delete)
         resource_type: Type of resource affected
         resource_id: ID of affected resource
+        status: Action status (success/failure)
         details: JSON details of the action
         ip_address: Client IP address
+        entry_id: ID of the originating audit entry
         timestamp: Action timestamp
     """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+        Index("ix_audit_logs_actor_timestamp", "actor", "timestamp", "id"),
+        Index("ix_audit_logs_action_timestamp", "action", "timestamp", "id"),
+        Index(
+            "ix_audit_logs_resource_timestamp", "resource_type", "resource_id", "timestamp", "id"
+        ),
+        Index("ix_audit_logs_status_timestamp", "status", "timestamp", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("employees.id"), nullable=False)
+    user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("employees.id"), nullable=True)
+    actor: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     action: Mapped[str] = mapped_column(String(50), nullable=False)
     resource_type: Mapped[str] = mapped_column(String(100), nullable=False)
     resource_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="success", nullable=False)
     details: Mapped[dict] = mapped_column(JSON, default=dict)
-    ip_address: Mapped[str] = mapped_column(String(45), nullable=False)
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    entry_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     def __repr__(self) -> str:
@@ -642,6 +660,8 @@ def init_db(database_url: str = DATABASE_URL) -> None:
     if engine is None:
         raise RuntimeError("Failed to initialize database engine")
 
+    import src.repositories  # noqa: F401  registers repository-owned models on Base
+
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created successfully")
 
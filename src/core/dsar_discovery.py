@@ -0,0 +1,649 @@
+"""
+COMP-004: DSAR data discovery engine.
+
+Finds everything we hold about a data subject for access and portability
+requests. Every store has an extractor in a DataSourceRegistry: a callable
+that takes the resolved DataSubject and yields that subject's records as
+dicts. Built-in sources cover:
+
+- database tables, each queried by its subject column (employees.id,
+  leave_requests.employee_id, audit_logs.user_id, ...; chat and
+  conversation messages through their conversation; audit rows also by the
+  actor they were logged under); see ensure_indexes for the matching indexes
+- HRIS connectors (profile, leave, benefits)
+- RAG / vector collections, filtered on a metadata field
+
+A discovery runs all extractors concurrently on a thread pool. Records flow
+through a bounded queue to a single consumer, which either writes them to a
+gzip-compressed JSON Lines export or collects them, so a slow consumer holds
+the extractors back instead of buffering everything in memory.
+"""
+
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Columns never exported: credentials, not personal data
+SECRET_COLUMNS = frozenset({"password_hash", "token_hash"})
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class DataSubject:
+    """A data subject resolved to the identifiers our stores use."""
+
+    subject_id: str  # as given in the request
+    employee_id: Optional[int] = None  # employees.id
+    hris_id: Optional[str] = None
+    email: Optional[str] = None
+    name: Optional[str] = None
+
+    @property
+    def external_id(self) -> str:
+        """ID used by HRIS connectors and document stores."""
+        return self.hris_id or self.subject_id
+
+    @property
+    def actor_ids(self) -> Tuple[str, ...]:
+        """Every ID the subject may be logged under as a free-form actor."""
+        ids = [self.subject_id, self.hris_id, self.email]
+        if self.employee_id is not None:
+            ids.append(str(self.employee_id))
+        return tuple(dict.fromkeys(i for i in ids if i))
+
+
+Extractor = Callable[[DataSubject], Iterable[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class DataSource:
+    """A store that may hold a subject's personal data."""
+
+    name: str
+    category: str  # e.g. employment_records, leave_records, chat_history
+    extractor: Extractor
+
+
+@dataclass
+class SourceSummary:
+    """Outcome of one source in a discovery run."""
+
+    source: str
+    category: str
+    records: int = 0
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class DiscoveryReport:
+    """Outcome of a discovery run."""
+
+    subject: DataSubject
+    sources: List[SourceSummary]
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
+    export_path: Optional[str] = None
+
+    @property
+    def total_records(self) -> int:
+        return sum(summary.records for summary in self.sources)
+
+    @property
+    def failed_sources(self) -> List[str]:
+        return [summary.source for summary in self.sources if summary.error]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "subject": asdict(self.subject),
+            "sources": [asdict(summary) for summary in self.sources],
+            "total_records": self.total_records,
+            "failed_sources": self.failed_sources,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "export_path": self.export_path,
+        }
+
+
+class DataSourceRegistry:
+    """Registry of per-source extractors, keyed by source name."""
+
+    def __init__(self) -> None:
+        self._sources: Dict[str, DataSource] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, category: str, extractor: Extractor) -> DataSource:
+        """
+        Register (or replace) a source.
+
+        Args:
+            name: Unique source name
+            category: Data category the source's records belong to
+            extractor: Callable yielding the subject's records as dicts
+
+        Returns:
+            The registered DataSource
+        """
+        source = DataSource(name=name, category=category, extractor=extractor)
+        with self._lock:
+            self._sources[name] = source
+        return source
+
+    def unregister(self, name: str) -> bool:
+        """Remove a source. Returns True if it was registered."""
+        with self._lock:
+            return self._sources.pop(name, None) is not None
+
+    def sources(self) -> List[DataSource]:
+        """Get registered sources in registration order."""
+        with self._lock:
+            return list(self._sources.values())
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
+# ============================================================================
+# Built-in sources
+# ============================================================================
+
+# (source name, category, table, subject column, (parent table, parent subject column) or None)
+# Child tables reach the subject through their conversation_id.
+DATABASE_SOURCES: List[Tuple[str, str, str, str, Optional[Tuple[str, str]]]] = [
+    ("employees", "employment_records", "employees", "id", None),
+    ("generated_documents", "employment_records", "generated_documents", "employee_id", None),
+    ("onboarding_checklists", "employment_records", "onboarding_checklists", "employee_id", None),
+    ("leave_requests", "leave_records", "leave_requests", "employee_id", None),
+    ("leave_balances", "leave_records", "leave_balances", "employee_id", None),
+    ("benefits_enrollments", "benefits_data", "benefits_enrollments", "employee_id", None),
+    ("performance_reviews", "performance_records", "performance_reviews", "employee_id", None),
+    ("performance_goals", "performance_records", "performance_goals", "employee_id", None),
+    ("chat_conversations", "chat_history", "chat_conversations", "employee_id", None),
+    (
+        "chat_messages",
+        "chat_history",
+        "chat_messages",
+        "conversation_id",
+        ("chat_conversations", "employee_id"),
+    ),
+    ("conversations", "chat_history", "conversations", "user_id", None),
+    (
+        "conversation_messages",
+        "chat_history",
+        "conversation_messages",
+        "conversation_id",
+        ("conversations", "user_id"),
+    ),
+    ("query_logs", "activity_logs", "query_logs", "employee_id", None),
+    ("audit_logs", "activity_logs", "audit_logs", "user_id", None),
+    ("auth_sessions", "activity_logs", "auth_sessions", "user_id", None),
+    ("notification_records", "notifications", "notification_records", "recipient_id", None),
+]
+
+# Tables that may log the subject only by a free-form actor ID (user_id is NULL
+# for rows written through SqlAuditLogStore) -> that actor column
+ACTOR_COLUMNS: Dict[str, str] = {"audit_logs": "actor"}
+
+
+def subject_condition(table: Any, column: str, subject: DataSubject) -> Any:
+    """
+    Condition matching a table's rows for a resolved subject.
+
+    Args:
+        table: SQLAlchemy Table
+        column: Column holding the subject's employee ID
+        subject: Subject with employee_id set
+
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    condition = table.c[column] == subject.employee_id
+    actor_column = ACTOR_COLUMNS.get(table.name)
+    if actor_column is not None:
+        condition = condition | table.c[actor_column].in_(subject.actor_ids)
+    return condition
+
+
+def table_extractor(
+    session_factory: Callable[[], Any],
+    table: Any,
+    column: str,
+    parent: Optional[Tuple[Any, str]] = None,
+    batch_size: int = 500,
+) -> Extractor:
+    """
+    Build an extractor streaming a table's rows for a subject.
+
+    Args:
+        session_factory: Callable returning a SQLAlchemy session
+        table: SQLAlchemy Table
+        column: Column holding the subject's employee ID, or (with parent)
+            the foreign key to the parent table's id
+        parent: (parent Table, parent column holding the employee ID)
+        batch_size: Rows fetched per round trip
+
+    Returns:
+        Extractor yielding one dict per row, without SECRET_COLUMNS
+    """
+    from sqlalchemy import select
+
+    columns = [c for c in table.c if c.name not in SECRET_COLUMNS]
+
+    def extract(subject: DataSubject) -> Iterator[Dict[str, Any]]:
+        if subject.employee_id is None:
+            return
+        if parent is None:
+            condition = subject_condition(table, column, subject)
+        else:
+            parent_table, parent_column = parent
+            conversations = select(parent_table.c.id).where(
+                parent_table.c[parent_column] == subject.employee_id
+            )
+            condition = table.c[column].in_(conversations)
+        session = session_factory()
+        try:
+            statement = select(*columns).where(condition).execution_options(yield_per=batch_size)
+            for row in session.execute(statement).mappings():
+                yield dict(row)
+        finally:
+            session.close()
+
+    return extract
+
+
+def register_database_sources(
+    registry: DataSourceRegistry, session_factory: Callable[[], Any]
+) -> None:
+    """
+    Register an extractor per personal-data table.
+
+    Args:
+        registry: Registry to add sources to
+        session_factory: Callable returning a SQLAlchemy session
+    """
+    from src.core.database import Base
+
+    tables = Base.metadata.tables
+    for name, category, table, column, parent in DATABASE_SOURCES:
+        parent_ref = (tables[parent[0]], parent[1]) if parent else None
+        registry.register(
+            name, category, table_extractor(session_factory, tables[table], column, parent_ref)
+        )
+
+
+def register_connector_sources(
+    registry: DataSourceRegistry, connector: Any, prefix: str = "hris"
+) -> None:
+    """
+    Register extractors for an HRIS connector's employee profile, leave and benefits.
+
+    Args:
+        registry: Registry to add sources to
+        connector: HRISConnector
+        prefix: Source name prefix
+    """
+
+    def dump(items: Any) -> Iterator[Dict[str, Any]]:
+        for item in items or []:
+            yield item.model_dump(mode="json")
+
+    def profile(subject: DataSubject) -> Iterator[Dict[str, Any]]:
+        employee = connector.get_employee(subject.external_id)
+        return dump([employee] if employee else [])
+
+    registry.register(f"{prefix}_profile", "employment_records", profile)
+    registry.register(
+        f"{prefix}_leave_requests",
+        "leave_records",
+        lambda subject: dump(connector.get_leave_requests(subject.external_id)),
+    )
+    registry.register(
+        f"{prefix}_leave_balances",
+        "leave_records",
+        lambda subject: dump(connector.get_leave_balance(subject.external_id)),
+    )
+    registry.register(
+        f"{prefix}_benefits",
+        "benefits_data",
+        lambda subject: dump(connector.get_benefits(subject.external_id)),
+    )
+
+
+def register_collection_source(
+    registry: DataSourceRegistry,
+    name: str,
+    collection: Any,
+    metadata_field: str = "employee_id",
+    category: str = "documents",
+    page_size: int = 500,
+) -> None:
+    """
+    Register an extractor for a vector collection (ChromaDB API).
+
+    Documents are matched on a metadata field holding the subject's external ID
+    and read a page at a time.
+
+    Args:
+        registry: Registry to add the source to
+        name: Source name
+        collection: Collection exposing get(where=..., include=..., limit=..., offset=...)
+        metadata_field: Metadata field holding the subject's ID
+        category: Data category
+        page_size: Documents read per call
+    """
+
+    def extract(subject: DataSubject) -> Iterator[Dict[str, Any]]:
+        offset = 0
+        while True:
+            page = collection.get(
+                where={metadata_field: subject.external_id},
+                include=["documents", "metadatas"],
+                limit=page_size,
+                offset=offset,
+            )
+            ids = page.get("ids") or []
+            documents = page.get("documents") or [None] * len(ids)
+            metadatas = page.get("metadatas") or [None] * len(ids)
+            for doc_id, document, metadata in zip(ids, documents, metadatas):
+                yield {"id": doc_id, "document": document, "metadata": metadata}
+            if len(ids) < page_size:
+                return
+            offset += page_size
+
+    registry.register(name, category, extract)
+
+
+def resolve_subject(
+    session_factory: Optional[Callable[[], Any]], subject_id: Union[str, int]
+) -> DataSubject:
+    """
+    Resolve a subject ID (employee ID, HRIS ID or email) against the employees table.
+
+    Args:
+        session_factory: SQLAlchemy session factory; without one nothing is resolved
+        subject_id: ID from the request
+
+    Returns:
+        DataSubject; only subject_id is set if no employee matches
+
+    Raises:
+        ValueError: If the ID matches more than one employee (e.g. one
+            employee's HRIS ID is another's numeric ID)
+    """
+    subject_id = str(subject_id)
+    if session_factory is None:
+        return DataSubject(subject_id=subject_id)
+
+    from sqlalchemy import or_, select
+    from src.core.database import Employee
+
+    conditions = [Employee.hris_id == subject_id, Employee.email == subject_id]
+    if subject_id.isdigit():
+        conditions.append(Employee.id == int(subject_id))
+    session = session_factory()
+    try:
+        rows = session.execute(
+            select(
+                Employee.id,
+                Employee.hris_id,
+                Employee.email,
+                Employee.first_name,
+                Employee.last_name,
+            )
+            .where(or_(*conditions))
+            .limit(2)
+        ).all()
+    finally:
+        session.close()
+
+    if not rows:
+        logger.warning(f"DSAR subject {subject_id} not found in employees")
+        return DataSubject(subject_id=subject_id)
+    if len(rows) > 1:
+        # Exporting or erasing the wrong person is worse than failing the request
+        raise ValueError(
+            f"DSAR subject {subject_id} matches employees {rows[0].id} and {rows[1].id}; "
+            f"use an ID that identifies one employee"
+        )
+    row = rows[0]
+    return DataSubject(
+        subject_id=subject_id,
+        employee_id=row.id,
+        hris_id=row.hris_id,
+        email=row.email,
+        name=f"{row.first_name} {row.last_name}",
+    )
+
+
+# ============================================================================
+# Discovery Engine
+# ============================================================================
+
+
+class DSARDiscoveryEngine:
+    """
+    Concurrent discovery of a data subject's personal data across registered sources.
+
+    Usage:
+        engine = DSARDiscoveryEngine(session_factory=SessionLocal, hris_connector=connector)
+        report = engine.export("emp_001", "/exports/emp_001.jsonl.gz")
+    """
+
+    def __init__(
+        self,
+        registry: Optional[DataSourceRegistry] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        hris_connector: Optional[Any] = None,
+        collections: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        queue_size: int = 1000,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            registry: Source registry (a new one if not provided)
+            session_factory: SQLAlchemy session factory; registers the database
+                sources and enables subject resolution
+            hris_connector: HRIS connector whose records to include
+            collections: Vector collections to include, by source name
+            max_workers: Sources extracted concurrently
+            queue_size: Records buffered between extractors and the consumer
+        """
+        self.registry = registry if registry is not None else DataSourceRegistry()
+        self._session_factory = session_factory
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+
+        if session_factory is not None:
+            register_database_sources(self.registry, session_factory)
+        if hris_connector is not None:
+            register_connector_sources(self.registry, hris_connector)
+        for name, collection in (collections or {}).items():
+            register_collection_source(self.registry, name, collection)
+
+    def resolve_subject(self, subject_id: Union[str, int]) -> DataSubject:
+        """
+        Resolve a subject ID (employee ID, HRIS ID or email) to the IDs our stores use.
+
+        Args:
+            subject_id: ID from the request
+
+        Returns:
+            DataSubject; only subject_id is set if no employee matches
+
+        Raises:
+            ValueError: If the ID matches more than one employee
+        """
+        return resolve_subject(self._session_factory, subject_id)
+
+    def discover(
+        self,
+        subject: Union[str, int, DataSubject],
+        sink: Optional[Callable[[DataSource, Dict[str, Any]], None]] = None,
+    ) -> DiscoveryReport:
+        """
+        Run every source's extractor concurrently and hand records to a sink.
+
+        The sink runs on the calling thread, one record at a time. A failing
+        source is recorded in the report and does not stop the others.
+
+        Args:
+            subject: Subject ID or resolved DataSubject
+            sink: Called with (source, record) for every record found
+
+        Returns:
+            DiscoveryReport with per-source record counts and errors
+        """
+        if not isinstance(subject, DataSubject):
+            subject = self.resolve_subject(subject)
+        sources = self.registry.sources()
+        report = DiscoveryReport(
+            subject=subject, sources=[SourceSummary(s.name, s.category) for s in sources]
+        )
+        if not sources:
+            report.completed_at = datetime.utcnow()
+            return report
+
+        records: "queue.Queue[Tuple[DataSource, Any]]" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def put(item: Tuple[DataSource, Any]) -> bool:
+            # Block while the consumer catches up, but give up once it has stopped
+            while not stop.is_set():
+                try:
+                    records.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(source: DataSource, summary: SourceSummary) -> None:
+            started = time.perf_counter()
+            iterator = None
+            try:
+                iterator = iter(source.extractor(subject))
+                for record in iterator:
+                    if not put((source, record)):
+                        break
+                    summary.records += 1
+            except Exception as e:
+                summary.error = str(e) or type(e).__name__
+                logger.warning(f"DSAR source {source.name} failed: {e}")
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+                summary.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+                put((source, _DONE))
+
+        workers = max(1, min(self.max_workers, len(sources)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dsar") as pool:
+            for source, summary in zip(sources, report.sources):
+                pool.submit(run, source, summary)
+            pending = len(sources)
+            try:
+                while pending:
+                    source, record = records.get()
+                    if record is _DONE:
+                        pending -= 1
+                    elif sink is not None:
+                        sink(source, record)
+            finally:
+                stop.set()
+
+        report.completed_at = datetime.utcnow()
+        logger.info(
+            f"DSAR discovery for {subject.subject_id}: {report.total_records} records "
+            f"from {len(sources)} sources ({len(report.failed_sources)} failed)"
+        )
+        return report
+
+    def collect(
+        self, subject: Union[str, int, DataSubject]
+    ) -> Tuple[DiscoveryReport, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Discover a subject's records and group them by category in memory.
+
+        Args:
+            subject: Subject ID or resolved DataSubject
+
+        Returns:
+            (report, {category: [record, ...]}); each record carries a "_source" key
+        """
+        found: Dict[str, List[Dict[str, Any]]] = {}
+
+        def sink(source: DataSource, record: Dict[str, Any]) -> None:
+            found.setdefault(source.category, []).append({"_source": source.name, **record})
+
+        return self.discover(subject, sink), found
+
+    def export(
+        self, subject: Union[str, int, DataSubject], path: Union[str, Path]
+    ) -> DiscoveryReport:
+        """
+        Stream a subject's records into a gzip-compressed JSON Lines file.
+
+        The first line describes the subject, each following line holds one
+        record ({"source", "category", "record"}) and the last line holds the
+        discovery summary.
+
+        Args:
+            subject: Subject ID or resolved DataSubject
+            path: Export file path (conventionally *.jsonl.gz)
+
+        Returns:
+            DiscoveryReport with export_path set
+        """
+        if not isinstance(subject, DataSubject):
+            subject = self.resolve_subject(subject)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+
+            def write(line: Dict[str, Any]) -> None:
+                handle.write(json.dumps(line, default=_json_default))
+                handle.write("\n")
+
+            write({"subject": asdict(subject), "generated_at": datetime.utcnow().isoformat()})
+            report = self.discover(
+                subject,
+                lambda source, record: write(
+                    {"source": source.name, "category": source.category, "record": record}
+                ),
+            )
+            report.export_path = str(path)
+            write({"summary": report.to_dict()})
+
+        return report
+
+
+def read_export(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Iterate the lines of a DSAR export file."""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            yield json.loads(line)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
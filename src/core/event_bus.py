@@ -5,16 +5,30 @@ Implements a lightweight publish/subscribe pattern that enables agents to
 communicate state changes without direct coupling. Events are persisted
 to the EventLog table for audit and replay.
 
+By default handlers run synchronously on the publisher's thread. Calling
+``configure_async()`` switches the bus to a bounded-queue worker pool so a
+slow subscriber (email, webhook, ...) cannot add latency to the publisher.
+Each subscriber is pinned to a single worker, which preserves per-subscriber
+delivery order. EventLog persistence has its own unbounded queue and worker,
+so the overflow policy never drops an audit row.
+
 Usage:
     bus = EventBus.instance()
     bus.subscribe("leave.submitted", my_handler)
     bus.publish(Event(type="leave.submitted", source="leave_request_agent", payload={...}))
+
+    # Optional: dispatch off the request thread
+    bus.configure_async(max_workers=4, queue_size=1000)
 """
 
 import logging
+import queue
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
@@ -42,6 +56,14 @@ ALL_EVENT_TYPES = [
 ]
 
 
+class OverflowPolicy(str, Enum):
+    """What to do when a worker queue is full in async mode."""
+
+    BLOCK = "block"  # wait up to block_timeout, then drop the new delivery
+    DROP_NEWEST = "drop_newest"  # drop the delivery being enqueued
+    DROP_OLDEST = "drop_oldest"  # evict the oldest queued delivery
+
+
 @dataclass
 class Event:
     """An event published on the event bus."""
@@ -53,73 +75,284 @@ class Event:
     correlation_id: str = field(default_factory=lambda: str(uuid4())[:8])
 
 
+@dataclass
+class _Delivery:
+    """A unit of work queued for a dispatch worker."""
+
+    handler: Callable[[Event], None]
+    event: Event
+    depth: int
+    label: str
+
+
+_STOP = object()
+
+
 class EventBus:
     """Singleton publish/subscribe event bus with DB persistence."""
 
     _instance: Optional["EventBus"] = None
+    _instance_lock = threading.Lock()
     MAX_DEPTH = 3  # prevent infinite event cascades
+    DEFAULT_LOG_SIZE = 1000
 
-    def __init__(self):
+    def __init__(self, log_size: int = DEFAULT_LOG_SIZE):
         self._subscribers: Dict[str, List[Callable]] = {}
-        self._event_log: List[Event] = []
-        self._publishing_depth = 0
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+        # Ring-buffered event log with incrementally maintained counters
+        self._event_log: Deque[Event] = deque(maxlen=log_size)
+        self._type_counts: Dict[str, int] = {}
+        self._total_events = 0
+
+        # Async dispatch state (inactive until configure_async is called)
+        self._async = False
+        self._queues: List[queue.Queue] = []
+        self._workers: List[threading.Thread] = []
+        self._persist_queue: Optional[queue.Queue] = None
+        self._overflow_policy = OverflowPolicy.BLOCK
+        self._block_timeout = 5.0
+        self._dropped = 0
+        self._handler_errors = 0
 
     @classmethod
     def instance(cls) -> "EventBus":
         """Get or create the singleton EventBus instance."""
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     @classmethod
     def reset(cls):
         """Reset singleton (for testing)."""
+        if cls._instance is not None:
+            cls._instance.shutdown(wait=False)
         cls._instance = None
 
+    # ─── Dispatch mode ───────────────────────────────────────────
+
+    def configure_async(
+        self,
+        max_workers: int = 4,
+        queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        block_timeout: float = 5.0,
+    ):
+        """Switch to asynchronous dispatch through a bounded worker pool.
+
+        Args:
+            max_workers: Number of dispatch worker threads
+            queue_size: Capacity of each worker's queue
+            overflow_policy: Behaviour when a worker queue is full
+            block_timeout: Seconds to wait for space under OverflowPolicy.BLOCK
+        """
+        if max_workers < 1 or queue_size < 1:
+            raise ValueError("max_workers and queue_size must be >= 1")
+
+        self.shutdown(wait=True)
+        with self._lock:
+            self._overflow_policy = OverflowPolicy(overflow_policy)
+            self._block_timeout = block_timeout
+            self._queues = [queue.Queue(maxsize=queue_size) for _ in range(max_workers)]
+            self._workers = []
+            for i, q in enumerate(self._queues):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(q,),
+                    name=f"event-bus-worker-{i}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+            # Unbounded: persistence is exempt from the overflow policy
+            self._persist_queue = queue.Queue()
+            persister = threading.Thread(
+                target=self._worker_loop,
+                args=(self._persist_queue,),
+                name="event-bus-persist",
+                daemon=True,
+            )
+            persister.start()
+            self._workers.append(persister)
+            self._async = True
+        logger.info(
+            f"EventBus: async dispatch enabled ({max_workers} workers, "
+            f"queue_size={queue_size}, overflow={self._overflow_policy.value})"
+        )
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None):
+        """Stop async workers and fall back to synchronous dispatch.
+
+        Args:
+            wait: Drain queued deliveries before returning
+            timeout: Max seconds to wait per worker when draining
+        """
+        with self._lock:
+            if not self._async:
+                return
+            self._async = False
+            queues, workers = self._queues + [self._persist_queue], self._workers
+            self._queues, self._workers, self._persist_queue = [], [], None
+
+        for q in queues:
+            try:
+                q.put(_STOP, timeout=timeout if wait else 0.1)
+            except queue.Full:
+                pass
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued deliveries have been processed.
+
+        Returns:
+            True if queues drained, False if the timeout elapsed first
+        """
+        if not self._async:
+            return True
+
+        done = threading.Event()
+
+        def _wait_all():
+            for q in [*self._queues, self._persist_queue]:
+                if q is not None:
+                    q.join()
+            done.set()
+
+        threading.Thread(target=_wait_all, daemon=True).start()
+        return done.wait(timeout)
+
+    @property
+    def is_async(self) -> bool:
+        """Whether deliveries are dispatched by the worker pool."""
+        return self._async
+
+    # ─── Subscriptions ───────────────────────────────────────────
+
     def subscribe(self, event_type: str, handler: Callable[[Event], None]):
         """Subscribe a handler to an event type. Use '*' for all events."""
-        self._subscribers.setdefault(event_type, []).append(handler)
-        logger.debug(f"EventBus: subscribed {handler.__name__} to '{event_type}'")
+        with self._lock:
+            # Copy-on-write so publishers can iterate without holding the lock
+            handlers = list(self._subscribers.get(event_type, []))
+            handlers.append(handler)
+            self._subscribers[event_type] = handlers
+        logger.debug(f"EventBus: subscribed {_handler_name(handler)} to '{event_type}'")
 
     def unsubscribe(self, event_type: str, handler: Callable[[Event], None]):
         """Remove a handler from an event type."""
-        if event_type in self._subscribers:
-            self._subscribers[event_type] = [
-                h for h in self._subscribers[event_type] if h != handler
-            ]
+        with self._lock:
+            if event_type in self._subscribers:
+                self._subscribers[event_type] = [
+                    h for h in self._subscribers[event_type] if h != handler
+                ]
+
+    # ─── Publishing ──────────────────────────────────────────────
+
+    @property
+    def _publishing_depth(self) -> int:
+        """Cascade depth of the event currently being handled on this thread."""
+        return getattr(self._local, "depth", 0)
+
+    @_publishing_depth.setter
+    def _publishing_depth(self, value: int):
+        self._local.depth = value
 
     def publish(self, event: Event):
         """Publish an event to all subscribers and persist to DB."""
-        if self._publishing_depth >= self.MAX_DEPTH:
+        depth = self._publishing_depth
+        if depth >= self.MAX_DEPTH:
             logger.warning(f"EventBus: max depth {self.MAX_DEPTH} reached, skipping {event.type}")
             return
 
-        self._publishing_depth += 1
-        try:
+        with self._lock:
             # Store in memory log
             self._event_log.append(event)
-            logger.info(
-                f"EventBus: published '{event.type}' from {event.source} [corr:{event.correlation_id}]"
-            )
+            self._type_counts[event.type] = self._type_counts.get(event.type, 0) + 1
+            self._total_events += 1
+            specific = self._subscribers.get(event.type, [])
+            wildcard = self._subscribers.get("*", [])
+            is_async = self._async
+            persist_queue = self._persist_queue
 
-            # Persist to DB
-            self._persist_event(event)
-
-            # Notify specific subscribers
-            for handler in self._subscribers.get(event.type, []):
-                try:
-                    handler(event)
-                except Exception as e:
-                    logger.error(f"EventBus: handler error for '{event.type}': {e}")
-
-            # Notify wildcard subscribers
-            for handler in self._subscribers.get("*", []):
-                try:
-                    handler(event)
-                except Exception as e:
-                    logger.error(f"EventBus: wildcard handler error: {e}")
+        logger.info(
+            f"EventBus: published '{event.type}' from {event.source} [corr:{event.correlation_id}]"
+        )
+
+        persist = _Delivery(self._persist_event, event, depth + 1, "persist")
+        deliveries = [_Delivery(h, event, depth + 1, "handler") for h in specific]
+        deliveries += [_Delivery(h, event, depth + 1, "wildcard handler") for h in wildcard]
+
+        if is_async and persist_queue is not None:
+            persist_queue.put(persist)
+            for delivery in deliveries:
+                self._enqueue(delivery)
+        else:
+            for delivery in [persist, *deliveries]:
+                self._run(delivery)
+
+    def _run(self, delivery: _Delivery):
+        """Invoke one handler with the cascade depth of its event."""
+        previous = self._publishing_depth
+        self._publishing_depth = delivery.depth
+        try:
+            delivery.handler(delivery.event)
+        except Exception as e:
+            with self._lock:
+                self._handler_errors += 1
+            logger.error(f"EventBus: {delivery.label} error for '{delivery.event.type}': {e}")
         finally:
-            self._publishing_depth -= 1
+            self._publishing_depth = previous
+
+    def _enqueue(self, delivery: _Delivery):
+        """Route a delivery to its subscriber's worker, applying the overflow policy."""
+        queues = self._queues
+        if not queues:
+            self._run(delivery)
+            return
+        q = queues[hash(delivery.handler) % len(queues)]
+
+        try:
+            if self._overflow_policy == OverflowPolicy.BLOCK:
+                q.put(delivery, timeout=self._block_timeout)
+            else:
+                q.put_nowait(delivery)
+            return
+        except queue.Full:
+            pass
+
+        if self._overflow_policy == OverflowPolicy.DROP_OLDEST:
+            try:
+                q.get_nowait()
+                q.task_done()
+                self._record_drop()
+                q.put_nowait(delivery)
+                return
+            except (queue.Empty, queue.Full):
+                pass
+
+        self._record_drop()
+        logger.warning(
+            f"EventBus: queue full, dropped {delivery.label} for '{delivery.event.type}'"
+        )
+
+    def _record_drop(self):
+        with self._lock:
+            self._dropped += 1
+
+    def _worker_loop(self, q: queue.Queue):
+        """Drain one worker queue until a stop sentinel arrives."""
+        while True:
+            delivery = q.get()
+            try:
+                if delivery is _STOP:
+                    return
+                self._run(delivery)
+            finally:
+                q.task_done()
 
     def _persist_event(self, event: Event):
         """Persist event to EventLog table."""
@@ -147,12 +380,23 @@ class EventBus:
         except ImportError:
             pass  # DB module not available
 
+    # ─── Introspection ───────────────────────────────────────────
+
     def get_recent_events(self, event_type: Optional[str] = None, limit: int = 50) -> List[Event]:
         """Get recent events from memory log, optionally filtered by type."""
-        events = self._event_log
-        if event_type:
-            events = [e for e in events if e.type == event_type]
-        return events[-limit:]
+        with self._lock:
+            snapshot = list(self._event_log)
+        if not event_type:
+            return snapshot[-limit:] if limit > 0 else []
+
+        matched: List[Event] = []
+        for event in reversed(snapshot):
+            if len(matched) >= limit:
+                break
+            if event.type == event_type:
+                matched.append(event)
+        matched.reverse()
+        return matched
 
     def get_subscriber_count(self, event_type: str) -> int:
         """Get number of subscribers for an event type."""
@@ -160,11 +404,18 @@ class EventBus:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get event bus statistics."""
-        type_counts = {}
-        for event in self._event_log:
-            type_counts[event.type] = type_counts.get(event.type, 0) + 1
-        return {
-            "total_events": len(self._event_log),
-            "event_types": type_counts,
-            "subscriber_count": {k: len(v) for k, v in self._subscribers.items()},
-        }
+        with self._lock:
+            return {
+                "total_events": self._total_events,
+                "event_types": dict(self._type_counts),
+                "subscriber_count": {k: len(v) for k, v in self._subscribers.items()},
+                "dispatch_mode": "async" if self._async else "sync",
+                "queue_depth": sum(q.qsize() for q in self._queues),
+                "dropped_deliveries": self._dropped,
+                "handler_errors": self._handler_errors,
+                "log_capacity": self._event_log.maxlen,
+            }
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__name__", repr(handler))
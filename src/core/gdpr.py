@@ -8,11 +8,15 @@ Data Subject Access Requests (DSAR), data retention policies, and audit trails.
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.core.dsar_discovery import DiscoveryReport, DSARDiscoveryEngine
+from src.core.retention import RetentionExecutor
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,8 +129,26 @@ class GDPRComplianceService:
     and audit trail logging for GDPR compliance.
     """
 
-    def __init__(self):
-        """Initialize GDPR compliance service."""
+    def __init__(
+        self,
+        discovery: Optional[DSARDiscoveryEngine] = None,
+        export_dir: Optional[str] = None,
+        retention_executor: Optional[RetentionExecutor] = None,
+    ):
+        """
+        Initialize GDPR compliance service.
+
+        Args:
+            discovery: DSAR discovery engine; without one, access requests
+                return placeholder data
+            export_dir: Directory for portability export files (requires discovery)
+            retention_executor: Executor applying retention and erasure to stored
+                data; without one, both only report what would be done
+        """
+        self.discovery = discovery
+        self.export_dir = export_dir
+        self.retention_executor = retention_executor
+
         # In-memory storage
         self._consents: Dict[str, List[ConsentRecord]] = {}
         self._dsars: Dict[str, DSARRequest] = {}
@@ -348,8 +370,16 @@ class GDPRComplianceService:
         elif request.type == DSARType.RECTIFICATION:
             result["message"] = "Rectification process initiated. Employee should verify data."
         elif request.type == DSARType.PORTABILITY:
-            result["data_export"] = self.data_subject_access(request.employee_id)
-            result["export_format"] = "JSON"
+            if self.discovery is not None and self.export_dir:
+                path = Path(self.export_dir) / f"{request.request_id}.jsonl.gz"
+                report = self.export_subject_data(request.employee_id, path)
+                request.data_export_path = report.export_path
+                result["export_path"] = report.export_path
+                result["export_records"] = report.total_records
+                result["export_format"] = "JSON Lines (gzip)"
+            else:
+                result["data_export"] = self.data_subject_access(request.employee_id)
+                result["export_format"] = "JSON"
 
         request.status = DSARStatus.COMPLETED
         request.completed_at = datetime.utcnow()
@@ -379,8 +409,21 @@ class GDPRComplianceService:
             legal_basis="GDPR Article 15 (Right of Access)",
         )
 
-        # In a real system, this would query a database
-        # For now, return structured placeholder data
+        if self.discovery is not None:
+            report, records = self.discovery.collect(employee_id)
+            return {
+                "employee_id": employee_id,
+                "records": records,
+                "record_counts": {
+                    summary.source: summary.records for summary in report.sources if summary.records
+                },
+                "data_sources": [summary.source for summary in report.sources if summary.records],
+                "failed_sources": report.failed_sources,
+                "legal_basis": "Consent, Employment Contract, Legal Obligation",
+                "retention_schedule": "See retention policy document",
+            }
+
+        # Without a discovery engine, return structured placeholder data
         return {
             "employee_id": employee_id,
             "personal_data": {
@@ -412,6 +455,36 @@ class GDPRComplianceService:
             "retention_schedule": "See retention policy document",
         }
 
+    def export_subject_data(self, employee_id: str, path: Union[str, Path]) -> DiscoveryReport:
+        """
+        Export all personal data about an employee to a compressed JSON Lines file.
+
+        Args:
+            employee_id: Employee ID
+            path: Export file path
+
+        Returns:
+            DiscoveryReport for the export
+
+        Raises:
+            ValueError: If no discovery engine is configured
+        """
+        if self.discovery is None:
+            raise ValueError("DSAR export requires a discovery engine")
+
+        report = self.discovery.export(employee_id, path)
+        self._log_audit_trail(
+            action="data_subject_export",
+            employee_id=employee_id,
+            details={
+                "export_path": report.export_path,
+                "records": report.total_records,
+                "failed_sources": report.failed_sources,
+            },
+            legal_basis="GDPR Article 20 (Right to Data Portability)",
+        )
+        return report
+
     def right_to_erasure(self, employee_id: str) -> Dict[str, Any]:
         """
         Execute right to erasure (right to be forgotten).
@@ -428,7 +501,6 @@ class GDPRComplianceService:
             legal_basis="GDPR Article 17 (Right to Erasure)",
         )
 
-        # Simulate anonymization of personal data
         result = {
             "employee_id": employee_id,
             "action": "anonymized",
@@ -454,6 +526,21 @@ class GDPRComplianceService:
             ],
         }
 
+        if self.retention_executor is not None:
+            report = self.retention_executor.erase(employee_id)
+            result["erasure_report"] = report.to_dict()
+            result["completed"] = report.completed
+            self._log_audit_trail(
+                action="right_to_erasure_executed",
+                employee_id=employee_id,
+                details={
+                    "deleted_records": report.deleted_records,
+                    "anonymized_records": report.anonymized_records,
+                    "vector_chunks": report.vector_chunks,
+                },
+                legal_basis="GDPR Article 17 (Right to Erasure)",
+            )
+
         logger.info(f"Right to erasure executed for {employee_id}")
         return result
 
@@ -503,14 +590,18 @@ class GDPRComplianceService:
         }
 
         for policy_id, policy in self._retention_policies.items():
-            # Simulate enforcement
             enforcement_result = {
                 "policy_id": policy_id,
                 "data_category": policy.data_category.value,
                 "retention_days": policy.retention_days,
                 "action": policy.action.value,
-                "affected_records": 0,  # Would be actual count in real system
+                "affected_records": 0,
             }
+            if self.retention_executor is not None:
+                tables = self.retention_executor.enforce(policy)
+                enforcement_result["affected_records"] = sum(t.rows for t in tables)
+                enforcement_result["completed"] = all(t.completed for t in tables)
+                enforcement_result["tables"] = [t.to_dict() for t in tables]
 
             if policy.action == RetentionAction.ARCHIVE:
                 result["archived_count"] += 1
@@ -522,7 +613,11 @@ class GDPRComplianceService:
             self._log_audit_trail(
                 action=f"retention_policy_enforced",
                 employee_id="SYSTEM",
-                details={"policy_id": policy_id, "action": policy.action.value},
+                details={
+                    "policy_id": policy_id,
+                    "action": policy.action.value,
+                    "affected_records": enforcement_result["affected_records"],
+                },
                 legal_basis="Data Retention Policy",
             )
 
@@ -32,7 +32,14 @@ Usage:
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.core.text_scanner import (
+    ScanRule,
+    get_text_scanner,
+    replace_spans,
+    spans_interact,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +81,36 @@ DANGEROUS_PATTERNS = [
     re.compile(r"on(?:load|error|click)\s*=", re.IGNORECASE),
 ]
 
+PII_MASKS = {
+    "ssn": "[SSN-REDACTED]",
+    "credit_card": "[CC-REDACTED]",
+    "email": "[EMAIL-REDACTED]",
+    "phone_us": "[PHONE-REDACTED]",
+    "passport": "[PASSPORT-REDACTED]",
+    "bank_account": "[ACCOUNT-REDACTED]",
+}
+
+# Scanner categories; the patterns above are matched in one pass per text
+SCAN_DANGEROUS = "guardrails.dangerous"
+SCAN_INJECTION = "guardrails.injection"
+SCAN_PII = "guardrails.pii"
+INPUT_CATEGORIES = (SCAN_DANGEROUS, SCAN_INJECTION, SCAN_PII)
+
+_PII_PRIORITY = {pii_type: rank for rank, pii_type in enumerate(PII_PATTERNS)}
+
+
+def _register_scan_rules() -> None:
+    rules = [ScanRule(SCAN_PII, name, p.pattern, p.flags) for name, p in PII_PATTERNS.items()]
+    for category, patterns in (
+        (SCAN_INJECTION, INJECTION_PATTERNS),
+        (SCAN_DANGEROUS, DANGEROUS_PATTERNS),
+    ):
+        rules += [ScanRule(category, str(i), p.pattern, p.flags) for i, p in enumerate(patterns)]
+    get_text_scanner().register(rules)
+
+
+_register_scan_rules()
+
 
 @dataclass
 class InputValidationResult:
@@ -195,36 +232,38 @@ class Guardrails:
             self._stats["inputs_blocked"] += 1
             return result
 
+        # 3-5 scan for dangerous content, injections and PII in one pass
+        spans = get_text_scanner().scan(query, INPUT_CATEGORIES)
+        found = {(span.category, span.rule) for span in spans}
+        categories = {category for category, _ in found}
+
         # 3. Dangerous content
-        for pattern in DANGEROUS_PATTERNS:
-            if pattern.search(query):
+        if SCAN_DANGEROUS in categories:
+            result.passed = False
+            result.blocked_reason = "Potentially dangerous content detected (SQL/XSS)"
+            self._stats["inputs_blocked"] += 1
+            logger.warning(f"Guardrails: Dangerous content blocked: {query[:50]}...")
+            return result
+
+        # 4. Prompt injection detection
+        if SCAN_INJECTION in categories:
+            result.injection_detected = True
+            self._stats["injections_detected"] += 1
+
+            if self.block_injections:
                 result.passed = False
-                result.blocked_reason = "Potentially dangerous content detected (SQL/XSS)"
+                result.blocked_reason = "Potential prompt injection detected"
                 self._stats["inputs_blocked"] += 1
-                logger.warning(f"Guardrails: Dangerous content blocked: {query[:50]}...")
+                logger.warning(f"Guardrails: Injection blocked: {query[:50]}...")
                 return result
-
-        # 4. Prompt injection detection
-        for pattern in INJECTION_PATTERNS:
-            if pattern.search(query):
-                result.injection_detected = True
-                self._stats["injections_detected"] += 1
-
-                if self.block_injections:
-                    result.passed = False
-                    result.blocked_reason = "Potential prompt injection detected"
-                    self._stats["inputs_blocked"] += 1
-                    logger.warning(f"Guardrails: Injection blocked: {query[:50]}...")
-                    return result
-                else:
-                    result.warnings.append("Potential prompt injection detected but not blocked")
-                break
+            else:
+                result.warnings.append("Potential prompt injection detected but not blocked")
 
         # 5. PII detection in input
-        for pii_type, pattern in PII_PATTERNS.items():
+        for pii_type in PII_PATTERNS:
             if pii_type == "bank_account":
                 continue  # Too broad for input checking
-            if pattern.search(query):
+            if (SCAN_PII, pii_type) in found:
                 result.pii_found.append(pii_type)
 
         if result.pii_found:
@@ -288,26 +327,12 @@ class Guardrails:
 
         # 3. PII detection and masking in output
         if self.mask_pii_in_output:
-            masked_answer = answer
-            for pii_type, pattern in PII_PATTERNS.items():
-                matches = pattern.findall(masked_answer)
-                if matches:
+            masked_answer, counts = self._mask_spans(answer)
+            for pii_type in PII_PATTERNS:
+                if pii_type in counts:
                     result.pii_detected = True
                     result.pii_types.append(pii_type)
-                    self._stats["pii_masked_count"] += len(matches)
-
-                    # Mask PII with type indicator
-                    mask_map = {
-                        "ssn": "[SSN-REDACTED]",
-                        "credit_card": "[CC-REDACTED]",
-                        "email": "[EMAIL-REDACTED]",
-                        "phone_us": "[PHONE-REDACTED]",
-                        "passport": "[PASSPORT-REDACTED]",
-                        "bank_account": "[ACCOUNT-REDACTED]",
-                    }
-                    mask_text = mask_map.get(pii_type, "[PII-REDACTED]")
-                    masked_answer = pattern.sub(mask_text, masked_answer)
-
+                    self._stats["pii_masked_count"] += counts[pii_type]
             result.sanitized_response = masked_answer
 
         return result
@@ -324,18 +349,16 @@ class Guardrails:
         Returns:
             List of dicts with pii_type, value, start, end positions.
         """
-        findings = []
-        for pii_type, pattern in PII_PATTERNS.items():
-            for match in pattern.finditer(text):
-                findings.append(
-                    {
-                        "pii_type": pii_type,
-                        "value": match.group(),
-                        "start": match.start(),
-                        "end": match.end(),
-                    }
-                )
-        return findings
+        spans = get_text_scanner().scan(text, [SCAN_PII])
+        return [
+            {
+                "pii_type": span.rule,
+                "value": span.text,
+                "start": span.start,
+                "end": span.end,
+            }
+            for span in sorted(spans, key=lambda span: _PII_PRIORITY[span.rule])
+        ]
 
     def mask_pii(self, text: str) -> str:
         """
@@ -347,19 +370,33 @@ class Guardrails:
         Returns:
             Text with PII replaced by type-specific masks.
         """
-        masked = text
-        for pii_type, pattern in PII_PATTERNS.items():
-            mask_map = {
-                "ssn": "[SSN-REDACTED]",
-                "credit_card": "[CC-REDACTED]",
-                "email": "[EMAIL-REDACTED]",
-                "phone_us": "[PHONE-REDACTED]",
-                "passport": "[PASSPORT-REDACTED]",
-                "bank_account": "[ACCOUNT-REDACTED]",
-            }
-            mask_text = mask_map.get(pii_type, "[PII-REDACTED]")
-            masked = pattern.sub(mask_text, masked)
-        return masked
+        return self._mask_spans(text)[0]
+
+    @staticmethod
+    def _mask_spans(text: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Mask PII found in one scan.
+
+        Masking is equivalent to applying each PII_PATTERNS entry in turn.
+        Where matches of different types overlap or touch, a later pattern
+        can see an earlier mask, so the text is masked type by type instead.
+
+        Returns:
+            Masked text and the number of matches masked per PII type
+        """
+        spans = get_text_scanner().scan(text, [SCAN_PII])
+        if spans_interact(spans):
+            masked, counts = text, {}
+            for pii_type, pattern in PII_PATTERNS.items():
+                masked, count = pattern.subn(PII_MASKS.get(pii_type, "[PII-REDACTED]"), masked)
+                if count:
+                    counts[pii_type] = count
+            return masked, counts
+        counts = {}
+        for span in spans:
+            counts[span.rule] = counts.get(span.rule, 0) + 1
+        masked = replace_spans(text, spans, lambda span: PII_MASKS.get(span.rule, "[PII-REDACTED]"))
+        return masked, counts
 
     # ==================== Stats ====================
 
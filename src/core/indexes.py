@@ -10,6 +10,39 @@ from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
 
+# Subject-ID columns of every table DSAR discovery reads (leave_requests,
+# leave_balances and auth_sessions are covered above, employees by primary key,
+# notification_records by its column index)
+DSAR_SUBJECT_INDEXES = [
+    ("idx_audit_logs_user_id", "audit_logs", "user_id", ""),
+    ("idx_conversations_user_id", "conversations", "user_id", ""),
+    ("idx_conversation_messages_conversation_id", "conversation_messages", "conversation_id", ""),
+    ("idx_chat_conversations_employee_id", "chat_conversations", "employee_id", ""),
+    ("idx_chat_messages_conversation_id", "chat_messages", "conversation_id", ""),
+    ("idx_query_logs_employee_id", "query_logs", "employee_id", ""),
+    ("idx_generated_documents_employee_id", "generated_documents", "employee_id", ""),
+    ("idx_benefits_enrollments_employee_id", "benefits_enrollments", "employee_id", ""),
+    ("idx_onboarding_checklists_employee_id", "onboarding_checklists", "employee_id", ""),
+    ("idx_performance_reviews_employee_id", "performance_reviews", "employee_id", ""),
+    ("idx_performance_goals_employee_id", "performance_goals", "employee_id", ""),
+]
+
+
+# Timestamp columns retention enforcement filters on (see src/core/retention.py;
+# auth_sessions.expires_at is covered below, query_logs.created_at by its
+# column index)
+RETENTION_TIMESTAMP_INDEXES = [
+    ("idx_leave_requests_updated_at", "leave_requests", "updated_at", ""),
+    ("idx_chat_messages_created_at", "chat_messages", "created_at", ""),
+    ("idx_chat_conversations_created_at", "chat_conversations", "created_at", ""),
+    ("idx_conversation_messages_timestamp", "conversation_messages", "timestamp", ""),
+    ("idx_conversations_created_at", "conversations", "created_at", ""),
+    ("idx_notification_records_created_at", "notification_records", "created_at", ""),
+    ("idx_performance_reviews_created_at", "performance_reviews", "created_at", ""),
+    ("idx_generated_documents_created_at", "generated_documents", "created_at", ""),
+    ("idx_benefits_enrollments_updated_at", "benefits_enrollments", "updated_at", ""),
+]
+
 
 def ensure_indexes(engine: Engine) -> None:
     """Create indexes on frequently queried columns.
@@ -38,6 +71,10 @@ def ensure_indexes(engine: Engine) -> None:
             # Additional useful indexes
             ("idx_employees_hire_date", "employees", "hire_date", ""),
             ("idx_employees_created_at", "employees", "created_at", ""),
+            # Per-subject lookups for DSAR discovery (see src/core/dsar_discovery.py)
+            *DSAR_SUBJECT_INDEXES,
+            # Age cutoffs for retention enforcement
+            *RETENTION_TIMESTAMP_INDEXES,
         ]
 
         for index_name, table_name, column_name, unique_flag in indexes:
@@ -81,6 +118,8 @@ def drop_indexes(engine: Engine) -> None:
             "idx_auth_sessions_expires_at",
             "idx_employees_hire_date",
             "idx_employees_created_at",
+            *(index_name for index_name, _, _, _ in DSAR_SUBJECT_INDEXES),
+            *(index_name for index_name, _, _, _ in RETENTION_TIMESTAMP_INDEXES),
         ]
 
         for index_name in index_names:
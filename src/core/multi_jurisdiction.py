@@ -6,9 +6,11 @@ and other regulatory frameworks with conflict resolution and integrated checking
 """
 
 import logging
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -44,6 +46,24 @@ class ComplianceStatus(str, Enum):
     NOT_APPLICABLE = "not_applicable"
 
 
+EU_COUNTRIES = ("DE", "FR", "IT", "ES", "NL", "BE", "AT", "PL")
+
+# Country code -> jurisdictions; US states add their own on top of US_FEDERAL
+COUNTRY_JURISDICTIONS: Dict[str, Tuple[Jurisdiction, ...]] = {
+    **{country: (Jurisdiction.EU_GDPR,) for country in EU_COUNTRIES},
+    "GB": (Jurisdiction.UK_GDPR,),
+    "CA": (Jurisdiction.CANADA_PIPEDA,),
+    "AU": (Jurisdiction.AUSTRALIA_APPS,),
+    "BR": (Jurisdiction.BRAZIL_LGPD,),
+    "US": (Jurisdiction.US_FEDERAL,),
+}
+US_STATE_JURISDICTIONS: Dict[str, Jurisdiction] = {
+    "CA": Jurisdiction.US_CALIFORNIA,
+    "NY": Jurisdiction.US_NEW_YORK,
+    "IL": Jurisdiction.US_ILLINOIS,
+}
+
+
 # ============================================================================
 # Pydantic Models
 # ============================================================================
@@ -125,6 +145,124 @@ class MultiJurisdictionConfig(BaseModel):
     model_config = ConfigDict(use_enum_values=False)
 
 
+# ============================================================================
+# Bulk Checking
+# ============================================================================
+
+
+@dataclass
+class EmployeeComplianceResult:
+    """
+    Compliance statuses for one employee from a bulk check.
+
+    A plain dataclass rather than a ComplianceCheckResult per requirement, so a
+    workforce-wide sweep does not build one pydantic model per check.
+    """
+
+    employee_id: Any
+    jurisdictions: List[Jurisdiction]
+    statuses: Dict[Tuple[Jurisdiction, str], ComplianceStatus] = field(default_factory=dict)
+    findings: Dict[Tuple[Jurisdiction, str], List[str]] = field(default_factory=dict)
+
+    @property
+    def non_compliant(self) -> List[Tuple[Jurisdiction, str]]:
+        """(jurisdiction, requirement) pairs that are non-compliant."""
+        return [
+            key for key, status in self.statuses.items() if status == ComplianceStatus.NON_COMPLIANT
+        ]
+
+
+@dataclass(frozen=True)
+class _CompiledRequirement:
+    """A requirement compiled into status and findings functions."""
+
+    jurisdiction: Jurisdiction
+    category: str
+    status: Callable[[Dict[str, Any]], ComplianceStatus]
+    findings: Callable[[Dict[str, Any]], List[str]]
+
+
+def _compile_status(
+    requirement: ComplianceRequirement,
+) -> Callable[[Dict[str, Any]], ComplianceStatus]:
+    """Build the status check for a requirement's category."""
+    category = requirement.category
+
+    if category == "consent":
+
+        def status(data: Dict[str, Any]) -> ComplianceStatus:
+            if "consent_records" in data or data.get("consent_granted", False):
+                return ComplianceStatus.COMPLIANT
+            return ComplianceStatus.NON_COMPLIANT
+
+    elif category == "dsar":
+        limit = requirement.deadline_days or 30
+
+        def status(data: Dict[str, Any]) -> ComplianceStatus:
+            if "dsar_response_time_days" in data and data["dsar_response_time_days"] <= limit:
+                return ComplianceStatus.COMPLIANT
+            return ComplianceStatus.PARTIAL
+
+    elif category == "breach_notification":
+
+        def status(data: Dict[str, Any]) -> ComplianceStatus:
+            if "breach_notified_hours" in data and data["breach_notified_hours"] <= 72:
+                return ComplianceStatus.COMPLIANT
+            return ComplianceStatus.NON_COMPLIANT
+
+    elif category in ("opt_out", "disclosure"):
+        # Compliant when the evidence field is present
+        evidence, otherwise = {
+            "opt_out": ("opt_out_requested", ComplianceStatus.PARTIAL),
+            "disclosure": ("privacy_notice_provided", ComplianceStatus.NON_COMPLIANT),
+        }[category]
+
+        def status(data: Dict[str, Any]) -> ComplianceStatus:
+            return ComplianceStatus.COMPLIANT if evidence in data else otherwise
+
+    else:
+
+        def status(data: Dict[str, Any]) -> ComplianceStatus:
+            return ComplianceStatus.NOT_APPLICABLE
+
+    return status
+
+
+def _compile_findings(requirement: ComplianceRequirement) -> Callable[[Dict[str, Any]], List[str]]:
+    """Build the findings check for a requirement."""
+    category = requirement.category
+    missing = f"Required {category} not found in data" if requirement.mandatory else None
+    deadline = requirement.deadline_days
+    days_key = f"{category}_days"
+
+    def findings(data: Dict[str, Any]) -> List[str]:
+        found = []
+        if missing and category not in data:
+            found.append(missing)
+        if deadline and days_key in data and data[days_key] > deadline:
+            found.append(f"Deadline exceeded: {data[days_key]} > {deadline} days")
+        return found
+
+    return findings
+
+
+def _evaluate_column(
+    check: Callable[[Dict[str, Any]], ComplianceStatus], rows: List[Dict[str, Any]]
+) -> List[ComplianceStatus]:
+    """Run a status check over rows; a row whose check raises is non-compliant."""
+    try:
+        return [check(row) for row in rows]
+    except Exception:
+        statuses = []
+        for row in rows:
+            try:
+                statuses.append(check(row))
+            except Exception as e:
+                logger.error("Failed to check requirement: %s", str(e))
+                statuses.append(ComplianceStatus.NON_COMPLIANT)
+        return statuses
+
+
 # ============================================================================
 # Multi-Jurisdiction Compliance Engine
 # ============================================================================
@@ -166,6 +304,7 @@ class MultiJurisdictionEngine:
         self._check_results: Dict[str, ComplianceCheckResult] = {}
         self._audit_trail: List[Dict[str, Any]] = []
         self._custom_requirements: Dict[Jurisdiction, List[ComplianceRequirement]] = {}
+        self._compiled: Dict[Jurisdiction, List[_CompiledRequirement]] = {}
 
         # Initialize default jurisdiction configs
         self._init_default_configs()
@@ -366,66 +505,50 @@ class MultiJurisdictionEngine:
         except Exception as e:
             logger.error("Failed to log audit trail: %s", str(e))
 
-    def determine_jurisdictions(self, employee_data: Dict[str, Any]) -> List[Jurisdiction]:
+    def _resolve_jurisdictions(self, employee_data: Dict[str, Any]) -> List[Jurisdiction]:
         """
-        Determine applicable jurisdictions based on employee data.
+        Work out applicable jurisdictions without audit logging.
 
         Args:
-            employee_data: Employee data including country, state, residence
+            employee_data: Employee data including country and state
 
         Returns:
-            List of applicable Jurisdiction enums
+            Applicable jurisdictions, the default jurisdiction if none match
 
         Raises:
             ValueError: If employee_data is invalid
         """
-        try:
-            if not isinstance(employee_data, dict):
-                raise ValueError("employee_data must be a dictionary")
-
-            applicable = []
-
-            # Check country
-            country = employee_data.get("country", "").upper()
-            state = employee_data.get("state", "").upper()
-            residence = employee_data.get("residence_country", "").upper()
+        if not isinstance(employee_data, dict):
+            raise ValueError("employee_data must be a dictionary")
 
-            # EU countries
-            if country in ["DE", "FR", "IT", "ES", "NL", "BE", "AT", "PL"]:
-                applicable.append(Jurisdiction.EU_GDPR)
+        country = employee_data.get("country", "").upper()
+        state = employee_data.get("state", "").upper()
 
-            # UK
-            if country == "GB":
-                applicable.append(Jurisdiction.UK_GDPR)
+        applicable = list(COUNTRY_JURISDICTIONS.get(country, ()))
+        if country == "US" and state in US_STATE_JURISDICTIONS:
+            applicable.append(US_STATE_JURISDICTIONS[state])
 
-            # Canada
-            if country == "CA":
-                applicable.append(Jurisdiction.CANADA_PIPEDA)
+        # If no specific jurisdiction found, use default
+        if not applicable:
+            applicable.append(self.config.default_jurisdiction)
 
-            # Australia
-            if country == "AU":
-                applicable.append(Jurisdiction.AUSTRALIA_APPS)
+        return applicable
 
-            # Brazil
-            if country == "BR":
-                applicable.append(Jurisdiction.BRAZIL_LGPD)
+    def determine_jurisdictions(self, employee_data: Dict[str, Any]) -> List[Jurisdiction]:
+        """
+        Determine applicable jurisdictions based on employee data.
 
-            # US states
-            if country == "US":
-                applicable.append(Jurisdiction.US_FEDERAL)
-                if state == "CA":
-                    applicable.append(Jurisdiction.US_CALIFORNIA)
-                elif state == "NY":
-                    applicable.append(Jurisdiction.US_NEW_YORK)
-                elif state == "IL":
-                    applicable.append(Jurisdiction.US_ILLINOIS)
+        Args:
+            employee_data: Employee data including country, state, residence
 
-            # If no specific jurisdiction found, use default
-            if not applicable:
-                applicable.append(self.config.default_jurisdiction)
+        Returns:
+            List of applicable Jurisdiction enums
 
-            # Remove duplicates
-            applicable = list(set(applicable))
+        Raises:
+            ValueError: If employee_data is invalid
+        """
+        try:
+            applicable = self._resolve_jurisdictions(employee_data)
 
             self._log_audit_trail(
                 action="jurisdictions_determined",
@@ -506,6 +629,118 @@ class MultiJurisdictionEngine:
             logger.error("Failed to check compliance: %s", str(e))
             raise
 
+    def check_compliance_bulk(
+        self, records: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> Iterator[EmployeeComplianceResult]:
+        """
+        Check compliance for many employees, e.g. a nightly workforce sweep.
+
+        Each employee is checked against the jurisdictions determine_jurisdictions
+        would return for them. Records are consumed in batches; within a batch,
+        employees are grouped by jurisdictions and every requirement (compiled
+        once per engine) is evaluated over the whole group. Results are yielded
+        per employee in input order and are not kept in the engine, so memory
+        stays flat however many records are streamed through. One aggregated
+        audit trail entry is written per batch instead of one per check.
+
+        Args:
+            records: Employee data dictionaries (any iterable, consumed lazily)
+            batch_size: Records evaluated and audited together
+
+        Yields:
+            EmployeeComplianceResult per record
+
+        Raises:
+            ValueError: If a record is not a dictionary or batch_size < 1
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        batch: List[Dict[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield from self._check_batch(batch)
+                batch = []
+        if batch:
+            yield from self._check_batch(batch)
+
+    def _check_batch(self, batch: List[Dict[str, Any]]) -> List[EmployeeComplianceResult]:
+        """
+        Check one batch of a bulk compliance run.
+
+        Args:
+            batch: Employee data dictionaries
+
+        Returns:
+            EmployeeComplianceResult per record, in batch order
+        """
+        try:
+            groups: Dict[Tuple[Jurisdiction, ...], List[int]] = {}
+            for index, record in enumerate(batch):
+                groups.setdefault(tuple(self._resolve_jurisdictions(record)), []).append(index)
+
+            results: List[Optional[EmployeeComplianceResult]] = [None] * len(batch)
+            status_counts: Counter = Counter()
+            for jurisdictions, indices in groups.items():
+                rows = [batch[index] for index in indices]
+                group_results = [
+                    EmployeeComplianceResult(
+                        employee_id=row.get("id"), jurisdictions=list(jurisdictions)
+                    )
+                    for row in rows
+                ]
+                for requirement in self._compiled_requirements(jurisdictions):
+                    key = (requirement.jurisdiction, requirement.category)
+                    statuses = _evaluate_column(requirement.status, rows)
+                    findings = [requirement.findings(row) for row in rows]
+                    for result, status, found in zip(group_results, statuses, findings):
+                        result.statuses[key] = status
+                        if found:
+                            result.findings[key] = found
+                    status_counts.update(statuses)
+                for index, result in zip(indices, group_results):
+                    results[index] = result
+
+            self._log_audit_trail(
+                action="bulk_compliance_checked",
+                details={
+                    "employees": len(batch),
+                    "checks": sum(status_counts.values()),
+                    "statuses": {status.value: count for status, count in status_counts.items()},
+                    "jurisdiction_groups": {
+                        "+".join(j.value for j in jurisdictions): len(indices)
+                        for jurisdictions, indices in groups.items()
+                    },
+                },
+                legal_basis="Compliance Verification",
+            )
+            return results
+        except Exception as e:
+            logger.error("Failed to check compliance batch: %s", str(e))
+            raise
+
+    def _compiled_requirements(
+        self, jurisdictions: Tuple[Jurisdiction, ...]
+    ) -> List[_CompiledRequirement]:
+        """Get compiled requirements for jurisdictions, compiling each jurisdiction once."""
+        compiled = []
+        for jurisdiction in jurisdictions:
+            if jurisdiction not in self._requirements:
+                continue
+            if jurisdiction not in self._compiled:
+                self._compiled[jurisdiction] = [
+                    _CompiledRequirement(
+                        jurisdiction=jurisdiction,
+                        category=requirement.category,
+                        status=_compile_status(requirement),
+                        findings=_compile_findings(requirement),
+                    )
+                    for requirement in self._requirements[jurisdiction]
+                ]
+            compiled.extend(self._compiled[jurisdiction])
+        return compiled
+
     def _check_requirement(
         self, data: Dict[str, Any], requirement: ComplianceRequirement
     ) -> ComplianceStatus:
@@ -521,54 +756,14 @@ class MultiJurisdictionEngine:
         """
         try:
             # Simulate compliance checking based on requirement category
-            if requirement.category == "consent":
-                if "consent_records" in data or data.get("consent_granted", False):
-                    return ComplianceStatus.COMPLIANT
-                return ComplianceStatus.NON_COMPLIANT
-
-            elif requirement.category == "dsar":
-                if "dsar_response_time_days" in data:
-                    response_time = data["dsar_response_time_days"]
-                    if response_time <= (requirement.deadline_days or 30):
-                        return ComplianceStatus.COMPLIANT
-                return ComplianceStatus.PARTIAL
-
-            elif requirement.category == "breach_notification":
-                if "breach_notified_hours" in data:
-                    if data["breach_notified_hours"] <= 72:
-                        return ComplianceStatus.COMPLIANT
-                return ComplianceStatus.NON_COMPLIANT
-
-            elif requirement.category == "opt_out":
-                if "opt_out_requested" in data:
-                    return ComplianceStatus.COMPLIANT
-                return ComplianceStatus.PARTIAL
-
-            elif requirement.category == "disclosure":
-                if "privacy_notice_provided" in data:
-                    return ComplianceStatus.COMPLIANT
-                return ComplianceStatus.NON_COMPLIANT
-
-            return ComplianceStatus.NOT_APPLICABLE
+            return _compile_status(requirement)(data)
         except Exception as e:
             logger.error("Failed to check requirement: %s", str(e))
             return ComplianceStatus.NON_COMPLIANT
 
     def _get_findings(self, data: Dict[str, Any], requirement: ComplianceRequirement) -> List[str]:
         """Get specific findings for a requirement."""
-        findings = []
-
-        if requirement.mandatory and requirement.category not in data:
-            findings.append(f"Required {requirement.category} not found in data")
-
-        if requirement.deadline_days and f"{requirement.category}_days" in data:
-            if data[f"{requirement.category}_days"] > requirement.deadline_days:
-                findings.append(
-                    f"Deadline exceeded: {data[f'{requirement.category}_days']} > "
-                    f"{requirement.deadline_days} days"
-                )
-
-        return findings
+        return _compile_findings(requirement)(data)
 
     def _get_recommendations(self, requirement: ComplianceRequirement) -> List[str]:
         """Get recommendations for a requirement."""
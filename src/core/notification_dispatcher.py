@@ -0,0 +1,462 @@
+"""
+NOTIF-002: Notification Dispatcher
+Parallel, rate-limited delivery layer for NotificationService.
+
+Each channel gets its own worker pool and token-bucket throttle. Outbound
+transports are reused across messages: SMTP sessions are pooled and send many
+messages per connection, and webhook/Slack calls share a keep-alive HTTP
+session. Transient failures are retried with exponential backoff and full
+jitter; HTTP and SMTP errors are classified by status or reply code, so
+permanent rejections (4xx HTTP, 5xx SMTP) fail without retrying.
+"""
+
+import logging
+import queue
+import random
+import smtplib
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from src.middleware.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ChannelConfig:
+    """Delivery settings for one notification channel."""
+
+    workers: int = 4  # Worker threads dedicated to the channel
+    rate_per_second: Optional[float] = None  # Outbound sends per second (None = unlimited)
+    burst: int = 10  # Token bucket capacity
+    max_retries: int = 3  # Retries after the first attempt
+    backoff_base: float = 0.5  # Seconds; backoff ceiling doubles per attempt
+    backoff_max: float = 10.0  # Upper bound on a single backoff sleep
+
+
+DEFAULT_CHANNEL_CONFIGS: Dict[str, ChannelConfig] = {
+    "in_app": ChannelConfig(workers=4),
+    "email": ChannelConfig(workers=4, rate_per_second=50, burst=50),
+    "webhook": ChannelConfig(workers=8, rate_per_second=20, burst=20),
+    # Slack incoming webhooks allow roughly one message per second
+    "slack": ChannelConfig(workers=2, rate_per_second=1, burst=1),
+}
+
+
+class ChannelThrottle:
+    """Thread-safe blocking wrapper around TokenBucket."""
+
+    def __init__(self, rate_per_second: Optional[float], burst: int) -> None:
+        """
+        Initialize throttle.
+
+        Args:
+            rate_per_second: Sustained rate; None disables throttling
+            burst: Maximum burst size
+        """
+        self._bucket = TokenBucket(burst, rate_per_second) if rate_per_second else None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a send token is available."""
+        if self._bucket is None:
+            return
+        while True:
+            with self._lock:
+                if self._bucket.consume():
+                    return
+                wait_for = (1 - self._bucket.tokens) / self._bucket.refill_rate
+            time.sleep(max(wait_for, 0.001))
+
+
+class SMTPConnectionPool:
+    """
+    Pool of persistent, authenticated SMTP sessions.
+
+    Sessions are reused across messages (EHLO/STARTTLS/login happen once per
+    connection) and recycled after ``max_messages_per_connection`` sends.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        user: str = "",
+        password: str = "",
+        max_size: int = 4,
+        max_messages_per_connection: int = 100,
+        timeout: float = 30.0,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+    ) -> None:
+        """
+        Initialize SMTP pool.
+
+        Args:
+            host: SMTP server host
+            port: SMTP server port (587 enables STARTTLS)
+            user: Login user (optional)
+            password: Login password (optional)
+            max_size: Maximum idle sessions kept open
+            max_messages_per_connection: Recycle sessions after this many sends
+            timeout: Socket timeout in seconds
+            smtp_factory: Callable creating an SMTP client (injectable for tests)
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+        self._factory = smtp_factory
+        self._idle: "queue.LifoQueue[List[Any]]" = queue.LifoQueue(maxsize=max_size)
+        self.connections_opened = 0
+
+    def send(self, from_addr: str, to_addr: str, message: str) -> None:
+        """
+        Send one message over a pooled session.
+
+        Args:
+            from_addr: Envelope sender
+            to_addr: Envelope recipient
+            message: Full RFC 5322 message text
+
+        Raises:
+            smtplib.SMTPException / OSError: On delivery failure
+        """
+        entry = self._checkout()
+        try:
+            entry[0].sendmail(from_addr, to_addr, message)
+            entry[1] += 1
+        except smtplib.SMTPServerDisconnected:
+            self._close(entry)
+            raise
+        except smtplib.SMTPException:
+            # SMTPException subclasses OSError, so it is caught first: the server
+            # rejected this message but the session itself is still usable
+            try:
+                entry[0].rset()
+            except OSError:
+                self._close(entry)
+            else:
+                self._checkin(entry)
+            raise
+        except OSError:
+            # Broken session: drop it; the caller's retry opens a new one
+            self._close(entry)
+            raise
+        self._checkin(entry)
+
+    def close_all(self) -> None:
+        """Close every idle session."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def _checkout(self) -> List[Any]:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return [self._connect(), 0]
+
+    def _checkin(self, entry: List[Any]) -> None:
+        if entry[1] >= self.max_messages_per_connection:
+            self._close(entry)
+            return
+        try:
+            self._idle.put_nowait(entry)
+        except queue.Full:
+            self._close(entry)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = self._factory(self.host, self.port, timeout=self.timeout)
+        server.ehlo()
+        if self.port == 587:
+            server.starttls()
+            server.ehlo()
+        if self.user and self.password:
+            server.login(self.user, self.password)
+        self.connections_opened += 1
+        return server
+
+    @staticmethod
+    def _close(entry: List[Any]) -> None:
+        try:
+            entry[0].quit()
+        except Exception:
+            pass
+
+
+class NotificationJob:
+    """Handle for an asynchronous bulk send."""
+
+    def __init__(self, notifications: List[Any], futures: List[Future]) -> None:
+        """
+        Initialize job handle.
+
+        Args:
+            notifications: Notifications being delivered (updated in place)
+            futures: One future per notification, resolving to delivery success
+        """
+        self.job_id = str(uuid.uuid4())
+        self.created_at = datetime.utcnow()
+        self.notifications = notifications
+        self._futures = futures
+
+    @property
+    def total(self) -> int:
+        """Number of notifications in the job."""
+        return len(self._futures)
+
+    def done(self) -> bool:
+        """Whether every delivery has finished."""
+        return all(f.done() for f in self._futures)
+
+    def wait(self, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Block until deliveries finish.
+
+        Args:
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            The job's notifications
+        """
+        wait(self._futures, timeout=timeout)
+        return self.notifications
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        Get delivery progress counts.
+
+        Returns:
+            Dict with job_id, total, completed, succeeded, failed and done
+        """
+        completed = [f for f in self._futures if f.done()]
+        succeeded = sum(1 for f in completed if not f.exception() and f.result())
+        return {
+            "job_id": self.job_id,
+            "total": self.total,
+            "completed": len(completed),
+            "succeeded": succeeded,
+            "failed": len(completed) - succeeded,
+            "done": len(completed) == self.total,
+        }
+
+
+class NotificationDispatcher:
+    """
+    Per-channel worker pools with shared, reusable transports.
+
+    Attributes:
+        configs: ChannelConfig per channel value
+    """
+
+    def __init__(self, configs: Optional[Dict[str, ChannelConfig]] = None) -> None:
+        """
+        Initialize dispatcher.
+
+        Args:
+            configs: Overrides for DEFAULT_CHANNEL_CONFIGS keyed by channel value
+        """
+        self.configs: Dict[str, ChannelConfig] = {**DEFAULT_CHANNEL_CONFIGS, **(configs or {})}
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._throttles: Dict[str, ChannelThrottle] = {}
+        self._lock = threading.Lock()
+        self._http_session = None
+        self._smtp_pool: Optional[SMTPConnectionPool] = None
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    # ----- submission -----
+
+    def submit(self, channel: str, fn: Callable[[], bool]) -> Future:
+        """
+        Run a delivery on the channel's worker pool.
+
+        Args:
+            channel: Channel value (e.g. "email")
+            fn: Delivery callable returning success
+
+        Returns:
+            Future resolving to the delivery result
+        """
+        return self._executor(channel).submit(fn)
+
+    def call_with_retry(self, channel: str, fn: Callable[[], T]) -> T:
+        """
+        Throttle and call an outbound operation, retrying with jittered backoff.
+
+        Args:
+            channel: Channel value used for rate limit and retry settings
+            fn: Operation that raises on transient failure
+
+        Returns:
+            Result of fn
+
+        Raises:
+            Exception: The last error once retries are exhausted
+        """
+        config = self._config(channel)
+        throttle = self._throttle(channel)
+        attempt = 0
+        while True:
+            throttle.acquire()
+            try:
+                result = fn()
+                self._count(channel, "sent")
+                return result
+            except Exception as e:
+                if attempt >= config.max_retries or not _is_retryable(e):
+                    self._count(channel, "failed")
+                    raise
+                delay = random.uniform(
+                    0, min(config.backoff_max, config.backoff_base * (2**attempt))
+                )
+                attempt += 1
+                self._count(channel, "retried")
+                logger.warning(
+                    f"{channel.upper()} delivery attempt {attempt} failed ({e}); "
+                    f"retrying in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+    # ----- shared transports -----
+
+    def http_session(self):
+        """
+        Get the shared keep-alive HTTP session.
+
+        Returns:
+            requests.Session with a connection pool sized to the worker count
+        """
+        with self._lock:
+            if self._http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                pool_size = max(self._config("webhook").workers + self._config("slack").workers, 10)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def smtp_pool(self, host: str, port: int, user: str, password: str) -> SMTPConnectionPool:
+        """
+        Get the pooled SMTP transport for the given server settings.
+
+        Args:
+            host: SMTP host
+            port: SMTP port
+            user: Login user
+            password: Login password
+
+        Returns:
+            SMTPConnectionPool (recreated if settings changed)
+        """
+        with self._lock:
+            pool = self._smtp_pool
+            if pool is None or (pool.host, pool.port, pool.user, pool.password) != (
+                host,
+                port,
+                user,
+                password,
+            ):
+                if pool is not None:
+                    pool.close_all()
+                pool = SMTPConnectionPool(
+                    host, port, user, password, max_size=self._config("email").workers
+                )
+                self._smtp_pool = pool
+            return pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop worker pools and close transports.
+
+        Args:
+            wait: Wait for queued deliveries to finish
+        """
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
+        if self._smtp_pool is not None:
+            self._smtp_pool.close_all()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-channel delivery counters.
+
+        Returns:
+            Dict of channel -> {sent, failed, retried}
+        """
+        with self._lock:
+            return {k: dict(v) for k, v in self.stats.items()}
+
+    # ----- internals -----
+
+    def _config(self, channel: str) -> ChannelConfig:
+        return self.configs.get(channel, ChannelConfig())
+
+    def _executor(self, channel: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(channel)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._config(channel).workers,
+                    thread_name_prefix=f"notify-{channel}",
+                )
+                self._executors[channel] = executor
+            return executor
+
+    def _throttle(self, channel: str) -> ChannelThrottle:
+        with self._lock:
+            throttle = self._throttles.get(channel)
+            if throttle is None:
+                config = self._config(channel)
+                throttle = ChannelThrottle(config.rate_per_second, config.burst)
+                self._throttles[channel] = throttle
+            return throttle
+
+    def _count(self, channel: str, key: str) -> None:
+        with self._lock:
+            counters = self.stats.setdefault(channel, {"sent": 0, "failed": 0, "retried": 0})
+            counters[key] += 1
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Whether a delivery error may be transient.
+
+    HTTP 4xx responses other than 429 and SMTP 5xx replies are permanent.
+    Other SMTP protocol errors without a reply code (e.g. an unsupported
+    extension) are permanent too; dropped connections and network errors
+    are retried.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return any(code < 500 for code in codes)
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        return True
+    return status == 429 or status >= 500
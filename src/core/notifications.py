@@ -2,18 +2,28 @@
 NOTIF-001: Notification Service Module
 Centralized notification service for HR multi-agent platform.
 Supports multiple channels, templates, and user preferences.
+
+Delivery goes through NotificationDispatcher (NOTIF-002), which provides
+per-channel worker pools, pooled SMTP sessions, keep-alive HTTP, retries and
+rate limits. ``send_bulk`` returns a NotificationJob handle immediately;
+finished jobs are kept for ``job_ttl_seconds`` and at most ``max_jobs`` are
+retained.
 """
 
 import logging
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import partial
 from string import Template
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.core.notification_dispatcher import NotificationDispatcher, NotificationJob
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,12 +118,28 @@ class NotificationService:
     for database persistence.
     """
 
-    def __init__(self):
-        """Initialize notification service."""
+    def __init__(
+        self,
+        dispatcher: Optional[NotificationDispatcher] = None,
+        job_ttl_seconds: float = 3600,
+        max_jobs: int = 1000,
+    ):
+        """Initialize notification service.
+
+        Args:
+            dispatcher: Delivery layer (default: a new NotificationDispatcher)
+            job_ttl_seconds: How long finished bulk jobs stay retrievable
+            max_jobs: Bulk jobs retained; the oldest finished jobs are evicted first
+        """
         self.templates: Dict[str, NotificationTemplate] = {}
         self.notifications: Dict[str, Notification] = {}
         self.preferences: Dict[str, List[NotificationPreference]] = {}
         self.event_listeners: Dict[str, str] = {}
+        self.jobs: "OrderedDict[str, NotificationJob]" = OrderedDict()  # oldest first
+        self.job_ttl = timedelta(seconds=job_ttl_seconds)
+        self.max_jobs = max_jobs
+        self._in_app_store: List[Dict[str, Any]] = []
+        self.dispatcher = dispatcher or NotificationDispatcher()
         self._init_default_templates()
 
     def _init_default_templates(self) -> None:
@@ -224,20 +250,7 @@ class NotificationService:
             metadata={"template_id": template_id, **context},
         )
 
-        # Check quiet hours
-        if not self._check_quiet_hours(recipient_id, use_channel):
-            logger.info(
-                f"Notification {notification.id} queued due to quiet hours " f"for {recipient_id}"
-            )
-
-        # Dispatch
-        success = self._dispatch_notification(notification)
-
-        if success:
-            notification.status = NotificationStatus.SENT
-            notification.sent_at = datetime.utcnow()
-        else:
-            notification.status = NotificationStatus.FAILED
+        self._deliver(notification)
 
         # Store
         self.notifications[notification.id] = notification
@@ -254,9 +267,13 @@ class NotificationService:
         template_id: str,
         context: Dict[str, Any],
         priority: NotificationPriority = NotificationPriority.NORMAL,
-    ) -> List[Notification]:
+    ) -> NotificationJob:
         """
-        Send notification to multiple recipients.
+        Send notification to multiple recipients without blocking.
+
+        The template is rendered once and deliveries are queued on the
+        channel's worker pool. Use ``job.wait()`` to block until delivery
+        finishes, or ``job.progress()`` / ``get_job()`` to poll.
 
         Args:
             recipient_ids: List of recipient IDs
@@ -265,22 +282,71 @@ class NotificationService:
             priority: Priority level
 
         Returns:
-            List of created notifications
+            NotificationJob handle; ``job.notifications`` is in recipient order
+
+        Raises:
+            ValueError: If template not found
         """
-        notifications = []
+        if template_id not in self.templates:
+            raise ValueError(f"Template not found: {template_id}")
 
+        template = self.templates[template_id]
+        subject, body = self._render_template(template, context)
+
+        notifications = []
+        futures = []
         for recipient_id in recipient_ids:
-            notification = self.send_notification(
+            notification = Notification(
                 recipient_id=recipient_id,
-                template_id=template_id,
-                context=context,
+                channel=template.channel,
+                subject=subject,
+                body=body,
                 priority=priority,
+                metadata={"template_id": template_id, **context},
             )
+            self.notifications[notification.id] = notification
             notifications.append(notification)
+            futures.append(
+                self.dispatcher.submit(template.channel.value, partial(self._deliver, notification))
+            )
 
-        logger.info(f"Bulk notification sent to {len(recipient_ids)} recipients")
+        job = NotificationJob(notifications, futures)
+        self._evict_jobs()
+        self.jobs[job.job_id] = job
 
-        return notifications
+        logger.info(
+            f"Bulk notification job {job.job_id} queued for {len(recipient_ids)} recipients"
+        )
+
+        return job
+
+    def get_job(self, job_id: str) -> NotificationJob:
+        """
+        Get a bulk notification job.
+
+        Args:
+            job_id: ID returned by send_bulk
+
+        Returns:
+            NotificationJob handle
+
+        Raises:
+            ValueError: If job not found
+        """
+        if job_id not in self.jobs:
+            raise ValueError(f"Notification job not found: {job_id}")
+        return self.jobs[job_id]
+
+    def _evict_jobs(self) -> None:
+        """Drop finished jobs past their TTL, then the oldest finished jobs over max_jobs."""
+        expiry = datetime.utcnow() - self.job_ttl
+        finished = [job_id for job_id, job in self.jobs.items() if job.done()]
+        excess = len(self.jobs) - self.max_jobs + 1  # room for the job being added
+        for job_id in finished:
+            if excess <= 0 and self.jobs[job_id].created_at > expiry:
+                break
+            del self.jobs[job_id]
+            excess -= 1
 
     def get_notifications(
         self, recipient_id: str, status_filter: Optional[NotificationStatus] = None, limit: int = 50
@@ -441,6 +507,33 @@ class NotificationService:
 
     # ===== PRIVATE HELPER METHODS =====
 
+    def _deliver(self, notification: Notification) -> bool:
+        """
+        Dispatch a notification and record the outcome on it.
+
+        Args:
+            notification: Notification to deliver
+
+        Returns:
+            True if dispatch succeeded
+        """
+        # Check quiet hours
+        if not self._check_quiet_hours(notification.recipient_id, notification.channel):
+            logger.info(
+                f"Notification {notification.id} queued due to quiet hours "
+                f"for {notification.recipient_id}"
+            )
+
+        success = self._dispatch_notification(notification)
+
+        if success:
+            notification.status = NotificationStatus.SENT
+            notification.sent_at = datetime.utcnow()
+        else:
+            notification.status = NotificationStatus.FAILED
+
+        return success
+
     def _render_template(
         self, template: NotificationTemplate, context: Dict[str, Any]
     ) -> tuple[str, str]:
@@ -587,7 +680,6 @@ class NotificationService:
                     # Fall through to in-memory store
 
             # In-memory fallback (development / no DB)
-            self._in_app_store = getattr(self, "_in_app_store", [])
             self._in_app_store.append(
                 {
                     "id": notification.id,
@@ -610,7 +702,7 @@ class NotificationService:
 
     def _dispatch_email(self, notification: Notification) -> bool:
         """
-        Dispatch email notification via SMTP.
+        Dispatch email notification via a pooled SMTP session.
 
         Uses SMTP configuration from environment variables:
         - SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_FROM
@@ -628,7 +720,6 @@ class NotificationService:
 
         if smtp_host:
             try:
-                import smtplib
                 from email.mime.text import MIMEText
                 from email.mime.multipart import MIMEMultipart
 
@@ -641,14 +732,14 @@ class NotificationService:
                 msg["To"] = notification.recipient_id  # In production, resolve to real email
                 msg["Subject"] = notification.subject
                 msg.attach(MIMEText(notification.body, "plain"))
+                message = msg.as_string()
 
-                with smtplib.SMTP(smtp_host, smtp_port) as server:
-                    server.ehlo()
-                    if smtp_port == 587:
-                        server.starttls()
-                    if smtp_user and smtp_pass:
-                        server.login(smtp_user, smtp_pass)
-                    server.sendmail(smtp_from, notification.recipient_id, msg.as_string())
+                # Pooled session: EHLO/STARTTLS/login once per connection, not per message
+                pool = self.dispatcher.smtp_pool(smtp_host, smtp_port, smtp_user, smtp_pass)
+                self.dispatcher.call_with_retry(
+                    NotificationChannel.EMAIL.value,
+                    lambda: pool.send(smtp_from, notification.recipient_id, message),
+                )
 
                 logger.info(f"EMAIL sent to {notification.recipient_id}: {notification.subject}")
                 return True
@@ -683,9 +774,6 @@ class NotificationService:
 
         if webhook_urls:
             try:
-                import urllib.request
-                import urllib.error
-
                 payload = json.dumps(
                     {
                         "event": "notification",
@@ -695,11 +783,7 @@ class NotificationService:
                         "priority": (
                             notification.priority.value if notification.priority else "medium"
                         ),
-                        "channels": (
-                            [c.value for c in notification.channels]
-                            if notification.channels
-                            else []
-                        ),
+                        "channels": [notification.channel.value],
                         "metadata": notification.metadata or {},
                         "timestamp": (
                             notification.created_at.isoformat() if notification.created_at else None
@@ -707,20 +791,26 @@ class NotificationService:
                     }
                 ).encode("utf-8")
 
+                session = self.dispatcher.http_session()
+
+                def _post(target: str) -> None:
+                    resp = session.post(
+                        target,
+                        data=payload,
+                        headers={"Content-Type": "application/json"},
+                        timeout=10,
+                    )
+                    resp.raise_for_status()
+
                 success = False
                 for url in webhook_urls.split(","):
                     url = url.strip()
                     if not url:
                         continue
                     try:
-                        req = urllib.request.Request(
-                            url,
-                            data=payload,
-                            headers={"Content-Type": "application/json"},
-                            method="POST",
+                        self.dispatcher.call_with_retry(
+                            NotificationChannel.WEBHOOK.value, partial(_post, url)
                         )
-                        with urllib.request.urlopen(req, timeout=10) as resp:
-                            resp.read()
                         success = True
                     except Exception as e:
                         logger.warning(f"WEBHOOK failed for {url}: {e}")
@@ -763,12 +853,9 @@ class NotificationService:
 
         if webhook_url or bot_token:
             try:
-                import urllib.request
-                import urllib.error
-
                 priority_emoji = {
                     NotificationPriority.LOW: ":information_source:",
-                    NotificationPriority.MEDIUM: ":large_blue_circle:",
+                    NotificationPriority.NORMAL: ":large_blue_circle:",
                     NotificationPriority.HIGH: ":warning:",
                     NotificationPriority.URGENT: ":rotating_light:",
                 }
@@ -792,33 +879,29 @@ class NotificationService:
                 ]
 
                 if webhook_url:
+                    url = webhook_url
                     payload = json.dumps({"blocks": blocks}).encode("utf-8")
-                    req = urllib.request.Request(
-                        webhook_url,
-                        data=payload,
-                        headers={"Content-Type": "application/json"},
-                        method="POST",
-                    )
-                    with urllib.request.urlopen(req, timeout=10) as resp:
-                        resp.read()
-                elif bot_token:
+                    headers = {"Content-Type": "application/json"}
+                else:
+                    url = "https://slack.com/api/chat.postMessage"
                     payload = json.dumps(
                         {
                             "channel": notification.recipient_id,
                             "blocks": blocks,
                         }
                     ).encode("utf-8")
-                    req = urllib.request.Request(
-                        "https://slack.com/api/chat.postMessage",
-                        data=payload,
-                        headers={
-                            "Content-Type": "application/json",
-                            "Authorization": f"Bearer {bot_token}",
-                        },
-                        method="POST",
-                    )
-                    with urllib.request.urlopen(req, timeout=10) as resp:
-                        resp.read()
+                    headers = {
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {bot_token}",
+                    }
+
+                session = self.dispatcher.http_session()
+
+                def _post() -> None:
+                    resp = session.post(url, data=payload, headers=headers, timeout=10)
+                    resp.raise_for_status()
+
+                self.dispatcher.call_with_retry(NotificationChannel.SLACK.value, _post)
 
                 logger.info(f"SLACK sent to {notification.recipient_id}: {notification.subject}")
                 return True
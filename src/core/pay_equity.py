@@ -0,0 +1,412 @@
+"""
+PLAT-005: Columnar pay-equity engine.
+
+Backs BiasAuditor.check_compensation_equity. Employee records are turned
+into NumPy columns once (salary, age, peer group, gender and race codes);
+every statistic is then computed for all peer groups at once:
+
+- peer groups (job title + level) and attribute levels are coded as
+  integers in order of first appearance
+- counts and means come from ``np.bincount`` over group x level codes;
+  medians from one salary sort shared by all attributes, regrouped per
+  attribute with a stable sort by group x level
+- adjusted gaps regress log salary on the protected attribute within peer
+  groups (group means are subtracted, i.e. group fixed effects) and any
+  numeric controls such as tenure or performance rating
+
+Raw gaps follow the auditor's long-standing definitions: gender compares
+"f" with "m" over all records, race compares each race with "white" (or
+"majority") over records with a positive salary, and age compares 40 and
+over with under 40.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ATTRIBUTES = ("gender", "race", "age")
+
+# Age bands, in code order
+UNDER_40 = "under_40"
+AGE_40_AND_OVER = "40_and_over"
+
+
+@dataclass
+class AttributeStats:
+    """
+    Salary statistics per peer group and attribute level.
+
+    Arrays are indexed [group, level]; empty cells have count 0 and NaN
+    mean and median.
+    """
+
+    attribute: str
+    levels: List[str]
+    counts: np.ndarray
+    means: np.ndarray
+    medians: np.ndarray
+    first_seen: np.ndarray  # row index of the cell's first record (len(records) if empty)
+
+    def level(self, name: str) -> Optional[int]:
+        """Get a level's column, or None if no record has it."""
+        try:
+            return self.levels.index(name)
+        except ValueError:
+            return None
+
+
+@dataclass
+class PayGap:
+    """Mean pay of one attribute level compared with a reference level in a peer group."""
+
+    group: str
+    attribute: str
+    reference: str
+    comparison: str
+    reference_mean: float
+    comparison_mean: float
+    gap_pct: float  # (reference - comparison) / reference * 100
+    ratio: float  # comparison / reference
+
+
+@dataclass
+class AdjustedGap:
+    """Regression-adjusted pay gap of one attribute level across all peer groups."""
+
+    attribute: str
+    reference: str
+    comparison: str
+    gap_pct: float  # pay shortfall vs reference, holding peer group and controls fixed
+    coefficient: float  # on log salary
+    std_error: float
+    t_stat: float
+    observations: int
+    controls: List[str]
+
+
+class PayEquityEngine:
+    """
+    Vectorized pay-equity statistics over employee records.
+
+    Statistics are computed on first use and cached, so one engine can
+    serve gap checks, adjusted gaps and summaries for the same records.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Dict[str, Any]],
+        salary_field: str = "base_salary",
+        controls: Sequence[str] = (),
+    ) -> None:
+        """
+        Build the columns.
+
+        Args:
+            records: Employee records with job_title, level, gender, race, age
+                and salary fields
+            salary_field: Field holding the salary to compare
+            controls: Numeric fields to control for in adjusted gaps
+        """
+        count = len(records)
+        self.size = count
+        self.controls = list(controls)
+        self.salary = np.array([record.get(salary_field) or 0 for record in records], dtype=float)
+        self.age = _floats([record.get("age", 0) for record in records])
+        self.control_values = np.column_stack(
+            [_floats([record.get(name) for record in records]) for name in self.controls]
+            or [np.zeros((count, 0))]
+        )
+        self.groups, self.group = _codes(
+            [
+                f"{record.get('job_title', 'unknown')}_{record.get('level', 'unknown')}"
+                for record in records
+            ]
+        )
+        self._levels: Dict[str, Tuple[List[str], np.ndarray, np.ndarray]] = {
+            "gender": (
+                *_codes([str(record.get("gender") or "").lower() for record in records]),
+                np.ones(count, dtype=bool),
+            ),
+            "race": (
+                *_codes([str(record.get("race", "unknown")) for record in records]),
+                self.salary > 0,
+            ),
+            "age": (
+                [UNDER_40, AGE_40_AND_OVER],
+                (self.age >= 40).astype(np.intp),
+                ~np.isnan(self.age),
+            ),
+        }
+        # shared by every attribute's medians
+        self._by_salary = np.argsort(self.salary, kind="stable")
+        self._stats: Dict[str, AttributeStats] = {}
+
+    def stats(self, attribute: str) -> AttributeStats:
+        """
+        Get salary statistics per peer group for an attribute.
+
+        Args:
+            attribute: "gender", "race" or "age"
+
+        Returns:
+            AttributeStats over the attribute's records
+        """
+        cached = self._stats.get(attribute)
+        if cached is None:
+            levels, codes, mask = self._levels[attribute]
+            cached = self._compute(attribute, levels, codes, mask)
+            self._stats[attribute] = cached
+        return cached
+
+    def gaps(self, attribute: str) -> List[List[PayGap]]:
+        """
+        Compare each level's mean pay with the reference level in every peer group.
+
+        Args:
+            attribute: "gender", "race" or "age"
+
+        Returns:
+            One list of gaps per peer group, in group order; levels within a
+            group are in order of first appearance
+        """
+        stats = self.stats(attribute)
+        references = self._references(stats, stats.counts > 0)
+        groups = np.flatnonzero(references >= 0)
+        reference_means = np.full(len(self.groups), np.nan)
+        reference_means[groups] = stats.means[groups, references[groups]]
+
+        # every present level except the reference (gender only compares "f")
+        compared = stats.counts > 0
+        if attribute == "gender":
+            female = stats.level("f")
+            compared &= np.arange(len(stats.levels)) == (-1 if female is None else female)
+        compared[groups, references[groups]] = False
+        compared &= (reference_means > 0)[:, None]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gap_pct = ((reference_means[:, None] - stats.means) / reference_means[:, None]) * 100
+            ratio = stats.means / reference_means[:, None]
+
+        cells_group, cells_level = np.nonzero(compared)
+        order = np.lexsort((stats.first_seen[cells_group, cells_level], cells_group))
+        cells_group, cells_level = cells_group[order], cells_level[order]
+        per_group: List[List[PayGap]] = [[] for _ in self.groups]
+        for group, reference, level, reference_mean, comparison_mean, gap, level_ratio in zip(
+            cells_group.tolist(),
+            references[cells_group].tolist(),
+            cells_level.tolist(),
+            reference_means[cells_group].tolist(),
+            stats.means[cells_group, cells_level].tolist(),
+            gap_pct[cells_group, cells_level].tolist(),
+            ratio[cells_group, cells_level].tolist(),
+        ):
+            per_group[group].append(
+                PayGap(
+                    group=self.groups[group],
+                    attribute=attribute,
+                    reference=stats.levels[reference],
+                    comparison=stats.levels[level],
+                    reference_mean=reference_mean,
+                    comparison_mean=comparison_mean,
+                    gap_pct=gap,
+                    ratio=level_ratio,
+                )
+            )
+        return per_group
+
+    def adjusted_gaps(self, attribute: str) -> List[AdjustedGap]:
+        """
+        Estimate pay gaps within peer groups, controlling for the engine's controls.
+
+        Fits log(salary) = group effect + sum(level indicators) + controls by
+        least squares over records with a positive salary. Levels that never
+        share a peer group with the reference level cannot be estimated and
+        are skipped.
+
+        Args:
+            attribute: "gender", "race" or "age"
+
+        Returns:
+            One AdjustedGap per estimable comparison level
+        """
+        stats = self.stats(attribute)
+        levels, codes, mask = self._levels[attribute]
+        reference = int(self._references(stats, stats.counts.sum(axis=0, keepdims=True) > 0)[0])
+        if reference < 0:
+            return []
+        if attribute == "gender":
+            comparisons = [stats.level("f")]
+        else:
+            comparisons = [index for index in range(len(levels)) if index != reference]
+        comparisons = [index for index in comparisons if index is not None]
+        if not comparisons:
+            return []
+
+        rows = mask & (self.salary > 0) & np.isin(codes, [reference, *comparisons])
+        rows &= ~np.isnan(self.control_values).any(axis=1)
+        group = self.group[rows]
+        y = _demean(np.log(self.salary[rows]), group)
+        indicators = [(codes[rows] == index).astype(np.float64) for index in comparisons]
+        x = _demean(np.column_stack([*indicators, self.control_values[rows]]), group)
+
+        # drop levels with no within-group variation (never alongside the reference)
+        estimable = [i for i in range(len(comparisons)) if np.abs(x[:, i]).max(initial=0) > 1e-12]
+        keep = estimable + list(range(len(comparisons), x.shape[1]))
+        x = x[:, keep]
+        observations = int(rows.sum())
+        dof = observations - x.shape[1] - np.count_nonzero(np.bincount(group))
+        if not estimable or dof <= 0:
+            return []
+
+        coefficients, _, rank, _ = np.linalg.lstsq(x, y, rcond=None)
+        residuals = y - x @ coefficients
+        covariance = (residuals @ residuals / dof) * np.linalg.pinv(x.T @ x)
+        results = []
+        for column, index in enumerate(estimable):
+            coefficient = float(coefficients[column])
+            std_error = math.sqrt(max(float(covariance[column, column]), 0.0))
+            results.append(
+                AdjustedGap(
+                    attribute=attribute,
+                    reference=levels[reference],
+                    comparison=levels[comparisons[index]],
+                    gap_pct=(1 - math.exp(coefficient)) * 100,
+                    coefficient=coefficient,
+                    std_error=std_error,
+                    t_stat=coefficient / std_error if std_error else 0.0,
+                    observations=observations,
+                    controls=list(self.controls),
+                )
+            )
+        logger.debug(f"Adjusted {attribute} gaps over {observations} records (rank {rank})")
+        return results
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Summarize every peer group: headcount and, per attribute level, count, mean and median.
+
+        Returns:
+            One dict per peer group, in group order
+        """
+        counts = np.bincount(self.group, minlength=len(self.groups))
+        totals = np.bincount(self.group, weights=self.salary, minlength=len(self.groups))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = totals / counts
+        summary = [
+            {"group": name, "count": int(counts[index]), "mean_salary": _round(means[index])}
+            for index, name in enumerate(self.groups)
+        ]
+        for attribute in ATTRIBUTES:
+            stats = self.stats(attribute)
+            gaps = self.gaps(attribute)
+            for index, entry in enumerate(summary):
+                entry[attribute] = {
+                    "levels": {
+                        stats.levels[level]: {
+                            "count": int(stats.counts[index, level]),
+                            "mean": _round(stats.means[index, level]),
+                            "median": _round(stats.medians[index, level]),
+                        }
+                        for level in np.flatnonzero(stats.counts[index])
+                    },
+                    "gaps_pct": {gap.comparison: round(gap.gap_pct, 2) for gap in gaps[index]},
+                }
+        return summary
+
+    def _compute(
+        self, attribute: str, levels: List[str], codes: np.ndarray, mask: np.ndarray
+    ) -> AttributeStats:
+        groups, width = len(self.groups), len(levels)
+        rows = np.flatnonzero(mask)
+        cells = self.group[rows] * width + codes[rows]
+        salary = self.salary[rows]
+        size = groups * width
+
+        counts = np.bincount(cells, minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.bincount(cells, weights=salary, minlength=size) / counts
+
+        # records in salary order, then a stable sort by cell: salaries sorted within each cell
+        by_salary = self._by_salary[mask[self._by_salary]]
+        by_salary_cells = self.group[by_salary] * width + codes[by_salary]
+        # the narrowest unsigned key lets NumPy use radix sort for up to 65536 cells
+        key = by_salary_cells.astype(np.min_scalar_type(max(size - 1, 0)))
+        ordered = self.salary[by_salary[np.argsort(key, kind="stable")]]
+        starts = np.cumsum(counts) - counts
+        filled = counts > 0
+        medians = np.full(size, np.nan)
+        low = starts[filled] + (counts[filled] - 1) // 2
+        high = starts[filled] + counts[filled] // 2
+        medians[filled] = (ordered[low] + ordered[high]) / 2
+
+        first_seen = np.full(size, self.size, dtype=np.intp)
+        np.minimum.at(first_seen, cells, rows)
+
+        shape = (groups, width)
+        return AttributeStats(
+            attribute=attribute,
+            levels=levels,
+            counts=counts.reshape(shape),
+            means=means.reshape(shape),
+            medians=medians.reshape(shape),
+            first_seen=first_seen.reshape(shape),
+        )
+
+    @staticmethod
+    def _references(stats: AttributeStats, present: np.ndarray) -> np.ndarray:
+        """
+        Pick each row's reference level: m, white (else majority), or under 40.
+
+        Args:
+            stats: Attribute statistics
+            present: [row, level] flags of the levels present
+
+        Returns:
+            Reference level per row, -1 where none is present
+        """
+        candidates = {"gender": ("m",), "race": ("white", "majority"), "age": (UNDER_40,)}
+        references = np.full(present.shape[0], -1, dtype=np.intp)
+        for name in reversed(candidates[stats.attribute]):
+            level = stats.level(name)
+            if level is not None:
+                references = np.where(present[:, level], level, references)
+        return references
+
+
+def _codes(values: List[str]) -> Tuple[List[str], np.ndarray]:
+    """Code values as integers, numbered in order of first appearance."""
+    index = {value: code for code, value in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.intp, count=len(values))
+    return list(index), codes
+
+
+def _demean(values: np.ndarray, group: np.ndarray) -> np.ndarray:
+    """Subtract each group's mean from a column or from every column of a matrix."""
+    counts = np.maximum(np.bincount(group), 1)
+    if values.ndim == 1:
+        return values - (np.bincount(group, weights=values) / counts)[group]
+    return np.column_stack([_demean(column, group) for column in values.T])
+
+
+def _floats(values: List[Any]) -> np.ndarray:
+    """Convert values to floats; missing (None) and non-numeric values become NaN."""
+    try:
+        return np.array(values, dtype=float).reshape(len(values))
+    except (TypeError, ValueError):
+        return np.array([_number(value) for value in values], dtype=float)
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _round(value: float) -> Optional[float]:
+    return None if math.isnan(value) else round(float(value), 2)
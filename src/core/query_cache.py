@@ -13,6 +13,8 @@ from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.core.connection_pool import get_pool_manager
+
 try:
     import redis
 
@@ -150,9 +152,7 @@ class QueryCacheService:
 
         try:
             url = self.config.redis_url or "redis://localhost:6379/0"
-            self._redis_client = redis.from_url(
-                url, decode_responses=True, socket_keepalive=True, health_check_interval=30
-            )
+            self._redis_client = get_pool_manager().redis_client(url)
             self._redis_client.ping()
             logger.info("Connected to Redis for cache backend")
         except Exception as e:
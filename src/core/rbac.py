@@ -2,7 +2,10 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.connectors.org_index import OrgIndex
 
 
 # Enums
@@ -64,6 +67,8 @@ PERMISSION_MATRIX: Dict[Tuple[str, str], RoleLevel] = {
     ("leave", "view_team"): RoleLevel.MANAGER,
     ("leave", "view_all"): RoleLevel.HR_GENERALIST,
     ("leave", "approve"): RoleLevel.MANAGER,
+    # Approval Workflow Permissions (WorkflowEngine.approve_step)
+    ("workflow", "approve"): RoleLevel.MANAGER,
     # Analytics Permissions
     ("analytics", "view_team"): RoleLevel.MANAGER,
     ("analytics", "view_all"): RoleLevel.HR_GENERALIST,
@@ -165,9 +170,14 @@ def get_data_scope(user_role: str, agent_type: str) -> DataScope:
 class RBACEnforcer:
     """RBAC enforcement service for permission checks and data filtering."""
 
-    def __init__(self) -> None:
-        """Initialize RBAC enforcer."""
-        pass
+    def __init__(self, org_index: Optional["OrgIndex"] = None) -> None:
+        """Initialize RBAC enforcer.
+
+        Args:
+            org_index: Reporting hierarchy used to resolve TEAM scope when no
+                explicit team_members list is given
+        """
+        self.org_index = org_index
 
     def enforce(self, user_role: str, agent_type: str, action: str) -> None:
         """Enforce permission check and raise exception if denied.
@@ -293,7 +303,9 @@ class RBACEnforcer:
             agent_type: Agent type name
             requesting_user_id: ID of requesting user
             user_department: Department of requesting user
-            team_members: List of team member IDs for TEAM scope
+            team_members: List of team member IDs for TEAM scope (defaults to
+                everyone in the requester's reporting chain when an org index
+                is configured)
 
         Returns:
             Filtered list based on data scope
@@ -306,6 +318,13 @@ class RBACEnforcer:
         if scope == DataScope.OWN:
             return [item for item in data_list if item.get("user_id") == requesting_user_id]
         elif scope == DataScope.TEAM:
+            if team_members is None and self.org_index is not None:
+                return [
+                    item
+                    for item in data_list
+                    if item.get("user_id") == requesting_user_id
+                    or self.org_index.is_in_chain(str(item.get("user_id")), requesting_user_id)
+                ]
             team_ids = [requesting_user_id] + (team_members or [])
             return [item for item in data_list if item.get("user_id") in team_ids]
         elif scope == DataScope.DEPARTMENT:
@@ -0,0 +1,501 @@
+"""
+COMP-005: Retention enforcement and erasure executor.
+
+Turns GDPR retention policies and erasure requests into set-based SQL over
+the application tables:
+
+- a retention policy covers the tables listed for its data category in
+  RETENTION_TARGETS; rows older than the retention period are deleted
+  (RetentionAction.DELETE) or have their personal columns overwritten in
+  place (RetentionAction.ARCHIVE). Rows still in force (an active benefits
+  enrollment, a pending leave request) are never touched
+- an erasure deletes a subject's chat history, query logs, notifications and
+  sessions, anonymizes the records we must keep (employee row, reviews,
+  leave, audit logs) and removes vector-store chunks tagged with or
+  mentioning the subject
+
+Rows are processed in primary-key order, a chunk at a time, each chunk in its
+own short transaction so no statement holds locks on a large table for long.
+After every chunk the last primary key is saved to a checkpoint store, so a
+run that stops (max_batches reached, crash, deploy) resumes where it left off.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import String, cast, delete, literal, null, or_, select, update
+
+from src.core.dsar_discovery import DataSubject, resolve_subject, subject_condition
+
+if TYPE_CHECKING:
+    from src.core.gdpr import RetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[REDACTED]"
+
+
+def _erased_email(pk: Any) -> Any:
+    """Unique placeholder for the employees.email unique constraint."""
+    return literal("erased-").concat(cast(pk, String)).concat("@erased.invalid")
+
+
+def _erased_actor(pk: Any) -> Any:
+    """Per-row placeholder for audit_logs.actor, unlinkable to the subject."""
+    return literal("erased-").concat(cast(pk, String))
+
+
+# ============================================================================
+# Targets
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class RetentionTarget:
+    """A table covered by a retention policy."""
+
+    table: str
+    timestamp_column: str
+    # Column -> replacement written when anonymizing (see _anonymize_values)
+    anonymize: Dict[str, Any] = field(default_factory=dict)
+    # Parents of other tables are anonymized even under a DELETE policy, so
+    # newer child rows never point at a deleted row
+    deletable: bool = True
+    # Rows whose status is one of these are still in force and never expire
+    keep_statuses: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ErasureTarget:
+    """A table holding a subject's data, and what erasure does to it."""
+
+    table: str
+    column: str  # subject column, or the foreign key to parent
+    parent: Optional[Tuple[str, str]] = None  # (parent table, parent subject column)
+    anonymize: Optional[Dict[str, Any]] = None  # None deletes the rows
+
+
+# Data category (DataCategory value) -> tables it covers
+RETENTION_TARGETS: Dict[str, List[RetentionTarget]] = {
+    "personal": [
+        RetentionTarget("chat_messages", "created_at", {"content": REDACTED}),
+        RetentionTarget("chat_conversations", "created_at", {"title": REDACTED}, deletable=False),
+        RetentionTarget(
+            "conversation_messages", "timestamp", {"content": REDACTED, "tool_call": None}
+        ),
+        RetentionTarget(
+            "conversations",
+            "created_at",
+            {"query": REDACTED, "response_summary": REDACTED},
+            deletable=False,
+        ),
+        RetentionTarget("query_logs", "created_at", {"query": REDACTED}),
+        RetentionTarget(
+            "notification_records", "created_at", {"subject": REDACTED, "body": REDACTED}
+        ),
+        RetentionTarget(
+            "auth_sessions", "expires_at", {"ip_address": REDACTED, "user_agent": REDACTED}
+        ),
+    ],
+    "sensitive": [
+        RetentionTarget(
+            "performance_reviews",
+            "created_at",
+            {"strengths": None, "areas_for_improvement": None, "comments": None},
+        ),
+        RetentionTarget("generated_documents", "created_at", {"parameters": None}),
+    ],
+    # Aged from the last change (decision, termination), not from creation
+    "health": [
+        RetentionTarget(
+            "leave_requests", "updated_at", {"reason": None}, keep_statuses=("pending",)
+        ),
+    ],
+    "financial": [
+        RetentionTarget("benefits_enrollments", "updated_at", keep_statuses=("active",)),
+    ],
+    "biometric": [],
+}
+
+# Children come before their parents so deletes never orphan rows
+ERASURE_TARGETS: List[ErasureTarget] = [
+    ErasureTarget("chat_messages", "conversation_id", ("chat_conversations", "employee_id")),
+    ErasureTarget("chat_conversations", "employee_id"),
+    ErasureTarget("conversation_messages", "conversation_id", ("conversations", "user_id")),
+    ErasureTarget("conversations", "user_id"),
+    ErasureTarget("query_logs", "employee_id"),
+    ErasureTarget("notification_records", "recipient_id"),
+    ErasureTarget("auth_sessions", "user_id"),
+    # Kept for legal and audit reasons, stripped of free text
+    ErasureTarget("leave_requests", "employee_id", anonymize={"reason": None}),
+    ErasureTarget(
+        "performance_reviews",
+        "employee_id",
+        anonymize={"strengths": None, "areas_for_improvement": None, "comments": None},
+    ),
+    ErasureTarget(
+        "performance_goals", "employee_id", anonymize={"title": REDACTED, "description": None}
+    ),
+    ErasureTarget("onboarding_checklists", "employee_id", anonymize={"description": None}),
+    ErasureTarget("generated_documents", "employee_id", anonymize={"parameters": None}),
+    ErasureTarget(
+        "audit_logs", "user_id", anonymize={"actor": _erased_actor, "ip_address": REDACTED}
+    ),
+    ErasureTarget(
+        "employees",
+        "id",
+        anonymize={
+            "first_name": REDACTED,
+            "last_name": REDACTED,
+            "email": _erased_email,
+            "password_hash": None,
+        },
+    ),
+]
+
+
+# ============================================================================
+# Results and checkpoints
+# ============================================================================
+
+
+@dataclass
+class TableResult:
+    """Outcome and throughput of one table's chunked run."""
+
+    table: str
+    action: str  # "delete" or "anonymize"
+    rows: int = 0
+    batches: int = 0
+    elapsed_ms: float = 0.0
+    resumed_from: Optional[Any] = None  # checkpointed primary key the run started after
+    completed: bool = True
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows processed per second of run time."""
+        if not self.elapsed_ms:
+            return 0.0
+        return round(self.rows / self.elapsed_ms * 1000, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for audit trails and API responses."""
+        return {**asdict(self), "rows_per_second": self.rows_per_second}
+
+
+@dataclass
+class ErasureReport:
+    """Outcome of erasing one data subject."""
+
+    subject: DataSubject
+    tables: List[TableResult] = field(default_factory=list)
+    vector_chunks: Dict[str, int] = field(default_factory=dict)  # collection -> chunks deleted
+
+    @property
+    def deleted_records(self) -> int:
+        return sum(t.rows for t in self.tables if t.action == "delete")
+
+    @property
+    def anonymized_records(self) -> int:
+        return sum(t.rows for t in self.tables if t.action == "anonymize")
+
+    @property
+    def completed(self) -> bool:
+        return all(t.completed for t in self.tables)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for audit trails and API responses."""
+        return {
+            "subject": asdict(self.subject),
+            "deleted_records": self.deleted_records,
+            "anonymized_records": self.anonymized_records,
+            "vector_chunks": dict(self.vector_chunks),
+            "completed": self.completed,
+            "tables": [t.to_dict() for t in self.tables],
+        }
+
+
+class RetentionCheckpointStore:
+    """
+    Last processed primary key per run key.
+
+    Kept in memory, and mirrored to a JSON file when a path is given so runs
+    resume across restarts.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._checkpoints: Dict[str, Any] = {}
+        if self.path is not None and self.path.exists():
+            self._checkpoints = json.loads(self.path.read_text())
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._checkpoints[key] = value
+            self._save()
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            if self._checkpoints.pop(key, None) is not None:
+                self._save()
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._checkpoints)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self._checkpoints))
+        os.replace(tmp, self.path)
+
+
+# ============================================================================
+# Executor
+# ============================================================================
+
+
+class RetentionExecutor:
+    """
+    Executes retention policies and erasure requests against the database.
+
+    Usage:
+        executor = RetentionExecutor(SessionLocal, checkpoints=RetentionCheckpointStore(path))
+        results = executor.enforce(policy)
+        report = executor.erase("emp_001")
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        collections: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        checkpoints: Optional[RetentionCheckpointStore] = None,
+        metadata_field: str = "employee_id",
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            session_factory: SQLAlchemy session factory
+            collections: Vector collections (ChromaDB API) to erase chunks from, by name
+            batch_size: Rows per chunk (and per transaction)
+            checkpoints: Checkpoint store (in-memory if not provided)
+            metadata_field: Chunk metadata field holding the subject's ID
+        """
+        from src.core.database import Base
+
+        self._session_factory = session_factory
+        self._tables = Base.metadata.tables
+        self.collections = collections or {}
+        self.batch_size = batch_size
+        self.checkpoints = checkpoints if checkpoints is not None else RetentionCheckpointStore()
+        self.metadata_field = metadata_field
+
+    def enforce(
+        self,
+        policy: "RetentionPolicy",
+        now: Optional[datetime] = None,
+        max_batches: Optional[int] = None,
+    ) -> List[TableResult]:
+        """
+        Delete or anonymize rows older than a policy's retention period.
+
+        Args:
+            policy: RetentionPolicy to enforce
+            now: Reference time (default: utcnow)
+            max_batches: Stop each table after this many chunks; the next
+                call resumes from the checkpoint
+
+        Returns:
+            TableResult per table the policy's data category covers
+        """
+        cutoff = (now or datetime.utcnow()) - timedelta(days=policy.retention_days)
+        delete_rows = policy.action.value == "delete"
+        results = []
+        for target in RETENTION_TARGETS.get(policy.data_category.value, []):
+            table = self._tables[target.table]
+            condition = table.c[target.timestamp_column] < cutoff
+            if target.keep_statuses:
+                condition = condition & table.c.status.not_in(target.keep_statuses)
+            if delete_rows and target.deletable:
+                values = None
+            elif target.anonymize:
+                values = target.anonymize
+            else:
+                # Nothing personal to overwrite; archiving leaves the table as is
+                continue
+            results.append(
+                self._run(
+                    f"retention:{policy.policy_id}:{target.table}",
+                    target.table,
+                    condition,
+                    values,
+                    max_batches,
+                )
+            )
+        return results
+
+    def erase(
+        self, subject: Union[str, int, DataSubject], max_batches: Optional[int] = None
+    ) -> ErasureReport:
+        """
+        Erase a data subject's personal data.
+
+        Args:
+            subject: Subject ID (employee ID, HRIS ID or email) or resolved DataSubject
+            max_batches: Stop each table after this many chunks; the next
+                call resumes from the checkpoint
+
+        Returns:
+            ErasureReport with per-table results and vector chunks removed
+        """
+        if not isinstance(subject, DataSubject):
+            subject = resolve_subject(self._session_factory, subject)
+        report = ErasureReport(subject=subject)
+
+        if subject.employee_id is not None:
+            for target in ERASURE_TARGETS:
+                table = self._tables[target.table]
+                if target.parent:
+                    parent = self._tables[target.parent[0]]
+                    condition = table.c[target.column].in_(
+                        select(parent.c.id).where(parent.c[target.parent[1]] == subject.employee_id)
+                    )
+                else:
+                    condition = subject_condition(table, target.column, subject)
+                report.tables.append(
+                    self._run(
+                        f"erasure:{subject.employee_id}:{target.table}",
+                        target.table,
+                        condition,
+                        target.anonymize,
+                        max_batches,
+                    )
+                )
+        else:
+            logger.warning(f"Erasure subject {subject.subject_id} not in employees")
+
+        for name, collection in self.collections.items():
+            report.vector_chunks[name] = self._erase_chunks(collection, subject)
+
+        logger.info(
+            f"Erased subject {subject.subject_id}: {report.deleted_records} deleted, "
+            f"{report.anonymized_records} anonymized, "
+            f"{sum(report.vector_chunks.values())} vector chunks"
+        )
+        return report
+
+    def _run(
+        self,
+        key: str,
+        table_name: str,
+        condition: Any,
+        values: Optional[Dict[str, Any]],
+        max_batches: Optional[int],
+    ) -> TableResult:
+        """Process matching rows a chunk at a time, checkpointing after each chunk."""
+        table = self._tables[table_name]
+        pk = table.c.id
+        result = TableResult(table=table_name, action="delete" if values is None else "anonymize")
+
+        if values is not None:
+            values = _anonymize_values(table, values)
+            # Skip rows already anonymized so reruns only touch new rows; NULLs
+            # in other columns must not hide a row from the check
+            condition = condition & or_(
+                *(
+                    (
+                        table.c[column].is_not(None)
+                        if value is None
+                        else table.c[column].is_distinct_from(value)
+                    )
+                    for column, value in values.items()
+                )
+            )
+
+        last_id = result.resumed_from = self.checkpoints.get(key)
+        started = time.perf_counter()
+        while max_batches is None or result.batches < max_batches:
+            query = select(pk).where(condition).order_by(pk).limit(self.batch_size)
+            if last_id is not None:
+                query = query.where(pk > last_id)
+
+            session = self._session_factory()
+            try:
+                ids = session.execute(query).scalars().all()
+                if not ids:
+                    break
+                if values is None:
+                    statement = delete(table).where(pk.in_(ids))
+                else:
+                    statement = (
+                        update(table)
+                        .where(pk.in_(ids))
+                        .values({c: null() if v is None else v for c, v in values.items()})
+                    )
+                result.rows += session.execute(statement).rowcount
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+            result.batches += 1
+            last_id = ids[-1]
+            self.checkpoints.set(key, last_id)
+            if len(ids) < self.batch_size:
+                break
+        else:
+            result.completed = False
+
+        if result.completed:
+            self.checkpoints.clear(key)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(
+            f"{result.action} on {table_name}: {result.rows} rows in {result.batches} "
+            f"batches ({result.rows_per_second} rows/s)"
+            + ("" if result.completed else f", paused after id {last_id}")
+        )
+        return result
+
+    def _erase_chunks(self, collection: Any, subject: DataSubject) -> int:
+        """Delete chunks tagged with the subject's ID or mentioning their email or name."""
+        filters: List[Dict[str, Any]] = [{"where": {self.metadata_field: subject.external_id}}]
+        for term in (subject.email, subject.name):
+            if term:
+                filters.append({"where_document": {"$contains": term}})
+
+        deleted = 0
+        for chunk_filter in filters:
+            while True:
+                ids = collection.get(limit=self.batch_size, include=[], **chunk_filter)["ids"]
+                if not ids:
+                    break
+                collection.delete(ids=ids)
+                deleted += len(ids)
+                if len(ids) < self.batch_size:
+                    break
+        return deleted
+
+
+def _anonymize_values(table: Any, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve replacements: None clears the column, callables get the primary key column."""
+    return {
+        column: value(table.c.id) if callable(value) else value for column, value in values.items()
+    }
@@ -0,0 +1,424 @@
+"""
+CORE-006: Unified text-safety scanner.
+
+Guardrails, PII redaction, request sanitization and the bias auditor all
+look for regex rules in the same chat text. They register their rules here
+under a category and scan through a shared TextScanner, which returns typed
+spans for the categories a consumer asks for.
+
+Python's re has no multi-pattern engine: one alternation of every rule tries
+each branch at every position and loses the literal-prefix search each rule
+gets on its own, which measured slower than separate passes. The scanner
+instead prefilters like Hyperscan does. When a category set is compiled,
+each rule gets the literals one of which any of its matches must contain
+(e.g. "table" for ``(?:DROP|DELETE)\\s+TABLE``). A scan checks those
+literals against the text once and only runs rules whose literals are
+present, plus rules with no usable literal (e.g. ``\\d{3}-\\d{2}-\\d{4}``).
+Chat text usually contains few rule literals, so most rules never run.
+
+Spans follow the semantics of running ``finditer`` per rule: every rule
+reports its own non-overlapping matches, even where they overlap matches of
+other rules.
+
+Consumers that replace matched text (masking, redaction) rebuild it with
+replace_spans in one pass. Rules replaced one after another can interact
+(a later rule sees the earlier replacements), so where spans_interact
+reports overlapping or adjacent matches of different rules, those consumers
+fall back to replacing rule by rule.
+
+Usage:
+    scanner = get_text_scanner()
+    scanner.register([ScanRule("pii", "ssn", r"\\b\\d{3}-\\d{2}-\\d{4}\\b")])
+    spans = scanner.scan(text, ["pii"])
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
+
+_REPEATS = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+_ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+
+
+@dataclass(frozen=True)
+class ScanRule:
+    """
+    A pattern registered with the scanner.
+
+    Attributes:
+        category: Rule set the rule belongs to (e.g. "pii", "injection")
+        name: Rule name, unique within its category
+        pattern: Regular expression source
+        flags: re flags to compile the pattern with
+    """
+
+    category: str
+    name: str
+    pattern: str
+    flags: int = 0
+
+
+@dataclass(frozen=True)
+class ScanSpan:
+    """A rule match in scanned text."""
+
+    category: str
+    rule: str
+    start: int
+    end: int
+    text: str
+
+
+def required_literals(pattern: str, flags: int = 0) -> Optional[Tuple[FrozenSet[str], bool]]:
+    """
+    Find literals one of which every match of a pattern contains.
+
+    Args:
+        pattern: Regular expression source
+        flags: re flags the pattern is compiled with
+
+    Returns:
+        (literals, ignorecase), or None if no literal is required. Literals
+        of case-insensitive patterns are lowercase ASCII and must be looked
+        up in lowercased text.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    ignorecase = bool(parsed.state.flags & re.IGNORECASE)
+    literals = _required(parsed, ignorecase)
+    return (literals, ignorecase) if literals else None
+
+
+def _required(items: Iterable[Tuple[object, object]], ignorecase: bool) -> Optional[FrozenSet[str]]:
+    """Pick the most selective literal set required by a parsed sequence."""
+    candidates: List[FrozenSet[str]] = []
+    run: List[str] = []
+    for op, av in items:
+        # non-ASCII letters can match ASCII ones case-insensitively (e.g. "ſ" and "s")
+        if op is sre_constants.LITERAL and not (ignorecase and av >= 128):
+            run.append(chr(av).lower() if ignorecase else chr(av))
+            continue
+        if run:
+            candidates.append(frozenset(["".join(run)]))
+            run = []
+        found = None
+        if op is sre_constants.SUBPATTERN and not av[1] and not av[2]:
+            found = _required(av[3], ignorecase)
+        elif op in _REPEATS and av[0] >= 1:
+            found = _required(av[2], ignorecase)
+        elif op is _ATOMIC_GROUP:
+            found = _required(av, ignorecase)
+        elif op is sre_constants.BRANCH:
+            branches = [_required(branch, ignorecase) for branch in av[1]]
+            if all(branches):
+                found = frozenset().union(*branches)
+        if found:
+            candidates.append(found)
+    if run:
+        candidates.append(frozenset(["".join(run)]))
+    return max(candidates, key=lambda literals: min(map(len, literals)), default=None)
+
+
+class _Plan:
+    """
+    Compiled rules of a category set.
+
+    Each rule is kept with its compiled pattern and required literals; rules
+    without literals always run.
+    """
+
+    def __init__(self, rules: Sequence[ScanRule]) -> None:
+        self.rules = [
+            (
+                rule,
+                re.compile(rule.pattern, rule.flags),
+                required_literals(rule.pattern, rule.flags),
+            )
+            for rule in rules
+        ]
+        self.prefiltered = sum(1 for _, _, literals in self.rules if literals)
+
+    def scan(self, text: str) -> List[ScanSpan]:
+        if not text:
+            return []
+        # lowercasing is a per-character fold only for ASCII text
+        lowered = text.lower() if text.isascii() else None
+        present: Dict[Tuple[str, bool], bool] = {}
+        spans: List[ScanSpan] = []
+        for rule, pattern, required in self.rules:
+            if required is not None:
+                literals, ignorecase = required
+                haystack = lowered if ignorecase else text
+                if haystack is not None and not any(
+                    _contains(present, haystack, literal, ignorecase) for literal in literals
+                ):
+                    continue
+            for match in pattern.finditer(text):
+                spans.append(ScanSpan(rule.category, rule.name, *match.span(), match.group()))
+        spans.sort(key=lambda span: span.start)
+        return spans
+
+
+def _contains(
+    present: Dict[Tuple[str, bool], bool], haystack: str, literal: str, ignorecase: bool
+) -> bool:
+    key = (literal, ignorecase)
+    found = present.get(key)
+    if found is None:
+        found = present[key] = literal in haystack
+    return found
+
+
+class TextScanner:
+    """
+    Registry of scan rules, compiled once per category set.
+
+    Thread-safe. Rules are compiled on first use of a category set and
+    recompiled only when a category's rules change.
+    """
+
+    def __init__(self, rules: Iterable[ScanRule] = ()) -> None:
+        """
+        Initialize scanner.
+
+        Args:
+            rules: Rules to register up front
+        """
+        self._rules: Dict[str, Dict[str, ScanRule]] = {}
+        self._plans: Dict[FrozenSet[str], _Plan] = {}
+        self._lock = threading.Lock()
+        self.register(rules)
+
+    def register(self, rules: Iterable[ScanRule]) -> None:
+        """
+        Add rules, replacing any registered rule with the same category and name.
+
+        Re-registering identical rules is a no-op, so consumers may register
+        on every construction.
+
+        Args:
+            rules: Rules to register
+        """
+        with self._lock:
+            changed = set()
+            for rule in rules:
+                category = self._rules.setdefault(rule.category, {})
+                if category.get(rule.name) != rule:
+                    category[rule.name] = rule
+                    changed.add(rule.category)
+            if changed:
+                self._plans = {key: plan for key, plan in self._plans.items() if not key & changed}
+
+    def categories(self) -> List[str]:
+        """Get the registered categories."""
+        with self._lock:
+            return list(self._rules)
+
+    def rules(self, category: str) -> List[ScanRule]:
+        """Get a category's rules in registration order."""
+        with self._lock:
+            return list(self._rules.get(category, {}).values())
+
+    def scan(self, text: str, categories: Optional[Iterable[str]] = None) -> List[ScanSpan]:
+        """
+        Find every rule match in text.
+
+        Args:
+            text: Text to scan
+            categories: Categories to match (default: all registered)
+
+        Returns:
+            Spans ordered by start position, then category and registration order
+        """
+        return self._plan(categories).scan(text)
+
+    def _plan(self, categories: Optional[Iterable[str]]) -> _Plan:
+        with self._lock:
+            key = frozenset(self._rules if categories is None else categories)
+            plan = self._plans.get(key)
+            if plan is None:
+                rules = [
+                    rule
+                    for category in sorted(key)
+                    for rule in self._rules.get(category, {}).values()
+                ]
+                plan = _Plan(rules)
+                self._plans[key] = plan
+                logger.debug(
+                    f"Compiled scanner for {sorted(key)}: {len(rules)} rules, "
+                    f"{plan.prefiltered} prefiltered"
+                )
+            return plan
+
+
+class Gazetteer:
+    """
+    Aho-Corasick automaton over a fixed list of literal terms.
+
+    Finds every occurrence of every term in one pass over the text, however
+    many terms there are. Used for term lists too large to compile into
+    regexes (e.g. an employee roster for name redaction). Matching is
+    case-sensitive.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            terms: Terms to find; empty terms are ignored
+        """
+        self.terms: List[str] = list(terms)
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, term in enumerate(self.terms):
+            if not term:
+                continue
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # breadth-first so a state's failure target is finished before it
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                fail[next_state] = goto[target].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+                queue.append(next_state)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple((index, len(self.terms[index])) for index in out) for out in outputs]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Find all occurrences of all terms, including overlapping ones.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            (start, end, term index) tuples ordered by end position
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: List[Tuple[int, int, int]] = []
+        state = 0
+        for position, char in enumerate(text, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index, length in outputs[state]:
+                found.append((position - length, position, index))
+        return found
+
+
+def is_word_char(char: str) -> bool:
+    """Check whether a character is matched by ``\\w`` in a str pattern."""
+    return char.isalnum() or char == "_"
+
+
+def spans_interact(spans: Sequence[ScanSpan]) -> bool:
+    """
+    Check whether matches of different rules overlap or touch.
+
+    Replacing one rule's matches can change what a later rule matches only
+    where their spans overlap or are adjacent (word boundaries look one
+    character past a match). Without such spans, replacing every span in
+    one pass gives the same text as replacing rule by rule; with them,
+    callers should replace rule by rule.
+
+    Args:
+        spans: Spans ordered by start position
+
+    Returns:
+        True if two spans of different rules overlap or are adjacent
+    """
+    for index, span in enumerate(spans):
+        for other in spans[index + 1 :]:
+            if other.start > span.end:
+                break
+            if (other.category, other.rule) != (span.category, span.rule):
+                return True
+    return False
+
+
+def replace_spans(
+    text: str, spans: Sequence[ScanSpan], replacement: Callable[[ScanSpan], str]
+) -> str:
+    """
+    Replace non-overlapping spans in one pass.
+
+    Args:
+        text: Original text
+        spans: Spans ordered by start position, not overlapping
+        replacement: Text to put in place of a span
+
+    Returns:
+        Rewritten text
+    """
+    parts: List[str] = []
+    position = 0
+    for span in spans:
+        parts.append(text[position : span.start])
+        parts.append(replacement(span))
+        position = span.end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def spans_by_rule(spans: Iterable[ScanSpan]) -> Dict[Tuple[str, str], List[ScanSpan]]:
+    """Group spans by (category, rule name), keeping text order."""
+    grouped: Dict[Tuple[str, str], List[ScanSpan]] = {}
+    for span in spans:
+        grouped.setdefault((span.category, span.rule), []).append(span)
+    return grouped
+
+
+# ============================================================================
+# Singleton
+# ============================================================================
+
+_text_scanner: Optional[TextScanner] = None
+_scanner_lock = threading.Lock()
+
+
+def get_text_scanner() -> TextScanner:
+    """
+    Get the process-wide text scanner shared by the text-safety consumers.
+
+    Returns:
+        TextScanner instance
+    """
+    global _text_scanner
+    if _text_scanner is None:
+        with _scanner_lock:
+            if _text_scanner is None:
+                _text_scanner = TextScanner()
+    return _text_scanner
@@ -4,15 +4,25 @@ REALTIME-001: WebSocket Manager for Real-time Notifications.
 This module implements WebSocket connection management, message routing, and
 real-time event broadcasting for the HR agent platform. Supports user-targeted
 messaging, broadcast notifications, and connection lifecycle management.
+
+Delivery model: every connection owns a bounded outbox of pre-encoded frames.
+Messages are serialized once (a broadcast encodes a single frame shared by
+every outbox) and written to the socket by ``flush`` / ``drain``. Connections
+whose outbox fills up are handled by the configured SlowConsumerPolicy, and
+heartbeat deadlines live in a timing wheel so stale-connection cleanup only
+touches connections that are actually due.
 """
 
 import logging
-from datetime import datetime, timedelta
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +42,14 @@ class WebSocketEvent(str, Enum):
     WORKFLOW_UPDATE = "workflow_update"
 
 
+class SlowConsumerPolicy(str, Enum):
+    """What to do when a connection's outbox is full."""
+
+    DROP_OLDEST = "drop_oldest"  # evict the oldest queued frame
+    DROP_NEWEST = "drop_newest"  # drop the frame being enqueued
+    DISCONNECT = "disconnect"  # close the connection
+
+
 # ============================================================================
 # Pydantic Models
 # ============================================================================
@@ -67,6 +85,14 @@ class ConnectionInfo(BaseModel):
 
     model_config = ConfigDict(use_enum_values=False)
 
+    # Set by WebSocketManager so heartbeat deadlines follow last_ping updates
+    _observer: Optional[Callable[["ConnectionInfo"], None]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "last_ping" and self._observer is not None:
+            self._observer(self)
+
 
 class WebSocketConfig(BaseModel):
     """Configuration for WebSocket manager."""
@@ -75,6 +101,12 @@ class WebSocketConfig(BaseModel):
     ping_interval: int = Field(30, description="Ping interval in seconds")
     ping_timeout: int = Field(10, description="Ping timeout in seconds")
     max_message_size: int = Field(65536, description="Max message size in bytes")
+    outbox_size: int = Field(256, description="Max queued frames per connection")
+    slow_consumer_policy: SlowConsumerPolicy = Field(
+        SlowConsumerPolicy.DROP_OLDEST, description="Action when a connection's outbox is full"
+    )
+    wheel_tick_seconds: float = Field(1.0, description="Timing wheel tick for heartbeat deadlines")
+    wheel_slots: int = Field(512, description="Number of timing wheel slots")
     allowed_events: List[WebSocketEvent] = Field(
         default_factory=lambda: [
             WebSocketEvent.NOTIFICATION,
@@ -89,6 +121,121 @@ class WebSocketConfig(BaseModel):
     model_config = ConfigDict(use_enum_values=False)
 
 
+# ============================================================================
+# Delivery Primitives
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class OutboundFrame:
+    """A message encoded once and shared by every outbox it is queued on."""
+
+    message: WebSocketMessage
+    data: str
+    size: int
+
+
+class TimingWheel:
+    """
+    Hashed timing wheel for connection deadlines.
+
+    Scheduling, rescheduling and cancelling are O(1); ``advance`` only visits
+    the slots for ticks that elapsed since the previous call, so the cost of
+    a sweep is proportional to the connections that are due rather than to
+    every open connection.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, slots: int = 512, start: float = 0.0) -> None:
+        """
+        Initialize timing wheel.
+
+        Args:
+            tick_seconds: Resolution of a slot in seconds
+            slots: Number of slots (deadlines further out wrap around)
+            start: Timestamp the wheel starts at
+        """
+        if tick_seconds <= 0 or slots <= 0:
+            raise ValueError("tick_seconds and slots must be positive")
+        self.tick_seconds = tick_seconds
+        self._slots: List[Dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._where: Dict[Hashable, int] = {}  # key -> slot index, or -1 for overdue
+        self._overdue: Dict[Hashable, int] = {}
+        self._processed_tick = self._tick(start) - 1
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """
+        Schedule (or move) a key to fire at a deadline.
+
+        Args:
+            key: Item identifier
+            deadline: Timestamp at which the key becomes due
+        """
+        self.cancel(key)
+        tick = self._tick(deadline)
+        if tick <= self._processed_tick:
+            self._overdue[key] = tick
+            self._where[key] = -1
+            return
+        index = tick % len(self._slots)
+        self._slots[index][key] = tick
+        self._where[key] = index
+
+    def cancel(self, key: Hashable) -> None:
+        """
+        Remove a key from the wheel if present.
+
+        Args:
+            key: Item identifier
+        """
+        index = self._where.pop(key, None)
+        if index is None:
+            return
+        if index < 0:
+            self._overdue.pop(key, None)
+        else:
+            self._slots[index].pop(key, None)
+
+    def advance(self, now: float) -> List[Hashable]:
+        """
+        Move the wheel to ``now`` and pop every key that is due.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            Keys whose deadline tick has been reached
+        """
+        now_tick = self._tick(now)
+        expired = list(self._overdue)
+        self._overdue.clear()
+        elapsed = now_tick - self._processed_tick
+        if elapsed > 0:
+            for offset in range(1, min(elapsed, len(self._slots)) + 1):
+                slot = self._slots[(self._processed_tick + offset) % len(self._slots)]
+                due = [key for key, tick in slot.items() if tick <= now_tick]
+                for key in due:
+                    del slot[key]
+                expired.extend(due)
+            self._processed_tick = now_tick
+        for key in expired:
+            self._where.pop(key, None)
+        return expired
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp // self.tick_seconds)
+
+
+def _timestamp(value: datetime) -> float:
+    """Convert a naive UTC datetime to a POSIX timestamp."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
 # ============================================================================
 # WebSocket Manager
 # ============================================================================
@@ -100,6 +247,8 @@ class WebSocketManager:
 
     Manages WebSocket connections, message routing, broadcasting, and
     connection lifecycle with support for user targeting and event filtering.
+    Outbound messages are queued on per-connection outboxes and written to
+    the attached transport by ``flush`` (push) or ``drain`` (pull).
     """
 
     def __init__(self, config: WebSocketConfig) -> None:
@@ -112,23 +261,48 @@ class WebSocketManager:
         self.config = config
         self.connections: Dict[str, ConnectionInfo] = {}
         self.user_connections: Dict[str, List[str]] = {}  # user_id -> [connection_ids]
-        self.message_queue: List[WebSocketMessage] = []
+        self.outboxes: Dict[str, Deque[OutboundFrame]] = {}
+        self.transports: Dict[str, Callable[[str], Any]] = {}
         self.stats = {
             "total_connections": 0,
             "messages_sent": 0,
             "messages_broadcast": 0,
             "connected_users": 0,
+            "messages_delivered": 0,
+            "messages_dropped": 0,
+            "slow_consumers_disconnected": 0,
+            "stale_connections_removed": 0,
         }
+        self._lock = threading.RLock()
+        self._ready: Dict[str, None] = {}  # connection_ids with queued frames (ordered set)
+        self._pending = 0
+        self._heartbeats = TimingWheel(
+            tick_seconds=config.wheel_tick_seconds,
+            slots=config.wheel_slots,
+            start=_timestamp(datetime.utcnow()),
+        )
 
         logger.info("WebSocketManager initialized")
 
-    def connect(self, user_id: str, metadata: Optional[Dict[str, Any]] = None) -> ConnectionInfo:
+    @property
+    def message_queue(self) -> List[WebSocketMessage]:
+        """Messages still waiting in any outbox, in per-connection order."""
+        with self._lock:
+            return [frame.message for outbox in self.outboxes.values() for frame in outbox]
+
+    def connect(
+        self,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        transport: Optional[Callable[[str], Any]] = None,
+    ) -> ConnectionInfo:
         """
         Register a new WebSocket connection.
 
         Args:
             user_id: Connected user ID
             metadata: Optional connection metadata
+            transport: Optional callable that writes one text frame to the socket
 
         Returns:
             ConnectionInfo instance
@@ -137,34 +311,58 @@ class WebSocketManager:
             ValueError: If max connections per user exceeded
         """
         try:
-            # Check connection limit
-            user_conns = self.user_connections.get(user_id, [])
-            if len(user_conns) >= self.config.max_connections_per_user:
-                raise ValueError(
-                    f"User {user_id} has exceeded max connections "
-                    f"({self.config.max_connections_per_user})"
-                )
-
-            # Create connection info
-            conn_info = ConnectionInfo(user_id=user_id, metadata=metadata or {})
-
-            self.connections[conn_info.connection_id] = conn_info
-            user_conns.append(conn_info.connection_id)
-
-            # Increment connected_users only if this is a new user
-            if user_id not in self.user_connections or len(user_conns) == 1:
-                self.stats["connected_users"] += 1
-
-            self.user_connections[user_id] = user_conns
-            self.stats["total_connections"] += 1
-
-            logger.info(f"User {user_id} connected (connection_id: {conn_info.connection_id})")
+            with self._lock:
+                # Check connection limit
+                user_conns = self.user_connections.get(user_id, [])
+                if len(user_conns) >= self.config.max_connections_per_user:
+                    raise ValueError(
+                        f"User {user_id} has exceeded max connections "
+                        f"({self.config.max_connections_per_user})"
+                    )
+
+                # Create connection info
+                conn_info = ConnectionInfo(user_id=user_id, metadata=metadata or {})
+                connection_id = conn_info.connection_id
+
+                self.connections[connection_id] = conn_info
+                self.outboxes[connection_id] = deque()
+                if transport is not None:
+                    self.transports[connection_id] = transport
+                user_conns.append(connection_id)
+
+                # Increment connected_users only if this is a new user
+                if user_id not in self.user_connections or len(user_conns) == 1:
+                    self.stats["connected_users"] += 1
+
+                self.user_connections[user_id] = user_conns
+                self.stats["total_connections"] += 1
+
+                conn_info._observer = self._schedule_heartbeat
+                self._schedule_heartbeat(conn_info)
+
+            logger.info(f"User {user_id} connected (connection_id: {connection_id})")
             return conn_info
 
         except Exception as e:
             logger.error(f"Error connecting user {user_id}: {e}")
             raise ValueError(f"Failed to establish connection: {e}")
 
+    def attach_transport(self, connection_id: str, transport: Callable[[str], Any]) -> None:
+        """
+        Attach the socket writer for an existing connection.
+
+        Args:
+            connection_id: Connection ID
+            transport: Callable that writes one text frame to the socket
+
+        Raises:
+            ValueError: If connection not found
+        """
+        with self._lock:
+            if connection_id not in self.connections:
+                raise ValueError(f"Connection not found: {connection_id}")
+            self.transports[connection_id] = transport
+
     def disconnect(self, connection_id: str) -> bool:
         """
         Unregister a WebSocket connection.
@@ -176,20 +374,26 @@ class WebSocketManager:
             True if disconnection successful
         """
         try:
-            conn_info = self.connections.get(connection_id)
-            if not conn_info:
-                logger.warning(f"Connection not found: {connection_id}")
-                return False
-
-            user_id = conn_info.user_id
-            del self.connections[connection_id]
-
-            # Remove from user connections
-            if user_id in self.user_connections:
-                self.user_connections[user_id].remove(connection_id)
-                if not self.user_connections[user_id]:
-                    del self.user_connections[user_id]
-                    self.stats["connected_users"] -= 1
+            with self._lock:
+                conn_info = self.connections.get(connection_id)
+                if not conn_info:
+                    logger.warning(f"Connection not found: {connection_id}")
+                    return False
+
+                user_id = conn_info.user_id
+                del self.connections[connection_id]
+                conn_info._observer = None
+                self._heartbeats.cancel(connection_id)
+                self.transports.pop(connection_id, None)
+                self._ready.pop(connection_id, None)
+                self._pending -= len(self.outboxes.pop(connection_id, ()))
+
+                # Remove from user connections
+                if user_id in self.user_connections:
+                    self.user_connections[user_id].remove(connection_id)
+                    if not self.user_connections[user_id]:
+                        del self.user_connections[user_id]
+                        self.stats["connected_users"] -= 1
 
             logger.info(f"User {user_id} disconnected (connection_id: {connection_id})")
             return True
@@ -198,6 +402,22 @@ class WebSocketManager:
             logger.error(f"Error disconnecting {connection_id}: {e}")
             return False
 
+    def heartbeat(self, connection_id: str) -> bool:
+        """
+        Record a ping/pong from a connection.
+
+        Args:
+            connection_id: Connection ID
+
+        Returns:
+            True if the connection exists
+        """
+        conn_info = self.connections.get(connection_id)
+        if not conn_info:
+            return False
+        conn_info.last_ping = datetime.utcnow()
+        return True
+
     def send_message(self, connection_id: str, message: WebSocketMessage) -> bool:
         """
         Send message to specific connection.
@@ -207,33 +427,25 @@ class WebSocketManager:
             message: WebSocketMessage to send
 
         Returns:
-            True if message queued successfully
+            True if message queued successfully, False if the slow-consumer
+            policy dropped it
 
         Raises:
             ValueError: If connection not found or message invalid
         """
         try:
-            if not self._validate_message(message):
-                raise ValueError("Invalid message format")
-
             if connection_id not in self.connections:
                 raise ValueError(f"Connection not found: {connection_id}")
 
-            # Check message size
-            import json
+            frame = self._encode(message)
+            queued = self._enqueue(connection_id, frame)
 
-            msg_size = len(json.dumps(message.model_dump(), default=str))
-            if msg_size > self.config.max_message_size:
-                raise ValueError(
-                    f"Message exceeds max size ({msg_size} > {self.config.max_message_size})"
+            if queued:
+                conn_info = self.connections[connection_id]
+                logger.debug(
+                    f"Queued message for {conn_info.user_id} (connection: {connection_id})"
                 )
-
-            self.message_queue.append(message)
-            self.stats["messages_sent"] += 1
-
-            conn_info = self.connections[connection_id]
-            logger.debug(f"Queued message for {conn_info.user_id} (connection: {connection_id})")
-            return True
+            return queued
 
         except Exception as e:
             logger.error(f"Error sending message to {connection_id}: {e}")
@@ -245,6 +457,9 @@ class WebSocketManager:
         """
         Broadcast message to all or multiple users.
 
+        The message is validated and encoded once; every outbox receives the
+        same frame.
+
         Args:
             message: WebSocketMessage to broadcast
             exclude_users: Optional list of user IDs to exclude
@@ -256,21 +471,22 @@ class WebSocketManager:
             ValueError: If message invalid
         """
         try:
-            if not self._validate_message(message):
-                raise ValueError("Invalid message format")
-
-            exclude_users = exclude_users or []
+            frame = self._encode(message)
+            excluded = set(exclude_users or ())
             sent_count = 0
 
-            for connection_id, conn_info in self.connections.items():
-                if conn_info.user_id not in exclude_users:
-                    try:
-                        self.send_message(connection_id, message)
+            with self._lock:
+                targets = [
+                    connection_id
+                    for user_id, connection_ids in self.user_connections.items()
+                    if user_id not in excluded
+                    for connection_id in connection_ids
+                ]
+                for connection_id in targets:
+                    if self._enqueue(connection_id, frame):
                         sent_count += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to send to {connection_id}: {e}")
 
-            self.stats["messages_broadcast"] += 1
+                self.stats["messages_broadcast"] += 1
             logger.info(f"Broadcast message to {sent_count} connections")
             return sent_count
 
@@ -291,14 +507,16 @@ class WebSocketManager:
         """
         try:
             user_conns = self.user_connections.get(user_id, [])
-            sent_count = 0
+            if not user_conns:
+                logger.info(f"Sent message to 0 connections for user {user_id}")
+                return 0
 
-            for connection_id in user_conns:
-                try:
-                    self.send_message(connection_id, message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to send to connection {connection_id}: {e}")
+            frame = self._encode(message)
+            sent_count = 0
+            with self._lock:
+                for connection_id in list(user_conns):
+                    if self._enqueue(connection_id, frame):
+                        sent_count += 1
 
             logger.info(f"Sent message to {sent_count} connections for user {user_id}")
             return sent_count
@@ -344,6 +562,59 @@ class WebSocketManager:
             logger.error(f"Error sending notification to {user_id}: {e}")
             return False
 
+    def drain(self, connection_id: str, max_frames: Optional[int] = None) -> List[str]:
+        """
+        Pop queued frames for a connection (for pull-based socket writers).
+
+        Args:
+            connection_id: Connection ID
+            max_frames: Maximum frames to return (None = all)
+
+        Returns:
+            Encoded frames in FIFO order
+        """
+        with self._lock:
+            outbox = self.outboxes.get(connection_id)
+            if not outbox:
+                return []
+            count = len(outbox) if max_frames is None else min(max_frames, len(outbox))
+            frames = [outbox.popleft().data for _ in range(count)]
+            if not outbox:
+                self._ready.pop(connection_id, None)
+            self._pending -= count
+            self.stats["messages_delivered"] += count
+            return frames
+
+    def flush(self, max_frames_per_connection: Optional[int] = None) -> int:
+        """
+        Write queued frames to every connection with an attached transport.
+
+        Only connections with pending frames are visited. A transport that
+        raises is treated as a dead socket and its connection is closed.
+
+        Args:
+            max_frames_per_connection: Cap per connection per call (None = all)
+
+        Returns:
+            Number of frames written
+        """
+        written = 0
+        with self._lock:
+            ready = [cid for cid in self._ready if cid in self.transports]
+        for connection_id in ready:
+            transport = self.transports.get(connection_id)
+            if transport is None:
+                continue
+            for data in self.drain(connection_id, max_frames_per_connection):
+                try:
+                    transport(data)
+                    written += 1
+                except Exception as e:
+                    logger.warning(f"Transport error on {connection_id}, closing: {e}")
+                    self.disconnect(connection_id)
+                    break
+        return written
+
     def get_connections(self, user_id: str) -> List[ConnectionInfo]:
         """
         Get all active connections for a user.
@@ -391,12 +662,11 @@ class WebSocketManager:
             Dictionary with current statistics
         """
         try:
-            pending_messages = len(self.message_queue)
-
             stats = {
                 **self.stats,
                 "total_active_connections": len(self.connections),
-                "pending_messages": pending_messages,
+                "pending_messages": self._pending,
+                "connections_with_backlog": len(self._ready),
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
@@ -411,6 +681,8 @@ class WebSocketManager:
         """
         Remove connections that have exceeded ping timeout.
 
+        Only connections whose heartbeat deadline has passed are examined.
+
         Returns:
             Number of connections cleaned up
         """
@@ -419,14 +691,20 @@ class WebSocketManager:
             timeout_delta = timedelta(seconds=self.config.ping_timeout)
             removed = 0
 
-            stale_conns = []
-            for conn_id, conn_info in self.connections.items():
-                if now - conn_info.last_ping > timeout_delta:
-                    stale_conns.append(conn_id)
-
-            for conn_id in stale_conns:
-                if self.disconnect(conn_id):
-                    removed += 1
+            with self._lock:
+                due = self._heartbeats.advance(_timestamp(now))
+                for conn_id in due:
+                    conn_info = self.connections.get(conn_id)
+                    if conn_info is None:
+                        continue
+                    if now - conn_info.last_ping > timeout_delta:
+                        if self.disconnect(conn_id):
+                            removed += 1
+                    else:
+                        # Deadline fell inside the current tick; check again later
+                        self._schedule_heartbeat(conn_info)
+
+                self.stats["stale_connections_removed"] += removed
 
             if removed > 0:
                 logger.info(f"Cleaned up {removed} stale connections")
@@ -437,6 +715,70 @@ class WebSocketManager:
             logger.error(f"Error cleaning up stale connections: {e}")
             return 0
 
+    def _encode(self, message: WebSocketMessage) -> OutboundFrame:
+        """
+        Validate, serialize and size-check a message once.
+
+        Args:
+            message: WebSocketMessage to encode
+
+        Returns:
+            OutboundFrame ready to be queued on any number of outboxes
+
+        Raises:
+            ValueError: If message invalid or too large
+        """
+        if not self._validate_message(message):
+            raise ValueError("Invalid message format")
+
+        data = message.model_dump_json()
+        size = len(data.encode("utf-8"))
+        if size > self.config.max_message_size:
+            raise ValueError(f"Message exceeds max size ({size} > {self.config.max_message_size})")
+        return OutboundFrame(message=message, data=data, size=size)
+
+    def _enqueue(self, connection_id: str, frame: OutboundFrame) -> bool:
+        """
+        Queue a frame on a connection's outbox, applying the slow-consumer policy.
+
+        Args:
+            connection_id: Target connection ID
+            frame: Encoded frame
+
+        Returns:
+            True if the frame was queued
+        """
+        with self._lock:
+            outbox = self.outboxes.get(connection_id)
+            if outbox is None:
+                return False
+
+            if len(outbox) >= self.config.outbox_size:
+                policy = self.config.slow_consumer_policy
+                self.stats["messages_dropped"] += 1
+                if policy == SlowConsumerPolicy.DROP_NEWEST:
+                    logger.debug(f"Outbox full for {connection_id}, dropping new frame")
+                    return False
+                if policy == SlowConsumerPolicy.DISCONNECT:
+                    logger.warning(f"Slow consumer {connection_id} disconnected (outbox full)")
+                    self.stats["slow_consumers_disconnected"] += 1
+                    self.disconnect(connection_id)
+                    return False
+                outbox.popleft()
+                self._pending -= 1
+
+            outbox.append(frame)
+            self._pending += 1
+            self._ready[connection_id] = None
+            self.stats["messages_sent"] += 1
+            return True
+
+    def _schedule_heartbeat(self, conn_info: ConnectionInfo) -> None:
+        """Place a connection's ping deadline on the timing wheel."""
+        deadline = conn_info.last_ping + timedelta(seconds=self.config.ping_timeout)
+        with self._lock:
+            self._heartbeats.schedule(conn_info.connection_id, _timestamp(deadline))
+
     def _validate_message(self, message: WebSocketMessage) -> bool:
         """
         Validate WebSocket message.
@@ -3,22 +3,34 @@ WRITE-001: Approval Workflow Engine
 Generic state-machine approval workflow engine for HR multi-agent platform.
 
 Supports sequential and parallel approval modes, RBAC integration, auto-escalation,
-and comprehensive audit logging. Workflows are stored in-memory with database
-integration points for future persistence.
+and comprehensive audit logging. Workflows are stored in-memory by default; pass a
+WorkflowInstanceRepository as ``store`` to persist every transition together with
+its audit events, with optimistic concurrency across worker processes.
+get_workflow_engine() returns the process-wide engine, backed by that store
+once the database is initialized.
+
+Secondary indexes (approver -> pending workflows, creator -> workflows,
+workflow -> events, and an escalation min-heap keyed by due time) keep the
+dashboard queries proportional to open work rather than total history.
 """
 
+import heapq
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from config.settings import get_settings
 from src.core.rbac import RoleLevel, check_permission
 
+if TYPE_CHECKING:
+    from src.repositories.workflow_repository import WorkflowInstanceRepository
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +45,12 @@ class WorkflowState(str, Enum):
     CANCELLED = "cancelled"  # Cancelled by initiator or admin
 
 
+# States after which a workflow can no longer change
+TERMINAL_STATES = frozenset(
+    {WorkflowState.APPROVED, WorkflowState.REJECTED, WorkflowState.CANCELLED}
+)
+
+
 class ApprovalMode(str, Enum):
     """Approval workflow modes."""
 
@@ -93,6 +111,18 @@ class ApprovalWorkflow(BaseModel):
 
     model_config = ConfigDict(use_enum_values=False)
 
+    # Notified when an indexed field changes so the owning engine can re-index
+    _observer: Optional[Callable[["ApprovalWorkflow"], None]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _INDEXED_FIELDS and self._observer is not None:
+            self._observer(self)
+
+
+# Fields whose changes affect WorkflowEngine's secondary indexes
+_INDEXED_FIELDS = frozenset({"state", "current_step", "updated_at"})
+
 
 class WorkflowTemplate(BaseModel):
     """Reusable workflow template."""
@@ -149,6 +179,10 @@ class WorkflowEvent:
         }
 
 
+class WorkflowConflictError(ValueError):
+    """Raised when a workflow was modified by another worker since it was loaded."""
+
+
 class WorkflowEngine:
     """
     Generic approval workflow engine for HR processes.
@@ -157,13 +191,32 @@ class WorkflowEngine:
     Supports both sequential and parallel approval modes with RBAC integration.
     """
 
-    def __init__(self) -> None:
-        """Initialize workflow engine."""
+    def __init__(self, store: Optional["WorkflowInstanceRepository"] = None) -> None:
+        """Initialize workflow engine.
+
+        Args:
+            store: Optional durable store. When set, the store is the source of
+                truth and ``workflows`` only caches open workflows loaded by ID.
+        """
+        self.store = store
         self.workflows: Dict[str, ApprovalWorkflow] = {}
         self.templates: Dict[str, WorkflowTemplate] = {}
         self.audit_events: List[WorkflowEvent] = []
         self.settings = get_settings()
 
+        # Secondary indexes, maintained on every state transition
+        self._creation_seq: Dict[str, int] = {}
+        self._by_creator: Dict[str, Dict[str, None]] = {}  # insertion-ordered set
+        self._pending_by_approver: Dict[Optional[str], Set[str]] = {}  # None = any approver
+        self._indexed_approver: Dict[str, Optional[str]] = {}
+        self._events_by_workflow: Dict[str, List[WorkflowEvent]] = {}
+        self._escalation_heap: List[Tuple[datetime, str, int]] = []
+        self._escalation_version: Dict[str, int] = {}
+
+        # Durable-store bookkeeping: row versions and events awaiting commit
+        self._versions: Dict[str, int] = {}
+        self._unsaved_events: Dict[str, List[WorkflowEvent]] = {}
+
     def register_template(self, template: WorkflowTemplate) -> str:
         """Register a workflow template.
 
@@ -240,7 +293,7 @@ class WorkflowEngine:
             approval_mode=template.approval_mode,
         )
 
-        self.workflows[workflow.workflow_id] = workflow
+        self._add_workflow(workflow)
         self._emit_event(
             WorkflowEvent(
                 event_type="workflow_created",
@@ -254,6 +307,8 @@ class WorkflowEngine:
             )
         )
 
+        self._save(workflow, created=True)
+
         logger.info(f"Created workflow: {workflow.workflow_id}")
         return workflow.workflow_id
 
@@ -283,6 +338,7 @@ class WorkflowEngine:
                 actor=workflow.created_by,
             )
         )
+        self._save(workflow)
 
         logger.info(f"Submitted workflow for approval: {workflow_id}")
         return True
@@ -309,6 +365,289 @@ class WorkflowEngine:
             ValueError: If workflow not found or validation fails
         """
         workflow = self._get_workflow(workflow_id)
+        _, message = self._apply_approval(workflow, approver_id, approver_role, comments)
+        self._save(workflow)
+
+        logger.info(f"Approved step in workflow: {workflow_id}")
+        return True, message
+
+    def reject_step(
+        self,
+        workflow_id: str,
+        approver_id: str,
+        approver_role: str,
+        comments: str = "",
+    ) -> bool:
+        """Reject workflow at current step.
+
+        Args:
+            workflow_id: Workflow instance ID
+            approver_id: User ID of approver
+            approver_role: Role of approver
+            comments: Rejection reason/comments
+
+        Returns:
+            True if rejection successful
+
+        Raises:
+            ValueError: If workflow not found or validation fails
+        """
+        workflow = self._get_workflow(workflow_id)
+        self._apply_rejection(workflow, approver_id, approver_role, comments)
+        self._save(workflow)
+
+        logger.info(f"Rejected workflow: {workflow_id}")
+        return True
+
+    def escalate_step(
+        self,
+        workflow_id: str,
+        reason: str = "",
+    ) -> bool:
+        """Escalate current step to next-level approver.
+
+        Args:
+            workflow_id: Workflow instance ID
+            reason: Reason for escalation
+
+        Returns:
+            True if escalation successful
+
+        Raises:
+            ValueError: If workflow not found or validation fails
+        """
+        workflow = self._get_workflow(workflow_id)
+        self._apply_escalation(workflow, reason)
+        self._save(workflow)
+
+        logger.info(f"Escalated workflow: {workflow_id}")
+        return True
+
+    def cancel_workflow(
+        self,
+        workflow_id: str,
+        user_id: str,
+        user_role: str = "employee",
+    ) -> bool:
+        """Cancel a workflow.
+
+        Only creator or HR admin can cancel.
+
+        Args:
+            workflow_id: Workflow instance ID
+            user_id: User ID requesting cancellation
+            user_role: Role of user
+
+        Returns:
+            True if cancellation successful
+
+        Raises:
+            ValueError: If workflow not found or user lacks permission
+        """
+        workflow = self._get_workflow(workflow_id)
+
+        # Only creator or HR admin can cancel
+        if user_id != workflow.created_by and user_role != "hr_admin":
+            raise ValueError(f"User {user_id} lacks permission to cancel workflow")
+
+        if workflow.state == WorkflowState.CANCELLED:
+            raise ValueError("Workflow already cancelled")
+
+        workflow.state = WorkflowState.CANCELLED
+        workflow.updated_at = datetime.utcnow()
+
+        self._emit_event(
+            WorkflowEvent(
+                event_type="workflow_cancelled",
+                workflow_id=workflow_id,
+                actor=user_id,
+            )
+        )
+        self._save(workflow)
+
+        logger.info(f"Cancelled workflow: {workflow_id}")
+        return True
+
+    def bulk_approve(
+        self,
+        workflow_ids: Iterable[str],
+        approver_id: str,
+        approver_role: str,
+        comments: str = "",
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Approve the current step of many workflows at once.
+
+        Workflows are loaded in one query and all transitions are committed in
+        one transaction. Failures are reported per workflow rather than raised.
+
+        Args:
+            workflow_ids: Workflow instance IDs
+            approver_id: User ID of approver
+            approver_role: Role of approver
+            comments: Comments from approver
+
+        Returns:
+            Mapping of workflow ID to (success, message)
+        """
+        return self._bulk_transition(
+            workflow_ids,
+            lambda wf: self._apply_approval(wf, approver_id, approver_role, comments),
+        )
+
+    def bulk_reject(
+        self,
+        workflow_ids: Iterable[str],
+        approver_id: str,
+        approver_role: str,
+        comments: str = "",
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Reject many workflows at their current step at once.
+
+        Args:
+            workflow_ids: Workflow instance IDs
+            approver_id: User ID of approver
+            approver_role: Role of approver
+            comments: Rejection reason/comments
+
+        Returns:
+            Mapping of workflow ID to (success, message)
+        """
+
+        def _reject(workflow: ApprovalWorkflow) -> Tuple[bool, str]:
+            self._apply_rejection(workflow, approver_id, approver_role, comments)
+            return True, "Workflow rejected"
+
+        return self._bulk_transition(workflow_ids, _reject)
+
+    def get_pending_approvals(self, approver_id: str) -> List[ApprovalWorkflow]:
+        """Get all pending workflows awaiting approval from user.
+
+        Args:
+            approver_id: User ID of approver
+
+        Returns:
+            List of pending workflows
+        """
+        if self.store is not None:
+            snapshots = self.store.load_pending_for_approver(
+                approver_id, WorkflowState.PENDING_APPROVAL.value
+            )
+            return [self._hydrate(payload, version) for payload, version in snapshots]
+
+        candidate_ids = self._pending_by_approver.get(approver_id, set()) | (
+            self._pending_by_approver.get(None, set())
+        )
+        ordered = sorted(candidate_ids, key=self._creation_seq.__getitem__)
+        return [self.workflows[wid] for wid in ordered]
+
+    def get_workflow(self, workflow_id: str) -> ApprovalWorkflow:
+        """Get workflow by ID.
+
+        Args:
+            workflow_id: Workflow instance ID
+
+        Returns:
+            Workflow instance
+
+        Raises:
+            ValueError: If workflow not found
+        """
+        return self._get_workflow(workflow_id)
+
+    def get_workflow_history(self, workflow_id: str) -> List[WorkflowEvent]:
+        """Get all events for a workflow (audit trail).
+
+        Args:
+            workflow_id: Workflow instance ID
+
+        Returns:
+            List of events for workflow
+        """
+        if self.store is not None:
+            return [WorkflowEvent(**row) for row in self.store.load_events(workflow_id)]
+
+        return list(self._events_by_workflow.get(workflow_id, []))
+
+    def get_user_workflows(
+        self, user_id: str, state_filter: Optional[WorkflowState] = None
+    ) -> List[ApprovalWorkflow]:
+        """Get all workflows created by user.
+
+        Args:
+            user_id: User ID
+            state_filter: Optional state filter
+
+        Returns:
+            List of workflows
+        """
+        if self.store is not None:
+            snapshots = self.store.load_by_creator(
+                user_id, state_filter.value if state_filter else None
+            )
+            return [self._hydrate(payload, version) for payload, version in snapshots]
+
+        workflows = [self.workflows[wid] for wid in self._by_creator.get(user_id, {})]
+
+        if state_filter:
+            workflows = [w for w in workflows if w.state == state_filter]
+
+        return workflows
+
+    def check_escalations(self) -> List[str]:
+        """Check for pending workflows that need auto-escalation.
+
+        Returns workflows that exceeded escalation timeout.
+
+        Returns:
+            List of workflow IDs that were escalated
+        """
+        escalated = []
+        now = datetime.utcnow()
+
+        if self.store is not None:
+            due = [self._hydrate(p, v) for p, v in self.store.load_due_escalations(now)]
+            changed = []
+            for workflow in due:
+                try:
+                    self._apply_escalation(workflow, "Auto-escalation timeout")
+                    changed.append(workflow)
+                except ValueError as e:
+                    logger.warning(f"Failed to auto-escalate {workflow.workflow_id}: {e}")
+            conflicts = set(self._save_many(changed))
+            return [w.workflow_id for w in changed if w.workflow_id not in conflicts]
+
+        # Pop only entries whose deadline has passed; stale entries are skipped
+        while self._escalation_heap and self._escalation_heap[0][0] < now:
+            _, workflow_id, version = heapq.heappop(self._escalation_heap)
+            if self._escalation_version.get(workflow_id) != version:
+                continue
+
+            try:
+                self.escalate_step(workflow_id, "Auto-escalation timeout")
+                escalated.append(workflow_id)
+            except ValueError as e:
+                logger.warning(f"Failed to auto-escalate {workflow_id}: {e}")
+
+        return escalated
+
+    def _apply_approval(
+        self, workflow: ApprovalWorkflow, approver_id: str, approver_role: str, comments: str
+    ) -> Tuple[bool, str]:
+        """Validate and apply an approval to the workflow's current step.
+
+        Args:
+            workflow: Workflow instance
+            approver_id: User ID of approver
+            approver_role: Role of approver
+            comments: Comments from approver
+
+        Returns:
+            Tuple of (success, message)
+
+        Raises:
+            ValueError: If validation fails
+        """
+        workflow_id = workflow.workflow_id
 
         if workflow.state != WorkflowState.PENDING_APPROVAL:
             raise ValueError(f"Cannot approve workflow in {workflow.state} state")
@@ -368,31 +707,23 @@ class WorkflowEngine:
             )
 
         workflow.updated_at = datetime.utcnow()
-        logger.info(f"Approved step in workflow: {workflow_id}")
         return True, message
 
-    def reject_step(
-        self,
-        workflow_id: str,
-        approver_id: str,
-        approver_role: str,
-        comments: str = "",
-    ) -> bool:
-        """Reject workflow at current step.
+    def _apply_rejection(
+        self, workflow: ApprovalWorkflow, approver_id: str, approver_role: str, comments: str
+    ) -> None:
+        """Validate and apply a rejection at the workflow's current step.
 
         Args:
-            workflow_id: Workflow instance ID
+            workflow: Workflow instance
             approver_id: User ID of approver
             approver_role: Role of approver
             comments: Rejection reason/comments
 
-        Returns:
-            True if rejection successful
-
         Raises:
-            ValueError: If workflow not found or validation fails
+            ValueError: If validation fails
         """
-        workflow = self._get_workflow(workflow_id)
+        workflow_id = workflow.workflow_id
 
         if workflow.state != WorkflowState.PENDING_APPROVAL:
             raise ValueError(f"Cannot reject workflow in {workflow.state} state")
@@ -435,27 +766,17 @@ class WorkflowEngine:
             )
         )
 
-        logger.info(f"Rejected workflow: {workflow_id}")
-        return True
-
-    def escalate_step(
-        self,
-        workflow_id: str,
-        reason: str = "",
-    ) -> bool:
-        """Escalate current step to next-level approver.
+    def _apply_escalation(self, workflow: ApprovalWorkflow, reason: str) -> None:
+        """Validate and escalate the workflow's current step to the next-level role.
 
         Args:
-            workflow_id: Workflow instance ID
+            workflow: Workflow instance
             reason: Reason for escalation
 
-        Returns:
-            True if escalation successful
-
         Raises:
-            ValueError: If workflow not found or validation fails
+            ValueError: If validation fails
         """
-        workflow = self._get_workflow(workflow_id)
+        workflow_id = workflow.workflow_id
 
         if workflow.state != WorkflowState.PENDING_APPROVAL:
             raise ValueError(f"Cannot escalate workflow in {workflow.state} state")
@@ -495,174 +816,341 @@ class WorkflowEngine:
         # Return to PENDING so escalated approver can act
         workflow.state = WorkflowState.PENDING_APPROVAL
 
-        logger.info(f"Escalated workflow: {workflow_id}")
-        return True
-
-    def cancel_workflow(
-        self,
-        workflow_id: str,
-        user_id: str,
-        user_role: str = "employee",
-    ) -> bool:
-        """Cancel a workflow.
-
-        Only creator or HR admin can cancel.
+    def _get_workflow(self, workflow_id: str) -> ApprovalWorkflow:
+        """Internal helper to get workflow and raise if not found.
 
         Args:
             workflow_id: Workflow instance ID
-            user_id: User ID requesting cancellation
-            user_role: Role of user
 
         Returns:
-            True if cancellation successful
+            Workflow instance
 
         Raises:
-            ValueError: If workflow not found or user lacks permission
+            ValueError: If workflow not found
         """
-        workflow = self._get_workflow(workflow_id)
-
-        # Only creator or HR admin can cancel
-        if user_id != workflow.created_by and user_role != "hr_admin":
-            raise ValueError(f"User {user_id} lacks permission to cancel workflow")
-
-        if workflow.state == WorkflowState.CANCELLED:
-            raise ValueError("Workflow already cancelled")
+        if self.store is not None:
+            snapshot = self.store.load_workflow(workflow_id)
+            if snapshot is None:
+                self._evict(workflow_id)
+                raise ValueError(f"Workflow not found: {workflow_id}")
+            return self._hydrate(*snapshot)
 
-        workflow.state = WorkflowState.CANCELLED
-        workflow.updated_at = datetime.utcnow()
+        workflow = self.workflows.get(workflow_id)
+        if not workflow:
+            raise ValueError(f"Workflow not found: {workflow_id}")
+        return workflow
 
-        self._emit_event(
-            WorkflowEvent(
-                event_type="workflow_cancelled",
-                workflow_id=workflow_id,
-                actor=user_id,
-            )
-        )
+    def _emit_event(self, event: WorkflowEvent) -> None:
+        """Emit and log an audit event.
 
-        logger.info(f"Cancelled workflow: {workflow_id}")
-        return True
+        Args:
+            event: WorkflowEvent to emit
+        """
+        if self.store is not None:
+            # Written with the transition by _save; history is read from the store
+            self._unsaved_events.setdefault(event.workflow_id, []).append(event)
+        else:
+            self.audit_events.append(event)
+            self._events_by_workflow.setdefault(event.workflow_id, []).append(event)
+        logger.info(f"Workflow event: {event.to_dict()}")
 
-    def get_pending_approvals(self, approver_id: str) -> List[ApprovalWorkflow]:
-        """Get all pending workflows awaiting approval from user.
+    def _bulk_transition(
+        self,
+        workflow_ids: Iterable[str],
+        apply: Callable[[ApprovalWorkflow], Tuple[bool, str]],
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Apply a transition to many workflows and commit them together.
 
         Args:
-            approver_id: User ID of approver
+            workflow_ids: Workflow instance IDs
+            apply: Transition to apply to each loaded workflow
 
         Returns:
-            List of pending workflows
+            Mapping of workflow ID to (success, message)
         """
-        pending = []
-        for workflow in self.workflows.values():
-            if workflow.state != WorkflowState.PENDING_APPROVAL:
+        ids = list(dict.fromkeys(workflow_ids))
+        if self.store is not None:
+            snapshots = self.store.load_workflows(ids)
+            loaded = {wid: self._hydrate(*snap) for wid, snap in snapshots.items()}
+        else:
+            loaded = {wid: self.workflows[wid] for wid in ids if wid in self.workflows}
+
+        results: Dict[str, Tuple[bool, str]] = {}
+        changed: List[ApprovalWorkflow] = []
+        for workflow_id in ids:
+            workflow = loaded.get(workflow_id)
+            if workflow is None:
+                results[workflow_id] = (False, f"Workflow not found: {workflow_id}")
                 continue
+            try:
+                results[workflow_id] = apply(workflow)
+                changed.append(workflow)
+            except ValueError as e:
+                results[workflow_id] = (False, str(e))
 
-            if workflow.current_step >= len(workflow.steps):
-                continue
+        for workflow_id in self._save_many(changed):
+            results[workflow_id] = (False, "Workflow was modified concurrently; reload and retry")
 
-            current_step = workflow.steps[workflow.current_step]
+        logger.info(f"Bulk transition: {len(changed)} applied of {len(ids)} requested")
+        return results
 
-            # Check if this user can approve (role match or specific ID match)
-            if current_step.approver_id == approver_id or current_step.approver_id is None:
-                pending.append(workflow)
+    def _save(self, workflow: ApprovalWorkflow, created: bool = False) -> None:
+        """Persist a workflow transition and its pending events to the store.
 
-        return pending
+        Args:
+            workflow: Workflow that was just modified
+            created: True if the workflow is new
 
-    def get_workflow(self, workflow_id: str) -> ApprovalWorkflow:
-        """Get workflow by ID.
+        Raises:
+            WorkflowConflictError: If another worker changed the workflow first
+        """
+        if self.store is None:
+            return
+
+        workflow_id = workflow.workflow_id
+        if created:
+            events = self._unsaved_events.pop(workflow_id, [])
+            try:
+                self._versions[workflow_id] = self.store.insert_workflow(
+                    self._to_row(workflow), [self._event_row(e) for e in events]
+                )
+            except Exception:
+                self._evict(workflow_id)
+                raise
+            return
+
+        if self._save_many([workflow]):
+            raise WorkflowConflictError(
+                f"Workflow {workflow_id} was modified concurrently; reload and retry"
+            )
+
+    def _save_many(self, workflows: List[ApprovalWorkflow]) -> List[str]:
+        """Persist several transitions in a single store transaction.
 
         Args:
-            workflow_id: Workflow instance ID
+            workflows: Workflows modified since they were loaded
 
         Returns:
-            Workflow instance
+            IDs of workflows whose update lost an optimistic-concurrency race
+        """
+        if self.store is None or not workflows:
+            return []
+
+        transitions = []
+        for workflow in workflows:
+            workflow_id = workflow.workflow_id
+            events = self._unsaved_events.pop(workflow_id, [])
+            transitions.append(
+                (
+                    self._to_row(workflow),
+                    self._versions.get(workflow_id, 0),
+                    [self._event_row(e) for e in events],
+                )
+            )
 
-        Raises:
-            ValueError: If workflow not found
+        try:
+            saved, conflicts = self.store.save_transitions(transitions)
+        except Exception:
+            for workflow in workflows:
+                self._evict(workflow.workflow_id)
+            raise
+
+        for workflow_id, version in saved.items():
+            self._versions[workflow_id] = version
+            if self.workflows[workflow_id].state in TERMINAL_STATES:
+                # Closed workflows are read back from the store on demand
+                self._evict(workflow_id)
+        for workflow_id in conflicts:
+            logger.warning(f"Workflow {workflow_id} changed concurrently; discarding local edit")
+            self._evict(workflow_id)
+        return conflicts
+
+    def _hydrate(self, payload: Dict[str, Any], version: int) -> ApprovalWorkflow:
+        """Return the cached workflow for a stored snapshot, refreshing if stale.
+
+        Args:
+            payload: Serialized ApprovalWorkflow
+            version: Stored row version
+
+        Returns:
+            Workflow instance tracked by this engine
         """
-        return self._get_workflow(workflow_id)
+        workflow_id = payload["workflow_id"]
+        cached = self.workflows.get(workflow_id)
+        if cached is not None and self._versions.get(workflow_id) == version:
+            return cached
+
+        if cached is not None:
+            cached._observer = None
+        workflow = ApprovalWorkflow.model_validate(payload)
+        self._add_workflow(workflow)
+        self._versions[workflow_id] = version
+        return workflow
 
-    def get_workflow_history(self, workflow_id: str) -> List[WorkflowEvent]:
-        """Get all events for a workflow (audit trail).
+    def _evict(self, workflow_id: str) -> None:
+        """Drop a workflow from the local cache and indexes.
 
         Args:
             workflow_id: Workflow instance ID
+        """
+        workflow = self.workflows.pop(workflow_id, None)
+        if workflow is not None:
+            workflow._observer = None
+            creator_bucket = self._by_creator.get(workflow.created_by)
+            if creator_bucket is not None:
+                creator_bucket.pop(workflow_id, None)
+                if not creator_bucket:
+                    del self._by_creator[workflow.created_by]
+
+        previous = self._indexed_approver.pop(workflow_id, None)
+        bucket = self._pending_by_approver.get(previous)
+        if bucket is not None:
+            bucket.discard(workflow_id)
+            if not bucket:
+                del self._pending_by_approver[previous]
+
+        self._creation_seq.pop(workflow_id, None)
+        self._escalation_version.pop(workflow_id, None)
+        self._versions.pop(workflow_id, None)
+        self._unsaved_events.pop(workflow_id, None)
+
+    @staticmethod
+    def _to_row(workflow: ApprovalWorkflow) -> Dict[str, Any]:
+        """Build the workflow_instances row for a workflow.
+
+        Args:
+            workflow: Workflow instance
 
         Returns:
-            List of events for workflow
+            Column values including denormalized query columns
         """
-        return [e for e in self.audit_events if e.workflow_id == workflow_id]
+        approver_id = None
+        escalation_due_at = None
+        if workflow.state == WorkflowState.PENDING_APPROVAL and workflow.current_step < len(
+            workflow.steps
+        ):
+            step = workflow.steps[workflow.current_step]
+            approver_id = step.approver_id
+            if step.next_level_role:
+                escalation_due_at = workflow.updated_at + timedelta(hours=step.escalate_after_hours)
 
-    def get_user_workflows(
-        self, user_id: str, state_filter: Optional[WorkflowState] = None
-    ) -> List[ApprovalWorkflow]:
-        """Get all workflows created by user.
+        return {
+            "workflow_id": workflow.workflow_id,
+            "entity_type": workflow.entity_type,
+            "entity_id": workflow.entity_id,
+            "created_by": workflow.created_by,
+            "state": workflow.state.value,
+            "current_approver_id": approver_id,
+            "escalation_due_at": escalation_due_at,
+            "payload": workflow.model_dump(mode="json"),
+            "created_at": workflow.created_at,
+            "updated_at": workflow.updated_at,
+        }
+
+    @staticmethod
+    def _event_row(event: WorkflowEvent) -> Dict[str, Any]:
+        """Build the workflow_events row for an event.
 
         Args:
-            user_id: User ID
-            state_filter: Optional state filter
+            event: WorkflowEvent to persist
 
         Returns:
-            List of workflows
+            Column values
         """
-        workflows = [w for w in self.workflows.values() if w.created_by == user_id]
-
-        if state_filter:
-            workflows = [w for w in workflows if w.state == state_filter]
+        return {
+            "workflow_id": event.workflow_id,
+            "event_type": event.event_type,
+            "actor": event.actor,
+            "details": event.details,
+            "created_at": event.timestamp,
+        }
 
-        return workflows
+    def _add_workflow(self, workflow: ApprovalWorkflow) -> None:
+        """Register a workflow with the engine and its indexes.
 
-    def check_escalations(self) -> List[str]:
-        """Check for pending workflows that need auto-escalation.
+        Args:
+            workflow: Workflow instance to track
+        """
+        workflow_id = workflow.workflow_id
+        self.workflows[workflow_id] = workflow
+        self._creation_seq.setdefault(workflow_id, len(self._creation_seq))
+        self._by_creator.setdefault(workflow.created_by, {})[workflow_id] = None
+        workflow._observer = self._reindex
+        self._reindex(workflow)
 
-        Returns workflows that exceeded escalation timeout.
+    def _reindex(self, workflow: ApprovalWorkflow) -> None:
+        """Refresh the approver index and escalation deadline for a workflow.
 
-        Returns:
-            List of workflow IDs that were escalated
+        Args:
+            workflow: Workflow whose state, step or timestamp changed
         """
-        escalated = []
-        now = datetime.utcnow()
+        workflow_id = workflow.workflow_id
 
-        for workflow in self.workflows.values():
-            if workflow.state != WorkflowState.PENDING_APPROVAL:
-                continue
+        if workflow_id in self._indexed_approver:
+            previous = self._indexed_approver.pop(workflow_id)
+            bucket = self._pending_by_approver.get(previous)
+            if bucket is not None:
+                bucket.discard(workflow_id)
+                if not bucket:
+                    del self._pending_by_approver[previous]
 
-            if workflow.current_step >= len(workflow.steps):
-                continue
+        # Bumping the version invalidates any heap entry pushed earlier
+        version = self._escalation_version.get(workflow_id, 0) + 1
+        self._escalation_version[workflow_id] = version
 
-            current_step = workflow.steps[workflow.current_step]
-            hours_pending = (now - workflow.updated_at).total_seconds() / 3600
+        if workflow.state != WorkflowState.PENDING_APPROVAL:
+            return
+        if workflow.current_step >= len(workflow.steps):
+            return
 
-            if hours_pending > current_step.escalate_after_hours:
-                try:
-                    self.escalate_step(workflow.workflow_id, "Auto-escalation timeout")
-                    escalated.append(workflow.workflow_id)
-                except ValueError as e:
-                    logger.warning(f"Failed to auto-escalate {workflow.workflow_id}: {e}")
+        step = workflow.steps[workflow.current_step]
+        self._pending_by_approver.setdefault(step.approver_id, set()).add(workflow_id)
+        self._indexed_approver[workflow_id] = step.approver_id
 
-        return escalated
+        if step.next_level_role:
+            due = workflow.updated_at + timedelta(hours=step.escalate_after_hours)
+            heapq.heappush(self._escalation_heap, (due, workflow_id, version))
+            self._compact_escalation_heap()
 
-    def _get_workflow(self, workflow_id: str) -> ApprovalWorkflow:
-        """Internal helper to get workflow and raise if not found.
+    def _compact_escalation_heap(self) -> None:
+        """Drop invalidated heap entries once they dominate the heap."""
+        if len(self._escalation_heap) <= 2 * len(self._indexed_approver) + 64:
+            return
+        self._escalation_heap = [
+            entry
+            for entry in self._escalation_heap
+            if self._escalation_version.get(entry[1]) == entry[2]
+        ]
+        heapq.heapify(self._escalation_heap)
 
-        Args:
-            workflow_id: Workflow instance ID
 
-        Returns:
-            Workflow instance
+# Process-wide engine shared by agents and MCP tools
+_workflow_engine: Optional[WorkflowEngine] = None
+_workflow_engine_lock = threading.Lock()
 
-        Raises:
-            ValueError: If workflow not found
-        """
-        workflow = self.workflows.get(workflow_id)
-        if not workflow:
-            raise ValueError(f"Workflow not found: {workflow_id}")
-        return workflow
 
-    def _emit_event(self, event: WorkflowEvent) -> None:
-        """Emit and log an audit event.
+def get_workflow_engine() -> WorkflowEngine:
+    """
+    Get the process-wide workflow engine.
 
-        Args:
-            event: WorkflowEvent to emit
-        """
-        self.audit_events.append(event)
-        logger.info(f"Workflow event: {event.to_dict()}")
+    Once the database is initialized the engine persists to
+    workflow_instances, so workers share workflow state. Before that an
+    in-memory engine is returned; it is replaced by a durable one on the
+    first call after init_db().
+
+    Returns:
+        WorkflowEngine instance
+    """
+    global _workflow_engine
+    from src.core import database
+
+    with _workflow_engine_lock:
+        durable = database.SessionLocal is not None
+        if _workflow_engine is None or (durable and _workflow_engine.store is None):
+            store = None
+            if durable:
+                from src.repositories.workflow_repository import WorkflowInstanceRepository
+
+                store = WorkflowInstanceRepository()
+            _workflow_engine = WorkflowEngine(store=store)
+        return _workflow_engine
@@ -1290,95 +1290,106 @@ def get_notifications(employee_id: str, status: str = "", limit: int = 20) -> st
 # ============================================================
 
 
+def _approver_role(approver_id: str) -> str:
+    """Look up an approver's role level in the employees table ("" if unknown)."""
+
+    def _query(session):
+        from src.core.database import Employee
+
+        emp = None
+        if approver_id.isdigit():
+            emp = session.query(Employee).filter_by(id=int(approver_id)).first()
+        if emp is None:
+            emp = session.query(Employee).filter_by(hris_id=approver_id).first()
+        return {"role_level": emp.role_level if emp else ""}
+
+    return _with_session(_query).get("role_level", "")
+
+
+def _decide_workflow(
+    workflow_id: str, approver_id: str, approver_role: str, comments: str, approve: bool
+) -> str:
+    """Apply an approval or rejection through the shared workflow engine.
+
+    IDs that are not workflow instances are treated as leave request IDs.
+    Engine validation errors (wrong state, missing permission) are returned
+    as errors rather than falling back.
+    """
+    from src.core.workflow_engine import get_workflow_engine
+
+    engine = get_workflow_engine()
+    try:
+        engine.get_workflow(workflow_id)
+    except ValueError:
+        if approve:
+            return approve_leave_request(workflow_id, approver_id)
+        return reject_leave_request(workflow_id, comments)
+
+    approver_role = approver_role or _approver_role(approver_id)
+    try:
+        if approve:
+            _, message = engine.approve_step(
+                workflow_id=workflow_id,
+                approver_id=approver_id,
+                approver_role=approver_role,
+                comments=comments,
+            )
+        else:
+            engine.reject_step(
+                workflow_id=workflow_id,
+                approver_id=approver_id,
+                approver_role=approver_role,
+                comments=comments,
+            )
+            message = f"Workflow {workflow_id} rejected."
+    except ValueError as e:
+        return json.dumps(
+            {"workflow_id": workflow_id, "status": "error", "error": str(e)}, indent=2
+        )
+
+    workflow = engine.get_workflow(workflow_id)
+    return json.dumps(
+        {
+            "workflow_id": workflow_id,
+            "status": workflow.state.value,
+            "current_step": workflow.current_step,
+            "approver_id": approver_id,
+            "comments": comments,
+            "message": message,
+        },
+        indent=2,
+        default=str,
+    )
+
+
 @mcp.tool()
-def approve_workflow(workflow_id: str, approver_id: str, comments: str = "") -> str:
+def approve_workflow(
+    workflow_id: str, approver_id: str, comments: str = "", approver_role: str = ""
+) -> str:
     """Approve a workflow/approval request (leave, compensation change, etc.).
 
     Args:
-        workflow_id: Workflow instance ID
+        workflow_id: Workflow instance ID (or leave request ID)
         approver_id: ID of the approver
         comments: Optional approval comments
+        approver_role: Approver's role (looked up from the employee record if empty)
     """
-    try:
-        from src.core.workflow_engine import WorkflowEngine
-
-        engine = WorkflowEngine()
-        result = engine.approve_step(
-            instance_id=workflow_id,
-            approver_id=approver_id,
-            comments=comments,
-        )
-        return json.dumps(
-            {
-                "workflow_id": workflow_id,
-                "status": "approved",
-                "approver_id": approver_id,
-                "comments": comments,
-                "result": str(result),
-                "message": f"Workflow {workflow_id} approved.",
-            },
-            indent=2,
-            default=str,
-        )
-    except Exception as e:
-        # Fallback: try treating it as a leave request approval
-        try:
-            result = json.loads(approve_leave_request(workflow_id, approver_id))
-            return json.dumps(result, indent=2, default=str)
-        except Exception:
-            return json.dumps(
-                {
-                    "workflow_id": workflow_id,
-                    "status": "error",
-                    "error": str(e),
-                },
-                indent=2,
-            )
+    return _decide_workflow(workflow_id, approver_id, approver_role, comments, approve=True)
 
 
 @mcp.tool()
-def reject_workflow(workflow_id: str, approver_id: str, reason: str = "") -> str:
+def reject_workflow(
+    workflow_id: str, approver_id: str, reason: str = "", approver_role: str = ""
+) -> str:
     """Reject a workflow/approval request.
 
     Args:
-        workflow_id: Workflow instance ID
+        workflow_id: Workflow instance ID (or leave request ID)
         approver_id: ID of the approver
         reason: Reason for rejection
+        approver_role: Approver's role (looked up from the employee record if empty)
     """
-    try:
-        from src.core.workflow_engine import WorkflowEngine
-
-        engine = WorkflowEngine()
-        result = engine.reject_step(
-            instance_id=workflow_id,
-            approver_id=approver_id,
-            comments=reason,
-        )
-        return json.dumps(
-            {
-                "workflow_id": workflow_id,
-                "status": "rejected",
-                "approver_id": approver_id,
-                "reason": reason,
-                "result": str(result),
-                "message": f"Workflow {workflow_id} rejected.",
-            },
-            indent=2,
-            default=str,
-        )
-    except Exception as e:
-        try:
-            result = json.loads(reject_leave_request(workflow_id, reason))
-            return json.dumps(result, indent=2, default=str)
-        except Exception:
-            return json.dumps(
-                {
-                    "workflow_id": workflow_id,
-                    "status": "error",
-                    "error": str(e),
-                },
-                indent=2,
-            )
+    return _decide_workflow(workflow_id, approver_id, approver_role, reason, approve=False)
 
 
 # ============================================================
@@ -3,14 +3,32 @@ CORE-004: PII Stripping Middleware
 Detects and redacts personally identifiable information from HR data.
 """
 
+import bisect
 import json
 import logging
 import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.core.text_scanner import (
+    Gazetteer,
+    ScanRule,
+    ScanSpan,
+    get_text_scanner,
+    is_word_char,
+    replace_spans,
+    spans_interact,
+)
+
 logger = logging.getLogger(__name__)
 
+# Scanner category for the redaction patterns
+SCAN_CATEGORY = "pii_stripper"
+
+# Shape of the placeholders strip() produces, e.g. [SSN_REDACTED], [PERSON_2]
+PLACEHOLDER_PATTERN = re.compile(r"(\[[A-Z0-9_]+\])")
+PLACEHOLDER_LIST_PATTERN = re.compile(r"\[[A-Z0-9_]+\](?:\n\[[A-Z0-9_]+\])*")
+
 
 @dataclass
 class PIIResult:
@@ -42,6 +60,9 @@ class PIIStripper:
     EMPLOYEE_ID_PATTERN = re.compile(r"\bEMP-\d+\b")
     SALARY_PATTERN = re.compile(r"\$[\d,]+(?:\.\d{2})?")
 
+    # Redaction order
+    PII_TYPES = ("SSN", "EMAIL", "PHONE", "EMPLOYEE_ID", "SALARY")
+
     def __init__(self, enable_name_detection: bool = True):
         """
         Initialize PII Stripper.
@@ -50,6 +71,8 @@ class PIIStripper:
             enable_name_detection: Whether to detect names from context
         """
         self.enable_name_detection = enable_name_detection
+        # (roster, gazetteer, roster indexes longest name first), rebuilt on roster change
+        self._roster: Optional[Tuple[Tuple[str, ...], Gazetteer, List[int]]] = None
 
     def strip(self, text: str, employee_context: Optional[List[str]] = None) -> PIIResult:
         """
@@ -65,81 +88,36 @@ class PIIStripper:
         if not text:
             return PIIResult(sanitized_text="", mapping={}, pii_count=0)
 
-        sanitized_text = text
         mapping = {}
         pii_types_found = set()
 
-        # Process SSN
-        ssn_matches = list(self.SSN_PATTERN.finditer(sanitized_text))
-        for match in reversed(ssn_matches):  # Reverse to maintain indices
-            original = match.group()
-            redacted = "[SSN_REDACTED]"
-            mapping[original] = redacted
-            pii_types_found.add("SSN")
-            sanitized_text = (
-                sanitized_text[: match.start()] + redacted + sanitized_text[match.end() :]
-            )
-
-        # Process Email
-        email_counter = 1
-        email_matches = list(self.EMAIL_PATTERN.finditer(sanitized_text))
-        for match in reversed(email_matches):
-            original = match.group()
-            redacted = f"[EMAIL_REDACTED_{email_counter}]"
-            mapping[original] = redacted
-            pii_types_found.add("EMAIL")
-            sanitized_text = (
-                sanitized_text[: match.start()] + redacted + sanitized_text[match.end() :]
-            )
-            email_counter += 1
-
-        # Process Phone
-        phone_matches = list(self.PHONE_PATTERN.finditer(sanitized_text))
-        for match in reversed(phone_matches):
-            original = match.group()
-            redacted = "[PHONE_REDACTED]"
-            mapping[original] = redacted
-            pii_types_found.add("PHONE")
-            sanitized_text = (
-                sanitized_text[: match.start()] + redacted + sanitized_text[match.end() :]
-            )
-
-        # Process Employee ID
-        emp_id_matches = list(self.EMPLOYEE_ID_PATTERN.finditer(sanitized_text))
-        for match in reversed(emp_id_matches):
-            original = match.group()
-            redacted = "[EMPLOYEE_ID_REDACTED]"
-            mapping[original] = redacted
-            pii_types_found.add("EMPLOYEE_ID")
-            sanitized_text = (
-                sanitized_text[: match.start()] + redacted + sanitized_text[match.end() :]
-            )
-
-        # Process Salary
-        salary_matches = list(self.SALARY_PATTERN.finditer(sanitized_text))
-        for match in reversed(salary_matches):
-            original = match.group()
-            redacted = "[SALARY_REDACTED]"
-            mapping[original] = redacted
-            pii_types_found.add("SALARY")
-            sanitized_text = (
-                sanitized_text[: match.start()] + redacted + sanitized_text[match.end() :]
-            )
+        # One scan for all patterns. Placeholders and the mapping come out as
+        # if each type were redacted in turn, which is how it is done when
+        # matches of different types overlap or touch.
+        spans = get_text_scanner().scan(text, [SCAN_CATEGORY])
+        if spans_interact(spans):
+            sanitized_text = text
+            for pii_type, pattern in zip(self.PII_TYPES, _patterns()):
+                typed = [
+                    ScanSpan(SCAN_CATEGORY, pii_type, m.start(), m.end(), m.group())
+                    for m in pattern.finditer(sanitized_text)
+                ]
+                placeholders = self._redact(typed, mapping, pii_types_found)
+                sanitized_text = replace_spans(
+                    sanitized_text, typed, lambda span: placeholders[span.start]
+                )
+        else:
+            placeholders = {}
+            for pii_type in self.PII_TYPES:
+                typed = [span for span in spans if span.rule == pii_type]
+                placeholders.update(self._redact(typed, mapping, pii_types_found))
+            sanitized_text = replace_spans(text, spans, lambda span: placeholders[span.start])
 
         # Process Names from context
         if self.enable_name_detection and employee_context:
-            person_counter = 1
-            for name in sorted(employee_context, key=len, reverse=True):
-                name_pattern = re.compile(r"\b" + re.escape(name) + r"\b")
-                matches = list(name_pattern.finditer(sanitized_text))
-                for match in reversed(matches):
-                    redacted = f"[PERSON_{person_counter}]"
-                    mapping[name] = redacted
-                    pii_types_found.add("NAME")
-                    sanitized_text = (
-                        sanitized_text[: match.start()] + redacted + sanitized_text[match.end() :]
-                    )
-                person_counter += 1
+            sanitized_text = self._redact_names(
+                sanitized_text, employee_context, mapping, pii_types_found
+            )
 
         return PIIResult(
             sanitized_text=sanitized_text,
@@ -159,15 +137,20 @@ class PIIStripper:
         Returns:
             Text with original values restored
         """
-        result = text
-
         # Reverse mapping to go from redacted back to original
         reverse_mapping = {v: k for k, v in mapping.items()}
-
-        for redacted, original in reverse_mapping.items():
-            result = result.replace(redacted, original)
-
-        return result
+        if not reverse_mapping:
+            return text
+
+        # One pass: split out placeholder-shaped tokens and swap in originals
+        if PLACEHOLDER_LIST_PATTERN.fullmatch("\n".join(reverse_mapping)):
+            tokens = PLACEHOLDER_PATTERN
+        else:
+            alternation = "|".join(map(re.escape, sorted(reverse_mapping, key=len, reverse=True)))
+            tokens = re.compile(f"({alternation})")
+        parts = tokens.split(text)
+        parts[1::2] = [reverse_mapping.get(token, token) for token in parts[1::2]]
+        return "".join(parts)
 
     def is_pii_safe(self, text: str) -> bool:
         """
@@ -179,18 +162,145 @@ class PIIStripper:
         Returns:
             True if no PII found, False otherwise
         """
-        if self.SSN_PATTERN.search(text):
-            return False
-        if self.EMAIL_PATTERN.search(text):
-            return False
-        if self.PHONE_PATTERN.search(text):
-            return False
-        if self.EMPLOYEE_ID_PATTERN.search(text):
-            return False
-        if self.SALARY_PATTERN.search(text):
-            return False
-
-        return True
+        return not get_text_scanner().scan(text, [SCAN_CATEGORY])
+
+    def _name_gazetteer(self, names: List[str]) -> Tuple[Gazetteer, List[int]]:
+        """
+        Get the gazetteer for a roster, building it only when the roster changes.
+
+        Returns:
+            Gazetteer over the names ordered longest first, and the roster
+            index of each of its terms
+        """
+        roster = tuple(names)
+        cached = self._roster
+        if cached is None or cached[0] != roster:
+            order = sorted(range(len(roster)), key=lambda index: len(roster[index]), reverse=True)
+            cached = (roster, Gazetteer(roster[index] for index in order), order)
+            self._roster = cached
+            logger.debug(f"Built name gazetteer for {len(roster)} employees")
+        return cached[1], cached[2]
+
+    def _redact_names(
+        self, text: str, names: List[str], mapping: Dict[str, str], pii_types_found: set
+    ) -> str:
+        """
+        Redact whole-word occurrences of roster names in one pass.
+
+        Occurrences are claimed longest name first, each name's left to
+        right, as if every name were replaced in turn: an occurrence inside
+        a longer name's match is skipped, and word boundaries next to an
+        earlier replacement see its brackets.
+
+        Args:
+            text: Text with pattern-based PII already redacted
+            names: Employee names to redact
+            mapping: Original-to-placeholder mapping to update
+            pii_types_found: PII types seen so far
+
+        Returns:
+            Text with names replaced by [PERSON_n] placeholders
+        """
+        gazetteer, order = self._name_gazetteer(names)
+        by_rank: Dict[int, List[Tuple[int, int]]] = {}
+        for start, end, rank in gazetteer.find_all(text):
+            by_rank.setdefault(rank, []).append((start, end))
+
+        claimed: List[Tuple[int, int]] = []  # sorted by start
+        starts: List[int] = []
+        opened: set = set()
+        closed: set = set()
+        spans: List[ScanSpan] = []
+        placeholders: Dict[int, str] = {}
+        for rank in sorted(by_rank):
+            name = names[order[rank]]
+            accepted = []
+            resume = 0
+            for start, end in sorted(by_rank[rank]):
+                if start < resume or not (
+                    _boundary(text, start, opened, closed) and _boundary(text, end, opened, closed)
+                ):
+                    continue
+                slot = bisect.bisect_right(starts, start)
+                if (slot and claimed[slot - 1][1] > start) or (
+                    slot < len(claimed) and claimed[slot][0] < end
+                ):
+                    continue
+                accepted.append((start, end))
+                resume = end
+            if not accepted:
+                continue
+            redacted = f"[PERSON_{rank + 1}]"
+            mapping[name] = redacted
+            pii_types_found.add("NAME")
+            for start, end in accepted:
+                slot = bisect.bisect_right(starts, start)
+                claimed.insert(slot, (start, end))
+                starts.insert(slot, start)
+                opened.add(start)
+                closed.add(end)
+                spans.append(ScanSpan(SCAN_CATEGORY, "NAME", start, end, name))
+                placeholders[start] = redacted
+        spans.sort(key=lambda span: span.start)
+        return replace_spans(text, spans, lambda span: placeholders[span.start])
+
+    @staticmethod
+    def _redact(
+        spans: List[ScanSpan], mapping: Dict[str, str], pii_types_found: set
+    ) -> Dict[int, str]:
+        """
+        Assign placeholders to one type's spans, last span first.
+
+        Args:
+            spans: Spans of a single PII type in text order
+            mapping: Original-to-placeholder mapping to update
+            pii_types_found: PII types seen so far
+
+        Returns:
+            Placeholder by span start
+        """
+        placeholders = {}
+        for counter, span in enumerate(reversed(spans), start=1):
+            if span.rule == "EMAIL":
+                redacted = f"[EMAIL_REDACTED_{counter}]"
+            else:
+                redacted = f"[{span.rule}_REDACTED]"
+            mapping[span.text] = redacted
+            pii_types_found.add(span.rule)
+            placeholders[span.start] = redacted
+        return placeholders
+
+
+def _patterns() -> Tuple["re.Pattern[str]", ...]:
+    return (
+        PIIStripper.SSN_PATTERN,
+        PIIStripper.EMAIL_PATTERN,
+        PIIStripper.PHONE_PATTERN,
+        PIIStripper.EMPLOYEE_ID_PATTERN,
+        PIIStripper.SALARY_PATTERN,
+    )
+
+
+def _boundary(text: str, position: int, opened: set, closed: set) -> bool:
+    """
+    Check for a word boundary (``\\b``) at a position of partly redacted text.
+
+    Positions in ``opened`` / ``closed`` are where a placeholder will start /
+    has ended, so the character after / before them is a bracket.
+    """
+    before = position > 0 and position not in closed and is_word_char(text[position - 1])
+    after = position < len(text) and position not in opened and is_word_char(text[position])
+    return before != after
+
+
+def _register_scan_rules() -> None:
+    get_text_scanner().register(
+        ScanRule(SCAN_CATEGORY, pii_type, pattern.pattern, pattern.flags)
+        for pii_type, pattern in zip(PIIStripper.PII_TYPES, _patterns())
+    )
+
+
+_register_scan_rules()
 
 
 class PIIMiddleware:
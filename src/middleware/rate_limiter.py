@@ -123,9 +123,10 @@ class RateLimiter:
         # Try to initialize Redis if enabled
         if self.config.enable_redis:
             try:
-                import redis
+                from src.core.connection_pool import get_pool_manager
 
-                self.redis_client = redis.from_url(self.config.redis_url)
+                # Shared client; its connection pool is bounded by the pool manager
+                self.redis_client = get_pool_manager().redis_client(self.config.redis_url)
                 self.redis_client.ping()
                 logger.info("Redis client initialized for rate limiting")
             except Exception as e:
@@ -133,6 +134,7 @@ class RateLimiter:
                     f"Failed to connect to Redis: {str(e)}",
                     extra={"redis_url": self.config.redis_url},
                 )
+                self.redis_client = None
                 if not self.config.fallback_to_memory:
                     raise
 
@@ -12,11 +12,17 @@ from typing import Any, Dict, Optional
 
 from flask import Flask, request, g
 
+from src.core.text_scanner import ScanRule, get_text_scanner, replace_spans
+
 logger = logging.getLogger(__name__)
 
 # HTML tag regex pattern
 HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
 
+# Scanner category for markup stripped from input
+SCAN_CATEGORY = "sanitizer.html"
+get_text_scanner().register([ScanRule(SCAN_CATEGORY, "tag", HTML_TAG_PATTERN.pattern)])
+
 # Email validation regex
 EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
@@ -43,7 +49,8 @@ class InputSanitizer:
         """
         if not isinstance(value, str):
             return value
-        return HTML_TAG_PATTERN.sub("", value)
+        spans = get_text_scanner().scan(value, [SCAN_CATEGORY])
+        return replace_spans(value, spans, lambda span: "") if spans else value
 
     @staticmethod
     def validate_email(email: str) -> bool:
@@ -5,7 +5,10 @@ Iteration 8 - Wave 2
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from uuid import uuid4, UUID
@@ -13,8 +16,29 @@ from pydantic import BaseModel, ConfigDict, Field
 from collections import defaultdict
 import json
 
+from src.core.audit_log_store import AuditLogStore
+from src.platform_services.report_engine import (
+    ActivityAggregates,
+    CronSchedule,
+    ReportCache,
+    write_export,
+)
+
 logger = logging.getLogger(__name__)
 
+# Audit log actions that change users, roles or configuration
+PRIVILEGED_ACTIONS = (
+    "user_created",
+    "user_updated",
+    "user_deleted",
+    "user_activated",
+    "user_deactivated",
+    "role_created",
+    "role_updated",
+    "role_deleted",
+    "config_changed",
+)
+
 
 class ReportType(str, Enum):
     """Audit report types."""
@@ -88,10 +112,24 @@ class AuditReportConfig(BaseModel):
     retention_days: int = Field(default=730, description="Report retention period in days")
     include_pii: bool = Field(default=False, description="Include PII in reports")
     max_findings_per_report: int = Field(default=1000, description="Maximum findings per report")
+    report_workers: int = Field(default=4, description="Worker threads for scheduled reports")
+    cache_max_entries: int = Field(
+        default=256, description="Generated reports and rendered exports kept in cache"
+    )
+    export_dir: Optional[str] = Field(
+        default=None, description="Directory scheduled report exports are written to"
+    )
 
     model_config = ConfigDict(frozen=False)
 
 
+# Report types computed from the audit log store; others have no data version
+STORE_REPORT_TYPES = (ReportType.SECURITY, ReportType.ACCESS)
+
+# Scheduled report run: (schedule_id, report_type, period start, period end)
+ReportJob = Tuple[str, ReportType, datetime, datetime]
+
+
 class AuditReportService:
     """
     Audit Report Service.
@@ -102,6 +140,8 @@ class AuditReportService:
         self,
         config: Optional[AuditReportConfig] = None,
         audit_logger=None,
+        audit_store: Optional[AuditLogStore] = None,
+        failed_login_threshold: int = 5,
     ) -> None:
         """
         Initialize audit report service.
@@ -109,12 +149,34 @@ class AuditReportService:
         Args:
             config: Audit report configuration
             audit_logger: Optional external audit logger
+            audit_store: Audit log store that security and access reports
+                are computed from (placeholder figures if None)
+            failed_login_threshold: Failed logins per user in a report
+                period that raise a critical security finding
         """
         self.config = config or AuditReportConfig()
         self.audit_logger = audit_logger
+        self.audit_store = audit_store
+        self.failed_login_threshold = failed_login_threshold
         self.reports: List[AuditReport] = []
         self.findings_log: List[Dict[str, Any]] = []
         self.scheduled_reports: Dict[str, Dict[str, Any]] = {}
+        self._reports_by_id: Dict[UUID, AuditReport] = {}
+        self._revisions: Dict[UUID, int] = {}  # bumped when a report's findings change
+        self._schedules: Dict[str, CronSchedule] = {}
+        self._generators: Dict[ReportType, Callable[[datetime, datetime], AuditReport]] = {
+            ReportType.COMPLIANCE: self.generate_compliance_report,
+            ReportType.SECURITY: self.generate_security_report,
+            ReportType.ACCESS: self.generate_access_report,
+            ReportType.DATA_PROCESSING: self.generate_data_processing_report,
+            ReportType.INCIDENT: self.generate_incident_report,
+        }
+        self._report_cache = ReportCache(self.config.cache_max_entries)
+        self._render_cache = ReportCache(self.config.cache_max_entries)
+        self._aggregates = ReportCache(self.config.cache_max_entries)
+        self._run_lock = threading.Lock()
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
 
         logger.info(
             "Audit report service initialized",
@@ -189,7 +251,7 @@ class AuditReportService:
                 },
             )
 
-            self.reports.append(report)
+            self._add_report(report)
             self._log_report_generation(report)
 
             logger.info(
@@ -259,6 +321,9 @@ class AuditReportService:
                     status="open",
                 ),
             ]
+            activity: Dict[str, Any] = {}
+            if self.audit_store is not None:
+                activity = self._security_activity(self._activity(start_date, end_date), findings)
 
             critical_count = sum(1 for f in findings if f.severity == "critical")
             warning_count = sum(1 for f in findings if f.severity == "warning")
@@ -270,6 +335,7 @@ class AuditReportService:
                 "info_findings": len(findings) - critical_count - warning_count,
                 "security_posture": "strong",
                 "risk_level": "medium" if critical_count > 0 else "low",
+                **activity,
             }
 
             report = AuditReport(
@@ -288,7 +354,7 @@ class AuditReportService:
                 },
             )
 
-            self.reports.append(report)
+            self._add_report(report)
             self._log_report_generation(report)
 
             logger.info(
@@ -355,6 +421,11 @@ class AuditReportService:
                 "inactive_accounts": 3,
                 "access_control_status": "good",
             }
+            if self.audit_store is not None:
+                summary.update(
+                    self._access_activity(self._activity(start_date, end_date), findings)
+                )
+                summary["total_findings"] = len(findings)
 
             report = AuditReport(
                 report_type=ReportType.ACCESS,
@@ -371,7 +442,7 @@ class AuditReportService:
                 },
             )
 
-            self.reports.append(report)
+            self._add_report(report)
             self._log_report_generation(report)
 
             logger.info(
@@ -455,7 +526,7 @@ class AuditReportService:
                 },
             )
 
-            self.reports.append(report)
+            self._add_report(report)
             self._log_report_generation(report)
 
             logger.info(
@@ -539,7 +610,7 @@ class AuditReportService:
                 },
             )
 
-            self.reports.append(report)
+            self._add_report(report)
             self._log_report_generation(report)
 
             logger.info(
@@ -614,7 +685,7 @@ class AuditReportService:
                 },
             )
 
-            self.reports.append(report)
+            self._add_report(report)
             self._log_report_generation(report)
 
             logger.info(
@@ -634,6 +705,43 @@ class AuditReportService:
             )
             raise
 
+    def get_or_generate_report(
+        self,
+        report_type: ReportType,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> AuditReport:
+        """
+        Get the report for a period, generating it only if not already cached.
+
+        Reports are cached by (type, period, data version). Store-backed
+        report types take the number of audit entries in the period as their
+        data version, so new activity in the period yields a fresh report.
+
+        Args:
+            report_type: Report type (any but custom)
+            start_date: Report period start
+            end_date: Report period end
+
+        Returns:
+            Cached or newly generated AuditReport
+
+        Raises:
+            ValueError: If the report type cannot be generated for a period
+        """
+        generate = self._generators.get(report_type)
+        if generate is None:
+            raise ValueError(f"Report type {report_type.value} cannot be generated by period")
+        version = 0
+        if report_type in STORE_REPORT_TYPES and self.audit_store is not None:
+            version = self._data_version(start_date, end_date)
+        key = (report_type, start_date, end_date, version)
+        report = self._report_cache.get(key)
+        if report is None:
+            report = generate(start_date, end_date)
+            self._report_cache.put(key, report)
+        return report
+
     def get_report(self, report_id: UUID) -> Optional[AuditReport]:
         """
         Retrieve a specific report.
@@ -645,10 +753,7 @@ class AuditReportService:
             AuditReport or None if not found
         """
         try:
-            for report in self.reports:
-                if report.report_id == report_id:
-                    return report
-            return None
+            return self._reports_by_id.get(report_id)
 
         except Exception as e:
             logger.error(
@@ -714,75 +819,57 @@ class AuditReportService:
             if not report:
                 raise ValueError(f"Report {report_id} not found")
 
-            if format == ReportFormat.JSON:
-                return {
-                    "format": "json",
-                    "data": {
-                        "report_id": str(report.report_id),
-                        "type": report.report_type.value,
-                        "title": report.title,
-                        "period": {
-                            "start": report.period.start_date.isoformat(),
-                            "end": report.period.end_date.isoformat(),
-                        },
-                        "findings": [
-                            {
-                                "id": str(f.finding_id),
-                                "severity": f.severity,
-                                "category": f.category,
-                                "description": f.description,
-                                "recommendation": f.recommendation,
-                                "status": f.status,
-                            }
-                            for f in report.findings
-                        ],
-                        "summary": report.summary,
-                    },
-                }
+            # Rendered once per report revision; findings changes bump it
+            key = (report.report_id, self._revisions.get(report.report_id, 0), format)
+            rendered = self._render_cache.get(key)
+            if rendered is None:
+                rendered = self._render(report, format)
+                self._render_cache.put(key, rendered)
+            return rendered
 
-            elif format == ReportFormat.CSV:
-                rows = [
-                    {
-                        "finding_id": str(f.finding_id),
-                        "severity": f.severity,
-                        "category": f.category,
-                        "description": f.description,
-                        "recommendation": f.recommendation,
-                        "status": f.status,
-                    }
-                    for f in report.findings
-                ]
-                return {
-                    "format": "csv",
-                    "data": rows,
-                }
+        except Exception as e:
+            logger.error(
+                "Failed to export report",
+                extra={"report_id": str(report_id), "error": str(e)},
+            )
+            raise
 
-            elif format == ReportFormat.SUMMARY:
-                return {
-                    "format": "summary",
-                    "data": {
-                        "report_id": str(report.report_id),
-                        "title": report.title,
-                        "summary": report.summary,
-                        "finding_count": len(report.findings),
-                    },
-                }
+    def export_report_to_file(
+        self,
+        report_id: UUID,
+        format: ReportFormat,
+        path: str,
+    ) -> Dict[str, Any]:
+        """
+        Stream an exported report to a file.
 
-            elif format == ReportFormat.PDF_DATA:
-                return {
-                    "format": "pdf_data",
-                    "data": {
-                        "title": report.title,
-                        "content": json.dumps(report.summary, indent=2),
-                    },
-                }
+        A report revision already written to path is not written again.
+
+        Args:
+            report_id: Report ID
+            format: Export format
+            path: Destination file
 
-            return {"format": "unknown", "data": {}}
+        Returns:
+            Dictionary with format, path, rows and bytes written
+        """
+        try:
+            rendered = self.export_report(report_id, format)
+            key = (report_id, self._revisions.get(report_id, 0), format, path)
+            written = self._render_cache.get(key)
+            if written is None or not os.path.exists(path):
+                written = write_export(rendered, path)
+                self._render_cache.put(key, written)
+                logger.info(
+                    "Report exported to file",
+                    extra={"report_id": str(report_id), "path": path, "rows": written["rows"]},
+                )
+            return written
 
         except Exception as e:
             logger.error(
-                "Failed to export report",
-                extra={"report_id": str(report_id), "error": str(e)},
+                "Failed to export report to file",
+                extra={"report_id": str(report_id), "path": path, "error": str(e)},
             )
             raise
 
@@ -810,6 +897,7 @@ class AuditReportService:
                 raise ValueError("Maximum findings per report exceeded")
 
             report.findings.append(finding)
+            self._bump_revision(report_id)
             self.findings_log.append(
                 {
                     "report_id": str(report_id),
@@ -863,6 +951,7 @@ class AuditReportService:
             for finding in report.findings:
                 if finding.finding_id == finding_id:
                     finding.status = status
+                    self._bump_revision(report_id)
                     self.findings_log.append(
                         {
                             "report_id": str(report_id),
@@ -954,24 +1043,48 @@ class AuditReportService:
         self,
         report_type: ReportType,
         cron_schedule: str,
+        period_days: int = 30,
+        export_format: Optional[ReportFormat] = None,
     ) -> Dict[str, Any]:
         """
         Schedule automatic report generation.
 
+        Each run covers the period_days before its fire time; see
+        run_due_reports. Cron expressions are evaluated in UTC, the clock
+        audit entries are timestamped with.
+
         Args:
             report_type: Report type to schedule
             cron_schedule: Cron expression for schedule
+            period_days: Days of activity each run reports on
+            export_format: Also write each run's report to config.export_dir
 
         Returns:
             Dictionary with schedule details
+
+        Raises:
+            ValueError: If the cron expression is invalid, the report type
+                cannot be scheduled, or an export has no export_dir
         """
         try:
+            if report_type not in self._generators:
+                raise ValueError(f"Report type {report_type.value} cannot be scheduled")
+            if export_format is not None and not self.config.export_dir:
+                raise ValueError("Scheduled exports require config.export_dir")
+            cron = CronSchedule.parse(cron_schedule)
             schedule_id = f"{report_type.value}_{uuid4()}"
+            now = datetime.utcnow()
 
+            self._schedules[schedule_id] = cron
             self.scheduled_reports[schedule_id] = {
                 "report_type": report_type.value,
                 "cron_schedule": cron_schedule,
-                "created_at": datetime.now().isoformat(),
+                "period_days": period_days,
+                "export_format": export_format.value if export_format else None,
+                "created_at": now.isoformat(),
+                "next_run": cron.next_after(now).isoformat(),
+                "last_run": None,
+                "last_report_id": None,
                 "status": "active",
             }
 
@@ -988,6 +1101,7 @@ class AuditReportService:
                 "schedule_id": schedule_id,
                 "report_type": report_type.value,
                 "cron_schedule": cron_schedule,
+                "next_run": self.scheduled_reports[schedule_id]["next_run"],
                 "status": "active",
             }
 
@@ -998,6 +1112,316 @@ class AuditReportService:
             )
             raise
 
+    def run_due_reports(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Run every active schedule whose next fire time has passed.
+
+        Due reports are generated in a worker pool. A run covers the
+        schedule's period ending at its fire time, so schedules firing
+        together share cached aggregates and reports. Missed fire times are
+        caught up with a single run.
+
+        Args:
+            now: Current UTC time (defaults to utcnow)
+
+        Returns:
+            One result dictionary per run
+        """
+        now = now or datetime.utcnow()
+        with self._run_lock:
+            jobs: List[ReportJob] = []
+            for schedule_id, schedule in self.scheduled_reports.items():
+                fire_time = datetime.fromisoformat(schedule["next_run"])
+                if schedule["status"] == "active" and fire_time <= now:
+                    start_date = fire_time - timedelta(days=schedule["period_days"])
+                    report_type = ReportType(schedule["report_type"])
+                    jobs.append((schedule_id, report_type, start_date, fire_time))
+            if not jobs:
+                return []
+
+            workers = min(self.config.report_workers, len(jobs))
+            if workers <= 1:
+                results = [self._run_scheduled(job) for job in jobs]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="audit-report"
+                ) as pool:
+                    results = list(pool.map(self._run_scheduled, jobs))
+
+            for (schedule_id, *_), result in zip(jobs, results):
+                schedule = self.scheduled_reports[schedule_id]
+                schedule["last_run"] = now.isoformat()
+                schedule["last_report_id"] = result.get("report_id")
+                schedule["next_run"] = self._schedules[schedule_id].next_after(now).isoformat()
+
+        logger.info(
+            "Scheduled reports run",
+            extra={
+                "runs": len(results),
+                "failed": sum(1 for r in results if r["status"] == "failed"),
+            },
+        )
+        return results
+
+    def start(self, interval_seconds: float = 60) -> None:
+        """
+        Run due reports periodically on a background thread.
+
+        Args:
+            interval_seconds: Seconds between checks for due schedules
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_periodic,
+            args=(interval_seconds, self._stop_event),
+            name="audit-report-scheduler",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Audit report scheduler checking every {interval_seconds}s")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the scheduler thread.
+
+        Args:
+            timeout: Max seconds to wait for running reports to finish
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get report, export and aggregate cache statistics.
+
+        Returns:
+            Dictionary of cache name to entries, hits and misses
+        """
+        return {
+            "reports": self._report_cache.stats(),
+            "renders": self._render_cache.stats(),
+            "aggregates": self._aggregates.stats(),
+        }
+
+    def _run_periodic(self, interval_seconds: float, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            self.run_due_reports()
+            stop_event.wait(interval_seconds)
+
+    def _run_scheduled(self, job: ReportJob) -> Dict[str, Any]:
+        """
+        Generate (and optionally export) one scheduled report.
+
+        Args:
+            job: Schedule ID, report type and period
+
+        Returns:
+            Result dictionary; failures are reported, not raised
+        """
+        schedule_id, report_type, start_date, end_date = job
+        result: Dict[str, Any] = {
+            "schedule_id": schedule_id,
+            "report_type": report_type.value,
+            "period_start": start_date.isoformat(),
+            "period_end": end_date.isoformat(),
+        }
+        try:
+            report = self.get_or_generate_report(report_type, start_date, end_date)
+            result["report_id"] = str(report.report_id)
+            export_format = self.scheduled_reports[schedule_id]["export_format"]
+            if export_format:
+                suffix = {"csv": "csv", "json": "json"}.get(export_format, f"{export_format}.json")
+                name = f"{report_type.value}_{start_date:%Y%m%dT%H%M}_{end_date:%Y%m%dT%H%M}"
+                result["export"] = self.export_report_to_file(
+                    report.report_id,
+                    ReportFormat(export_format),
+                    os.path.join(self.config.export_dir, f"{name}.{suffix}"),
+                )
+            result["status"] = "completed"
+        except Exception as e:
+            logger.error(
+                "Scheduled report failed",
+                extra={"schedule_id": schedule_id, "error": str(e)},
+            )
+            result.update(status="failed", error=str(e))
+        return result
+
+    def _add_report(self, report: AuditReport) -> None:
+        self.reports.append(report)
+        self._reports_by_id[report.report_id] = report
+
+    def _bump_revision(self, report_id: UUID) -> None:
+        self._revisions[report_id] = self._revisions.get(report_id, 0) + 1
+
+    def _data_version(self, start_date: datetime, end_date: datetime) -> int:
+        """
+        Audit entries in a period.
+
+        The log is append-only and retention purges the oldest entries, so
+        the count changes whenever the period's data does.
+        """
+        return self.audit_store.count(start=start_date, end=end_date)
+
+    def _activity(self, start_date: datetime, end_date: datetime) -> ActivityAggregates:
+        """Audit store aggregates for a period, shared by every report covering it."""
+        key = (start_date, end_date, self._data_version(start_date, end_date))
+        return self._aggregates.get_or_create(
+            key,
+            lambda: ActivityAggregates(self.audit_store, start_date, end_date),
+        )
+
+    def _security_activity(
+        self, activity: ActivityAggregates, findings: List[AuditFinding]
+    ) -> Dict[str, Any]:
+        """
+        Count failures in the audit log and add findings for repeated failed logins.
+
+        Args:
+            activity: Audit store aggregates for the report period
+            findings: Findings list to extend
+
+        Returns:
+            Summary fields
+        """
+        failed_by_action = activity.count_by("action", {"status": "failure"})
+        failed_logins = activity.count_by("user_id", {"action": "login_failure"})
+        flagged = sorted(
+            (user for user, count in failed_logins.items() if count >= self.failed_login_threshold),
+            key=lambda user: -failed_logins[user],
+        )
+        if flagged:
+            findings.append(
+                AuditFinding(
+                    severity="critical",
+                    category="authentication",
+                    description="Repeated failed login attempts",
+                    evidence=[f"{user}: {failed_logins[user]} failed logins" for user in flagged],
+                    recommendation="Review accounts for credential attacks and enforce lockout",
+                    status="open",
+                )
+            )
+        return {
+            "audit_events": activity.total(),
+            "failed_actions": sum(failed_by_action.values()),
+            "failed_actions_by_type": dict(failed_by_action),
+            "failed_logins": sum(failed_logins.values()),
+        }
+
+    def _access_activity(
+        self, activity: ActivityAggregates, findings: List[AuditFinding]
+    ) -> Dict[str, Any]:
+        """
+        Summarize audit log activity and add a finding for privileged changes.
+
+        Args:
+            activity: Audit store aggregates for the report period
+            findings: Findings list to extend
+
+        Returns:
+            Summary fields
+        """
+        by_action = activity.count_by("action")
+        by_user = activity.count_by("user_id")
+        privileged = {a: by_action[a] for a in PRIVILEGED_ACTIONS if a in by_action}
+        if privileged:
+            findings.append(
+                AuditFinding(
+                    severity="info",
+                    category="privileged_access",
+                    description="Privileged changes during the period",
+                    evidence=[f"{action}: {count}" for action, count in privileged.items()],
+                    recommendation="Confirm each change against an approved request",
+                    status="open",
+                )
+            )
+        return {
+            "audit_events": sum(by_action.values()),
+            "active_users": len(by_user),
+            "events_by_action": dict(by_action),
+            "privileged_changes": sum(privileged.values()),
+        }
+
+    def _render(self, report: AuditReport, format: ReportFormat) -> Dict[str, Any]:
+        """
+        Render a report in an export format.
+
+        Args:
+            report: Report to render
+            format: Export format
+
+        Returns:
+            Dictionary with report data in requested format
+        """
+        if format == ReportFormat.JSON:
+            return {
+                "format": "json",
+                "data": {
+                    "report_id": str(report.report_id),
+                    "type": report.report_type.value,
+                    "title": report.title,
+                    "period": {
+                        "start": report.period.start_date.isoformat(),
+                        "end": report.period.end_date.isoformat(),
+                    },
+                    "findings": [
+                        {
+                            "id": str(f.finding_id),
+                            "severity": f.severity,
+                            "category": f.category,
+                            "description": f.description,
+                            "recommendation": f.recommendation,
+                            "status": f.status,
+                        }
+                        for f in report.findings
+                    ],
+                    "summary": report.summary,
+                },
+            }
+
+        elif format == ReportFormat.CSV:
+            rows = [
+                {
+                    "finding_id": str(f.finding_id),
+                    "severity": f.severity,
+                    "category": f.category,
+                    "description": f.description,
+                    "recommendation": f.recommendation,
+                    "status": f.status,
+                }
+                for f in report.findings
+            ]
+            return {
+                "format": "csv",
+                "data": rows,
+            }
+
+        elif format == ReportFormat.SUMMARY:
+            return {
+                "format": "summary",
+                "data": {
+                    "report_id": str(report.report_id),
+                    "title": report.title,
+                    "summary": report.summary,
+                    "finding_count": len(report.findings),
+                },
+            }
+
+        elif format == ReportFormat.PDF_DATA:
+            return {
+                "format": "pdf_data",
+                "data": {
+                    "title": report.title,
+                    "content": json.dumps(report.summary, indent=2),
+                },
+            }
+
+        return {"format": "unknown", "data": {}}
+
     def _log_report_generation(self, report: AuditReport) -> None:
         """
         Log report generation event.
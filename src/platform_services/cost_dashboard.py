@@ -10,7 +10,13 @@ from datetime import datetime, timedelta
 from enum import Enum
 from uuid import uuid4, UUID
 from pydantic import BaseModel, ConfigDict, Field
-from collections import defaultdict
+
+from src.platform_services.usage_rollups import (
+    UsageRecordLog,
+    UsageRollups,
+    UsageStore,
+    floor_hour,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,15 +95,31 @@ class CostDashboardService:
     Tracks LLM token usage and manages budgets for the HR platform.
     """
 
-    def __init__(self, config: Optional[BudgetConfig] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[BudgetConfig] = None,
+        store: Optional[UsageStore] = None,
+        max_records_in_memory: int = 10000,
+        rollup_retention_days: Optional[int] = 90,
+    ) -> None:
         """
         Initialize cost dashboard service.
 
         Args:
             config: Budget configuration (uses defaults if None)
+            store: Append-only store for raw usage records (in-memory if None)
+            max_records_in_memory: Recent records kept in usage_records
+            rollup_retention_days: Days of usage that window queries can
+                reach; older rollups and in-memory rows are evicted (None
+                keeps everything)
         """
         self.config = config or BudgetConfig()
-        self.usage_records: List[UsageRecord] = []
+        # Every record appended to usage_records is rolled up by hour and day;
+        # queries read the rollups, never the record list
+        self.rollups = UsageRollups(store, retention_days=rollup_retention_days)
+        self.usage_records: List[UsageRecord] = UsageRecordLog(
+            self.rollups, max_records=max_records_in_memory
+        )
         self.user_budgets: Dict[str, float] = {}
         self.usage_alerts: List[Dict[str, Any]] = []
 
@@ -195,35 +217,17 @@ class CostDashboardService:
             if start_date is None:
                 start_date = end_date - timedelta(days=self.config.billing_cycle_days)
 
-            # Filter records by date range
-            filtered_records = [
-                r for r in self.usage_records if start_date <= r.timestamp <= end_date
-            ]
-
-            # Aggregate data
-            total_tokens = sum(r.tokens_used for r in filtered_records)
-            total_cost = sum(r.estimated_cost for r in filtered_records)
-
-            by_category = defaultdict(float)
-            by_department = defaultdict(float)
-            by_user = defaultdict(float)
-            by_model = defaultdict(float)
-
-            for record in filtered_records:
-                by_category[record.category.value] += record.estimated_cost
-                by_department[record.department] += record.estimated_cost
-                by_user[record.user_id] += record.estimated_cost
-                by_model[record.model_name] += record.estimated_cost
+            window = self.rollups.summarize(start_date, end_date)
 
             return CostSummary(
                 period_start=start_date,
                 period_end=end_date,
-                total_tokens=total_tokens,
-                total_cost=total_cost,
-                by_category=dict(by_category),
-                by_department=dict(by_department),
-                by_user=dict(by_user),
-                by_model=dict(by_model),
+                total_tokens=window.total.tokens,
+                total_cost=window.total.cost,
+                by_category={k: r.cost for k, r in window.by_category.items()},
+                by_department={k: r.cost for k, r in window.by_department.items()},
+                by_user={k: r.cost for k, r in window.by_user.items()},
+                by_model={k: r.cost for k, r in window.by_model.items()},
             )
 
         except Exception as e:
@@ -248,19 +252,10 @@ class CostDashboardService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
 
-            user_records = [
-                r
-                for r in self.usage_records
-                if r.user_id == user_id and start_date <= r.timestamp <= end_date
-            ]
-
-            total_tokens = sum(r.tokens_used for r in user_records)
-            total_cost = sum(r.estimated_cost for r in user_records)
-            query_count = len(set(r.query_id for r in user_records if r.query_id))
-
-            by_category = defaultdict(float)
-            for record in user_records:
-                by_category[record.category.value] += record.estimated_cost
+            usage = self.rollups.rollup(start_date, end_date, "user", user_id)
+            total_tokens = usage.tokens
+            total_cost = usage.cost
+            query_count = len(usage.query_ids or ())
 
             return {
                 "user_id": user_id,
@@ -271,7 +266,7 @@ class CostDashboardService:
                 "avg_cost_per_query": (
                     round(total_cost / query_count, 4) if query_count > 0 else 0
                 ),
-                "by_category": dict(by_category),
+                "by_category": usage.by_category,
                 "daily_average_tokens": round(total_tokens / period_days, 2),
             }
 
@@ -297,21 +292,12 @@ class CostDashboardService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
 
-            dept_records = [
-                r
-                for r in self.usage_records
-                if r.department == department and start_date <= r.timestamp <= end_date
-            ]
-
-            total_tokens = sum(r.tokens_used for r in dept_records)
-            total_cost = sum(r.estimated_cost for r in dept_records)
+            usage = self.rollups.rollup(start_date, end_date, "department", department)
+            total_tokens = usage.tokens
+            total_cost = usage.cost
             budget = self.config.department_budgets.get(department, 0)
 
-            unique_users = len(set(r.user_id for r in dept_records))
-
-            by_category = defaultdict(float)
-            for record in dept_records:
-                by_category[record.category.value] += record.estimated_cost
+            unique_users = len(usage.users or ())
 
             return {
                 "department": department,
@@ -321,7 +307,7 @@ class CostDashboardService:
                 "budget": budget,
                 "budget_used_percent": (round((total_cost / budget * 100), 2) if budget > 0 else 0),
                 "unique_users": unique_users,
-                "by_category": dict(by_category),
+                "by_category": usage.by_category,
             }
 
         except Exception as e:
@@ -407,26 +393,17 @@ class CostDashboardService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
 
-            filtered_records = [
-                r for r in self.usage_records if start_date <= r.timestamp <= end_date
-            ]
-
-            user_costs = defaultdict(float)
-            user_tokens = defaultdict(int)
-
-            for record in filtered_records:
-                user_costs[record.user_id] += record.estimated_cost
-                user_tokens[record.user_id] += record.tokens_used
+            by_user = self.rollups.breakdown(start_date, end_date, "user")
 
             consumers = [
                 {
                     "user_id": user_id,
-                    "total_cost": round(cost, 4),
-                    "total_tokens": user_tokens[user_id],
+                    "total_cost": round(usage.cost, 4),
+                    "total_tokens": usage.tokens,
                 }
-                for user_id, cost in sorted(user_costs.items(), key=lambda x: x[1], reverse=True)[
-                    :limit
-                ]
+                for user_id, usage in sorted(
+                    by_user.items(), key=lambda x: x[1].cost, reverse=True
+                )[:limit]
             ]
 
             return consumers
@@ -453,35 +430,28 @@ class CostDashboardService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=7)
 
-            recent_records = [
-                r for r in self.usage_records if start_date <= r.timestamp <= end_date
-            ]
+            recent = self.rollups.rollup(start_date, end_date)
 
-            if not recent_records:
+            if not recent.count:
                 return {
                     "projected_cost": 0,
                     "projected_tokens": 0,
                     "trend": "insufficient_data",
                 }
 
-            daily_cost = sum(r.estimated_cost for r in recent_records) / 7
-            daily_tokens = sum(r.tokens_used for r in recent_records) / 7
+            daily_cost = recent.cost / 7
+            daily_tokens = recent.tokens / 7
 
             projected_cost = daily_cost * days_ahead
             projected_tokens = int(daily_tokens * days_ahead)
 
-            # Determine trend
-            if len(recent_records) > 1:
-                recent_half = recent_records[len(recent_records) // 2 :]
-                early_half = recent_records[: len(recent_records) // 2]
-                recent_avg = (
-                    sum(r.estimated_cost for r in recent_half) / len(recent_half)
-                    if recent_half
-                    else 0
-                )
-                early_avg = (
-                    sum(r.estimated_cost for r in early_half) / len(early_half) if early_half else 0
-                )
+            # Determine trend: average cost per record, later half vs earlier half
+            if recent.count > 1:
+                midpoint = start_date + (end_date - start_date) / 2
+                early_half = self.rollups.rollup(start_date, midpoint - timedelta(microseconds=1))
+                recent_half = self.rollups.rollup(midpoint, end_date)
+                recent_avg = recent_half.cost / recent_half.count if recent_half.count else 0
+                early_avg = early_half.cost / early_half.count if early_half.count else 0
                 trend = (
                     "increasing"
                     if recent_avg > early_avg
@@ -559,12 +529,10 @@ class CostDashboardService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=1)
 
-            user_daily_usage = defaultdict(int)
-            for record in self.usage_records:
-                if start_date <= record.timestamp <= end_date:
-                    user_daily_usage[record.user_id] += record.tokens_used
+            user_daily_usage = self.rollups.breakdown(start_date, end_date, "user")
 
-            for user_id, tokens in user_daily_usage.items():
+            for user_id, usage in user_daily_usage.items():
+                tokens = usage.tokens
                 percent = (
                     (tokens / self.config.user_daily_limit * 100)
                     if self.config.user_daily_limit > 0
@@ -583,12 +551,10 @@ class CostDashboardService:
 
             # Check department budgets
             start_date = end_date - timedelta(days=self.config.billing_cycle_days)
-            dept_costs = defaultdict(float)
-            for record in self.usage_records:
-                if start_date <= record.timestamp <= end_date:
-                    dept_costs[record.department] += record.estimated_cost
+            dept_costs = self.rollups.breakdown(start_date, end_date, "department")
 
-            for dept, cost in dept_costs.items():
+            for dept, usage in dept_costs.items():
+                cost = usage.cost
                 budget = self.config.department_budgets.get(dept, 0)
                 if budget > 0:
                     percent = cost / budget * 100
@@ -620,22 +586,13 @@ class CostDashboardService:
             Dictionary with model cost analysis
         """
         try:
-            model_costs = defaultdict(float)
-            model_tokens = defaultdict(int)
-            model_queries = defaultdict(int)
-
-            for record in self.usage_records:
-                model_costs[record.model_name] += record.estimated_cost
-                model_tokens[record.model_name] += record.tokens_used
-                model_queries[record.model_name] += 1
-
             comparison = {}
-            for model in model_costs:
+            for model, usage in self.rollups.lifetime.by_model.items():
                 comparison[model] = {
-                    "total_cost": round(model_costs[model], 4),
-                    "total_tokens": model_tokens[model],
-                    "query_count": model_queries[model],
-                    "avg_cost_per_query": round(model_costs[model] / model_queries[model], 6),
+                    "total_cost": round(usage.cost, 4),
+                    "total_tokens": usage.tokens,
+                    "query_count": usage.count,
+                    "avg_cost_per_query": round(usage.cost / usage.count, 6),
                     "cost_per_1k_tokens": self.config.cost_per_1k_tokens.get(model, 0.001),
                 }
 
@@ -713,32 +670,50 @@ class CostDashboardService:
         """
         Check if budget threshold is exceeded.
 
+        Runs on every record_usage call, so the windows start on an hour
+        boundary: they are then covered by whole hour and day buckets and the
+        check never reads raw records. This can include up to an hour more
+        usage than check_budget, so alerts err on the early side.
+
         Args:
             user_id: User ID
             department: Department name
         """
         try:
-            budget_check = self.check_budget(user_id=user_id)
-            if not budget_check.get("within_budget", True):
+            now = datetime.now()
+            token_limit = self.config.user_daily_limit
+            daily_tokens = self.rollups.rollup(
+                floor_hour(now - timedelta(days=1)), now, "user", user_id
+            ).tokens
+            if daily_tokens > token_limit:
                 self.usage_alerts.append(
                     {
                         "type": "user_budget_exceeded",
                         "user_id": user_id,
-                        "timestamp": datetime.now(),
-                        "usage_percent": budget_check.get("usage_percent", 0),
+                        "timestamp": now,
+                        "usage_percent": (
+                            round((daily_tokens / token_limit * 100), 2) if token_limit > 0 else 0
+                        ),
                     }
                 )
 
-            dept_check = self.check_budget(department=department)
-            if not dept_check.get("within_budget", True):
-                self.usage_alerts.append(
-                    {
-                        "type": "department_budget_exceeded",
-                        "department": department,
-                        "timestamp": datetime.now(),
-                        "usage_percent": dept_check.get("usage_percent", 0),
-                    }
-                )
+            budget = self.config.department_budgets.get(department, 0)
+            if budget > 0:
+                cost = self.rollups.rollup(
+                    floor_hour(now - timedelta(days=self.config.billing_cycle_days)),
+                    now,
+                    "department",
+                    department,
+                ).cost
+                if cost > budget:
+                    self.usage_alerts.append(
+                        {
+                            "type": "department_budget_exceeded",
+                            "department": department,
+                            "timestamp": now,
+                            "usage_percent": round((cost / budget * 100), 2),
+                        }
+                    )
 
         except Exception as e:
             logger.debug(
@@ -0,0 +1,287 @@
+"""
+PLAT-008: Audit report execution engine.
+
+CronSchedule parses the five-field cron expressions that
+AuditReportService.schedule_report records and finds each schedule's next
+fire time, so due reports can be run in a worker pool. ReportCache is a
+thread-safe LRU used for generated reports, keyed by (type, period, data
+version), and for rendered exports keyed by (report, revision, format).
+ActivityAggregates memoizes audit store counts for one period so every
+report type covering that period shares them. write_export streams a
+rendered report to disk one finding at a time.
+"""
+
+import csv
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (low, high) of minute, hour, day of month, month, day of week (0 = Sunday)
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+
+# Days searched for a matching date before a schedule is declared impossible
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(text: str, low: int, high: int) -> FrozenSet[int]:
+    """Expand one cron field (``*``, ``a``, ``a-b``, ``*/n``, ``a-b/n``, lists)."""
+    values = set()
+    for part in text.split(","):
+        spec, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if spec == "*":
+            first, last = low, high
+        elif "-" in spec:
+            first_text, _, last_text = spec.partition("-")
+            first, last = int(first_text), int(last_text)
+        else:
+            first = int(spec)
+            last = high if step_text else first
+        if step <= 0 or first > last:
+            raise ValueError(f"Invalid cron field: {text!r}")
+        values.update(range(first, last + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """Parsed five-field cron expression (minute hour day month weekday)."""
+
+    expression: str
+    minutes: FrozenSet[int]
+    hours: FrozenSet[int]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]
+    any_day: bool  # day-of-month field is *
+    any_weekday: bool  # day-of-week field is *
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        """
+        Parse a cron expression.
+
+        Args:
+            expression: Five cron fields or an alias such as ``@daily``
+
+        Returns:
+            CronSchedule
+
+        Raises:
+            ValueError: If the expression is malformed or out of range
+        """
+        fields = CRON_ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs five fields: {expression!r}")
+        try:
+            parsed = []
+            for text, (low, high) in zip(fields, CRON_FIELDS):
+                # Day of week accepts 7 as Sunday
+                values = _parse_field(text, low, 7 if high == 6 else high)
+                if high == 6:
+                    values = frozenset(v % 7 for v in values)
+                if not values or min(values) < low or max(values) > high:
+                    raise ValueError(f"Cron field out of range: {text!r}")
+                parsed.append(values)
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression {expression!r}: {e}") from e
+        return cls(expression, *parsed, any_day=fields[2] == "*", any_weekday=fields[4] == "*")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_month = moment.day in self.days
+        in_week = (moment.weekday() + 1) % 7 in self.weekdays
+        # Standard cron: when both day fields are restricted, either may match
+        if self.any_day or self.any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def matches(self, moment: datetime) -> bool:
+        """Whether the schedule fires in the minute containing moment."""
+        return (
+            moment.month in self.months
+            and self._day_matches(moment)
+            and moment.hour in self.hours
+            and moment.minute in self.minutes
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        First fire time strictly after moment.
+
+        Raises:
+            ValueError: If no date within five years matches (e.g. ``0 0 30 2 *``)
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = candidate.replace(hour=0, minute=0)
+        for _ in range(_MAX_SEARCH_DAYS):
+            if day.month in self.months and self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        fire = day.replace(hour=hour, minute=minute)
+                        if fire >= candidate:
+                            return fire
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+class ReportCache:
+    """Thread-safe LRU mapping with hit and miss counters."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Cached value for key, creating it with factory on a miss.
+
+        The factory runs under the cache lock so concurrent callers share
+        one value; keep it cheap.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+            value = self._entries[key] = factory()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class ActivityAggregates:
+    """
+    Audit store counts for one report period, computed once and shared.
+
+    Stores are thread-safe; the lock only keeps concurrent report workers
+    from computing the same count twice.
+    """
+
+    def __init__(self, store: Any, start: datetime, end: datetime) -> None:
+        """
+        Initialize aggregates.
+
+        Args:
+            store: AuditLogStore to read
+            start: Period start (inclusive)
+            end: Period end (inclusive)
+        """
+        self.store = store
+        self.start = start
+        self.end = end
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Dict[Any, int]] = {}
+
+    def count_by(self, field: str, filters: Optional[Dict[str, Any]] = None) -> Dict[Any, int]:
+        """Entries in the period per value of field, optionally filtered."""
+        key = (field, tuple(sorted((filters or {}).items())))
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = self.store.count_by(
+                    field, filters, self.start, self.end
+                )
+        return counts
+
+    def total(self) -> int:
+        """All entries in the period."""
+        return sum(self.count_by("action").values())
+
+
+def write_export(rendered: Dict[str, Any], path: str) -> Dict[str, Any]:
+    """
+    Write a rendered report to path, one finding at a time.
+
+    The file is written beside path and renamed into place, so readers never
+    see a partial export.
+
+    Args:
+        rendered: Output of AuditReportService.export_report
+        path: Destination file
+
+    Returns:
+        Dictionary with format, path, rows and bytes written
+    """
+    data = rendered["data"]
+    rows = 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as handle:
+        if rendered["format"] == "csv":
+            writer = None
+            for row in data:
+                if writer is None:
+                    writer = csv.DictWriter(handle, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+                rows += 1
+        elif isinstance(data, dict) and isinstance(data.get("findings"), list):
+            handle.write(f'{{"format": {json.dumps(rendered["format"])}, "data": {{')
+            for name, value in data.items():
+                if name != "findings":
+                    handle.write(f"{json.dumps(name)}: {json.dumps(value, default=str)}, ")
+            handle.write('"findings": [')
+            for i, finding in enumerate(data["findings"]):
+                handle.write((", " if i else "") + json.dumps(finding, default=str))
+                rows += 1
+            handle.write("]}}\n")
+        else:
+            json.dump(rendered, handle, default=str)
+            rows = 1
+    os.replace(tmp_path, path)
+    return {
+        "format": rendered["format"],
+        "path": path,
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+    }
@@ -10,9 +10,14 @@ from datetime import datetime, timedelta
 from enum import Enum
 from uuid import uuid4, UUID
 from pydantic import BaseModel, ConfigDict, Field
-from collections import defaultdict
 import statistics
 
+from src.platform_services.sla_timeseries import (
+    MeasurementLog,
+    SeriesAggregate,
+    SLASeries,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,6 +91,13 @@ class SLAConfig(BaseModel):
         default=30, description="Auto-resolve incident after minutes"
     )
     report_generation_enabled: bool = Field(default=True, description="Enable report generation")
+    raw_retention_hours: int = Field(
+        default=48, description="Hours of raw measurements kept before downsampling to minutes"
+    )
+    minute_retention_days: int = Field(
+        default=35, description="Days of per-minute aggregates kept before downsampling to hours"
+    )
+    retention_days: int = Field(default=400, description="Days of history kept in total")
 
     model_config = ConfigDict(frozen=False)
 
@@ -96,15 +108,29 @@ class SLAMonitorService:
     Tracks service level agreements and uptime metrics.
     """
 
-    def __init__(self, config: Optional[SLAConfig] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[SLAConfig] = None,
+        max_measurements_in_memory: int = 10000,
+    ) -> None:
         """
         Initialize SLA monitor service.
 
         Args:
             config: SLA configuration (uses defaults if None)
+            max_measurements_in_memory: Recent measurements kept in measurements
         """
         self.config = config or SLAConfig()
-        self.measurements: List[SLAMeasurement] = []
+        # Every measurement appended to measurements is added to its metric's
+        # time-partitioned series; queries read the series, never the list
+        self.series = SLASeries(
+            raw_retention_hours=self.config.raw_retention_hours,
+            minute_retention_hours=self.config.minute_retention_days * 24,
+            max_age_hours=self.config.retention_days * 24,
+        )
+        self.measurements: List[SLAMeasurement] = MeasurementLog(
+            self.series, max_measurements=max_measurements_in_memory
+        )
         self.incidents: List[SLAIncident] = []
         self.check_history: List[Dict[str, Any]] = []
 
@@ -192,26 +218,21 @@ class SLAMonitorService:
 
             for target in self.config.targets:
                 metric = target.metric
-                # Get recent measurements for this metric
-                recent = [
-                    m
-                    for m in self.measurements
-                    if m.metric == metric
-                    and m.timestamp
-                    >= datetime.now() - timedelta(hours=target.measurement_window_hours)
-                ]
-
-                if recent:
-                    latest = recent[-1]
-                    compliant = sum(1 for m in recent if m.is_within_target) / len(recent)
+                # Recent measurements for this metric
+                since = datetime.now() - timedelta(hours=target.measurement_window_hours)
+                series = self.series.series(metric)
+                recent = series.aggregate(since)
+
+                if recent.count:
+                    latest_value, latest_breached = series.latest(since)
 
                     status[metric.value] = {
-                        "current_value": latest.value,
+                        "current_value": latest_value,
                         "target_value": target.target_value,
-                        "within_target": latest.is_within_target,
-                        "compliance_percent": round(compliant * 100, 2),
+                        "within_target": not latest_breached,
+                        "compliance_percent": round(recent.compliance * 100, 2),
                         "tier": target.tier.value,
-                        "measurement_count": len(recent),
+                        "measurement_count": recent.count,
                     }
                 else:
                     status[metric.value] = {
@@ -285,29 +306,21 @@ class SLAMonitorService:
             end_date = datetime.now()
             start_date = end_date - timedelta(hours=period_hours)
 
-            uptime_measurements = [
-                m
-                for m in self.measurements
-                if m.metric == SLAMetric.UPTIME and start_date <= m.timestamp <= end_date
-            ]
+            uptime = self.series.series(SLAMetric.UPTIME).aggregate(start_date, end_date)
 
-            if not uptime_measurements:
+            if not uptime.count:
                 return {
                     "uptime_percent": 0,
                     "total_checks": 0,
                     "failed_checks": 0,
                 }
 
-            uptime_values = [m.value for m in uptime_measurements]
-            avg_uptime = statistics.mean(uptime_values)
-            failed = sum(1 for m in uptime_measurements if not m.is_within_target)
-
             return {
-                "uptime_percent": round(avg_uptime, 4),
-                "total_checks": len(uptime_measurements),
-                "failed_checks": failed,
-                "min_uptime": round(min(uptime_values), 4),
-                "max_uptime": round(max(uptime_values), 4),
+                "uptime_percent": round(uptime.mean, 4),
+                "total_checks": uptime.count,
+                "failed_checks": uptime.breaches,
+                "min_uptime": round(uptime.minimum, 4),
+                "max_uptime": round(uptime.maximum, 4),
                 "period_hours": period_hours,
             }
 
@@ -332,13 +345,10 @@ class SLAMonitorService:
             end_date = datetime.now()
             start_date = end_date - timedelta(hours=period_hours)
 
-            rt_measurements = [
-                m
-                for m in self.measurements
-                if m.metric == SLAMetric.RESPONSE_TIME and start_date <= m.timestamp <= end_date
-            ]
+            series = self.series.series(SLAMetric.RESPONSE_TIME)
+            response_times = series.aggregate(start_date, end_date)
 
-            if not rt_measurements:
+            if not response_times.count:
                 return {
                     "p50": 0,
                     "p95": 0,
@@ -348,16 +358,16 @@ class SLAMonitorService:
                     "max": 0,
                 }
 
-            values = sorted([m.value for m in rt_measurements])
+            p50, p95, p99 = series.percentiles((0.5, 0.95, 0.99), start_date, end_date)
 
             return {
-                "p50": round(values[len(values) // 2], 4),
-                "p95": round(values[int(len(values) * 0.95)], 4),
-                "p99": round(values[int(len(values) * 0.99)], 4),
-                "avg": round(statistics.mean(values), 4),
-                "min": round(min(values), 4),
-                "max": round(max(values), 4),
-                "measurement_count": len(rt_measurements),
+                "p50": round(p50, 4),
+                "p95": round(p95, 4),
+                "p99": round(p99, 4),
+                "avg": round(response_times.mean, 4),
+                "min": round(response_times.minimum, 4),
+                "max": round(response_times.maximum, 4),
+                "measurement_count": response_times.count,
                 "period_hours": period_hours,
             }
 
@@ -382,13 +392,9 @@ class SLAMonitorService:
             end_date = datetime.now()
             start_date = end_date - timedelta(hours=period_hours)
 
-            error_measurements = [
-                m
-                for m in self.measurements
-                if m.metric == SLAMetric.ERROR_RATE and start_date <= m.timestamp <= end_date
-            ]
+            errors = self.series.series(SLAMetric.ERROR_RATE).aggregate(start_date, end_date)
 
-            if not error_measurements:
+            if not errors.count:
                 return {
                     "rate": 0,
                     "total_requests": 0,
@@ -396,14 +402,11 @@ class SLAMonitorService:
                 }
 
             # Assume value = error_rate percentage
-            avg_error_rate = statistics.mean([m.value for m in error_measurements])
-            error_count = sum(1 for m in error_measurements if not m.is_within_target)
-
             return {
-                "rate": round(avg_error_rate, 4),
-                "measurement_count": len(error_measurements),
-                "breaches": error_count,
-                "avg_rate": round(avg_error_rate, 4),
+                "rate": round(errors.mean, 4),
+                "measurement_count": errors.count,
+                "breaches": errors.breaches,
+                "avg_rate": round(errors.mean, 4),
                 "period_hours": period_hours,
             }
 
@@ -559,11 +562,6 @@ class SLAMonitorService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
 
-            # Get metrics for period
-            period_measurements = [
-                m for m in self.measurements if start_date <= m.timestamp <= end_date
-            ]
-
             # Get incidents for period
             period_incidents = self.get_incident_history(period_days)
 
@@ -571,17 +569,11 @@ class SLAMonitorService:
             status = self.get_current_sla_status()
             uptime = self.get_uptime(period_hours=period_days * 24)
 
-            compliance_by_metric = defaultdict(list)
-            for m in period_measurements:
-                if m.is_within_target:
-                    compliance_by_metric[m.metric.value].append(1)
-                else:
-                    compliance_by_metric[m.metric.value].append(0)
-
-            metric_compliance = {
-                k: round(sum(v) / len(v) * 100 if v else 0, 2)
-                for k, v in compliance_by_metric.items()
-            }
+            metric_compliance = {}
+            for metric, series in self.series.metrics.items():
+                period = series.aggregate(start_date, end_date)
+                if period.count:
+                    metric_compliance[metric] = round(period.compliance * 100, 2)
 
             critical_incidents = sum(1 for i in period_incidents if i.severity == "critical")
             warning_incidents = sum(1 for i in period_incidents if i.severity == "warning")
@@ -630,28 +622,18 @@ class SLAMonitorService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_days)
 
-            metric_measurements = [
-                m
-                for m in self.measurements
-                if m.metric == metric and start_date <= m.timestamp <= end_date
-            ]
+            series = self.series.series(metric)
+            daily = series.daily(start_date, end_date)
 
-            if not metric_measurements:
+            if not daily:
                 return {
                     "metric": metric.value,
                     "trend": "insufficient_data",
                     "daily_averages": {},
                 }
 
-            # Group by day
-            daily_data = defaultdict(list)
-            for m in metric_measurements:
-                day_key = m.timestamp.date().isoformat()
-                daily_data[day_key].append(m.value)
-
-            daily_averages = {
-                day: round(statistics.mean(values), 4) for day, values in sorted(daily_data.items())
-            }
+            daily_averages = {day: round(period.mean, 4) for day, period in daily.items()}
+            count = sum(period.count for period in daily.values())
 
             # Determine trend
             if len(daily_averages) > 1:
@@ -670,9 +652,9 @@ class SLAMonitorService:
                 "metric": metric.value,
                 "period_days": period_days,
                 "daily_averages": daily_averages,
-                "overall_average": round(statistics.mean(m.value for m in metric_measurements), 4),
+                "overall_average": round(sum(period.total for period in daily.values()) / count, 4),
                 "trend": trend,
-                "measurement_count": len(metric_measurements),
+                "measurement_count": count,
             }
 
         except Exception as e:
@@ -682,6 +664,57 @@ class SLAMonitorService:
             )
             raise
 
+    def get_metric_timeseries(
+        self,
+        metric: SLAMetric,
+        period_hours: int = 24,
+        interval_minutes: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Get a metric's aggregates per interval for trend charts.
+
+        Args:
+            metric: Metric to chart
+            period_hours: Period to chart in hours
+            interval_minutes: Width of each point in minutes
+
+        Returns:
+            Dictionary with one point per non-empty interval
+        """
+        try:
+            end_date = datetime.now()
+            start_date = end_date - timedelta(hours=period_hours)
+            interval = timedelta(minutes=interval_minutes)
+
+            points: Dict[datetime, SeriesAggregate] = {}
+            for minute, period in self.series.series(metric).minute_series(start_date, end_date):
+                bucket = minute - (minute - datetime.min) % interval
+                points.setdefault(bucket, SeriesAggregate()).merge(period)
+
+            return {
+                "metric": metric.value,
+                "period_hours": period_hours,
+                "interval_minutes": interval_minutes,
+                "points": [
+                    {
+                        "timestamp": bucket.isoformat(),
+                        "avg": round(period.mean, 4),
+                        "min": round(period.minimum, 4),
+                        "max": round(period.maximum, 4),
+                        "count": period.count,
+                        "breaches": period.breaches,
+                    }
+                    for bucket, period in points.items()
+                ],
+            }
+
+        except Exception as e:
+            logger.error(
+                "Failed to get metric timeseries",
+                extra={"metric": metric.value if metric else None, "error": str(e)},
+            )
+            raise
+
     def _create_breach_incident(
         self,
         metric: SLAMetric,
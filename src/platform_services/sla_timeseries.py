@@ -0,0 +1,484 @@
+"""
+PLAT-007: Time-partitioned columnar series for SLA measurements.
+
+Each metric has its own MetricSeries: a ring of one-hour partitions ordered by
+start time. A raw partition keeps timestamps (integer microseconds), values
+and breach flags in parallel arrays sorted by timestamp, plus per-minute
+aggregates (count, sum, min, max, breaches) maintained on append. Window
+queries bisect the partition list and, for partitions cut by a window edge,
+the timestamp array; partitions fully inside a window contribute their
+precomputed totals.
+
+Partitions are downsampled as the newest measurement moves on: older than
+raw_retention_hours they drop their raw columns and keep the minute
+aggregates, older than minute_retention_hours they keep only their hour
+totals, and older than max_age_hours they are evicted. A window edge falling
+inside downsampled data includes the whole minute (or hour) that starts
+within the window; percentiles over downsampled data use the minute (or
+hour) means weighted by their counts.
+"""
+
+import logging
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1)
+MINUTE_US = 60_000_000
+HOUR_US = 60 * MINUTE_US
+END_OF_TIME = 2**62
+
+RAW = "raw"
+MINUTE = "minute"
+HOUR = "hour"
+
+
+def to_micros(ts: datetime) -> int:
+    """Microseconds since 1970-01-01 for a naive (local) timestamp."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone().replace(tzinfo=None)
+    delta = ts - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_micros(micros: int) -> datetime:
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def _window(start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+    return (
+        to_micros(start) if start is not None else -END_OF_TIME,
+        to_micros(end) if end is not None else END_OF_TIME,
+    )
+
+
+# ============================================================================
+# Aggregates
+# ============================================================================
+
+
+@dataclass
+class SeriesAggregate:
+    """Count, sum, min, max and breach count of a set of measurements."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    breaches: int = 0
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def compliance(self) -> Optional[float]:
+        """Fraction of measurements within target."""
+        return (self.count - self.breaches) / self.count if self.count else None
+
+    def add(self, value: float, breached: bool) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.breaches += breached
+
+    def merge(self, other: "SeriesAggregate") -> None:
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.breaches += other.breaches
+
+    @classmethod
+    def of(cls, values: Sequence[float], breached: Sequence[int]) -> "SeriesAggregate":
+        if not values:
+            return cls()
+        return cls(len(values), math.fsum(values), min(values), max(values), sum(breached))
+
+
+class MinuteAggregates:
+    """Sixty per-minute aggregates of one hour, as parallel arrays."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "breaches")
+
+    def __init__(self) -> None:
+        self.count = array("l", [0]) * 60
+        self.total = array("d", [0.0]) * 60
+        self.minimum = array("d", [math.inf]) * 60
+        self.maximum = array("d", [-math.inf]) * 60
+        self.breaches = array("l", [0]) * 60
+
+    def add(self, minute: int, value: float, breached: bool) -> None:
+        self.count[minute] += 1
+        self.total[minute] += value
+        if value < self.minimum[minute]:
+            self.minimum[minute] = value
+        if value > self.maximum[minute]:
+            self.maximum[minute] = value
+        self.breaches[minute] += breached
+
+    def get(self, minute: int) -> SeriesAggregate:
+        return SeriesAggregate(
+            self.count[minute],
+            self.total[minute],
+            self.minimum[minute],
+            self.maximum[minute],
+            self.breaches[minute],
+        )
+
+
+# ============================================================================
+# Partitions
+# ============================================================================
+
+
+@dataclass
+class SeriesPartition:
+    """Measurements of one metric within one hour."""
+
+    hour: int  # hours since 1970-01-01
+    resolution: str = RAW
+    timestamps: Optional[array] = field(default_factory=lambda: array("q"))
+    values: Optional[array] = field(default_factory=lambda: array("d"))
+    breached: Optional[array] = field(default_factory=lambda: array("b"))
+    minutes: Optional[MinuteAggregates] = field(default_factory=MinuteAggregates)
+    summary: SeriesAggregate = field(default_factory=SeriesAggregate)
+    first_us: int = END_OF_TIME
+    last_us: int = -END_OF_TIME
+
+    @property
+    def start_us(self) -> int:
+        return self.hour * HOUR_US
+
+    def add(self, ts: int, value: float, breached: bool) -> None:
+        if self.resolution == RAW:
+            if not self.timestamps or ts >= self.timestamps[-1]:
+                self.timestamps.append(ts)
+                self.values.append(value)
+                self.breached.append(breached)
+            else:
+                # Late arrival; equal timestamps keep insertion order
+                i = bisect_right(self.timestamps, ts)
+                self.timestamps.insert(i, ts)
+                self.values.insert(i, value)
+                self.breached.insert(i, breached)
+        if self.minutes is not None:
+            self.minutes.add((ts - self.start_us) // MINUTE_US, value, breached)
+        self.summary.add(value, breached)
+        self.first_us = min(self.first_us, ts)
+        self.last_us = max(self.last_us, ts)
+
+    def downsample(self, resolution: str) -> None:
+        """Drop raw columns (MINUTE) or raw columns and minute aggregates (HOUR)."""
+        self.timestamps = self.values = self.breached = None
+        if resolution == HOUR:
+            self.minutes = None
+        self.resolution = resolution
+
+    def _covers(self, start: int, end: int) -> bool:
+        return start <= self.first_us and self.last_us <= end
+
+    def _disjoint(self, start: int, end: int) -> bool:
+        return self.last_us < start or self.first_us > end
+
+    def _slice(self, start: int, end: int) -> Tuple[int, int]:
+        return bisect_left(self.timestamps, start), bisect_right(self.timestamps, end)
+
+    def _minute_range(self, start: int, end: int) -> range:
+        """Minutes whose start lies within [start, end]."""
+        first = max(0, -((self.start_us - start) // MINUTE_US))
+        last = min(59, (end - self.start_us) // MINUTE_US)
+        return range(first, last + 1)
+
+    def aggregate(self, start: int, end: int) -> SeriesAggregate:
+        if self._disjoint(start, end):
+            return SeriesAggregate()
+        if self._covers(start, end):
+            return self.summary
+        if self.resolution == RAW:
+            lo, hi = self._slice(start, end)
+            return SeriesAggregate.of(self.values[lo:hi], self.breached[lo:hi])
+        result = SeriesAggregate()
+        if self.resolution == MINUTE:
+            for minute in self._minute_range(start, end):
+                result.merge(self.minutes.get(minute))
+        elif start <= self.start_us <= end:
+            result.merge(self.summary)
+        return result
+
+    def points(self, start: int, end: int, raw: List[float], weighted: List[Tuple]) -> None:
+        """Collect raw values, and (value, weight) pairs for downsampled data."""
+        if self._disjoint(start, end):
+            return
+        if self.resolution == RAW:
+            lo, hi = self._slice(start, end)
+            raw.extend(self.values[lo:hi])
+        elif self.resolution == MINUTE:
+            for minute in self._minute_range(start, end):
+                count = self.minutes.count[minute]
+                if count:
+                    weighted.append((self.minutes.total[minute] / count, count))
+        elif start <= self.start_us <= end and self.summary.count:
+            weighted.append((self.summary.mean, self.summary.count))
+
+    def minute_series(self, start: int, end: int) -> Iterator[Tuple[int, SeriesAggregate]]:
+        """(minute start, aggregate) for each non-empty minute in the window."""
+        if self._disjoint(start, end):
+            return
+        if self.resolution == HOUR:
+            if start <= self.start_us <= end:
+                yield self.start_us, self.summary
+            return
+        covered = self._covers(start, end)
+        for minute in range(60):
+            if not self.minutes.count[minute]:
+                continue
+            minute_start = self.start_us + minute * MINUTE_US
+            minute_end = minute_start + MINUTE_US - 1
+            if covered or (start <= minute_start and minute_end <= end):
+                yield minute_start, self.minutes.get(minute)
+            elif self.resolution == RAW and minute_end >= start and minute_start <= end:
+                lo, hi = self._slice(max(start, minute_start), min(end, minute_end))
+                if hi > lo:
+                    yield minute_start, SeriesAggregate.of(self.values[lo:hi], self.breached[lo:hi])
+            elif self.resolution == MINUTE and start <= minute_start <= end:
+                yield minute_start, self.minutes.get(minute)
+
+    def latest(self, start: int, end: int) -> Optional[Tuple[float, bool]]:
+        """Value and breach flag of the latest measurement in the window."""
+        if self._disjoint(start, end):
+            return None
+        if self.resolution == RAW:
+            i = bisect_right(self.timestamps, end) - 1
+            if i >= 0 and self.timestamps[i] >= start:
+                return self.values[i], bool(self.breached[i])
+            return None
+        if self.resolution == MINUTE:
+            for minute in reversed(self._minute_range(start, end)):
+                if self.minutes.count[minute]:
+                    aggregate = self.minutes.get(minute)
+                    return aggregate.mean, aggregate.breaches > 0
+            return None
+        if start <= self.start_us <= end:
+            return self.summary.mean, self.summary.breaches > 0
+        return None
+
+
+# ============================================================================
+# Series
+# ============================================================================
+
+
+class MetricSeries:
+    """Hour partitions of one metric, downsampled and evicted by age."""
+
+    def __init__(
+        self,
+        raw_retention_hours: int = 48,
+        minute_retention_hours: int = 35 * 24,
+        max_age_hours: int = 400 * 24,
+    ) -> None:
+        self.raw_retention_hours = raw_retention_hours
+        self.minute_retention_hours = minute_retention_hours
+        self.max_age_hours = max_age_hours
+        self.partitions: List[SeriesPartition] = []
+        self._hours: List[int] = []
+
+    def __len__(self) -> int:
+        return sum(p.summary.count for p in self.partitions)
+
+    def add(self, timestamp: datetime, value: float, breached: bool) -> None:
+        ts = to_micros(timestamp)
+        hour = ts // HOUR_US
+        if self._hours and self._hours[-1] == hour:
+            self.partitions[-1].add(ts, value, breached)
+            return
+        i = bisect_left(self._hours, hour)
+        if i < len(self._hours) and self._hours[i] == hour:
+            self.partitions[i].add(ts, value, breached)
+            return
+        partition = SeriesPartition(hour)
+        partition.add(ts, value, breached)
+        self._hours.insert(i, hour)
+        self.partitions.insert(i, partition)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Downsample and evict partitions by age relative to the newest one."""
+        newest = self._hours[-1]
+        evict = 0
+        for partition in self.partitions:
+            age = newest - partition.hour
+            if age <= self.raw_retention_hours:
+                break
+            if age > self.max_age_hours:
+                evict += 1
+            elif age > self.minute_retention_hours:
+                if partition.resolution != HOUR:
+                    partition.downsample(HOUR)
+            elif partition.resolution == RAW:
+                partition.downsample(MINUTE)
+        if evict:
+            logger.debug(f"Evicting {evict} SLA partitions older than {self.max_age_hours}h")
+            del self.partitions[:evict]
+            del self._hours[:evict]
+
+    def _overlapping(self, start: int, end: int) -> List[SeriesPartition]:
+        lo = bisect_left(self._hours, start // HOUR_US)
+        hi = bisect_right(self._hours, end // HOUR_US)
+        return self.partitions[lo:hi]
+
+    def aggregate(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> SeriesAggregate:
+        """
+        Aggregate of the measurements with start <= timestamp <= end.
+
+        Args:
+            start: Window start (inclusive, unbounded if None)
+            end: Window end (inclusive, unbounded if None)
+
+        Returns:
+            SeriesAggregate for the window
+        """
+        lo, hi = _window(start, end)
+        result = SeriesAggregate()
+        for partition in self._overlapping(lo, hi):
+            result.merge(partition.aggregate(lo, hi))
+        return result
+
+    def daily(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, SeriesAggregate]:
+        """Aggregates per calendar day (ISO date keys, ascending) over a window."""
+        lo, hi = _window(start, end)
+        days: Dict[int, SeriesAggregate] = {}
+        for partition in self._overlapping(lo, hi):
+            part = partition.aggregate(lo, hi)
+            if part.count:
+                days.setdefault(partition.hour // 24, SeriesAggregate()).merge(part)
+        return {
+            (EPOCH + timedelta(days=day)).date().isoformat(): aggregate
+            for day, aggregate in sorted(days.items())
+        }
+
+    def percentiles(
+        self,
+        quantiles: Iterable[float],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[float]:
+        """
+        Values at int(count * q) in ascending order, for each quantile q.
+
+        Args:
+            quantiles: Fractions in [0, 1)
+            start: Window start (inclusive, unbounded if None)
+            end: Window end (inclusive, unbounded if None)
+
+        Returns:
+            One value per quantile (empty if the window has no measurements)
+        """
+        lo, hi = _window(start, end)
+        raw: List[float] = []
+        weighted: List[Tuple[float, int]] = []
+        for partition in self._overlapping(lo, hi):
+            partition.points(lo, hi, raw, weighted)
+        if not weighted:
+            if not raw:
+                return []
+            raw.sort()
+            return [raw[int(len(raw) * q)] for q in quantiles]
+        weighted.extend((value, 1) for value in raw)
+        weighted.sort()
+        cumulative = list(accumulate(weight for _, weight in weighted))
+        return [weighted[bisect_right(cumulative, int(cumulative[-1] * q))][0] for q in quantiles]
+
+    def minute_series(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[Tuple[datetime, SeriesAggregate]]:
+        """Per-minute aggregates over a window (hourly for hour-resolution partitions)."""
+        lo, hi = _window(start, end)
+        return [
+            (from_micros(minute), aggregate)
+            for partition in self._overlapping(lo, hi)
+            for minute, aggregate in partition.minute_series(lo, hi)
+        ]
+
+    def latest(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Optional[Tuple[float, bool]]:
+        """Value and breach flag of the latest measurement in a window, if any."""
+        lo, hi = _window(start, end)
+        for partition in reversed(self._overlapping(lo, hi)):
+            found = partition.latest(lo, hi)
+            if found is not None:
+                return found
+        return None
+
+
+class SLASeries:
+    """One MetricSeries per metric, fed with SLAMeasurement objects."""
+
+    def __init__(
+        self,
+        raw_retention_hours: int = 48,
+        minute_retention_hours: int = 35 * 24,
+        max_age_hours: int = 400 * 24,
+    ) -> None:
+        self.raw_retention_hours = raw_retention_hours
+        self.minute_retention_hours = minute_retention_hours
+        self.max_age_hours = max_age_hours
+        self.metrics: Dict[str, MetricSeries] = {}
+
+    def add(self, measurement: Any) -> None:
+        """Add an SLAMeasurement to its metric's series."""
+        self.series(measurement.metric).add(
+            measurement.timestamp, measurement.value, not measurement.is_within_target
+        )
+
+    def series(self, metric: Any) -> MetricSeries:
+        key = getattr(metric, "value", metric)
+        series = self.metrics.get(key)
+        if series is None:
+            series = self.metrics[key] = MetricSeries(
+                self.raw_retention_hours, self.minute_retention_hours, self.max_age_hours
+            )
+        return series
+
+
+class MeasurementLog(list):
+    """
+    The most recent SLA measurements; appending also feeds the series.
+
+    Only append() and extend() feed the series. Once more than
+    max_measurements are held, the oldest are dropped from memory (they
+    remain in the series).
+    """
+
+    def __init__(self, series: SLASeries, max_measurements: int = 10000) -> None:
+        super().__init__()
+        self.series = series
+        self.max_measurements = max_measurements
+
+    def append(self, measurement: Any) -> None:
+        self.series.add(measurement)
+        super().append(measurement)
+        if len(self) > self.max_measurements:
+            # Trim in chunks so appends stay amortized O(1)
+            del self[: max(len(self) - self.max_measurements, self.max_measurements // 10)]
+
+    def extend(self, measurements: Iterable[Any]) -> None:
+        for measurement in measurements:
+            self.append(measurement)
@@ -0,0 +1,428 @@
+"""
+PLAT-006: Incremental usage rollups for the cost dashboard.
+
+Every usage record is added once to an hour bucket, a day bucket and a
+lifetime bucket. Each bucket keeps totals (tokens, cost, records) overall and
+per user, department, model and category. A query over any window sums the
+day buckets fully inside it, the hour buckets at either end and, only when
+a window boundary splits an hour that has records on both sides, that
+hour's raw records read back from the store.
+
+Hour and day buckets, and the rows of the in-memory store, are kept for
+retention_days behind the newest record and evicted after that; windows
+reaching further back only see what is retained. The lifetime bucket keeps
+totals for every record but no per-user query IDs or per-department users.
+
+Raw records go to an append-only UsageStore as compact tuples: in memory by
+default, or one JSON Lines file per day with JsonlUsageStore. The service's
+usage_records list only holds the most recent records.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# (timestamp, user_id, department, category, tokens, cost, model_name, query_id, record_id)
+UsageRow = Tuple[datetime, str, str, str, int, float, str, Optional[str], str]
+
+DIMENSIONS = ("user", "department", "model", "category")
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+
+def to_row(record: Any) -> UsageRow:
+    """Convert a UsageRecord to its compact row form."""
+    return (
+        record.timestamp,
+        record.user_id,
+        record.department,
+        record.category.value,
+        record.tokens_used,
+        record.estimated_cost,
+        record.model_name,
+        record.query_id,
+        str(record.record_id),
+    )
+
+
+def floor_hour(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(ts: datetime) -> datetime:
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# ============================================================================
+# Raw record stores
+# ============================================================================
+
+
+class UsageStore:
+    """Append-only store of raw usage rows, readable by hour."""
+
+    def append(self, row: UsageRow) -> None:
+        raise NotImplementedError
+
+    def read_hour(self, hour: datetime) -> List[UsageRow]:
+        """Rows whose timestamp falls in the hour starting at `hour`, in append order."""
+        raise NotImplementedError
+
+    def purge_before(self, cutoff: datetime) -> int:
+        """Drop rows older than cutoff from memory; returns how many were dropped."""
+        return 0
+
+
+class InMemoryUsageStore(UsageStore):
+    """Rows kept as tuples, grouped by hour, until the rollups purge them."""
+
+    def __init__(self) -> None:
+        self._hours: Dict[datetime, List[UsageRow]] = {}
+
+    def append(self, row: UsageRow) -> None:
+        self._hours.setdefault(floor_hour(row[0]), []).append(row)
+
+    def read_hour(self, hour: datetime) -> List[UsageRow]:
+        return list(self._hours.get(hour, ()))
+
+    def purge_before(self, cutoff: datetime) -> int:
+        dropped = 0
+        for hour in [hour for hour in self._hours if hour < cutoff]:
+            dropped += len(self._hours.pop(hour))
+        return dropped
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._hours.values())
+
+
+class JsonlUsageStore(UsageStore):
+    """
+    Rows appended to one JSON Lines file per day (usage-YYYYMMDD.jsonl).
+
+    Nothing is held in memory, so purges keep the files; rotate them externally.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, ts: datetime) -> Path:
+        return self.directory / f"usage-{ts:%Y%m%d}.jsonl"
+
+    def append(self, row: UsageRow) -> None:
+        with open(self._path(row[0]), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps([row[0].isoformat(), *row[1:]]))
+            handle.write("\n")
+
+    def read_hour(self, hour: datetime) -> List[UsageRow]:
+        path = self._path(hour)
+        if not path.exists():
+            return []
+        rows = []
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                values = json.loads(line)
+                ts = datetime.fromisoformat(values[0])
+                if floor_hour(ts) == hour:
+                    rows.append((ts, *values[1:]))
+        return rows
+
+
+# ============================================================================
+# Rollups
+# ============================================================================
+
+
+@dataclass
+class UsageRollup:
+    """Totals for one key (a user, department, model or category) in a bucket."""
+
+    tokens: int = 0
+    cost: float = 0.0
+    count: int = 0
+    by_category: Dict[str, float] = field(default_factory=dict)  # cost per category
+    query_ids: Optional[Set[str]] = None  # kept for users
+    users: Optional[Set[str]] = None  # kept for departments
+
+    def add(self, row: UsageRow) -> None:
+        self.tokens += row[4]
+        self.cost += row[5]
+        self.count += 1
+        self.by_category[row[3]] = self.by_category.get(row[3], 0.0) + row[5]
+        if self.query_ids is not None and row[7]:
+            self.query_ids.add(row[7])
+        if self.users is not None:
+            self.users.add(row[1])
+
+    def merge(self, other: "UsageRollup", detail: bool = True) -> None:
+        """Add another rollup's totals; with detail, also its category costs and ID sets."""
+        self.tokens += other.tokens
+        self.cost += other.cost
+        self.count += other.count
+        if not detail:
+            return
+        for category, cost in other.by_category.items():
+            self.by_category[category] = self.by_category.get(category, 0.0) + cost
+        if other.query_ids:
+            if self.query_ids is None:
+                self.query_ids = set()
+            self.query_ids |= other.query_ids
+        if other.users:
+            if self.users is None:
+                self.users = set()
+            self.users |= other.users
+
+
+@dataclass
+class UsageBucket:
+    """Rollups for the records of one time bucket; without detail, no ID sets are kept."""
+
+    total: UsageRollup = field(default_factory=UsageRollup)
+    by_user: Dict[str, UsageRollup] = field(default_factory=dict)
+    by_department: Dict[str, UsageRollup] = field(default_factory=dict)
+    by_model: Dict[str, UsageRollup] = field(default_factory=dict)
+    by_category: Dict[str, UsageRollup] = field(default_factory=dict)
+    first_ts: Optional[datetime] = None
+    last_ts: Optional[datetime] = None
+    detail: bool = True
+
+    def add(self, row: UsageRow) -> None:
+        ts = row[0]
+        if self.first_ts is None or ts < self.first_ts:
+            self.first_ts = ts
+        if self.last_ts is None or ts > self.last_ts:
+            self.last_ts = ts
+        self.total.add(row)
+        user = self.by_user.get(row[1])
+        if user is None:
+            user = self.by_user[row[1]] = UsageRollup(query_ids=set() if self.detail else None)
+        user.add(row)
+        department = self.by_department.get(row[2])
+        if department is None:
+            department = self.by_department[row[2]] = UsageRollup(
+                users=set() if self.detail else None
+            )
+        department.add(row)
+        for rollups, key in ((self.by_model, row[6]), (self.by_category, row[3])):
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = UsageRollup()
+            rollup.add(row)
+
+    def merge(self, other: "UsageBucket") -> None:
+        """Add another bucket; per-key rollups get totals only (see UsageRollup.merge)."""
+        if other.first_ts is None:
+            return
+        if self.first_ts is None or other.first_ts < self.first_ts:
+            self.first_ts = other.first_ts
+        if self.last_ts is None or other.last_ts > self.last_ts:
+            self.last_ts = other.last_ts
+        self.total.merge(other.total)
+        for name in DIMENSIONS:
+            mine = self.dimension(name)
+            for key, part in other.dimension(name).items():
+                merged = mine.get(key)
+                if merged is None:
+                    merged = mine[key] = UsageRollup()
+                merged.merge(part, detail=False)
+
+    def dimension(self, name: str) -> Dict[str, UsageRollup]:
+        return getattr(self, f"by_{name}")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[UsageRow]) -> "UsageBucket":
+        bucket = cls()
+        for row in rows:
+            bucket.add(row)
+        return bucket
+
+
+class UsageRollups:
+    """Hour and day buckets over the retained records, and lifetime totals over all."""
+
+    def __init__(
+        self, store: Optional[UsageStore] = None, retention_days: Optional[int] = 90
+    ) -> None:
+        """
+        Initialize rollups.
+
+        Args:
+            store: Raw row store (in-memory if None)
+            retention_days: Days of hour and day buckets (and in-memory rows)
+                kept behind the newest record; None keeps everything
+        """
+        self.store = store if store is not None else InMemoryUsageStore()
+        self.retention = None if retention_days is None else timedelta(days=retention_days)
+        self.hours: Dict[datetime, UsageBucket] = {}
+        self.days: Dict[datetime, UsageBucket] = {}
+        self.lifetime = UsageBucket(detail=False)
+        self._newest_day: Optional[datetime] = None
+
+    def add(self, record: Any) -> None:
+        """Add a UsageRecord to the store and its buckets."""
+        row = to_row(record)
+        self.store.append(row)
+        hour = floor_hour(row[0])
+        bucket = self.hours.get(hour)
+        if bucket is None:
+            bucket = self.hours[hour] = UsageBucket()
+        bucket.add(row)
+        day = floor_day(row[0])
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = UsageBucket()
+        bucket.add(row)
+        self.lifetime.add(row)
+        if self._newest_day is None or day > self._newest_day:
+            self._newest_day = day
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop buckets and stored rows older than the retention period (once per new day)."""
+        if self.retention is None:
+            return
+        cutoff = self._newest_day - self.retention
+        for buckets in (self.hours, self.days):
+            for key in [key for key in buckets if key < cutoff]:
+                del buckets[key]
+        dropped = self.store.purge_before(cutoff)
+        if dropped:
+            logger.debug(f"Evicted {dropped} usage rows before {cutoff:%Y-%m-%d}")
+
+    def buckets(self, start: datetime, end: datetime) -> List[UsageBucket]:
+        """
+        Buckets exactly covering the records with start <= timestamp <= end.
+
+        Args:
+            start: Window start (inclusive)
+            end: Window end (inclusive)
+
+        Returns:
+            Day and hour buckets inside the window, plus buckets built from
+            raw rows for boundary hours the window splits
+        """
+        if end < start:
+            return []
+        first_hour, last_hour = floor_hour(start), floor_hour(end)
+        if first_hour == last_hour:
+            return self._edge(first_hour, start, end)
+
+        covered = self._edge(first_hour, start, end)
+        inner_start, inner_end = first_hour + HOUR, last_hour
+        first_day, last_day = floor_day(inner_start), floor_day(inner_end)
+        if first_day == inner_start:
+            day_start = first_day
+        else:
+            day_start = first_day + DAY
+        if day_start < last_day:
+            covered += self._range(self.hours, inner_start, day_start, HOUR)
+            covered += self._range(self.days, day_start, last_day, DAY)
+            covered += self._range(self.hours, last_day, inner_end, HOUR)
+        else:
+            covered += self._range(self.hours, inner_start, inner_end, HOUR)
+        covered += self._edge(last_hour, start, end)
+        return covered
+
+    def rollup(
+        self,
+        start: datetime,
+        end: datetime,
+        dimension: Optional[str] = None,
+        key: Optional[str] = None,
+    ) -> UsageRollup:
+        """
+        Totals over a window, overall or for one user/department/model/category.
+
+        Args:
+            start: Window start (inclusive)
+            end: Window end (inclusive)
+            dimension: "user", "department", "model" or "category"
+            key: Value of the dimension to total
+
+        Returns:
+            Merged UsageRollup
+        """
+        result = UsageRollup()
+        for bucket in self.buckets(start, end):
+            part = bucket.total if dimension is None else bucket.dimension(dimension).get(key)
+            if part is not None:
+                result.merge(part)
+        return result
+
+    def breakdown(self, start: datetime, end: datetime, dimension: str) -> Dict[str, UsageRollup]:
+        """Tokens, cost and record count over a window for every key of a dimension."""
+        result: Dict[str, UsageRollup] = {}
+        for bucket in self.buckets(start, end):
+            for key, part in bucket.dimension(dimension).items():
+                merged = result.get(key)
+                if merged is None:
+                    merged = result[key] = UsageRollup()
+                merged.merge(part, detail=False)
+        return result
+
+    def summarize(self, start: datetime, end: datetime) -> UsageBucket:
+        """All rollups over a window merged into one bucket (per-key totals only)."""
+        result = UsageBucket()
+        for bucket in self.buckets(start, end):
+            result.merge(bucket)
+        return result
+
+    def _edge(self, hour: datetime, start: datetime, end: datetime) -> List[UsageBucket]:
+        """An hour at a window boundary; raw rows are read only if the window splits it."""
+        bucket = self.hours.get(hour)
+        if bucket is None:
+            return []
+        if start <= bucket.first_ts and bucket.last_ts <= end:
+            return [bucket]
+        if bucket.last_ts < start or bucket.first_ts > end:
+            return []
+        rows = [row for row in self.store.read_hour(hour) if start <= row[0] <= end]
+        return [UsageBucket.from_rows(rows)] if rows else []
+
+    @staticmethod
+    def _range(
+        buckets: Dict[datetime, UsageBucket], start: datetime, end: datetime, step: timedelta
+    ) -> List[UsageBucket]:
+        """Buckets with start <= key < end."""
+        if (end - start) / step > len(buckets):
+            return [bucket for key, bucket in buckets.items() if start <= key < end]
+        found = []
+        key = start
+        while key < end:
+            bucket = buckets.get(key)
+            if bucket is not None:
+                found.append(bucket)
+            key += step
+        return found
+
+
+class UsageRecordLog(list):
+    """
+    The most recent usage records; appending also updates the rollups.
+
+    Only append() and extend() feed the rollups. Once more than max_records
+    records are held, the oldest are dropped from memory (they remain in the
+    rollups and the store).
+    """
+
+    def __init__(self, rollups: UsageRollups, max_records: int = 10000) -> None:
+        super().__init__()
+        self.rollups = rollups
+        self.max_records = max_records
+
+    def append(self, record: Any) -> None:
+        self.rollups.add(record)
+        super().append(record)
+        if len(self) > self.max_records:
+            # Trim in chunks so appends stay amortized O(1)
+            del self[: max(len(self) - self.max_records, self.max_records // 10)]
+
+    def extend(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.append(record)
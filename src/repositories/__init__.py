@@ -1,7 +1,11 @@
 """Repository package for database persistence layer."""
 
 from src.repositories.base_repository import BaseRepository
-from src.repositories.workflow_repository import WorkflowRepository, WorkflowStepRepository
+from src.repositories.workflow_repository import (
+    WorkflowInstanceRepository,
+    WorkflowRepository,
+    WorkflowStepRepository,
+)
 from src.repositories.notification_repository import (
     NotificationRepository,
     NotificationPreferenceRepository,
@@ -16,6 +20,8 @@ from src.repositories.document_repository import (
     GeneratedDocumentRepository,
 )
 from src.repositories.bias_repository import BiasRepository, BiasAuditReportRepository
+from src.repositories.hris_mirror_repository import HRISMirrorRepository
+from src.repositories.audit_log_repository import AuditLogRepository
 from src.repositories.dashboard_repository import (
     DashboardRepository,
     DashboardWidgetRepository,
@@ -26,6 +32,7 @@ __all__ = [
     "BaseRepository",
     "WorkflowRepository",
     "WorkflowStepRepository",
+    "WorkflowInstanceRepository",
     "NotificationRepository",
     "NotificationPreferenceRepository",
     "GDPRRepository",
@@ -35,7 +42,9 @@ __all__ = [
     "GeneratedDocumentRepository",
     "BiasRepository",
     "BiasAuditReportRepository",
+    "HRISMirrorRepository",
     "DashboardRepository",
     "DashboardWidgetRepository",
     "MetricSnapshotRepository",
+    "AuditLogRepository",
 ]
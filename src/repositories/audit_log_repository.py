@@ -0,0 +1,200 @@
+"""Audit log repository for indexed, keyset-paginated audit queries."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, delete, func, insert, or_, select
+
+from src.core.database import AuditLog
+from src.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+# (timestamp, id) of a row; pages continue strictly after/before it
+AuditKey = Tuple[datetime, int]
+
+ROW_COLUMNS = (
+    AuditLog.id,
+    AuditLog.timestamp,
+    AuditLog.actor,
+    AuditLog.action,
+    AuditLog.resource_type,
+    AuditLog.resource_id,
+    AuditLog.status,
+    AuditLog.details,
+    AuditLog.ip_address,
+    AuditLog.entry_id,
+)
+
+
+class AuditLogRepository(BaseRepository[AuditLog]):
+    """
+    Durable store for audit log rows.
+
+    Filters are equality matches on actor, action, resource_type,
+    resource_id and status; each is covered by a (column, timestamp, id)
+    index, so pages are read by keyset rather than OFFSET. Rows are passed
+    and returned as plain dicts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize audit log repository."""
+        super().__init__(AuditLog)
+
+    def append(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Insert audit rows in one transaction.
+
+        Args:
+            rows: Column values for audit_logs (without id)
+        """
+        if not rows:
+            return
+        with self._get_session() as session:
+            session.execute(insert(AuditLog), list(rows))
+
+    def page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after: Optional[AuditKey] = None,
+        limit: int = 50,
+        offset: int = 0,
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Load one page of rows ordered by (timestamp, id).
+
+        Args:
+            filters: Column:value equality filters
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            after: Key of the last row of the previous page
+            limit: Maximum rows to return
+            offset: Rows to skip (only used without a key)
+            descending: Newest first
+
+        Returns:
+            Row dicts
+        """
+        stmt = self._filtered(select(*ROW_COLUMNS), filters, start, end)
+        if after is not None:
+            ts, row_id = after
+            if descending:
+                beyond, same_ts = AuditLog.timestamp < ts, AuditLog.id < row_id
+            else:
+                beyond, same_ts = AuditLog.timestamp > ts, AuditLog.id > row_id
+            stmt = stmt.where(or_(beyond, and_(AuditLog.timestamp == ts, same_ts)))
+        elif offset:
+            stmt = stmt.offset(offset)
+        if descending:
+            stmt = stmt.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        else:
+            stmt = stmt.order_by(AuditLog.timestamp, AuditLog.id)
+        with self._get_session() as session:
+            return [dict(row._mapping) for row in session.execute(stmt.limit(limit))]
+
+    def stream(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield matching rows oldest first, one keyset batch per session.
+
+        Args:
+            filters: Column:value equality filters
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+            batch_size: Rows loaded per query
+
+        Yields:
+            Row dicts
+        """
+        after: Optional[AuditKey] = None
+        while True:
+            rows = self.page(filters, start, end, after, batch_size, descending=False)
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1]["timestamp"], rows[-1]["id"])
+
+    def count_matching(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        """Count rows matching filters within a time range."""
+        stmt = self._filtered(select(func.count(AuditLog.id)), filters, start, end)
+        with self._get_session() as session:
+            return session.execute(stmt).scalar_one()
+
+    def count_by(
+        self,
+        columns: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Dict[Tuple[Any, ...], int]:
+        """
+        Count matching rows grouped by columns.
+
+        Args:
+            columns: Column names to group by
+            filters: Column:value equality filters
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (inclusive)
+
+        Returns:
+            Mapping of column value tuples to row counts
+        """
+        group = [getattr(AuditLog, column) for column in columns]
+        stmt = self._filtered(select(*group, func.count(AuditLog.id)), filters, start, end)
+        with self._get_session() as session:
+            return {tuple(row[:-1]): row[-1] for row in session.execute(stmt.group_by(*group))}
+
+    def delete_before(self, cutoff: datetime, batch_size: int = 5000) -> int:
+        """
+        Delete rows older than cutoff, oldest first, one transaction per batch.
+
+        Args:
+            cutoff: Rows with timestamp < cutoff are deleted
+            batch_size: Rows deleted per transaction
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+        while True:
+            with self._get_session() as session:
+                ids = (
+                    select(AuditLog.id)
+                    .where(AuditLog.timestamp < cutoff)
+                    .order_by(AuditLog.timestamp)
+                    .limit(batch_size)
+                    .scalar_subquery()
+                )
+                count = session.execute(delete(AuditLog).where(AuditLog.id.in_(ids))).rowcount
+            deleted += count
+            if count < batch_size:
+                break
+        if deleted:
+            logger.info(f"Deleted {deleted} audit log rows older than {cutoff.isoformat()}")
+        return deleted
+
+    @staticmethod
+    def _filtered(stmt, filters, start, end):
+        for column, value in (filters or {}).items():
+            stmt = stmt.where(getattr(AuditLog, column) == value)
+        if start is not None:
+            stmt = stmt.where(AuditLog.timestamp >= start)
+        if end is not None:
+            stmt = stmt.where(AuditLog.timestamp <= end)
+        return stmt
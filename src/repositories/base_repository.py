@@ -10,6 +10,7 @@ from typing import Any, Dict, Generic, List, Optional, TypeVar
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.core import database
 from src.core.database import SessionLocal
 
 logger = logging.getLogger(__name__)
@@ -50,10 +51,12 @@ class BaseRepository(ABC, Generic[T]):
         Raises:
             RuntimeError: If database not initialized
         """
-        if SessionLocal is None:
+        # SessionLocal is bound at import; init_db may have run since then
+        session_factory = SessionLocal or database.SessionLocal
+        if session_factory is None:
             raise RuntimeError("Database not initialized. Call init_db() first.")
 
-        session = SessionLocal()
+        session = session_factory()
         try:
             yield session
             session.commit()
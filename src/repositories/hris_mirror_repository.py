@@ -0,0 +1,510 @@
+"""HRIS mirror repository: local read replica of external HRIS data."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, delete, func, or_, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+# Filters answered from indexed columns with exact matches
+_EXACT_FILTERS = ("department", "status", "location", "job_title", "manager_id")
+
+# Max IDs bound into one IN (...) clause on batch reads
+_IN_CHUNK = 500
+
+
+def _chunked(employee_ids: Sequence[str]) -> Iterable[Sequence[str]]:
+    for start in range(0, len(employee_ids), _IN_CHUNK):
+        yield employee_ids[start : start + _IN_CHUNK]
+
+
+class HRISMirrorEmployeeModel(Base):
+    """
+    SQLAlchemy model for mirrored HRIS employees.
+
+    Keeps the serialized connector Employee alongside the columns that
+    searches and org-chart builds filter on.
+
+    Attributes:
+        source: Connector the row was pulled from (e.g., 'bamboohr')
+        employee_id: Employee ID in that connector
+        first_name: First name
+        last_name: Last name
+        email: Email address
+        department: Department name
+        job_title: Job title
+        manager_id: Manager's employee ID
+        status: Employment status value
+        location: Office location
+        payload: Serialized Employee
+        synced_at: When the row was last written by a sync
+    """
+
+    __tablename__ = "hris_mirror_employees"
+    __table_args__ = (
+        Index("ix_hris_mirror_employees_source_department", "source", "department"),
+        Index("ix_hris_mirror_employees_source_manager", "source", "manager_id"),
+    )
+
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    employee_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    department: Mapped[str] = mapped_column(String(255), nullable=False)
+    job_title: Mapped[str] = mapped_column(String(255), nullable=False)
+    manager_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    location: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    synced_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<HRISMirrorEmployeeModel(source={self.source}, id={self.employee_id})>"
+
+
+class HRISMirrorRecordModel(Base):
+    """
+    SQLAlchemy model for mirrored per-employee HRIS collections.
+
+    One row per (source, employee, kind) holds the full serialized list,
+    e.g. all leave balances or all benefit plans of an employee.
+
+    Attributes:
+        source: Connector the row was pulled from
+        employee_id: Employee ID in that connector
+        kind: Collection kind ('leave_balances' or 'benefits')
+        payload: Serialized list of models
+        synced_at: When the row was last written by a sync
+    """
+
+    __tablename__ = "hris_mirror_records"
+
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    employee_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(50), primary_key=True)
+    payload: Mapped[list] = mapped_column(JSON, nullable=False)
+    synced_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<HRISMirrorRecordModel(source={self.source}, id={self.employee_id}, "
+            f"kind={self.kind})>"
+        )
+
+
+class HRISSyncStateModel(Base):
+    """
+    SQLAlchemy model for per-source sync bookkeeping.
+
+    Attributes:
+        source: Connector name
+        cursor: Opaque delta cursor returned by the connector (NULL = full sync next)
+        last_synced_at: When the last successful sync finished
+        last_full_sync_at: When the last full sync finished
+        employee_count: Employees in the mirror after the last sync
+        last_error: Error message of the last failed sync (NULL if it succeeded)
+    """
+
+    __tablename__ = "hris_sync_state"
+
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    cursor: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_full_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    employee_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<HRISSyncStateModel(source={self.source}, last_synced_at={self.last_synced_at})>"
+
+
+class HRISMirrorRepository(BaseRepository[HRISMirrorEmployeeModel]):
+    """
+    Repository for the HRIS read replica.
+
+    Employees are passed in and returned as plain dicts (serialized connector
+    models) so this module stays free of connector imports.
+    """
+
+    def __init__(self) -> None:
+        """Initialize HRIS mirror repository."""
+        super().__init__(HRISMirrorEmployeeModel)
+
+    # ----- writes -----
+
+    def upsert_employees(
+        self, source: str, employees: Sequence[Dict[str, Any]], synced_at: datetime
+    ) -> int:
+        """
+        Insert or update mirrored employees in one transaction.
+
+        Args:
+            source: Connector name
+            employees: Serialized Employee dicts (JSON mode)
+            synced_at: Sync timestamp stored on every row
+
+        Returns:
+            Number of rows written
+        """
+        if not employees:
+            return 0
+        rows = [self._employee_row(source, emp, synced_at) for emp in employees]
+        with self._get_session() as session:
+            existing = self._existing_keys(
+                session,
+                HRISMirrorEmployeeModel,
+                source,
+                [r["employee_id"] for r in rows],
+            )
+            new_rows = [r for r in rows if r["employee_id"] not in existing]
+            changed_rows = [r for r in rows if r["employee_id"] in existing]
+            if new_rows:
+                session.execute(HRISMirrorEmployeeModel.__table__.insert(), new_rows)
+            if changed_rows:
+                session.execute(update(HRISMirrorEmployeeModel), changed_rows)
+        return len(rows)
+
+    def delete_employees(self, source: str, employee_ids: Iterable[str]) -> int:
+        """
+        Remove employees and their collections from the mirror.
+
+        Args:
+            source: Connector name
+            employee_ids: Employee IDs to remove
+
+        Returns:
+            Number of employee rows deleted
+        """
+        ids = list(employee_ids)
+        if not ids:
+            return 0
+        with self._get_session() as session:
+            session.execute(
+                delete(HRISMirrorRecordModel).where(
+                    HRISMirrorRecordModel.source == source,
+                    HRISMirrorRecordModel.employee_id.in_(ids),
+                )
+            )
+            result = session.execute(
+                delete(HRISMirrorEmployeeModel).where(
+                    HRISMirrorEmployeeModel.source == source,
+                    HRISMirrorEmployeeModel.employee_id.in_(ids),
+                )
+            )
+            return result.rowcount or 0
+
+    def replace_records(
+        self,
+        source: str,
+        kind: str,
+        records: Dict[str, List[Dict[str, Any]]],
+        synced_at: datetime,
+    ) -> int:
+        """
+        Store per-employee collections, replacing previous values.
+
+        Args:
+            source: Connector name
+            kind: Collection kind ('leave_balances' or 'benefits')
+            records: Mapping of employee ID to serialized model list
+            synced_at: Sync timestamp stored on every row
+
+        Returns:
+            Number of rows written
+        """
+        if not records:
+            return 0
+        rows = [
+            {
+                "source": source,
+                "employee_id": employee_id,
+                "kind": kind,
+                "payload": payload,
+                "synced_at": synced_at,
+            }
+            for employee_id, payload in records.items()
+        ]
+        with self._get_session() as session:
+            session.execute(
+                delete(HRISMirrorRecordModel).where(
+                    HRISMirrorRecordModel.source == source,
+                    HRISMirrorRecordModel.kind == kind,
+                    HRISMirrorRecordModel.employee_id.in_(list(records)),
+                )
+            )
+            session.execute(HRISMirrorRecordModel.__table__.insert(), rows)
+        return len(rows)
+
+    def save_sync_state(
+        self,
+        source: str,
+        cursor: Optional[str],
+        synced_at: Optional[datetime],
+        full: bool = False,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the outcome of a sync run.
+
+        Args:
+            source: Connector name
+            cursor: Delta cursor to resume from (ignored when error is set)
+            synced_at: Completion time of a successful sync
+            full: Whether the run was a full sync
+            error: Error message if the run failed
+        """
+        with self._get_session() as session:
+            state = session.get(HRISSyncStateModel, source)
+            if state is None:
+                state = HRISSyncStateModel(source=source, employee_count=0)
+                session.add(state)
+            state.last_error = error[:1000] if error else None
+            if error:
+                return
+            state.cursor = cursor
+            state.last_synced_at = synced_at
+            if full:
+                state.last_full_sync_at = synced_at
+            session.flush()
+            state.employee_count = self._count_employees(session, source)
+
+    # ----- reads -----
+
+    def get_sync_state(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Get sync bookkeeping for a source.
+
+        Args:
+            source: Connector name
+
+        Returns:
+            Dict of HRISSyncStateModel columns, or None if never synced
+        """
+        with self._get_session() as session:
+            state = session.get(HRISSyncStateModel, source)
+            if state is None:
+                return None
+            return {
+                "source": state.source,
+                "cursor": state.cursor,
+                "last_synced_at": state.last_synced_at,
+                "last_full_sync_at": state.last_full_sync_at,
+                "employee_count": state.employee_count,
+                "last_error": state.last_error,
+            }
+
+    def get_employee(self, source: str, employee_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one mirrored employee.
+
+        Args:
+            source: Connector name
+            employee_id: Employee ID
+
+        Returns:
+            Serialized Employee or None if not mirrored
+        """
+        with self._get_session() as session:
+            return session.execute(
+                select(HRISMirrorEmployeeModel.payload).where(
+                    HRISMirrorEmployeeModel.source == source,
+                    HRISMirrorEmployeeModel.employee_id == employee_id,
+                )
+            ).scalar_one_or_none()
+
+    def get_employees(self, source: str, employee_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several mirrored employees.
+
+        Args:
+            source: Connector name
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> serialized Employee for the mirrored IDs
+        """
+        model = HRISMirrorEmployeeModel
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._get_session() as session:
+            for chunk in _chunked(employee_ids):
+                rows = session.execute(
+                    select(model.employee_id, model.payload).where(
+                        model.source == source, model.employee_id.in_(chunk)
+                    )
+                )
+                found.update({employee_id: payload for employee_id, payload in rows})
+        return found
+
+    def list_employee_ids(self, source: str) -> List[str]:
+        """
+        List every mirrored employee ID of a source.
+
+        Args:
+            source: Connector name
+
+        Returns:
+            Employee IDs
+        """
+        with self._get_session() as session:
+            return list(
+                session.execute(
+                    select(HRISMirrorEmployeeModel.employee_id).where(
+                        HRISMirrorEmployeeModel.source == source
+                    )
+                ).scalars()
+            )
+
+    def search_employees(
+        self, source: str, filters: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search mirrored employees.
+
+        department, status, location, job_title and manager_id match exactly;
+        name and email match case-insensitive substrings. Other keys are ignored.
+
+        Args:
+            source: Connector name
+            filters: Filter criteria
+            limit: Optional maximum number of results
+
+        Returns:
+            Serialized Employees ordered by last name, first name
+        """
+        model = HRISMirrorEmployeeModel
+        stmt = select(model.payload).where(model.source == source)
+        for key in _EXACT_FILTERS:
+            if key in filters:
+                value = filters[key]
+                stmt = stmt.where(getattr(model, key) == getattr(value, "value", value))
+        if "name" in filters:
+            term = f"%{filters['name']}%"
+            stmt = stmt.where(or_(model.first_name.ilike(term), model.last_name.ilike(term)))
+        if "email" in filters:
+            stmt = stmt.where(model.email.ilike(f"%{filters['email']}%"))
+        stmt = stmt.order_by(model.last_name, model.first_name)
+        if limit:
+            stmt = stmt.limit(limit)
+        with self._get_session() as session:
+            return list(session.execute(stmt).scalars())
+
+    def get_org_rows(self, source: str, department: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get the columns needed to build an org chart.
+
+        Args:
+            source: Connector name
+            department: Optional exact department filter
+
+        Returns:
+            Dicts with employee_id, first_name, last_name, job_title,
+            department and manager_id
+        """
+        model = HRISMirrorEmployeeModel
+        stmt = select(
+            model.employee_id,
+            model.first_name,
+            model.last_name,
+            model.job_title,
+            model.department,
+            model.manager_id,
+        ).where(model.source == source)
+        if department:
+            stmt = stmt.where(model.department == department)
+        with self._get_session() as session:
+            return [dict(row._mapping) for row in session.execute(stmt)]
+
+    def get_records(self, source: str, kind: str, employee_id: str) -> Optional[List[Dict]]:
+        """
+        Get a mirrored per-employee collection.
+
+        Args:
+            source: Connector name
+            kind: Collection kind
+            employee_id: Employee ID
+
+        Returns:
+            Serialized model list, or None if not mirrored
+        """
+        with self._get_session() as session:
+            return session.execute(
+                select(HRISMirrorRecordModel.payload).where(
+                    HRISMirrorRecordModel.source == source,
+                    HRISMirrorRecordModel.kind == kind,
+                    HRISMirrorRecordModel.employee_id == employee_id,
+                )
+            ).scalar_one_or_none()
+
+    def get_records_bulk(
+        self, source: str, kind: str, employee_ids: List[str]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get a mirrored per-employee collection for several employees.
+
+        Args:
+            source: Connector name
+            kind: Collection kind
+            employee_ids: Employee IDs
+
+        Returns:
+            Dict of employee ID -> serialized model list for the mirrored IDs
+        """
+        model = HRISMirrorRecordModel
+        found: Dict[str, List[Dict]] = {}
+        with self._get_session() as session:
+            for chunk in _chunked(employee_ids):
+                rows = session.execute(
+                    select(model.employee_id, model.payload).where(
+                        model.source == source,
+                        model.kind == kind,
+                        model.employee_id.in_(chunk),
+                    )
+                )
+                found.update({employee_id: payload for employee_id, payload in rows})
+        return found
+
+    # ----- internals -----
+
+    @staticmethod
+    def _employee_row(source: str, emp: Dict[str, Any], synced_at: datetime) -> Dict[str, Any]:
+        return {
+            "source": source,
+            "employee_id": str(emp["id"]),
+            "first_name": emp.get("first_name") or "",
+            "last_name": emp.get("last_name") or "",
+            "email": emp.get("email") or "",
+            "department": emp.get("department") or "",
+            "job_title": emp.get("job_title") or "",
+            "manager_id": emp.get("manager_id"),
+            "status": emp.get("status") or "",
+            "location": emp.get("location") or "",
+            "payload": emp,
+            "synced_at": synced_at,
+        }
+
+    @staticmethod
+    def _existing_keys(session, model, source: str, employee_ids: List[str]) -> set:
+        return set(
+            session.execute(
+                select(model.employee_id).where(
+                    model.source == source, model.employee_id.in_(employee_ids)
+                )
+            ).scalars()
+        )
+
+    @staticmethod
+    def _count_employees(session, source: str) -> int:
+        return session.execute(
+            select(func.count())
+            .select_from(HRISMirrorEmployeeModel)
+            .where(HRISMirrorEmployeeModel.source == source)
+        ).scalar_one()
@@ -5,9 +5,9 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, select
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, or_, select, update
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base, TimestampMixin
@@ -341,3 +341,293 @@ class WorkflowStepRepository(BaseRepository[WorkflowStepModel]):
             List of pending WorkflowStepModel instances
         """
         return self.list({"workflow_id": workflow_id, "status": "pending"})
+
+
+class WorkflowInstanceModel(Base):
+    """
+    SQLAlchemy model for WorkflowEngine instances.
+
+    Stores the full serialized ApprovalWorkflow alongside the denormalized
+    columns the engine queries on. The version column implements optimistic
+    concurrency: every transition must name the version it was derived from.
+
+    Attributes:
+        workflow_id: Engine workflow ID (primary key)
+        entity_type: Type of entity being approved
+        entity_id: ID of entity being approved
+        created_by: User ID of the workflow creator
+        state: Current WorkflowState value
+        current_approver_id: Assigned approver of the current step (NULL = any)
+        escalation_due_at: When the current step auto-escalates (NULL = never)
+        version: Optimistic concurrency counter
+        payload: Serialized ApprovalWorkflow
+        created_at: Creation timestamp
+        updated_at: Last transition timestamp
+    """
+
+    __tablename__ = "workflow_instances"
+    __table_args__ = (
+        Index("ix_workflow_instances_state_approver", "state", "current_approver_id"),
+        Index("ix_workflow_instances_creator_state", "created_by", "state"),
+    )
+
+    workflow_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_by: Mapped[str] = mapped_column(String(255), nullable=False)
+    state: Mapped[str] = mapped_column(String(50), nullable=False)
+    current_approver_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    escalation_due_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, index=True
+    )
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<WorkflowInstanceModel(id={self.workflow_id}, state={self.state}, "
+            f"version={self.version})>"
+        )
+
+
+class WorkflowEventModel(Base):
+    """
+    SQLAlchemy model for WorkflowEngine audit events.
+
+    Attributes:
+        id: Primary key
+        workflow_id: Workflow the event belongs to
+        event_type: Event type (workflow_created, step_approved, ...)
+        actor: User ID that triggered the event
+        details: Event details as JSON
+        created_at: Event timestamp
+    """
+
+    __tablename__ = "workflow_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    workflow_id: Mapped[str] = mapped_column(
+        String(64), ForeignKey("workflow_instances.workflow_id"), nullable=False, index=True
+    )
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    actor: Mapped[str] = mapped_column(String(255), nullable=False)
+    details: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<WorkflowEventModel(workflow_id={self.workflow_id}, type={self.event_type})>"
+
+
+# (payload, version) as loaded from workflow_instances
+WorkflowSnapshot = Tuple[Dict[str, Any], int]
+
+
+class WorkflowInstanceRepository(BaseRepository[WorkflowInstanceModel]):
+    """
+    Durable store backing WorkflowEngine.
+
+    Each transition writes the workflow row and its audit events in a single
+    transaction. Updates are conditional on the caller's expected version, so
+    two workers acting on the same workflow cannot both succeed.
+
+    Rows are passed in as plain dicts produced by the engine, keeping this
+    module free of engine imports.
+    """
+
+    def __init__(self) -> None:
+        """Initialize workflow instance repository."""
+        super().__init__(WorkflowInstanceModel)
+
+    def insert_workflow(self, row: Dict[str, Any], events: Sequence[Dict[str, Any]]) -> int:
+        """
+        Insert a new workflow and its creation events.
+
+        Args:
+            row: Column values for workflow_instances (without version)
+            events: Event rows for workflow_events
+
+        Returns:
+            Initial version number
+        """
+        with self._get_session() as session:
+            session.add(WorkflowInstanceModel(version=1, **row))
+            session.flush()
+            self._add_events(session, events)
+        return 1
+
+    def save_transitions(
+        self, transitions: Iterable[Tuple[Dict[str, Any], int, Sequence[Dict[str, Any]]]]
+    ) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Persist many workflow transitions in one transaction.
+
+        Each transition is applied only if the stored version still equals the
+        expected version. Events of conflicting transitions are not written.
+
+        Args:
+            transitions: (row, expected_version, events) tuples
+
+        Returns:
+            Tuple of ({workflow_id: new_version}, [conflicting workflow_ids])
+        """
+        saved: Dict[str, int] = {}
+        conflicts: List[str] = []
+        with self._get_session() as session:
+            for row, expected_version, events in transitions:
+                workflow_id = row["workflow_id"]
+                values = {k: v for k, v in row.items() if k != "workflow_id"}
+                result = session.execute(
+                    update(WorkflowInstanceModel)
+                    .where(
+                        WorkflowInstanceModel.workflow_id == workflow_id,
+                        WorkflowInstanceModel.version == expected_version,
+                    )
+                    .values(version=expected_version + 1, **values)
+                )
+                if result.rowcount != 1:
+                    conflicts.append(workflow_id)
+                    continue
+                self._add_events(session, events)
+                saved[workflow_id] = expected_version + 1
+        return saved, conflicts
+
+    def load_workflow(self, workflow_id: str) -> Optional[WorkflowSnapshot]:
+        """
+        Load a single workflow snapshot by ID.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            (payload, version) or None if not found
+        """
+        with self._get_session() as session:
+            row = session.execute(
+                select(WorkflowInstanceModel.payload, WorkflowInstanceModel.version).where(
+                    WorkflowInstanceModel.workflow_id == workflow_id
+                )
+            ).first()
+            return (row[0], row[1]) if row else None
+
+    def load_workflows(self, workflow_ids: Sequence[str]) -> Dict[str, WorkflowSnapshot]:
+        """
+        Load many workflow snapshots in one query.
+
+        Args:
+            workflow_ids: Workflow IDs
+
+        Returns:
+            Mapping of workflow_id to (payload, version) for IDs that exist
+        """
+        if not workflow_ids:
+            return {}
+        with self._get_session() as session:
+            rows = session.execute(
+                select(
+                    WorkflowInstanceModel.workflow_id,
+                    WorkflowInstanceModel.payload,
+                    WorkflowInstanceModel.version,
+                ).where(WorkflowInstanceModel.workflow_id.in_(list(workflow_ids)))
+            ).all()
+            return {r[0]: (r[1], r[2]) for r in rows}
+
+    def load_pending_for_approver(self, approver_id: str, state: str) -> List[WorkflowSnapshot]:
+        """
+        Load workflows whose current step is open to the given approver.
+
+        Args:
+            approver_id: User ID of the approver
+            state: State value meaning "pending approval"
+
+        Returns:
+            List of (payload, version) ordered by creation time
+        """
+        stmt = (
+            select(WorkflowInstanceModel.payload, WorkflowInstanceModel.version)
+            .where(
+                WorkflowInstanceModel.state == state,
+                or_(
+                    WorkflowInstanceModel.current_approver_id == approver_id,
+                    WorkflowInstanceModel.current_approver_id.is_(None),
+                ),
+            )
+            .order_by(WorkflowInstanceModel.created_at)
+        )
+        return self._load_snapshots(stmt)
+
+    def load_by_creator(
+        self, created_by: str, state: Optional[str] = None
+    ) -> List[WorkflowSnapshot]:
+        """
+        Load workflows created by a user.
+
+        Args:
+            created_by: Creator user ID
+            state: Optional state filter
+
+        Returns:
+            List of (payload, version) ordered by creation time
+        """
+        stmt = select(WorkflowInstanceModel.payload, WorkflowInstanceModel.version).where(
+            WorkflowInstanceModel.created_by == created_by
+        )
+        if state is not None:
+            stmt = stmt.where(WorkflowInstanceModel.state == state)
+        return self._load_snapshots(stmt.order_by(WorkflowInstanceModel.created_at))
+
+    def load_due_escalations(self, now: datetime, limit: int = 500) -> List[WorkflowSnapshot]:
+        """
+        Load workflows whose escalation deadline has passed.
+
+        Args:
+            now: Current time
+            limit: Maximum workflows to return per sweep
+
+        Returns:
+            List of (payload, version) ordered by due time
+        """
+        stmt = (
+            select(WorkflowInstanceModel.payload, WorkflowInstanceModel.version)
+            .where(WorkflowInstanceModel.escalation_due_at < now)
+            .order_by(WorkflowInstanceModel.escalation_due_at)
+            .limit(limit)
+        )
+        return self._load_snapshots(stmt)
+
+    def load_events(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """
+        Load the audit trail for a workflow.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Event rows in chronological order
+        """
+        with self._get_session() as session:
+            rows = session.execute(
+                select(WorkflowEventModel)
+                .where(WorkflowEventModel.workflow_id == workflow_id)
+                .order_by(WorkflowEventModel.id)
+            ).scalars()
+            return [
+                {
+                    "event_type": r.event_type,
+                    "workflow_id": r.workflow_id,
+                    "actor": r.actor,
+                    "timestamp": r.created_at,
+                    "details": r.details or {},
+                }
+                for r in rows
+            ]
+
+    def _load_snapshots(self, stmt) -> List[WorkflowSnapshot]:
+        with self._get_session() as session:
+            return [(r[0], r[1]) for r in session.execute(stmt).all()]
+
+    @staticmethod
+    def _add_events(session, events: Sequence[Dict[str, Any]]) -> None:
+        if events:
+            session.add_all(WorkflowEventModel(**event) for event in events)
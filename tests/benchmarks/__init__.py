@@ -0,0 +1 @@
+"""Connector benchmarks against recorded vendor responses."""
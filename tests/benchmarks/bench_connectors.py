@@ -0,0 +1,298 @@
+"""
+Connector benchmarks against the replay server.
+
+Runs the hot connector paths against recorded vendor responses under
+concurrency and reports latency percentiles, vendor request counts, retries
+and throughput per scenario, so connector changes can be compared before
+and after without touching a real tenant:
+
+    python -m tests.benchmarks.bench_connectors --concurrency 16 --iterations 200
+    python -m tests.benchmarks.bench_connectors --latency-ms 40 --rate-429 0.05 --json
+
+Scenarios:
+
+- ``workday_search_employees``: paginated directory search (Workday)
+- ``bamboohr_org_chart``: department org chart from the org index (BambooHR)
+- ``bamboohr_bulk_leave_balances``: balances for a batch of employees
+- ``workday_submit_leave``: leave submission (POST)
+- ``payroll_history``: paginated pay-period history (generic payroll API)
+
+The replay server runs in the benchmark process, so absolute latencies under
+high concurrency include GIL contention with the server threads; compare
+runs against each other rather than against production timings.
+"""
+
+import argparse
+import json
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.connectors.bamboohr import BambooHRConnector
+from src.connectors.hris_interface import LeaveRequest, LeaveStatus, LeaveType
+from src.connectors.http_client import VendorHTTPClient
+from src.connectors.payroll_connector import PayrollConfig, PayrollConnector, PayrollProvider
+from src.connectors.workday import WorkdayConnector
+
+from .replay import FaultProfile, ReplayServer
+
+# Employees per bulk balance call
+BULK_BATCH_SIZE = 25
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one scenario."""
+
+    scenario: str
+    operations: int
+    concurrency: int
+    errors: int
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    vendor_requests: int
+    retries: int
+    throughput_ops: float
+
+    def as_row(self) -> str:
+        return (
+            f"{self.scenario:<30} {self.operations:>5} {self.p50_ms:>9.1f} {self.p99_ms:>9.1f} "
+            f"{self.vendor_requests:>8} {self.retries:>7} {self.errors:>6} "
+            f"{self.throughput_ops:>9.1f}"
+        )
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples: Measurements
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The smallest sample with at least pct% of samples at or below it
+        (0.0 for no samples)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def make_http_client(concurrency: int) -> VendorHTTPClient:
+    """HTTP client with short backoffs so injected faults don't dominate timings."""
+    return VendorHTTPClient(
+        pool_size=max(concurrency, 1), max_retries=3, backoff_base=0.01, backoff_max=0.1
+    )
+
+
+def _leave_request(employee_id: str) -> LeaveRequest:
+    return LeaveRequest(
+        employee_id=employee_id,
+        leave_type=LeaveType.PTO,
+        start_date=datetime(2026, 4, 6),
+        end_date=datetime(2026, 4, 10),
+        status=LeaveStatus.PENDING,
+        reason="Benchmark",
+        submitted_at=datetime(2026, 3, 2),
+    )
+
+
+def build_scenarios(
+    server: ReplayServer, http_client: VendorHTTPClient
+) -> Dict[str, Callable[[int], Any]]:
+    """
+    Build scenario operations against a running replay server.
+
+    Each operation takes the iteration number, so operations can vary the
+    employee they touch.
+
+    Args:
+        server: Running replay server serving all vendors
+        http_client: Client shared by the connectors
+
+    Returns:
+        Scenario name -> operation
+    """
+    workday = WorkdayConnector(
+        client_id="replay",
+        client_secret="replay",
+        tenant_url=server.vendor_url("workday"),
+        http_client=http_client,
+    )
+    bamboo = BambooHRConnector(api_key="replay", subdomain="acme", http_client=http_client)
+    bamboo.BASE_URL = server.vendor_url("bamboohr")
+    payroll = PayrollConnector(
+        PayrollConfig(
+            provider=PayrollProvider.GENERIC,
+            base_url=server.vendor_url("payroll"),
+            api_key="replay",
+        ),
+        http_client=http_client,
+    )
+    bamboo_ids = [str(4000 + i) for i in range(150)]
+
+    def bulk_balances(i: int) -> Any:
+        start = (i * BULK_BATCH_SIZE) % len(bamboo_ids)
+        batch = (bamboo_ids + bamboo_ids)[start : start + BULK_BATCH_SIZE]
+        return bamboo.get_leave_balances(batch)
+
+    return {
+        "workday_search_employees": lambda i: workday.search_employees(
+            {"department": "Engineering"}
+        ),
+        "bamboohr_org_chart": lambda i: bamboo.get_org_chart("Engineering"),
+        "bamboohr_bulk_leave_balances": bulk_balances,
+        "workday_submit_leave": lambda i: workday.submit_leave_request(
+            _leave_request(f"WD{100000 + i % 150}")
+        ),
+        "payroll_history": lambda i: payroll.get_payroll_history(
+            f"E-{i}", datetime(2025, 1, 1), datetime(2025, 12, 31)
+        ),
+    }
+
+
+def run_scenario(
+    name: str,
+    operation: Callable[[int], Any],
+    server: ReplayServer,
+    http_client: VendorHTTPClient,
+    iterations: int,
+    concurrency: int,
+) -> BenchmarkResult:
+    """
+    Run one scenario and collect its measurements.
+
+    Args:
+        name: Scenario name
+        operation: Callable taking the iteration number
+        server: Replay server (for vendor request counts)
+        http_client: Client used by the operation (for retry counts)
+        iterations: Operations to run
+        concurrency: Worker threads
+
+    Returns:
+        BenchmarkResult
+    """
+    server.reset_stats()
+    retries_before = _retries(http_client)
+    latencies: List[float] = []
+    errors = 0
+
+    def timed(i: int) -> Optional[float]:
+        started = time.perf_counter()
+        try:
+            operation(i)
+        except Exception:
+            return None
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+        for elapsed in pool.map(timed, range(iterations)):
+            if elapsed is None:
+                errors += 1
+            else:
+                latencies.append(elapsed)
+    wall = time.perf_counter() - started
+
+    return BenchmarkResult(
+        scenario=name,
+        operations=iterations,
+        concurrency=concurrency,
+        errors=errors,
+        p50_ms=round(percentile(latencies, 50), 2),
+        p99_ms=round(percentile(latencies, 99), 2),
+        max_ms=round(max(latencies, default=0.0), 2),
+        vendor_requests=server.stats().get("total", 0),
+        retries=_retries(http_client) - retries_before,
+        throughput_ops=round(iterations / wall, 2) if wall else 0.0,
+    )
+
+
+def run_benchmarks(
+    iterations: int = 100,
+    concurrency: int = 8,
+    faults: Optional[FaultProfile] = None,
+    scenarios: Optional[Sequence[str]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Start a replay server and run the selected scenarios against it.
+
+    Args:
+        iterations: Operations per scenario
+        concurrency: Worker threads per scenario
+        faults: Latency/error injection
+        scenarios: Scenario names to run (default: all)
+
+    Returns:
+        One BenchmarkResult per scenario, in run order
+    """
+    results = []
+    with ReplayServer(faults=faults) as server:
+        http_client = make_http_client(concurrency)
+        try:
+            operations = build_scenarios(server, http_client)
+            for name in scenarios or list(operations):
+                results.append(
+                    run_scenario(
+                        name, operations[name], server, http_client, iterations, concurrency
+                    )
+                )
+        finally:
+            http_client.close()
+    return results
+
+
+def _retries(http_client: VendorHTTPClient) -> int:
+    return int(sum(host["retries"] for host in http_client.get_stats().values()))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark connectors against recorded APIs")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--scenario", action="append", help="Scenario to run (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Show connector logs")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # injected faults make the connectors log every retry and failure
+        logging.getLogger("src").setLevel(logging.CRITICAL)
+
+    faults = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        seed=args.seed,
+    )
+    results = run_benchmarks(args.iterations, args.concurrency, faults, args.scenario)
+
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(
+            f"{'scenario':<30} {'ops':>5} {'p50 ms':>9} {'p99 ms':>9} "
+            f"{'requests':>8} {'retries':>7} {'errors':>6} {'ops/s':>9}"
+        )
+        for result in results:
+            print(result.as_row())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
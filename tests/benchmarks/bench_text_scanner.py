@@ -0,0 +1,223 @@
+"""
+Text-safety scan benchmark.
+
+Measures what one chat request costs in pattern matching: the query goes
+through the request sanitizer, PII stripper and input guardrails, and the
+answer through output guardrails and the bias auditor. Two strategies are
+timed over the rules those consumers register with the shared TextScanner:
+
+- ``per_rule``: one ``finditer`` pass per rule, as each consumer used to run
+  its own pattern loops
+- ``scanner``: one TextScanner scan per text over the same rules
+
+plus ``consumers``, the full request path through the consumers themselves:
+
+    python -m tests.benchmarks.bench_text_scanner --requests 2000
+    python -m tests.benchmarks.bench_text_scanner --response-words 400 --json
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from src.core.bias_audit import SCAN_CATEGORIES as BIAS_CATEGORIES
+from src.core.bias_audit import BiasAuditor
+from src.core.guardrails import INPUT_CATEGORIES, SCAN_PII, Guardrails
+from src.core.text_scanner import TextScanner, get_text_scanner
+from src.middleware.pii_stripper import SCAN_CATEGORY as PII_STRIPPER_CATEGORY
+from src.middleware.pii_stripper import PIIStripper
+from src.middleware.sanitizer import SCAN_CATEGORY as SANITIZER_CATEGORY
+from src.middleware.sanitizer import InputSanitizer
+from tests.benchmarks.bench_connectors import percentile
+
+# Categories scanned per request: (query categories, answer categories)
+QUERY_CATEGORIES = [SANITIZER_CATEGORY, PII_STRIPPER_CATEGORY, *INPUT_CATEGORIES]
+ANSWER_CATEGORIES = [SCAN_PII, *BIAS_CATEGORIES]
+
+_WORDS = (
+    "the employee policy leave balance benefits enrollment manager team review "
+    "request approved pending payroll schedule department training handbook "
+    "eligible days remaining period annual quarterly office remote"
+).split()
+
+_FRAGMENTS = (
+    "jane.doe@example.com",
+    "555-123-4567",
+    "123-45-6789",
+    "EMP-1042",
+    "$85,000",
+    "<b>urgent</b>",
+    "young and energetic",
+    "he should",
+)
+
+
+@dataclass
+class ScanBenchmarkResult:
+    """Per-request cost of one scan strategy."""
+
+    strategy: str
+    requests: int
+    mean_us: float
+    p50_us: float
+    p99_us: float
+
+    def as_row(self) -> str:
+        return (
+            f"{self.strategy:<12} {self.requests:>8} {self.mean_us:>10.1f} "
+            f"{self.p50_us:>10.1f} {self.p99_us:>10.1f}"
+        )
+
+
+def make_requests(
+    count: int, query_words: int = 25, response_words: int = 150, seed: int = 1
+) -> List[Tuple[str, str]]:
+    """Build (query, answer) pairs with a sprinkling of PII, markup and biased phrases."""
+    rng = random.Random(seed)
+
+    def text(words: int) -> str:
+        tokens = [rng.choice(_WORDS) for _ in range(words)]
+        for _ in range(max(1, words // 50)):
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(_FRAGMENTS))
+        return " ".join(tokens)
+
+    return [(text(query_words), text(response_words)) for _ in range(count)]
+
+
+def _scanner() -> TextScanner:
+    # guardrails, the PII stripper and the sanitizer register on import;
+    # the bias auditor registers its lexicon on construction
+    BiasAuditor()
+    return get_text_scanner()
+
+
+def per_rule_scan() -> Callable[[str, str], int]:
+    """Scan with one finditer pass per registered rule."""
+    scanner = _scanner()
+
+    def compiled(categories: Sequence[str]) -> List["re.Pattern[str]"]:
+        return [
+            re.compile(rule.pattern, rule.flags)
+            for category in categories
+            for rule in scanner.rules(category)
+        ]
+
+    query_patterns = compiled(QUERY_CATEGORIES)
+    answer_patterns = compiled(ANSWER_CATEGORIES)
+
+    def run(query: str, answer: str) -> int:
+        found = sum(len(list(pattern.finditer(query))) for pattern in query_patterns)
+        return found + sum(len(list(pattern.finditer(answer))) for pattern in answer_patterns)
+
+    return run
+
+
+def scanner_scan() -> Callable[[str, str], int]:
+    """Scan each text once through the TextScanner."""
+    scanner = _scanner()
+
+    def run(query: str, answer: str) -> int:
+        return len(scanner.scan(query, QUERY_CATEGORIES)) + len(
+            scanner.scan(answer, ANSWER_CATEGORIES)
+        )
+
+    return run
+
+
+def consumer_pipeline() -> Callable[[str, str], int]:
+    """Run a request through the scanner-based consumers."""
+    guardrails = Guardrails()
+    stripper = PIIStripper()
+    auditor = BiasAuditor()
+
+    def run(query: str, answer: str) -> int:
+        cleaned = InputSanitizer.strip_html(query)
+        stripped = stripper.strip(cleaned)
+        guardrails.validate_input(stripped.sanitized_text)
+        output = guardrails.validate_output({"answer": answer, "confidence": 0.9}, query)
+        return len(output.pii_types) + len(auditor.scan_response("benchmark", query, answer))
+
+    return run
+
+
+STRATEGIES = {
+    "per_rule": per_rule_scan,
+    "scanner": scanner_scan,
+    "consumers": consumer_pipeline,
+}
+
+
+def run_benchmarks(
+    requests: int = 1000,
+    query_words: int = 25,
+    response_words: int = 150,
+    strategies: Optional[Sequence[str]] = None,
+    seed: int = 1,
+) -> List[ScanBenchmarkResult]:
+    """
+    Time each strategy over the same generated requests.
+
+    Args:
+        requests: Number of (query, answer) pairs
+        query_words: Words per query
+        response_words: Words per answer
+        strategies: Strategies to run (default: all)
+        seed: Random seed for the generated text
+
+    Returns:
+        One result per strategy
+    """
+    corpus = make_requests(requests, query_words, response_words, seed)
+    results = []
+    for name in strategies or list(STRATEGIES):
+        run = STRATEGIES[name]()
+        run(*corpus[0])  # compile combined patterns outside the timed loop
+        samples = []
+        for query, answer in corpus:
+            started = time.perf_counter()
+            run(query, answer)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+        results.append(
+            ScanBenchmarkResult(
+                strategy=name,
+                requests=len(samples),
+                mean_us=round(sum(samples) / len(samples), 1),
+                p50_us=round(percentile(samples, 50), 1),
+                p99_us=round(percentile(samples, 99), 1),
+            )
+        )
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-request text-safety scans")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--query-words", type=int, default=25)
+    parser.add_argument("--response-words", type=int, default=150)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--strategy", action="append", choices=list(STRATEGIES))
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    # the guardrails and bias auditor log every blocked query and incident
+    logging.getLogger("src").setLevel(logging.CRITICAL)
+
+    results = run_benchmarks(
+        args.requests, args.query_words, args.response_words, args.strategy, args.seed
+    )
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(f"{'strategy':<12} {'requests':>8} {'mean us':>10} {'p50 us':>10} {'p99 us':>10}")
+        for result in results:
+            print(result.as_row())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
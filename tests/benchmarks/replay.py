@@ -0,0 +1,279 @@
+"""
+Local HTTP stand-in for vendor APIs, replaying recorded responses.
+
+ReplayServer serves the JSON fixtures in ``tests/benchmarks/fixtures`` (one
+file per vendor) under a path prefix per vendor, so connectors can be
+pointed at it instead of Workday, BambooHR or the payroll provider:
+
+    with ReplayServer(["workday", "bamboohr"]) as server:
+        connector = WorkdayConnector(tenant_url=server.vendor_url("workday"), ...)
+
+Fixture format::
+
+    {"routes": [
+        {"method": "GET", "path": "/ccx/v1/employees", "paginate": "data",
+         "body": {"data": [...]}, "status": 200, "headers": {}}
+    ]}
+
+``path`` segments in braces (``/employees/{id}``) match any single
+segment. With ``paginate``, the named list in the body is sliced by the
+request's ``offset``/``limit`` query parameters and ``total`` is added, as
+the vendors' list endpoints do.
+
+Faults are injected per request from a FaultProfile (fixed latency plus
+jitter, and a probability of 429 or 5xx), or scripted with enqueue_faults
+for deterministic retry tests. The server counts requests per route and
+status so benchmarks can report how many calls reached the "vendor".
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+VENDORS = ("workday", "bamboohr", "payroll")
+
+
+@dataclass
+class FaultProfile:
+    """Latency and error injection applied to every replayed request."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    # Retry-After header sent with injected 429s (None = no header)
+    retry_after: Optional[float] = None
+    seed: Optional[int] = None
+
+
+@dataclass
+class _Route:
+    vendor: str
+    method: str
+    path: str
+    pattern: Pattern[str]
+    status: int
+    body: Any
+    headers: Dict[str, str]
+    paginate: Optional[str]
+
+
+def _compile(path: str) -> Pattern[str]:
+    parts = [
+        "[^/]+" if segment.startswith("{") and segment.endswith("}") else re.escape(segment)
+        for segment in path.strip("/").split("/")
+    ]
+    return re.compile("^/" + "/".join(parts) + "/?$")
+
+
+def load_routes(vendors: Iterable[str], fixtures_dir: Path = FIXTURES_DIR) -> List[_Route]:
+    """
+    Load recorded routes for vendors.
+
+    Args:
+        vendors: Fixture names (``workday``, ``bamboohr``, ``payroll``)
+        fixtures_dir: Directory holding ``<vendor>.json`` files
+
+    Returns:
+        Routes, in fixture order
+    """
+    routes: List[_Route] = []
+    for vendor in vendors:
+        data = json.loads((fixtures_dir / f"{vendor}.json").read_text())
+        for route in data["routes"]:
+            routes.append(
+                _Route(
+                    vendor=vendor,
+                    method=route.get("method", "GET").upper(),
+                    path=route["path"],
+                    pattern=_compile(f"/{vendor}{route['path']}"),
+                    status=route.get("status", 200),
+                    body=route.get("body", {}),
+                    headers=route.get("headers", {}),
+                    paginate=route.get("paginate"),
+                )
+            )
+    return routes
+
+
+class ReplayServer:
+    """
+    Threaded local HTTP server replaying vendor fixtures.
+
+    Attributes:
+        url: Base URL of the running server (``http://127.0.0.1:<port>``)
+    """
+
+    def __init__(
+        self,
+        vendors: Iterable[str] = VENDORS,
+        faults: Optional[FaultProfile] = None,
+        fixtures_dir: Path = FIXTURES_DIR,
+    ) -> None:
+        """
+        Initialize server (call start() or use as a context manager).
+
+        Args:
+            vendors: Fixture sets to serve
+            faults: Latency/error injection (default: none)
+            fixtures_dir: Directory holding the fixture files
+        """
+        self.routes = load_routes(vendors, fixtures_dir)
+        self.faults = faults or FaultProfile()
+        self.url = ""
+        self._random = random.Random(self.faults.seed)
+        self._scripted: Deque[int] = deque()
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> "ReplayServer":
+        """Bind an ephemeral port on localhost and serve in a daemon thread."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body go out as separate writes; without this each
+            # response waits on the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                server._handle(self)
+
+            do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="replay-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def vendor_url(self, vendor: str) -> str:
+        """Base URL under which a vendor's fixtures are served."""
+        return f"{self.url}/{vendor}"
+
+    def set_faults(self, faults: FaultProfile) -> None:
+        """Replace the fault profile (and reseed its random source)."""
+        with self._lock:
+            self.faults = faults
+            self._random = random.Random(faults.seed)
+
+    def enqueue_faults(self, statuses: Iterable[int]) -> None:
+        """Fail the next requests with these statuses, in order, before any profile faults."""
+        with self._lock:
+            self._scripted.extend(statuses)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get request counts.
+
+        Returns:
+            ``"total"``, ``"status_<code>"`` and ``"<METHOD> <vendor><path>"``
+            counters
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def reset_stats(self) -> None:
+        """Clear request counts."""
+        with self._lock:
+            self._counts.clear()
+
+    # ----- request handling -----
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        parts = urlsplit(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        if length:
+            handler.rfile.read(length)
+
+        route = self._match(handler.command, parts.path)
+        status, headers, body = self._respond(route, parse_qs(parts.query))
+
+        with self._lock:
+            self._counts["total"] += 1
+            self._counts[f"status_{status}"] += 1
+            if route is not None:
+                self._counts[f"{route.method} /{route.vendor}{route.path}"] += 1
+
+        payload = json.dumps(body).encode() if body is not None else b""
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _match(self, method: str, path: str) -> Optional[_Route]:
+        for route in self.routes:
+            if route.method == method and route.pattern.match(path):
+                return route
+        return None
+
+    def _respond(
+        self, route: Optional[_Route], query: Dict[str, List[str]]
+    ) -> Tuple[int, Dict[str, str], Any]:
+        fault, delay = self._draw_fault()
+        if delay:
+            time.sleep(delay)
+        if fault is not None:
+            headers = {}
+            if fault == 429 and self.faults.retry_after is not None:
+                headers["Retry-After"] = str(self.faults.retry_after)
+            return fault, headers, {"error": "injected fault"}
+        if route is None:
+            return 404, {}, {"error": "no recorded response"}
+        body = route.body
+        if route.paginate and isinstance(body, dict):
+            body = self._page(body, route.paginate, query)
+        return route.status, dict(route.headers), body
+
+    def _draw_fault(self) -> Tuple[Optional[int], float]:
+        with self._lock:
+            faults = self.faults
+            delay = faults.latency_ms + self._random.uniform(0, faults.jitter_ms)
+            if self._scripted:
+                return self._scripted.popleft(), delay / 1000
+            roll = self._random.random()
+        if roll < faults.rate_429:
+            return 429, delay / 1000
+        if roll < faults.rate_429 + faults.rate_5xx:
+            return 503, delay / 1000
+        return None, delay / 1000
+
+    @staticmethod
+    def _page(body: Dict[str, Any], key: str, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        items = body.get(key, [])
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(len(items))])[0])
+        return {**body, key: items[offset : offset + limit], "total": len(items)}
@@ -171,6 +171,94 @@ class TestEventBusUnit:
         assert stats["event_types"]["a"] == 2
         assert stats["event_types"]["b"] == 1
 
+    def test_event_log_is_bounded_ring_buffer(self):
+        """The in-memory log keeps only the newest events but counts all of them."""
+        from src.core.event_bus import EventBus, Event
+
+        bus = EventBus(log_size=3)
+        for i in range(5):
+            bus.publish(Event(type="a", source="test", payload={"i": i}))
+        recent = bus.get_recent_events()
+        assert [e.payload["i"] for e in recent] == [2, 3, 4]
+        assert bus.get_stats()["total_events"] == 5
+        assert bus.get_stats()["event_types"]["a"] == 5
+
+    def test_async_dispatch_does_not_block_publisher(self):
+        """In async mode a slow handler runs on a worker, not the publisher thread."""
+        import threading
+        from src.core.event_bus import EventBus, Event
+
+        bus = EventBus.instance()
+        bus.configure_async(max_workers=2, queue_size=10)
+        release = threading.Event()
+        received = []
+
+        def slow_handler(e):
+            release.wait(2)
+            received.append(e.payload["i"])
+
+        bus.subscribe("slow", slow_handler)
+        start = time.time()
+        bus.publish(Event(type="slow", source="test", payload={"i": 1}))
+        assert time.time() - start < 0.5
+        assert received == []
+        release.set()
+        assert bus.flush(timeout=2)
+        assert received == [1]
+        bus.shutdown()
+
+    def test_async_dispatch_preserves_per_subscriber_order(self):
+        """Each subscriber sees events in publish order in async mode."""
+        from src.core.event_bus import EventBus, Event
+
+        bus = EventBus.instance()
+        bus.configure_async(max_workers=4, queue_size=100)
+        first, second = [], []
+        bus.subscribe("seq", lambda e: first.append(e.payload["i"]))
+        bus.subscribe("seq", lambda e: second.append(e.payload["i"]))
+        for i in range(50):
+            bus.publish(Event(type="seq", source="test", payload={"i": i}))
+        assert bus.flush(timeout=2)
+        assert first == list(range(50))
+        assert second == list(range(50))
+        bus.shutdown()
+
+    def test_async_overflow_drop_newest(self):
+        """DROP_NEWEST discards deliveries once a worker queue is full."""
+        import threading
+        from src.core.event_bus import EventBus, Event, OverflowPolicy
+
+        bus = EventBus.instance()
+        bus._persist_event = lambda e: None
+        bus.configure_async(max_workers=1, queue_size=2, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        release = threading.Event()
+        bus.subscribe("burst", lambda e: release.wait(2))
+        for _ in range(5):
+            bus.publish(Event(type="burst", source="test"))
+        assert bus.get_stats()["dropped_deliveries"] > 0
+        release.set()
+        assert bus.flush(timeout=2)
+        bus.shutdown()
+
+    def test_async_overflow_never_drops_persistence(self):
+        """EventLog persistence is exempt from the overflow policy."""
+        import threading
+        from src.core.event_bus import EventBus, Event, OverflowPolicy
+
+        bus = EventBus.instance()
+        persisted = []
+        bus._persist_event = lambda e: persisted.append(e.payload["i"])
+        bus.configure_async(max_workers=1, queue_size=1, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        release = threading.Event()
+        bus.subscribe("burst", lambda e: release.wait(2))
+        for i in range(20):
+            bus.publish(Event(type="burst", source="test", payload={"i": i}))
+        release.set()
+        assert bus.flush(timeout=2)
+        assert bus.get_stats()["dropped_deliveries"] > 0
+        assert persisted == list(range(20))
+        bus.shutdown()
+
     def test_all_event_type_constants_defined(self):
         """All expected event type constants are defined."""
         from src.core import event_bus
@@ -0,0 +1,228 @@
+"""Tests for the indexed audit log store (COMP-006)."""
+
+import random
+import sys
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.admin_routes import AdminService, AuditLogEntry
+from src.core.audit_log_store import InMemoryAuditLogStore, SqlAuditLogStore
+from src.core.database import AuditLog
+from src.platform_services.audit_reports import AuditReportService
+from src.repositories.audit_log_repository import AuditLogRepository
+
+BASE = datetime(2024, 5, 1, 9, 0)
+
+FILTER_SETS = [
+    {},
+    {"user_id": "u1"},
+    {"action": "login_failure"},
+    {"user_id": "u2", "status": "failure"},
+    {"action": "user_updated", "resource": "user:7"},
+    {"user_id": "nobody"},
+]
+
+
+@pytest.fixture
+def entries():
+    rnd = random.Random(7)
+    return [
+        AuditLogEntry(
+            timestamp=BASE + timedelta(minutes=rnd.randint(0, 600)),
+            user_id=rnd.choice(["u1", "u2", "u3", "SYSTEM"]),
+            action=rnd.choice(["login_failure", "user_updated", "config_changed"]),
+            resource=rnd.choice(["user:7", "user:8", "audit_logs"]),
+            status=rnd.choice(["success", "failure"]),
+        )
+        for _ in range(300)
+    ]
+
+
+@pytest.fixture
+def sql_store():
+    """SqlAuditLogStore bound to an in-memory SQLite database."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    AuditLog.__table__.create(engine)
+    with patch(
+        "src.repositories.base_repository.SessionLocal",
+        sessionmaker(bind=engine, expire_on_commit=False),
+    ):
+        yield SqlAuditLogStore(AuditLogRepository(), AuditLogEntry)
+    engine.dispose()
+
+
+def _expected(entries, filters, start=None, end=None):
+    matches = [
+        e
+        for e in entries
+        if all(getattr(e, name) == value for name, value in filters.items())
+        and (start is None or e.timestamp >= start)
+        and (end is None or e.timestamp <= end)
+    ]
+    # Stable sort keeps append order among equal timestamps
+    return sorted(matches, key=lambda e: e.timestamp)
+
+
+def _walk(store, filters, start=None, end=None, limit=7, descending=True):
+    cursor, seen = None, []
+    while True:
+        page = store.query(filters, start, end, limit=limit, cursor=cursor, descending=descending)
+        seen.extend(page.entries)
+        if page.next_cursor is None:
+            return seen
+        assert len(page.entries) == limit
+        cursor = page.next_cursor
+
+
+class TestInMemoryAuditLogStore:
+    """Tests for indexed queries and keyset pagination."""
+
+    def test_pages_match_full_scan(self, entries):
+        store = InMemoryAuditLogStore()
+        for entry in entries:
+            store.append(entry)
+        start, end = BASE + timedelta(hours=2), BASE + timedelta(hours=7, minutes=30)
+
+        for filters in FILTER_SETS:
+            for window in ((None, None), (start, end)):
+                expected = _expected(entries, filters, *window)
+                ids = [e.entry_id for e in expected]
+
+                assert [e.entry_id for e in _walk(store, filters, *window)] == ids[::-1]
+                assert [e.entry_id for e in _walk(store, filters, *window, descending=False)] == ids
+                assert store.count(filters, *window) == len(expected)
+                offset_page = store.query(filters, *window, limit=5, offset=5, with_total=True)
+                assert [e.entry_id for e in offset_page.entries] == ids[::-1][5:10]
+                assert offset_page.total == len(expected)
+
+    def test_count_by_and_purge(self, entries):
+        store = InMemoryAuditLogStore()
+        for entry in entries:
+            store.append(entry)
+        cutoff = BASE + timedelta(hours=5)
+
+        purged = store.purge_before(cutoff)
+        remaining = [e for e in entries if e.timestamp >= cutoff]
+
+        assert purged == len(entries) - len(remaining) == len(entries) - len(store)
+        assert store.count({"user_id": "u1"}) == sum(e.user_id == "u1" for e in remaining)
+        by_action = store.count_by("action", {"status": "failure"})
+        assert sum(by_action.values()) == sum(e.status == "failure" for e in remaining)
+        assert store.count_by("user_id")["u2"] == sum(e.user_id == "u2" for e in remaining)
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            InMemoryAuditLogStore().query(cursor="not-a-cursor")
+
+    def test_concurrent_appends_and_index_builds(self, entries):
+        store = InMemoryAuditLogStore()
+        errors = []
+
+        def write(chunk):
+            for entry in chunk:
+                store.append(entry)
+
+        def read():
+            try:
+                for filters in FILTER_SETS * 20:
+                    store.count(filters)
+                    store.count_by("action", filters)
+                    store.query(filters, limit=5)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write, args=(entries[i::4],)) for i in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        # Switch threads often so unlocked index builds would interleave with appends
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert len(store) == len(entries)
+        for filters in FILTER_SETS:
+            expected = _expected(entries, filters)
+            walked = _walk(store, filters, descending=False)
+            assert len({e.entry_id for e in walked}) == len(walked) == len(expected)
+            assert store.count(filters) == len(expected)
+
+
+class TestSqlAuditLogStore:
+    """Tests for the audit_logs-backed store."""
+
+    def test_matches_in_memory_store(self, entries, sql_store):
+        memory = InMemoryAuditLogStore()
+        for entry in entries:
+            memory.append(entry)
+            sql_store.append(entry)
+
+        for filters in FILTER_SETS:
+            assert [e.entry_id for e in _walk(sql_store, filters)] == [
+                e.entry_id for e in _walk(memory, filters)
+            ]
+            assert sql_store.count_by("resource", filters) == memory.count_by("resource", filters)
+        exported = list(sql_store.iter_entries(batch_size=40))
+        assert [e.entry_id for e in exported] == [e.entry_id for e in memory.iter_entries()]
+        assert exported[0].resource in {"user:7", "user:8", "audit_logs"}
+
+        assert sql_store.purge_before(BASE + timedelta(hours=5)) == memory.purge_before(
+            BASE + timedelta(hours=5)
+        )
+        assert len(sql_store) == len(memory)
+
+
+class TestServiceIntegration:
+    """Tests for AdminService and AuditReportService on the store."""
+
+    def test_admin_cursor_pagination_and_export(self):
+        service = AdminService()
+        for i in range(12):
+            service.create_user(f"user{i}", f"user{i}@example.com", "employee", "Engineering")
+
+        first = service.get_audit_logs(filters={"action": "user_created"}, per_page=5)
+        second = service.get_audit_logs(
+            filters={"action": "user_created"}, per_page=5, cursor=first["next_cursor"]
+        )
+
+        assert first["pagination"].total == 12
+        assert len(second["entries"]) == 5
+        assert first["entries"][-1].timestamp >= second["entries"][0].timestamp
+        assert not {e.entry_id for e in first["entries"]} & {e.entry_id for e in second["entries"]}
+        rows = list(service.iter_audit_export(BASE, datetime.utcnow() + timedelta(hours=1), "csv"))
+        assert len(rows) == 12
+        assert rows[0]["resource"].startswith("user:")
+
+    def test_reports_computed_from_store(self, entries):
+        store = InMemoryAuditLogStore()
+        for entry in entries:
+            store.append(entry)
+        service = AuditReportService(audit_store=store, failed_login_threshold=10)
+        start, end = BASE, BASE + timedelta(days=1)
+
+        security = service.generate_security_report(start, end)
+        access = service.generate_access_report(start, end)
+
+        failures = [e for e in entries if e.status == "failure"]
+        assert security.summary["failed_actions"] == len(failures)
+        assert security.summary["audit_events"] == len(entries)
+        flagged = security.findings[-1]
+        assert flagged.description == "Repeated failed login attempts"
+        assert security.summary["critical_findings"] == 2
+        assert access.summary["active_users"] == 4
+        assert access.summary["privileged_changes"] == sum(
+            e.action in ("user_updated", "config_changed") for e in entries
+        )
@@ -46,3 +46,113 @@ def test_health_check_returns_false_on_authentication_error(monkeypatch):
     monkeypatch.setattr(connector, "_make_request", fake_make_request)
 
     assert connector.health_check() is False
+
+
+def test_employee_changes_uses_changed_endpoint(monkeypatch):
+    """Delta sync should read /employees/changed and fetch only changed employees."""
+    connector = BambooHRConnector(api_key="test-key", subdomain="testco")
+    calls = []
+
+    def fake_make_request(method, endpoint, **kwargs):
+        calls.append((endpoint, kwargs.get("params")))
+        if endpoint == "/employees/changed":
+            return {
+                "latest": "2026-10-18T12:00:00+00:00",
+                "employees": {
+                    "7": {"id": "7", "action": "Updated"},
+                    "9": {"id": "9", "action": "Deleted"},
+                },
+            }
+        return {"id": "7", "firstName": "Ada", "lastName": "Lovelace", "status": "Active"}
+
+    monkeypatch.setattr(connector, "_make_request", fake_make_request)
+
+    changes = connector.get_employee_changes("2026-10-17T00:00:00")
+
+    assert calls[0] == ("/employees/changed", {"since": "2026-10-17T00:00:00"})
+    assert [e.id for e in changes.updated] == ["7"]
+    assert changes.deleted_ids == ["9"]
+    assert changes.cursor == "2026-10-18T12:00:00+00:00"
+
+
+def test_employee_changes_reports_inactive_employees_as_deleted(monkeypatch):
+    """Bulk lookups include former employees; they must leave the change set as deletions."""
+    connector = BambooHRConnector(api_key="test-key", subdomain="testco")
+    connector.bulk_report_threshold = 1
+
+    def fake_make_request(method, endpoint, **kwargs):
+        if endpoint == "/employees/changed":
+            return {
+                "latest": "2026-10-18T12:00:00+00:00",
+                "employees": {"7": {"action": "Updated"}, "8": {"action": "Updated"}},
+            }
+        return {
+            "employees": [
+                {"id": "7", "firstName": "Ada", "lastName": "Lovelace", "status": "Active"},
+                {"id": "8", "firstName": "Grace", "lastName": "Hopper", "status": "Inactive"},
+            ]
+        }
+
+    monkeypatch.setattr(connector, "_make_request", fake_make_request)
+
+    changes = connector.get_employee_changes("2026-10-17T00:00:00")
+
+    assert [e.id for e in changes.updated] == ["7"]
+    assert changes.deleted_ids == ["8"]
+
+
+def test_get_employees_uses_custom_report_for_large_batches(monkeypatch):
+    """Batches above the threshold should cost one custom report request."""
+    connector = BambooHRConnector(api_key="test-key", subdomain="testco")
+    connector.bulk_report_threshold = 2
+    calls = []
+
+    def fake_make_request(method, endpoint, **kwargs):
+        calls.append((method, endpoint))
+        return {
+            "employees": [
+                {"id": str(i), "firstName": "E", "lastName": str(i), "status": "Active"}
+                for i in range(1, 6)
+            ]
+        }
+
+    monkeypatch.setattr(connector, "_make_request", fake_make_request)
+
+    employees = connector.get_employees(["1", "3", "5", "99"])
+
+    assert calls == [("POST", "/reports/custom")]
+    assert sorted(employees) == ["1", "3", "5"]
+
+
+def test_org_chart_served_from_index_with_deltas(monkeypatch):
+    """The directory is loaded once; later refreshes apply /employees/changed deltas."""
+    connector = BambooHRConnector(api_key="test-key", subdomain="testco")
+    calls = []
+
+    def fake_make_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        if endpoint == "/employees/directory":
+            return {
+                "employees": [
+                    {"id": "1", "firstName": "Ada", "department": "Exec"},
+                    {"id": "2", "firstName": "Bo", "department": "Eng", "supervisor": "1"},
+                    {"id": "3", "firstName": "Cy", "department": "Eng", "supervisor": "2"},
+                ]
+            }
+        if endpoint == "/employees/changed":
+            return {"latest": "2026-10-18T12:00:00", "employees": {"3": {"action": "Deleted"}}}
+        raise AssertionError(endpoint)
+
+    monkeypatch.setattr(connector, "_make_request", fake_make_request)
+
+    roots = connector.get_org_chart()
+    assert [r.employee_id for r in roots] == ["1"]
+    assert [r.employee_id for r in connector.get_org_chart("Eng")] == ["2"]
+    assert connector.org_index().is_in_chain("3", "1")
+    assert calls == ["/employees/directory"]
+
+    connector.org_index_refresh_seconds = 0
+    index = connector.org_index()
+
+    assert "3" not in index
+    assert calls == ["/employees/directory", "/employees/changed"]
@@ -0,0 +1,103 @@
+"""Tests for the vendor replay server and connector benchmark harness."""
+
+import pytest
+
+from src.connectors.bamboohr import BambooHRConnector
+from src.connectors.workday import WorkdayConnector
+from tests.benchmarks.bench_connectors import make_http_client, percentile, run_benchmarks
+from tests.benchmarks.replay import FaultProfile, ReplayServer
+
+
+@pytest.fixture
+def server():
+    with ReplayServer() as replay:
+        yield replay
+
+
+@pytest.fixture
+def http_client():
+    client = make_http_client(4)
+    yield client
+    client.close()
+
+
+def _bamboo(server, http_client):
+    connector = BambooHRConnector(api_key="k", subdomain="acme", http_client=http_client)
+    connector.BASE_URL = server.vendor_url("bamboohr")
+    return connector
+
+
+class TestReplayServer:
+    """Tests for fixture replay and fault injection."""
+
+    def test_paginates_recorded_listing(self, server, http_client):
+        connector = WorkdayConnector(
+            client_id="c",
+            client_secret="s",
+            tenant_url=server.vendor_url("workday"),
+            http_client=http_client,
+        )
+
+        employees = list(connector.iter_employees(page_size=40))
+        stats = server.stats()
+
+        assert len(employees) == 150
+        assert stats["GET /workday/ccx/v1/employees"] == 4
+        assert stats["POST /workday/ccx/oauth2/token"] == 1
+
+    def test_path_parameters_and_unknown_routes(self, server, http_client):
+        connector = _bamboo(server, http_client)
+
+        balances = connector.get_leave_balance("4001")
+        response = http_client.request("GET", f"{server.url}/bamboohr/unknown")
+
+        assert {b.available_days for b in balances} == {10.0, 6.0}
+        assert response.status_code == 404
+
+    def test_scripted_faults_are_retried(self, server, http_client):
+        connector = _bamboo(server, http_client)
+        server.enqueue_faults([429, 503])
+
+        balances = connector.get_leave_balance("4001")
+        stats = server.stats()
+
+        assert len(balances) == 2
+        assert (stats["status_429"], stats["status_503"], stats["status_200"]) == (1, 1, 1)
+        assert sum(host["retries"] for host in http_client.get_stats().values()) == 2
+
+    def test_fault_profile_injects_errors_and_retry_after(self, server, http_client):
+        server.set_faults(FaultProfile(rate_429=1.0, retry_after=0))
+
+        response = http_client.request("GET", f"{server.url}/workday/ccx/v1/health", max_retries=0)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "0"
+
+
+class TestBenchmarks:
+    """Tests for the benchmark runner."""
+
+    def test_percentile_nearest_rank(self):
+        samples = list(range(1, 101))
+
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 99) == 99
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) == 0.0
+
+    def test_run_reports_latency_requests_and_throughput(self):
+        results = run_benchmarks(
+            iterations=6,
+            concurrency=3,
+            scenarios=["bamboohr_org_chart", "workday_submit_leave"],
+        )
+
+        org_chart, submit = results
+        assert [r.scenario for r in results] == ["bamboohr_org_chart", "workday_submit_leave"]
+        # the org index is loaded once and then served locally
+        assert (org_chart.vendor_requests, org_chart.errors) == (1, 0)
+        # one POST per operation, plus token requests from threads racing the first login
+        assert 6 < submit.vendor_requests <= 6 + 3
+        assert (submit.errors, submit.retries) == (0, 0)
+        assert 0 < submit.p50_ms <= submit.p99_ms <= submit.max_ms
+        assert submit.throughput_ops > 0
@@ -1,6 +1,11 @@
 """Unit tests for connection pool manager."""
 
+import threading
+from contextlib import ExitStack
+from unittest.mock import patch
+
 import pytest
+import requests
 from datetime import datetime, timedelta
 from src.core.connection_pool import (
     PoolType,
@@ -8,6 +13,8 @@ from src.core.connection_pool import (
     PoolStats,
     ConnectionHealth,
     ConnectionPoolManager,
+    PoolExhaustedError,
+    get_pool_manager,
 )
 
 
@@ -230,7 +237,7 @@ class TestGetConnection:
 
         with manager.get_connection(PoolType.HTTP) as conn:
             assert conn is not None
-            assert isinstance(conn, dict)
+            assert isinstance(conn, requests.Session)
 
     def test_get_connection_tracks_active(self):
         """Test getting connection increments active counter."""
@@ -528,3 +535,161 @@ class TestGetStatus:
 
         status = manager.get_status()
         assert len(status["pools"]) > 0
+
+
+class TestLeases:
+    """Tests for shared resources, bounded waits and leak detection."""
+
+    @pytest.fixture
+    def manager(self):
+        config = PoolConfig(
+            pool_type=PoolType.HTTP,
+            connection_string="https://api.vendor.test",
+            min_connections=1,
+            max_connections=2,
+            max_overflow=2,
+            pool_timeout=1,
+            leak_timeout=60,
+        )
+        manager = ConnectionPoolManager([config])
+        manager.initialize_pool(PoolType.HTTP)
+        return manager
+
+    def test_sessions_are_shared_per_upstream(self, manager):
+        with manager.get_connection(PoolType.HTTP, "https://a.test/x") as first:
+            with manager.get_connection(PoolType.HTTP, "https://a.test/y") as second:
+                assert first is second
+        with manager.get_connection(PoolType.HTTP, "https://b.test/x") as other:
+            assert other is not first
+        assert first.get_adapter("https://a.test/x")._pool_maxsize == 4
+
+    def test_acquire_times_out_when_exhausted(self, manager):
+        with manager.get_connection(PoolType.HTTP), manager.get_connection(PoolType.HTTP):
+            with pytest.raises(PoolExhaustedError):
+                with manager.get_connection(PoolType.HTTP, timeout=0.05):
+                    pass
+
+        stats = manager.get_pool_stats(PoolType.HTTP)[PoolType.HTTP]
+        assert stats.total_timeouts == 1
+        assert stats.active_connections == 0
+
+    def test_waiter_proceeds_when_lease_released(self, manager):
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with manager.get_connection(PoolType.HTTP), manager.get_connection(PoolType.HTTP):
+                acquired.set()
+                release.wait(2)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        acquired.wait(2)
+        threading.Timer(0.05, release.set).start()
+
+        with manager.get_connection(PoolType.HTTP, timeout=2) as session:
+            assert isinstance(session, requests.Session)
+        holder.join()
+        assert manager.get_pool_stats(PoolType.HTTP)[PoolType.HTTP].avg_wait_time > 0
+
+    def test_lease_cap_is_per_host(self, manager):
+        with ExitStack() as stack:
+            for _ in range(2):
+                stack.enter_context(manager.get_connection(PoolType.HTTP, "https://a.test/x"))
+            with pytest.raises(PoolExhaustedError):
+                with manager.get_connection(PoolType.HTTP, "https://a.test/y", timeout=0.05):
+                    pass
+            # A saturated vendor does not block another host
+            with manager.get_connection(PoolType.HTTP, "https://b.test/x", timeout=0.05):
+                assert manager._pools[PoolType.HTTP].active_connections == 3
+
+        assert manager._pools[PoolType.HTTP].upstream_active == {}
+        assert manager.get_pool_stats(PoolType.HTTP)[PoolType.HTTP].peak_connections == 2
+
+    def test_body_errors_release_the_lease(self, manager):
+        with pytest.raises(ValueError):
+            with manager.get_connection(PoolType.HTTP):
+                raise ValueError("request failed")
+
+        stats = manager.get_pool_stats(PoolType.HTTP)[PoolType.HTTP]
+        assert stats.active_connections == 0
+        assert stats.total_errors == 0
+
+    def test_leaks_are_reported(self, manager):
+        with manager.get_connection(PoolType.HTTP, "https://a.test/x"):
+            assert manager.find_leaks() == []
+            with patch("src.core.connection_pool.time.time", return_value=1e12):
+                leaks = manager.find_leaks()
+                stats = manager.get_pool_stats(PoolType.HTTP)[PoolType.HTTP]
+
+        assert len(leaks) == 1
+        assert leaks[0]["upstream"] == "https://a.test"
+        assert leaks[0]["holder"] == threading.current_thread().name
+        assert stats.leaked_connections == 1
+        assert manager.find_leaks() == []
+
+
+class TestAutoscale:
+    """Tests for adaptive sizing."""
+
+    def _manager(self, **overrides):
+        config = PoolConfig(
+            pool_type=PoolType.HTTP,
+            connection_string="http://localhost",
+            min_connections=1,
+            max_connections=4,
+            max_overflow=4,
+            **overrides,
+        )
+        manager = ConnectionPoolManager([config])
+        manager.initialize_pool(PoolType.HTTP)
+        return manager
+
+    def test_grows_when_saturated_up_to_ceiling(self):
+        manager = self._manager()
+        pool_config = manager._pools[PoolType.HTTP].config
+        for _ in range(6):
+            with ExitStack() as stack:
+                for _ in range(pool_config.max_connections):
+                    stack.enter_context(manager.get_connection(PoolType.HTTP))
+            manager.autoscale(PoolType.HTTP)
+
+        assert manager._pools[PoolType.HTTP].config.max_connections == 8
+
+    def test_timeouts_trigger_growth(self):
+        manager = self._manager()
+        manager.resize_pool(PoolType.HTTP, 1)
+        with manager.get_connection(PoolType.HTTP):
+            with pytest.raises(PoolExhaustedError):
+                with manager.get_connection(PoolType.HTTP, timeout=0.01):
+                    pass
+
+        assert manager.get_optimal_pool_size(PoolType.HTTP)["action"] == "increase"
+        assert manager.autoscale(PoolType.HTTP) == 2
+
+    def test_shrinks_when_idle_but_not_below_min(self):
+        manager = self._manager()
+        with manager.get_connection(PoolType.HTTP):
+            pass
+
+        assert manager.autoscale(PoolType.HTTP) == 1
+
+    def test_vendor_pool_never_shrinks_below_configured_size(self):
+        with patch("src.core.connection_pool._pool_manager", None):
+            manager = get_pool_manager()
+            pool_config = manager._pools[PoolType.HTTP].config
+            size = pool_config.max_connections
+            with manager.get_connection(PoolType.HTTP, "https://vendor.test"):
+                pass
+
+            assert pool_config.min_connections == size
+            assert manager.autoscale(PoolType.HTTP) == size
+
+    def test_release_autoscales_after_interval(self):
+        manager = self._manager(adaptive_sizing=True, health_check_interval=10)
+        manager._pools[PoolType.HTTP].last_resize -= 10
+
+        with manager.get_connection(PoolType.HTTP):
+            pass
+
+        assert manager._pools[PoolType.HTTP].config.max_connections == 1
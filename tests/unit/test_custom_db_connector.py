@@ -0,0 +1,151 @@
+"""Unit tests for CustomDB connector batch reads."""
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.connectors.custom_db import CustomDBConnector
+from src.connectors.hris_interface import LeaveType, PlanType
+
+SCHEMA_MAPPING = {
+    "employee_table": "employees",
+    "id_column": "id",
+    "leave_balance_table": "leave_balances",
+    "benefits_table": "benefits",
+}
+
+
+@pytest.fixture
+def connector(tmp_path):
+    """CustomDBConnector over a small SQLite HR database."""
+    url = f"sqlite:///{tmp_path / 'hr.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE employees (id TEXT PRIMARY KEY, first_name TEXT, last_name TEXT, "
+                "email TEXT, department TEXT, job_title TEXT, manager_id TEXT, status TEXT, "
+                "location TEXT)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE leave_balances (id INTEGER PRIMARY KEY, employee_id TEXT, "
+                "leave_type TEXT, total REAL, used REAL, pending REAL, available REAL)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE benefits (id INTEGER PRIMARY KEY, name TEXT, plan_type TEXT, "
+                "coverage_level TEXT, employee_cost REAL, employer_cost REAL, employee_id TEXT)"
+            )
+        )
+        # 1 (Exec) manages 2 (Eng) and 5 (Sales); 2 -> 3 -> 4 within Eng
+        org = {
+            "1": ("Exec", None),
+            "2": ("Eng", "1"),
+            "3": ("Eng", "2"),
+            "4": ("Eng", "3"),
+            "5": ("Sales", "1"),
+        }
+        for emp_id, (department, manager_id) in org.items():
+            conn.execute(
+                text(
+                    "INSERT INTO employees VALUES (:id, 'E', :id, :email, :department, "
+                    "'Engineer', :manager_id, 'active', 'Remote')"
+                ),
+                {
+                    "id": emp_id,
+                    "email": f"e{emp_id}@company.com",
+                    "department": department,
+                    "manager_id": manager_id,
+                },
+            )
+        conn.execute(text("INSERT INTO leave_balances VALUES (1, '1', 'pto', 20, 5, 0, 15)"))
+        conn.execute(text("INSERT INTO leave_balances VALUES (2, '1', 'sick', 10, 0, 0, 10)"))
+        conn.execute(
+            text("INSERT INTO benefits VALUES (1, 'Dental', 'dental', 'Employee', 10, 40, '2')")
+        )
+    engine.dispose()
+
+    db = CustomDBConnector(url, SCHEMA_MAPPING)
+    yield db
+    db.close()
+
+
+def _count_statements(connector):
+    statements = []
+    event.listen(
+        connector.engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    return statements
+
+
+def test_get_employees_uses_in_query(connector):
+    """Several employees are loaded with one IN query."""
+    statements = _count_statements(connector)
+
+    employees = connector.get_employees(["1", "4", "99", "1"])
+
+    assert sorted(employees) == ["1", "4"]
+    assert len(statements) == 1
+    assert " IN (" in statements[0]
+
+
+def test_get_employees_chunks_large_batches(connector):
+    """IDs are bound batch_size at a time."""
+    connector.batch_size = 2
+    statements = _count_statements(connector)
+
+    employees = connector.get_employees(["1", "2", "3", "4", "5"])
+
+    assert len(employees) == 5
+    assert len(statements) == 3
+
+
+def test_get_leave_balances_groups_rows(connector):
+    """Balance rows are grouped per employee; employees without rows get []."""
+    balances = connector.get_leave_balances(["1", "2"])
+
+    assert [b.leave_type for b in balances["1"]] == [LeaveType.PTO, LeaveType.SICK]
+    assert balances["1"][0].available_days == 15
+    assert balances["2"] == []
+
+
+def test_get_benefits_bulk_groups_rows(connector):
+    """Benefits rows are grouped per employee."""
+    plans = connector.get_benefits_bulk(["1", "2"])
+
+    assert plans["1"] == []
+    assert plans["2"][0].plan_type == PlanType.DENTAL
+
+
+def test_search_employees_streams_with_cached_statement(connector):
+    """Searches stream rows and reuse the statement built for the same filters."""
+    employees = list(connector.iter_employees({"department": "Eng"}))
+    connector.search_employees({"department": "Sales"})
+
+    assert sorted(e.id for e in employees) == ["2", "3", "4"]
+    assert list(connector._statements) == [("search", ("department",))]
+    assert len(connector.search_employees({}, limit=2)) == 2
+
+
+def test_org_chart_builds_full_hierarchy(connector):
+    """The unscoped chart starts at employees without a manager."""
+    roots = connector.get_org_chart()
+
+    assert [r.employee_id for r in roots] == ["1"]
+    assert [n.employee_id for n in roots[0].direct_reports] == ["2", "5"]
+    assert roots[0].direct_reports[0].direct_reports[0].direct_reports[0].employee_id == "4"
+
+
+def test_org_chart_department_computes_only_subtree(connector):
+    """A department chart is anchored at the department's heads."""
+    statements = _count_statements(connector)
+
+    roots = connector.get_org_chart(department="Eng")
+
+    assert [r.employee_id for r in roots] == ["2"]
+    assert roots[0].direct_reports[0].employee_id == "3"
+    assert len(statements) == 1
+    assert ":department" not in statements[0]  # bound, not interpolated
+    assert connector.get_org_chart(department="Unknown") == []
@@ -0,0 +1,343 @@
+"""Tests for DSAR data discovery (COMP-004)."""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.connectors.hris_interface import (
+    Employee as HRISEmployee,
+    EmployeeStatus,
+    LeaveBalance,
+    LeaveType,
+)
+from src.core.ccpa import CCPAComplianceService, CCPADataCategory
+from src.core.database import (
+    AuditLog,
+    Base,
+    ChatConversation,
+    ChatMessage,
+    Employee,
+    LeaveRequest,
+)
+from src.core.dsar_discovery import (
+    DataSourceRegistry,
+    DataSubject,
+    DSARDiscoveryEngine,
+    read_export,
+    register_collection_source,
+    register_connector_sources,
+)
+from src.core.gdpr import DSARRequest, DSARType, GDPRComplianceService
+
+NOW = datetime(2024, 1, 15, 9, 0)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Session factory for a file-backed SQLite database with two employees."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Employee.__table__),
+            [
+                dict(
+                    id=emp_id,
+                    hris_id=f"emp_{emp_id:03d}",
+                    hris_source="workday",
+                    first_name="Ada",
+                    last_name="Lovelace",
+                    email=f"user{emp_id}@example.com",
+                    department="Engineering",
+                    role_level="employee",
+                    hire_date=NOW,
+                    status="active",
+                    password_hash="not-exported",
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+                for emp_id in (1, 2)
+            ],
+        )
+        conn.execute(
+            insert(ChatConversation.__table__),
+            [
+                dict(id="c1", employee_id=1, title="PTO", created_at=NOW, updated_at=NOW),
+                dict(id="c2", employee_id=2, title="Pay", created_at=NOW, updated_at=NOW),
+            ],
+        )
+        conn.execute(
+            insert(ChatMessage.__table__),
+            [
+                dict(conversation_id=conv, role="user", content=text, created_at=NOW)
+                for conv, text in [("c1", "a"), ("c1", "b"), ("c2", "c")]
+            ],
+        )
+        conn.execute(
+            insert(LeaveRequest.__table__),
+            [
+                dict(
+                    employee_id=1,
+                    leave_type="pto",
+                    start_date="2024-02-01",
+                    end_date="2024-02-02",
+                    status="pending",
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+            ],
+        )
+        conn.execute(
+            insert(AuditLog.__table__),
+            [
+                dict(
+                    user_id=emp_id,
+                    action="read",
+                    resource_type="employee",
+                    resource_id="1",
+                    details={},
+                    ip_address="10.0.0.1",
+                    timestamp=NOW,
+                )
+                for emp_id in (1, 1, 2)
+            ],
+        )
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _static_registry(**sources):
+    registry = DataSourceRegistry()
+    for name, (category, records) in sources.items():
+        registry.register(name, category, lambda subject, records=records: iter(records))
+    return registry
+
+
+class TestDataSourceRegistry:
+    """Tests for source registration."""
+
+    def test_register_and_unregister(self):
+        registry = _static_registry(a=("documents", []), b=("chat_history", []))
+
+        assert [source.name for source in registry.sources()] == ["a", "b"]
+        assert registry.unregister("a") is True
+        assert registry.unregister("a") is False
+        assert len(registry) == 1
+
+    def test_engine_keeps_empty_registry(self):
+        registry = DataSourceRegistry()
+        engine = DSARDiscoveryEngine(registry=registry)
+
+        registry.register("late", "documents", lambda subject: iter([{"id": 1}]))
+
+        assert engine.discover("emp_001").total_records == 1
+
+
+class TestDatabaseDiscovery:
+    """Tests for discovery against the application database."""
+
+    def test_resolves_subject_by_hris_id_email_or_id(self, session_factory):
+        engine = DSARDiscoveryEngine(session_factory=session_factory)
+
+        for subject_id in ("emp_001", "user1@example.com", "1"):
+            subject = engine.resolve_subject(subject_id)
+            assert (subject.employee_id, subject.hris_id) == (1, "emp_001")
+        assert engine.resolve_subject("nobody").employee_id is None
+
+    def test_ambiguous_subject_is_rejected(self, session_factory):
+        session = session_factory()
+        session.get(Employee, 2).hris_id = "1"
+        session.commit()
+        session.close()
+        engine = DSARDiscoveryEngine(session_factory=session_factory)
+
+        with pytest.raises(ValueError):
+            engine.resolve_subject("1")
+        assert engine.resolve_subject("user2@example.com").employee_id == 2
+
+    def test_collect_finds_only_subject_records(self, session_factory):
+        report, records = DSARDiscoveryEngine(session_factory=session_factory).collect("emp_001")
+        counts = {summary.source: summary.records for summary in report.sources}
+
+        assert counts["employees"] == 1
+        assert counts["chat_conversations"] == 1
+        assert counts["chat_messages"] == 2
+        assert counts["leave_requests"] == 1
+        assert counts["audit_logs"] == 2
+        assert report.failed_sources == []
+        assert {r["content"] for r in records["chat_history"] if "content" in r} == {"a", "b"}
+        assert "password_hash" not in records["employment_records"][0]
+
+    def test_audit_rows_logged_by_actor_are_found(self, session_factory):
+        session = session_factory()
+        for actor in ("emp_001", "user1@example.com", "1", "emp_002", "SYSTEM"):
+            session.add(
+                AuditLog(actor=actor, action="read", resource_type="employee", resource_id="9")
+            )
+        session.commit()
+        session.close()
+
+        _, records = DSARDiscoveryEngine(session_factory=session_factory).collect("emp_001")
+        audit = [r for r in records["activity_logs"] if r["_source"] == "audit_logs"]
+
+        assert sorted(r["actor"] or "" for r in audit) == [
+            "",
+            "",
+            "1",
+            "emp_001",
+            "user1@example.com",
+        ]
+
+    def test_export_round_trip(self, session_factory, tmp_path):
+        engine = DSARDiscoveryEngine(session_factory=session_factory, max_workers=2)
+
+        report = engine.export("emp_001", tmp_path / "exports" / "emp_001.jsonl.gz")
+        header, *body, footer = read_export(report.export_path)
+
+        assert header["subject"]["hris_id"] == "emp_001"
+        assert len(body) == report.total_records == 7
+        assert {line["source"] for line in body} >= {"employees", "chat_messages"}
+        assert footer["summary"]["total_records"] == 7
+        assert all("password_hash" not in line["record"] for line in body)
+
+
+class TestDiscoveryFanOut:
+    """Tests for concurrent extraction and error handling."""
+
+    def test_failing_source_is_reported(self):
+        registry = _static_registry(good=("documents", [{"id": 1}, {"id": 2}]))
+
+        def broken(subject):
+            raise RuntimeError("store offline")
+
+        registry.register("broken", "chat_history", broken)
+
+        report = DSARDiscoveryEngine(registry=registry).discover("emp_001")
+
+        assert report.total_records == 2
+        assert report.failed_sources == ["broken"]
+        assert "store offline" in report.sources[1].error
+
+    def test_sink_error_stops_extractors(self):
+        produced = []
+        started = threading.Event()
+
+        def endless(subject):
+            started.set()
+            while True:
+                produced.append(1)
+                yield {"n": len(produced)}
+
+        registry = DataSourceRegistry()
+        registry.register("endless", "activity_logs", endless)
+        engine = DSARDiscoveryEngine(registry=registry, queue_size=4)
+
+        def sink(source, record):
+            if record["n"] == 3:
+                raise ValueError("disk full")
+
+        with pytest.raises(ValueError):
+            engine.discover("emp_001", sink)
+
+        assert started.is_set()
+        assert len(produced) < 50
+
+    def test_connector_sources(self):
+        connector = MagicMock()
+        connector.get_employee.return_value = HRISEmployee(
+            id="1",
+            hris_id="emp_001",
+            first_name="Ada",
+            last_name="Lovelace",
+            email="user1@example.com",
+            department="Engineering",
+            job_title="Engineer",
+            hire_date=NOW,
+            status=EmployeeStatus.ACTIVE,
+            location="London",
+        )
+        connector.get_leave_requests.return_value = []
+        connector.get_leave_balance.return_value = [
+            LeaveBalance(
+                employee_id="1",
+                leave_type=LeaveType.PTO,
+                total_days=20,
+                used_days=5,
+                pending_days=0,
+                available_days=15,
+            )
+        ]
+        connector.get_benefits.side_effect = NotImplementedError
+        registry = DataSourceRegistry()
+        register_connector_sources(registry, connector)
+
+        subject = DataSubject(subject_id="emp_001", employee_id=1, hris_id="emp_001")
+        report, records = DSARDiscoveryEngine(registry=registry).collect(subject)
+
+        connector.get_employee.assert_called_once_with("emp_001")
+        assert records["employment_records"][0]["hire_date"] == NOW.isoformat()
+        assert records["leave_records"][0]["leave_type"] == LeaveType.PTO.value
+        assert report.failed_sources == ["hris_benefits"]
+
+    def test_collection_source_pages(self):
+        collection = MagicMock()
+        collection.get.side_effect = [
+            {"ids": ["d1", "d2"], "documents": ["x", "y"], "metadatas": [{}, {}]},
+            {"ids": ["d3"], "documents": ["z"], "metadatas": [{}]},
+        ]
+        registry = DataSourceRegistry()
+        register_collection_source(registry, "policy_docs", collection, page_size=2)
+
+        _, records = DSARDiscoveryEngine(registry=registry).collect("emp_001")
+
+        assert [doc["id"] for doc in records["documents"]] == ["d1", "d2", "d3"]
+        assert collection.get.call_args.kwargs["where"] == {"employee_id": "emp_001"}
+        assert collection.get.call_args.kwargs["offset"] == 2
+
+
+class TestComplianceIntegration:
+    """Tests for GDPR and CCPA services backed by discovery."""
+
+    def test_gdpr_access_and_portability(self, session_factory, tmp_path):
+        service = GDPRComplianceService(
+            discovery=DSARDiscoveryEngine(session_factory=session_factory),
+            export_dir=str(tmp_path),
+        )
+
+        access = service.data_subject_access("emp_001")
+        request = DSARRequest(
+            employee_id="emp_001", type=DSARType.PORTABILITY, due_date=NOW + timedelta(days=30)
+        )
+        result = service.process_dsar(request)
+
+        assert access["record_counts"]["chat_messages"] == 2
+        assert "audit_logs" in access["data_sources"]
+        assert result["export_records"] == 7
+        assert result["export_path"].endswith(f"{request.request_id}.jsonl.gz")
+        assert request.data_export_path == result["export_path"]
+        assert "data_subject_export" in [e["action"] for e in service.get_audit_trail("emp_001")]
+
+    def test_gdpr_export_requires_discovery(self, tmp_path):
+        with pytest.raises(ValueError):
+            GDPRComplianceService().export_subject_data("emp_001", tmp_path / "x.jsonl.gz")
+
+    def test_ccpa_inventory_lists_sources_with_records(self, session_factory):
+        service = CCPAComplianceService(
+            discovery=DSARDiscoveryEngine(session_factory=session_factory)
+        )
+
+        inventory = service.get_data_inventory("emp_002")
+        by_source = {item.source: item for item in inventory}
+
+        assert set(by_source) == {
+            "employees",
+            "chat_conversations",
+            "chat_messages",
+            "audit_logs",
+        }
+        assert by_source["chat_messages"].category == CCPADataCategory.INTERNET_ACTIVITY
+        assert by_source["employees"].purpose == "Employment Administration"
@@ -0,0 +1,110 @@
+"""Unit tests for the FastMCP server's workflow approval tools."""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+pytest.importorskip("mcp")
+
+from src.core.database import Base, Employee  # noqa: E402
+from src.core.workflow_engine import (  # noqa: E402
+    WorkflowEngine,
+    WorkflowState,
+    WorkflowTemplate,
+    get_workflow_engine,
+)
+from src.mcp import fastmcp_server  # noqa: E402
+from src.repositories.workflow_repository import WorkflowInstanceRepository  # noqa: E402
+
+
+@pytest.fixture
+def database():
+    """Shared in-memory SQLite database with a manager and an employee."""
+    import src.repositories  # noqa: F401  (registers the workflow tables)
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+    session = Session()
+    for emp_id, role in ((1, "manager"), (2, "employee")):
+        session.add(
+            Employee(
+                id=emp_id,
+                hris_id=f"EMP-{emp_id}",
+                hris_source="local",
+                first_name="E",
+                last_name=str(emp_id),
+                email=f"e{emp_id}@company.com",
+                department="Engineering",
+                role_level=role,
+                hire_date=datetime(2022, 1, 1),
+                status="active",
+            )
+        )
+    session.commit()
+    session.close()
+    with patch("src.core.database.SessionLocal", Session), patch(
+        "src.repositories.base_repository.SessionLocal", Session
+    ), patch("src.core.workflow_engine._workflow_engine", None), patch.object(
+        fastmcp_server, "_db_initialized", True
+    ):
+        yield Session
+    engine.dispose()
+
+
+def _pending_workflow():
+    engine = get_workflow_engine()
+    template_id = engine.register_template(
+        WorkflowTemplate(
+            name="Compensation",
+            entity_type="compensation",
+            steps_config=[{"approver_role": "manager"}],
+        )
+    )
+    workflow_id = engine.create_workflow(template_id, "compensation", "comp_1", "2")
+    engine.submit_for_approval(workflow_id)
+    return workflow_id
+
+
+class TestWorkflowTools:
+    """approve_workflow / reject_workflow drive the durable workflow engine."""
+
+    def test_approve_persists_workflow_state(self, database):
+        workflow_id = _pending_workflow()
+
+        result = json.loads(fastmcp_server.approve_workflow(workflow_id, "1", comments="ok"))
+
+        assert result["status"] == WorkflowState.APPROVED.value
+        restarted = WorkflowEngine(store=WorkflowInstanceRepository())
+        workflow = restarted.get_workflow(workflow_id)
+        assert workflow.state == WorkflowState.APPROVED
+        assert workflow.steps[0].approver_id == "1"
+
+    def test_reject_persists_workflow_state(self, database):
+        workflow_id = _pending_workflow()
+
+        result = json.loads(fastmcp_server.reject_workflow(workflow_id, "1", reason="budget"))
+
+        assert result["status"] == WorkflowState.REJECTED.value
+        restarted = WorkflowEngine(store=WorkflowInstanceRepository())
+        assert restarted.get_workflow(workflow_id).state == WorkflowState.REJECTED
+
+    def test_engine_errors_are_returned_without_fallback(self, database):
+        workflow_id = _pending_workflow()
+
+        with patch.object(fastmcp_server, "approve_leave_request") as fallback:
+            result = json.loads(fastmcp_server.approve_workflow(workflow_id, "2"))
+
+        assert result["status"] == "error"
+        assert "lacks approval permission" in result["error"]
+        fallback.assert_not_called()
+        assert get_workflow_engine().get_workflow(workflow_id).state == (
+            WorkflowState.PENDING_APPROVAL
+        )
@@ -0,0 +1,309 @@
+"""Tests for the read-through HRIS caching layer."""
+
+from collections import Counter
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.connectors.hris_cache import CachePolicy, CachingHRISConnector
+from src.connectors.hris_interface import (
+    Employee,
+    EmployeeStatus,
+    HRISConnector,
+    LeaveBalance,
+    LeaveRequest,
+    LeaveStatus,
+    LeaveType,
+    NotFoundError,
+)
+
+
+def _employee(emp_id, department="Engineering"):
+    return Employee(
+        id=emp_id,
+        hris_id=f"HR-{emp_id}",
+        first_name="Ada",
+        last_name="Lovelace",
+        email=f"{emp_id}@company.com",
+        department=department,
+        job_title="Engineer",
+        hire_date=datetime(2022, 1, 1),
+        status=EmployeeStatus.ACTIVE,
+        location="Remote",
+    )
+
+
+class CountingConnector(HRISConnector):
+    """Connector stub that counts source calls."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.department = "Engineering"
+        self.used_days = 5
+
+    def get_employee(self, employee_id):
+        self.calls["get_employee"] += 1
+        if employee_id == "missing":
+            raise NotFoundError(f"Employee not found: {employee_id}")
+        if employee_id == "none":
+            return None
+        return _employee(employee_id, self.department)
+
+    def search_employees(self, filters):
+        self.calls["search_employees"] += 1
+        return [_employee("1")]
+
+    def get_leave_balance(self, employee_id):
+        self.calls["get_leave_balance"] += 1
+        if employee_id == "missing":
+            raise NotFoundError(f"Employee not found: {employee_id}")
+        return [
+            LeaveBalance(
+                employee_id=employee_id,
+                leave_type=LeaveType.PTO,
+                total_days=20,
+                used_days=self.used_days,
+                pending_days=0,
+                available_days=20 - self.used_days,
+            )
+        ]
+
+    def get_leave_requests(self, employee_id, status=None):
+        self.calls["get_leave_requests"] += 1
+        return []
+
+    def submit_leave_request(self, request):
+        self.calls["submit_leave_request"] += 1
+        self.used_days += 1
+        return request
+
+    def get_org_chart(self, department=None):
+        self.calls["get_org_chart"] += 1
+        return []
+
+    def get_benefits(self, employee_id):
+        self.calls["get_benefits"] += 1
+        return []
+
+    def health_check(self):
+        return True
+
+
+class DictCacheManager:
+    """CacheManager stand-in backed by a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl=3600):
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+        return True
+
+
+@pytest.fixture
+def clock():
+    """Controllable time source for the cache module."""
+    now = [1_000_000.0]
+    with patch("src.connectors.hris_cache.time.time", side_effect=lambda: now[0]):
+        yield now
+
+
+@pytest.fixture
+def source():
+    return CountingConnector()
+
+
+@pytest.fixture
+def cached(source):
+    connector = CachingHRISConnector(
+        source,
+        policies={"get_employee": CachePolicy(ttl=60, stale_ttl=60, negative_ttl=30)},
+    )
+    yield connector
+    connector.shutdown()
+
+
+class TestReadThrough:
+    """Tests for TTL hits and misses."""
+
+    def test_repeat_reads_hit_cache(self, cached, source, clock):
+        """Reads within the TTL are served without calling the source."""
+        cached.get_employee("1")
+        cached.get_employee("1")
+        cached.get_employee("2")
+
+        assert source.calls["get_employee"] == 2
+        stats = cached.get_stats()["get_employee"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3, rel=1e-3)
+
+    def test_expired_entry_is_reloaded(self, cached, source, clock):
+        """Entries past ttl + stale_ttl are fetched synchronously."""
+        cached.get_employee("1")
+        clock[0] += 121
+        cached.get_employee("1")
+
+        assert source.calls["get_employee"] == 2
+
+    def test_cached_values_are_copies(self, cached, clock):
+        """Mutating a returned model does not corrupt the cache."""
+        cached.get_employee("1").department = "Changed"
+
+        assert cached.get_employee("1").department == "Engineering"
+
+    def test_uncached_method_passes_through(self, source, clock):
+        """Methods without a policy always reach the source."""
+        connector = CachingHRISConnector(source, policies={})
+        connector.policies.pop("get_benefits")
+        connector.get_benefits("1")
+        connector.get_benefits("1")
+
+        assert source.calls["get_benefits"] == 2
+
+
+class TestNegativeCaching:
+    """Tests for remembered not-found answers."""
+
+    def test_not_found_error_is_cached(self, cached, source, clock):
+        """NotFoundError is re-raised from cache within negative_ttl."""
+        for _ in range(3):
+            with pytest.raises(NotFoundError, match="missing"):
+                cached.get_employee("missing")
+
+        assert source.calls["get_employee"] == 1
+        assert cached.get_stats()["get_employee"]["negative_hits"] == 2
+
+    def test_none_is_cached_until_negative_ttl(self, cached, source, clock):
+        """A None result is remembered for negative_ttl only."""
+        assert cached.get_employee("none") is None
+        assert cached.get_employee("none") is None
+        clock[0] += 31
+        assert cached.get_employee("none") is None
+
+        assert source.calls["get_employee"] == 2
+
+
+class TestStaleWhileRevalidate:
+    """Tests for background refresh of stale entries."""
+
+    def test_stale_entry_served_and_refreshed(self, cached, source, clock):
+        """A stale read returns the old value and refreshes in the background."""
+        cached.get_employee("1")
+        source.department = "Finance"
+        clock[0] += 90
+
+        assert cached.get_employee("1").department == "Engineering"
+        cached.shutdown()  # wait for the refresh to finish
+
+        assert cached.get_employee("1").department == "Finance"
+        stats = cached.get_stats()["get_employee"]
+        assert stats["stale_hits"] == 1
+        assert stats["refreshes"] == 1
+
+
+class TestInvalidation:
+    """Tests for write-through invalidation."""
+
+    def test_submit_leave_request_invalidates_balance(self, cached, source, clock):
+        """A successful leave submission drops the employee's cached balances."""
+        assert cached.get_leave_balance("1")[0].used_days == 5
+        cached.submit_leave_request(
+            LeaveRequest(
+                employee_id="1",
+                leave_type=LeaveType.PTO,
+                start_date=datetime(2026, 11, 2),
+                end_date=datetime(2026, 11, 3),
+                status=LeaveStatus.PENDING,
+                submitted_at=datetime.utcnow(),
+            )
+        )
+
+        assert cached.get_leave_balance("1")[0].used_days == 6
+        assert source.calls["get_leave_balance"] == 2
+        assert cached.get_stats()["get_leave_balance"]["invalidations"] == 1
+
+
+class TestBatchReads:
+    """Tests for batch reads sharing per-ID entries."""
+
+    def test_batch_fetches_only_misses(self, cached, source, clock):
+        """Cached IDs are served locally; the rest go to the source in one batch."""
+        cached.get_employee("1")
+
+        employees = cached.get_employees(["1", "2", "missing"])
+
+        assert list(employees) == ["1", "2"]
+        assert source.calls["get_employee"] == 3  # "1" once, then "2" and "missing"
+        assert cached.get_employee("2").id == "2"
+        assert source.calls["get_employee"] == 3
+        stats = cached.get_stats()["get_employee"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+
+    def test_batch_omission_replays_not_found_for_single_reads(self, source, clock):
+        """An ID a batch omitted raises NotFoundError on later single-ID reads."""
+        cached = CachingHRISConnector(source)
+
+        assert list(cached.get_leave_balances(["1", "missing"])) == ["1"]
+        with pytest.raises(NotFoundError, match="missing"):
+            cached.get_leave_balance("missing")
+
+        assert source.calls["get_leave_balance"] == 2
+        assert cached.get_stats()["get_leave_balance"]["negative_hits"] == 1
+        cached.shutdown()
+
+
+class TestSharedTier:
+    """Tests for the CacheManager-backed second tier."""
+
+    def test_workers_share_entries(self, source, clock):
+        """A second cache instance reuses entries written by the first."""
+        shared = DictCacheManager()
+        first = CachingHRISConnector(source, cache_manager=shared, namespace="test")
+        second = CachingHRISConnector(source, cache_manager=shared, namespace="test")
+
+        first.get_leave_balance("1")
+        balances = second.get_leave_balance("1")
+
+        assert source.calls["get_leave_balance"] == 1
+        assert isinstance(balances[0], LeaveBalance)
+        assert "hris:test:get_leave_balance:1" in shared.data
+
+    def test_shared_invalidation(self, source, clock):
+        """Invalidation removes the shared entry too."""
+        shared = DictCacheManager()
+        connector = CachingHRISConnector(source, cache_manager=shared, namespace="test")
+        connector.get_leave_balance("1")
+        connector.invalidate_employee("1")
+
+        assert "hris:test:get_leave_balance:1" not in shared.data
+
+
+def test_factory_wraps_connector_in_cache(monkeypatch):
+    """The factory wraps the resolved connector when HRIS_CACHE_ENABLED is set."""
+    from src.connectors.factory import (
+        get_hris_connector,
+        get_hris_connector_resolution,
+        reset_hris_connector_cache,
+    )
+
+    settings = SimpleNamespace(HRIS_PROVIDER="custom_db", HRIS_CACHE_ENABLED=True)
+    monkeypatch.setattr("src.connectors.factory.get_settings", lambda: settings)
+
+    reset_hris_connector_cache()
+    connector = get_hris_connector(force_refresh=True)
+
+    assert isinstance(connector, CachingHRISConnector)
+    assert connector.connector.__class__.__name__ == "LocalDBConnector"
+    assert get_hris_connector_resolution()["cached"] is True
+    reset_hris_connector_cache()
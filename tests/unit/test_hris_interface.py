@@ -352,3 +352,71 @@ class TestHRISConnectorInterface:
 
         connector = CompleteConnector()
         assert connector is not None
+
+
+class TestBatchFanOut:
+    """Tests for the default concurrent batch methods."""
+
+    class BatchConnector(HRISConnector):
+        def __init__(self):
+            self.calls = []
+
+        def get_employee(self, employee_id):
+            self.calls.append(employee_id)
+            if employee_id == "404":
+                raise NotFoundError("missing")
+            if employee_id == "none":
+                return None
+            if employee_id == "boom":
+                raise RuntimeError("vendor down")
+            return Employee(
+                id=employee_id,
+                hris_id=employee_id,
+                first_name="A",
+                last_name="B",
+                email="a@b.com",
+                department="Eng",
+                job_title="Engineer",
+                hire_date=datetime(2020, 1, 1),
+                status=EmployeeStatus.ACTIVE,
+                location="Remote",
+            )
+
+        def search_employees(self, filters):
+            return []
+
+        def get_leave_balance(self, employee_id):
+            return []
+
+        def get_leave_requests(self, employee_id, status=None):
+            return []
+
+        def submit_leave_request(self, request):
+            return request
+
+        def get_org_chart(self, department=None):
+            return []
+
+        def get_benefits(self, employee_id):
+            return []
+
+        def health_check(self):
+            return True
+
+    def test_get_employees_omits_missing_and_keeps_order(self):
+        """Unknown IDs are dropped and results follow input order."""
+        connector = self.BatchConnector()
+
+        result = connector.get_employees(["3", "404", "1", "none", "3", 2])
+
+        assert list(result) == ["3", "1", "2"]
+        assert sorted(connector.calls) == ["1", "2", "3", "404", "none"]
+
+    def test_get_leave_balances_keeps_empty_lists(self):
+        """Employees with no balances map to an empty list."""
+        assert self.BatchConnector().get_leave_balances(["1", "2"]) == {"1": [], "2": []}
+
+    def test_batch_propagates_connection_errors(self):
+        """Errors other than NotFoundError surface as they would from a loop."""
+        with pytest.raises(RuntimeError, match="vendor down"):
+            self.BatchConnector().get_employees(["1", "boom"])
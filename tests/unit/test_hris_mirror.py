@@ -0,0 +1,324 @@
+"""Tests for the HRIS read replica (sync service and mirrored connector)."""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.connectors.hris_interface import (
+    BenefitsPlan,
+    ConnectorError,
+    Employee,
+    EmployeeChangeSet,
+    EmployeeStatus,
+    HRISConnector,
+    LeaveBalance,
+    LeaveRequest,
+    LeaveStatus,
+    LeaveType,
+    OrgNode,
+    PlanType,
+)
+from src.connectors.hris_mirror import HRISSyncService, MirroredHRISConnector
+from src.repositories.hris_mirror_repository import (
+    HRISMirrorEmployeeModel,
+    HRISMirrorRecordModel,
+    HRISMirrorRepository,
+    HRISSyncStateModel,
+)
+
+
+def _employee(emp_id, department="Engineering", manager_id=None, last_name=None):
+    return Employee(
+        id=emp_id,
+        hris_id=f"HR-{emp_id}",
+        first_name=f"First{emp_id}",
+        last_name=last_name or f"Last{emp_id}",
+        email=f"{emp_id}@company.com",
+        department=department,
+        job_title="Engineer",
+        manager_id=manager_id,
+        hire_date=datetime(2022, 1, 1),
+        status=EmployeeStatus.ACTIVE,
+        location="Remote",
+    )
+
+
+class FakeVendorConnector(HRISConnector):
+    """In-memory vendor connector that counts calls."""
+
+    def __init__(self, employees, supports_delta=False):
+        self.employees = {e.id: e for e in employees}
+        self.supports_delta = supports_delta
+        self.changes = EmployeeChangeSet(cursor="cursor-2")
+        self.calls = Counter()
+        self.submitted = []
+
+    def get_employee(self, employee_id):
+        self.calls["get_employee"] += 1
+        return self.employees.get(employee_id)
+
+    def search_employees(self, filters):
+        self.calls["search_employees"] += 1
+        return [
+            e
+            for e in self.employees.values()
+            if all(getattr(e, k) == v for k, v in filters.items())
+        ]
+
+    def get_leave_balance(self, employee_id):
+        self.calls["get_leave_balance"] += 1
+        pending = sum(1 for r in self.submitted if r.employee_id == employee_id)
+        return [
+            LeaveBalance(
+                employee_id=employee_id,
+                leave_type=LeaveType.PTO,
+                total_days=20,
+                used_days=5,
+                pending_days=pending,
+                available_days=15 - pending,
+            )
+        ]
+
+    def get_leave_requests(self, employee_id, status=None):
+        self.calls["get_leave_requests"] += 1
+        return []
+
+    def submit_leave_request(self, request):
+        self.calls["submit_leave_request"] += 1
+        self.submitted.append(request)
+        request.id = f"req-{len(self.submitted)}"
+        return request
+
+    def get_org_chart(self, department=None):
+        self.calls["get_org_chart"] += 1
+        return []
+
+    def get_benefits(self, employee_id):
+        self.calls["get_benefits"] += 1
+        return [
+            BenefitsPlan(
+                id="plan-1",
+                name="Health",
+                plan_type=PlanType.HEALTH,
+                coverage_level="Employee",
+                employee_cost=100,
+                employer_cost=400,
+            )
+        ]
+
+    def get_employee_changes(self, since):
+        self.calls["get_employee_changes"] += 1
+        return self.changes if self.supports_delta else None
+
+    def health_check(self):
+        return True
+
+
+@pytest.fixture
+def mirror_repo():
+    """HRISMirrorRepository bound to an in-memory SQLite database."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    for model in (HRISMirrorEmployeeModel, HRISMirrorRecordModel, HRISSyncStateModel):
+        model.__table__.create(engine)
+    with patch(
+        "src.repositories.base_repository.SessionLocal",
+        sessionmaker(bind=engine, expire_on_commit=False),
+    ):
+        yield HRISMirrorRepository()
+    engine.dispose()
+
+
+@pytest.fixture
+def vendor():
+    return FakeVendorConnector(
+        [
+            _employee("1"),
+            _employee("2", manager_id="1"),
+            _employee("3", department="Sales", manager_id="1"),
+        ]
+    )
+
+
+class TestHRISSyncService:
+    """Tests for bulk and delta sync into the mirror."""
+
+    def test_full_sync_populates_mirror(self, vendor, mirror_repo):
+        """A first sync pulls every employee and their details."""
+        service = HRISSyncService(vendor, source="fake", repository=mirror_repo)
+        summary = service.sync()
+
+        assert summary["mode"] == "full"
+        assert summary["employees_synced"] == 3
+        assert sorted(mirror_repo.list_employee_ids("fake")) == ["1", "2", "3"]
+        assert mirror_repo.get_records("fake", "leave_balances", "2")[0]["total_days"] == 20
+        state = mirror_repo.get_sync_state("fake")
+        assert state["employee_count"] == 3
+        assert state["cursor"] is not None
+        assert service.last_synced_at is not None
+
+    def test_full_sync_removes_departed_employees(self, vendor, mirror_repo):
+        """Employees no longer returned by the vendor are dropped on full sync."""
+        service = HRISSyncService(vendor, source="fake", repository=mirror_repo)
+        service.sync()
+        del vendor.employees["3"]
+
+        summary = service.sync(full=True)
+
+        assert summary["employees_deleted"] == 1
+        assert "3" not in mirror_repo.list_employee_ids("fake")
+        assert mirror_repo.get_records("fake", "benefits", "3") is None
+
+    def test_delta_sync_uses_cursor(self, vendor, mirror_repo):
+        """Vendors with a change feed are synced incrementally."""
+        vendor.supports_delta = True
+        service = HRISSyncService(vendor, source="fake", repository=mirror_repo)
+        service.sync()
+        vendor.calls.clear()
+
+        vendor.changes = EmployeeChangeSet(
+            updated=[_employee("2", department="Finance", manager_id="1")],
+            deleted_ids=["3"],
+            cursor="cursor-2",
+        )
+        summary = service.sync()
+
+        assert summary["mode"] == "delta"
+        assert vendor.calls["search_employees"] == 0
+        assert vendor.calls["get_leave_balance"] == 1
+        assert mirror_repo.get_employee("fake", "2")["department"] == "Finance"
+        assert "3" not in mirror_repo.list_employee_ids("fake")
+        assert mirror_repo.get_sync_state("fake")["cursor"] == "cursor-2"
+
+    def test_failed_sync_keeps_previous_cursor(self, vendor, mirror_repo):
+        """A failing sync records the error and keeps the last good state."""
+        service = HRISSyncService(vendor, source="fake", repository=mirror_repo)
+        service.sync()
+        before = mirror_repo.get_sync_state("fake")
+
+        with patch.object(vendor, "search_employees", side_effect=RuntimeError("boom")):
+            with pytest.raises(ConnectorError, match="boom"):
+                service.sync(full=True)
+
+        after = mirror_repo.get_sync_state("fake")
+        assert after["cursor"] == before["cursor"]
+        assert after["last_synced_at"] == before["last_synced_at"]
+        assert "boom" in after["last_error"]
+
+
+class TestMirroredHRISConnector:
+    """Tests for reads from the mirror with bounded staleness."""
+
+    @pytest.fixture
+    def mirrored(self, vendor, mirror_repo):
+        service = HRISSyncService(vendor, source="fake", repository=mirror_repo)
+        service.sync()
+        vendor.calls.clear()
+        return MirroredHRISConnector(vendor, sync_service=service, max_staleness_seconds=60)
+
+    def test_reads_served_from_mirror(self, mirrored, vendor):
+        """Fresh mirror answers reads without vendor calls."""
+        assert mirrored.get_employee("2").manager_id == "1"
+        assert [e.id for e in mirrored.search_employees({"department": "Sales"})] == ["3"]
+        assert mirrored.get_leave_balance("1")[0].available_days == 15
+        assert mirrored.get_benefits("1")[0].plan_type == PlanType.HEALTH
+
+        assert sum(vendor.calls.values()) == 0
+        assert mirrored.stats["mirror_hits"] == 4
+
+    def test_org_chart_from_mirror(self, mirrored, vendor):
+        """The org hierarchy is built from mirrored manager links."""
+        roots = mirrored.get_org_chart()
+
+        assert [r.employee_id for r in roots] == ["1"]
+        assert sorted(n.employee_id for n in roots[0].direct_reports) == ["2", "3"]
+        assert [r.employee_id for r in mirrored.get_org_chart("Sales")] == ["3"]
+        assert vendor.calls["get_org_chart"] == 0
+
+    def test_stale_mirror_falls_back_to_vendor(self, mirrored, vendor):
+        """Reads go to the vendor once the mirror exceeds its staleness bound."""
+        mirrored.sync_service._last_synced_at = datetime.utcnow() - timedelta(minutes=5)
+        with patch.object(mirrored.sync_service, "reload_state", return_value=None):
+            mirrored.search_employees({"department": "Sales"})
+
+        assert vendor.calls["search_employees"] == 1
+        assert mirrored.stats["vendor_reads"] == 1
+
+    def test_unknown_employee_is_fetched_and_mirrored(self, mirrored, vendor, mirror_repo):
+        """Employees hired since the last sync come from the vendor and are mirrored."""
+        vendor.employees["4"] = _employee("4")
+
+        assert mirrored.get_employee("4").id == "4"
+        assert mirror_repo.get_employee("fake", "4") is not None
+
+    def test_submit_leave_passes_through_and_refreshes(self, mirrored, vendor):
+        """Writes go to the vendor and refresh the mirrored balances."""
+        request = LeaveRequest(
+            employee_id="2",
+            leave_type=LeaveType.PTO,
+            start_date=datetime(2026, 11, 2),
+            end_date=datetime(2026, 11, 3),
+            status=LeaveStatus.PENDING,
+            submitted_at=datetime.utcnow(),
+        )
+
+        assert mirrored.submit_leave_request(request).id == "req-1"
+        assert vendor.calls["submit_leave_request"] == 1
+        assert mirrored.get_leave_balance("2")[0].pending_days == 1
+
+    def test_batch_reads_served_from_mirror(self, mirrored, vendor):
+        """Batch reads come from the mirror; only unmirrored IDs reach the vendor."""
+        vendor.employees["4"] = _employee("4")
+
+        employees = mirrored.get_employees(["3", "1", "4", "404"])
+        balances = mirrored.get_leave_balances(["1", "2"])
+
+        assert list(employees) == ["3", "1", "4"]
+        assert vendor.calls["get_employee"] == 2
+        assert sorted(balances) == ["1", "2"]
+        assert vendor.calls["get_leave_balance"] == 0
+
+    def test_leave_requests_not_mirrored(self, mirrored, vendor):
+        """Leave requests are always read from the vendor."""
+        mirrored.get_leave_requests("1")
+        assert vendor.calls["get_leave_requests"] == 1
+
+
+def test_factory_wraps_external_provider_in_mirror(monkeypatch):
+    """The factory layers the mirror over external providers when enabled."""
+    from src.connectors.factory import get_hris_connector, reset_hris_connector_cache
+
+    settings = SimpleNamespace(
+        HRIS_PROVIDER="bamboohr",
+        BAMBOOHR_API_KEY="live-key",
+        BAMBOOHR_SUBDOMAIN="company",
+        HRIS_MIRROR_ENABLED=True,
+        HRIS_MIRROR_SYNC_INTERVAL_SECONDS=300,
+        HRIS_MIRROR_MAX_STALENESS_SECONDS=900,
+    )
+    monkeypatch.setattr("src.connectors.factory.get_settings", lambda: settings)
+
+    class StubBambooConnector:
+        def __init__(self, api_key, subdomain):
+            pass
+
+        def health_check(self):
+            return True
+
+    monkeypatch.setattr("src.connectors.bamboohr.BambooHRConnector", StubBambooConnector)
+
+    with patch.object(HRISSyncService, "start") as start:
+        reset_hris_connector_cache()
+        connector = get_hris_connector(force_refresh=True)
+
+    assert isinstance(connector, MirroredHRISConnector)
+    assert connector.source == "bamboohr"
+    start.assert_called_once_with(300)
+    reset_hris_connector_cache()
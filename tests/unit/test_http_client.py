@@ -0,0 +1,202 @@
+"""Tests for the shared vendor HTTP client."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.connectors.http_client import (
+    HostRateLimiter,
+    HTTPRequest,
+    VendorHTTPClient,
+    parse_retry_after,
+)
+from src.core.connection_pool import ConnectionPoolManager, PoolConfig, PoolType
+
+
+def _response(status=200, headers=None):
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def clock():
+    """Controllable time source; sleeping advances the clock."""
+    now = [1_700_000_000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    with patch("src.connectors.http_client.time.time", side_effect=lambda: now[0]), patch(
+        "src.middleware.rate_limiter.time.time", side_effect=lambda: now[0]
+    ), patch("src.connectors.http_client.time.sleep", side_effect=sleep):
+        yield now, sleeps
+
+
+@pytest.fixture
+def client():
+    http = VendorHTTPClient(pool_size=4, max_retries=2, backoff_base=0.1)
+    yield http
+    http.close()
+
+
+class TestRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_delta_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date(self):
+        assert parse_retry_after("Thu, 01 Jan 1970 00:01:40 GMT", now=40.0) == 60.0
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestHostRateLimiter:
+    """Tests for header-driven pacing."""
+
+    def test_unconfigured_limiter_does_not_wait(self, clock):
+        limiter = HostRateLimiter()
+
+        assert sum(limiter.acquire() for _ in range(50)) == 0
+
+    def test_paces_to_remaining_quota(self, clock):
+        """Remaining quota is spread across the reset window."""
+        now, _ = clock
+        limiter = HostRateLimiter(burst=1)
+        limiter.update({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "20"})
+
+        assert limiter.acquire() == 0
+        waited = limiter.acquire()
+
+        assert waited == pytest.approx(2.0)  # 10 requests over 20s
+        assert limiter.get_state()["rate_per_second"] == pytest.approx(0.5)
+
+    def test_exhausted_quota_waits_for_reset(self, clock):
+        now, _ = clock
+        limiter = HostRateLimiter()
+        limiter.update({"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": str(now[0] + 30)})
+
+        assert limiter.acquire() == pytest.approx(30.0)
+
+    def test_retry_after_blocks_host(self, clock):
+        limiter = HostRateLimiter(rate_per_second=100)
+        limiter.update({"Retry-After": "5"})
+
+        assert limiter.acquire() == pytest.approx(5.0)
+
+
+class TestRequest:
+    """Tests for retries and metrics."""
+
+    def test_retries_429_honouring_retry_after(self, client, clock):
+        """A 429 pauses the host for Retry-After and the request is retried."""
+        _, sleeps = clock
+        responses = [_response(429, {"Retry-After": "3"}), _response(200)]
+        with patch.object(requests.Session, "request", side_effect=responses) as send:
+            response = client.request("GET", "https://api.vendor.test/employees")
+
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert sum(sleeps) == pytest.approx(3.0)
+        stats = client.get_stats()["https://api.vendor.test"]
+        assert stats["requests"] == 2
+        assert stats["rate_limited"] == 1
+        assert stats["retries"] == 1
+
+    def test_returns_last_response_after_max_retries(self, client, clock):
+        with patch.object(requests.Session, "request", return_value=_response(503)) as send:
+            response = client.request("GET", "https://api.vendor.test/employees")
+
+        assert response.status_code == 503
+        assert send.call_count == 3
+        assert client.get_stats()["https://api.vendor.test"]["errors"] == 3
+
+    def test_non_retryable_status_returned_immediately(self, client, clock):
+        with patch.object(requests.Session, "request", return_value=_response(404)) as send:
+            response = client.request("GET", "https://api.vendor.test/employees/9")
+
+        assert response.status_code == 404
+        assert send.call_count == 1
+
+    def test_connection_error_raised_after_retries(self, client, clock):
+        error = requests.exceptions.ConnectionError("down")
+        with patch.object(requests.Session, "request", side_effect=error) as send:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.request("GET", "https://api.vendor.test/employees", max_retries=1)
+
+        assert send.call_count == 2
+
+    def test_sessions_are_pooled_per_host(self, client):
+        first = client.session_for("https://a.vendor.test/x")
+
+        assert client.session_for("https://a.vendor.test/y") is first
+        assert client.session_for("https://b.vendor.test/x") is not first
+        adapter = first.get_adapter("https://a.vendor.test/x")
+        assert adapter._pool_maxsize == 4
+
+    def test_requests_lease_from_shared_pool_manager(self):
+        manager = ConnectionPoolManager(
+            [PoolConfig(pool_type=PoolType.HTTP, connection_string="http://localhost")]
+        )
+        first = VendorHTTPClient(pool_manager=manager)
+        second = VendorHTTPClient(pool_manager=manager)
+
+        with patch.object(requests.Session, "request", return_value=_response()):
+            first.request("GET", "https://api.vendor.test/employees")
+            second.request("GET", "https://api.vendor.test/employees")
+
+        assert first.session_for("https://api.vendor.test") is second.session_for(
+            "https://api.vendor.test/x"
+        )
+        stats = manager.get_pool_stats(PoolType.HTTP)[PoolType.HTTP]
+        assert stats.total_created == 2
+        assert stats.active_connections == 0
+
+
+class TestFetchMany:
+    """Tests for concurrent fan-out."""
+
+    def test_results_in_input_order_with_exceptions(self, client):
+        def send(session, method, url, **kwargs):
+            if url.endswith("/bad"):
+                raise requests.exceptions.InvalidURL("bad")
+            time.sleep(0.01 if url.endswith("/0") else 0)
+            return _response(200, {"X-Url": url})
+
+        items = [HTTPRequest("GET", f"https://api.vendor.test/{i}") for i in ("0", "1", "bad")]
+        with patch.object(requests.Session, "request", autospec=True, side_effect=send):
+            results = client.fetch_many(items)
+
+        assert results[0].headers["X-Url"].endswith("/0")
+        assert results[1].headers["X-Url"].endswith("/1")
+        assert isinstance(results[2], requests.exceptions.InvalidURL)
+
+    def test_concurrency_bounded_by_pool(self, client):
+        in_flight = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def send(session, method, url, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return _response(200)
+
+        items = [HTTPRequest("GET", f"https://api.vendor.test/{i}") for i in range(12)]
+        with patch.object(requests.Session, "request", autospec=True, side_effect=send):
+            results = client.fetch_many(items, max_concurrency=10)
+
+        assert len(results) == 12
+        assert 1 < peak[0] <= 4
@@ -17,3 +17,198 @@ def test_local_db_health_check_returns_true(monkeypatch):
     monkeypatch.setattr(connector, "_get_session", lambda: FakeSession())
 
     assert connector.health_check() is True
+
+
+def test_local_db_batch_methods_use_single_queries(monkeypatch):
+    """Batch reads should return every existing requested employee from IN queries, chunked."""
+    from datetime import datetime
+
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from src.core.database import (
+        Base,
+        BenefitsEnrollment,
+        BenefitsPlan,
+        Employee,
+        LeaveBalance,
+    )
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    tables = [m.__table__ for m in (Employee, LeaveBalance, BenefitsPlan, BenefitsEnrollment)]
+    Base.metadata.create_all(engine, tables=tables)
+    Session = sessionmaker(bind=engine)
+
+    session = Session()
+    for i in (1, 2, 3):
+        session.add(
+            Employee(
+                id=i,
+                hris_id=f"EMP-{i}",
+                hris_source="local",
+                first_name="E",
+                last_name=str(i),
+                email=f"e{i}@company.com",
+                department="Engineering",
+                role_level="employee",
+                hire_date=datetime(2022, 1, 1),
+                status="active",
+            )
+        )
+    session.add(LeaveBalance(employee_id=1, vacation_total=15, vacation_used=5))
+    session.add(
+        BenefitsPlan(id=1, name="Health", plan_type="medical", provider="Acme", premium_monthly=100)
+    )
+    session.add(BenefitsEnrollment(employee_id=2, plan_id=1, coverage_level="family"))
+    session.commit()
+    session.close()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    connector = LocalDBConnector()
+    monkeypatch.setattr(connector, "_get_session", Session)
+
+    employees = connector.get_employees(["1", "3", "42", "abc"])
+    balances = connector.get_leave_balances(["1", "2", "42"])
+    benefits = connector.get_benefits_bulk(["1", "2", "42"])
+
+    assert sorted(employees) == ["1", "3"]
+    assert sorted(balances) == sorted(benefits) == ["1", "2"]
+    assert balances["1"][0].available_days == 10
+    assert balances["2"] == []
+    assert benefits["1"] == []
+    assert benefits["2"][0].coverage_level == "family"
+    assert len(statements) == 3
+
+    statements.clear()
+    connector.batch_size = 2
+
+    employees = connector.get_employees(["1", "2", "3", "42"])
+    balances = connector.get_leave_balances(["1", "2", "3"])
+    benefits = connector.get_benefits_bulk(["1", "2", "3"])
+
+    assert sorted(employees) == ["1", "2", "3"]
+    assert sorted(balances) == sorted(benefits) == ["1", "2", "3"]
+    assert balances["1"][0].available_days == 10
+    assert benefits["2"][0].coverage_level == "family"
+    assert len(statements) == 2 + 2 + 2
+
+
+def test_local_db_org_chart_index_applies_updates_incrementally(monkeypatch):
+    """The org index is built once and then patched with changed rows only."""
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from src.core.database import Base, Employee
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine, tables=[Employee.__table__])
+    Session = sessionmaker(bind=engine)
+
+    session = Session()
+    # 1 manages 2 and 3; 3 manages 4
+    org = ((1, None, "Exec"), (2, 1, "Sales"), (3, 1, "Eng"), (4, 3, "Eng"))
+    for emp_id, manager_id, department in org:
+        session.add(
+            Employee(
+                id=emp_id,
+                hris_id=f"EMP-{emp_id}",
+                hris_source="local",
+                first_name="E",
+                last_name=str(emp_id),
+                email=f"e{emp_id}@company.com",
+                department=department,
+                role_level="manager" if emp_id in (1, 3) else "employee",
+                manager_id=manager_id,
+                hire_date=datetime(2022, 1, 1),
+                status="active",
+                updated_at=datetime(2026, 1, 1),
+            )
+        )
+    session.commit()
+
+    connector = LocalDBConnector()
+    monkeypatch.setattr(connector, "_get_session", Session)
+
+    roots = connector.get_org_chart()
+    assert [r.employee_id for r in roots] == ["1"]
+    assert [n.employee_id for n in roots[0].direct_reports] == ["2", "3"]
+    assert [r.employee_id for r in connector.get_org_chart("eng")] == ["3"]
+
+    index = connector.org_index()
+    assert index.is_in_chain("4", "1")
+    assert index.chain_of_command("4") == ["3", "1"]
+
+    # Move 4 under 2 and deactivate 3
+    emp4 = session.get(Employee, 4)
+    emp4.manager_id = 2
+    emp4.updated_at = datetime(2026, 1, 1) + timedelta(days=1)
+    emp3 = session.get(Employee, 3)
+    emp3.status = "terminated"
+    emp3.updated_at = datetime(2026, 1, 1) + timedelta(days=1)
+    session.commit()
+    session.close()
+
+    assert connector.org_index() is index
+    assert index.chain_of_command("4") == ["2", "1"]
+    assert "3" not in index
+    assert [n.employee_id for n in connector.get_org_chart()[0].direct_reports] == ["2"]
+
+
+def test_local_db_org_index_detects_delete_hidden_by_insert(monkeypatch):
+    """A hard delete is applied even when an insert keeps the row count level."""
+    from datetime import datetime
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from src.core.database import Base, Employee
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine, tables=[Employee.__table__])
+    Session = sessionmaker(bind=engine)
+
+    def employee(emp_id, manager_id, day):
+        return Employee(
+            id=emp_id,
+            hris_id=f"EMP-{emp_id}",
+            hris_source="local",
+            first_name="E",
+            last_name=str(emp_id),
+            email=f"e{emp_id}@company.com",
+            department="Eng",
+            role_level="employee",
+            manager_id=manager_id,
+            hire_date=datetime(2022, 1, 1),
+            status="active",
+            updated_at=datetime(2026, 1, day),
+        )
+
+    session = Session()
+    session.add_all([employee(1, None, 1), employee(2, 1, 1), employee(3, 1, 1)])
+    session.commit()
+
+    connector = LocalDBConnector()
+    monkeypatch.setattr(connector, "_get_session", Session)
+    index = connector.org_index()
+
+    session.delete(session.get(Employee, 3))
+    session.add(employee(4, 1, 2))
+    session.commit()
+    session.close()
+
+    assert connector.org_index() is index
+    assert "3" not in index
+    assert sorted(index.direct_reports("1")) == ["2", "4"]
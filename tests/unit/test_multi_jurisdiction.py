@@ -444,6 +444,85 @@ class TestCheckCompliance:
         assert len(results) > 0
 
 
+class TestCheckComplianceBulk:
+    """Tests for check_compliance_bulk method."""
+
+    RECORDS = [
+        {"id": 1, "country": "DE", "consent_granted": True, "dsar_response_time_days": 40},
+        {"id": 2, "country": "US", "state": "CA", "privacy_notice_provided": True},
+        {"id": 3, "country": "FR", "breach_notified_hours": 10, "dsar_response_time_days": "x"},
+        {"id": 4, "country": "CA", "access_days": 45},
+        {"id": 5, "country": "JP"},
+    ]
+
+    def test_matches_per_record_checks(self, multi_jurisdiction_engine):
+        """check_compliance_bulk agrees with check_compliance per employee."""
+        results = list(multi_jurisdiction_engine.check_compliance_bulk(self.RECORDS, batch_size=2))
+
+        assert [r.employee_id for r in results] == [1, 2, 3, 4, 5]
+        for record, result in zip(self.RECORDS, results):
+            expected = multi_jurisdiction_engine.check_compliance(
+                record, jurisdictions=multi_jurisdiction_engine.determine_jurisdictions(record)
+            )
+            assert result.statuses == {(c.jurisdiction, c.requirement): c.status for c in expected}
+            assert result.findings == {
+                (c.jurisdiction, c.requirement): c.findings for c in expected if c.findings
+            }
+
+    def test_statuses_and_findings(self, multi_jurisdiction_engine):
+        """check_compliance_bulk reports statuses, findings and non-compliant checks."""
+        gdpr, pipeda = Jurisdiction.EU_GDPR, Jurisdiction.CANADA_PIPEDA
+
+        first, _, third, fourth, fifth = multi_jurisdiction_engine.check_compliance_bulk(
+            self.RECORDS
+        )
+
+        assert first.statuses[(gdpr, "consent")] == ComplianceStatus.COMPLIANT
+        assert first.statuses[(gdpr, "dsar")] == ComplianceStatus.PARTIAL
+        assert first.non_compliant == [(gdpr, "breach_notification")]
+        # A check that raises counts as non-compliant
+        assert third.statuses[(gdpr, "dsar")] == ComplianceStatus.NON_COMPLIANT
+        assert "Deadline exceeded: 45 > 30 days" in fourth.findings[(pipeda, "access")]
+        assert fifth.jurisdictions == [Jurisdiction.US_FEDERAL]
+        assert fifth.statuses == {}
+
+    def test_one_audit_entry_per_batch(self, multi_jurisdiction_engine):
+        """check_compliance_bulk writes an aggregated audit entry per batch."""
+        before = len(multi_jurisdiction_engine._audit_trail)
+
+        list(multi_jurisdiction_engine.check_compliance_bulk(self.RECORDS, batch_size=2))
+
+        entries = multi_jurisdiction_engine._audit_trail[before:]
+        assert [e["action"] for e in entries] == ["bulk_compliance_checked"] * 3
+        assert sum(e["details"]["employees"] for e in entries) == 5
+        assert entries[0]["details"]["jurisdiction_groups"] == {
+            "eu_gdpr": 1,
+            "us_federal+us_california": 1,
+        }
+        assert multi_jurisdiction_engine._check_results == {}
+
+    def test_streams_lazily(self, multi_jurisdiction_engine):
+        """check_compliance_bulk consumes records one batch at a time."""
+        consumed = []
+
+        def records():
+            for record in self.RECORDS:
+                consumed.append(record["id"])
+                yield record
+
+        results = multi_jurisdiction_engine.check_compliance_bulk(records(), batch_size=2)
+
+        assert next(results).employee_id == 1
+        assert consumed == [1, 2]
+
+    def test_rejects_invalid_input(self, multi_jurisdiction_engine):
+        """check_compliance_bulk rejects non-dict records and empty batches."""
+        with pytest.raises(ValueError):
+            list(multi_jurisdiction_engine.check_compliance_bulk(["not a dict"]))
+        with pytest.raises(ValueError):
+            list(multi_jurisdiction_engine.check_compliance_bulk(self.RECORDS, batch_size=0))
+
+
 # ============================================================================
 # Test Get Requirements
 # ============================================================================
@@ -0,0 +1,206 @@
+"""Tests for the notification dispatcher (NOTIF-002)."""
+
+import smtplib
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.notification_dispatcher import (
+    ChannelConfig,
+    ChannelThrottle,
+    NotificationDispatcher,
+    SMTPConnectionPool,
+)
+
+
+class FakeSMTP:
+    """Stand-in for smtplib.SMTP that records calls."""
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.host = host
+        self.port = port
+        self.sent = []
+        self.logins = 0
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def ehlo(self):
+        pass
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def sendmail(self, from_addr, to_addr, message):
+        self.sent.append(to_addr)
+
+    def rset(self):
+        pass
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_smtp():
+    FakeSMTP.instances = []
+
+
+class TestSMTPConnectionPool:
+    """Tests for pooled SMTP sessions."""
+
+    def test_reuses_session_across_messages(self):
+        """Many sends share one authenticated connection."""
+        pool = SMTPConnectionPool("smtp.test", 587, "user", "pass", smtp_factory=FakeSMTP)
+        for i in range(20):
+            pool.send("hr@company.com", f"emp-{i}", "msg")
+
+        assert pool.connections_opened == 1
+        assert FakeSMTP.instances[0].logins == 1
+        assert len(FakeSMTP.instances[0].sent) == 20
+
+    def test_recycles_after_message_limit(self):
+        """Sessions are closed after max_messages_per_connection sends."""
+        pool = SMTPConnectionPool(
+            "smtp.test", 25, max_messages_per_connection=5, smtp_factory=FakeSMTP
+        )
+        for i in range(12):
+            pool.send("hr@company.com", f"emp-{i}", "msg")
+
+        assert pool.connections_opened == 3
+        assert FakeSMTP.instances[0].closed is True
+
+    def test_drops_disconnected_session(self):
+        """A disconnected session is discarded and the error propagates."""
+        import smtplib
+
+        pool = SMTPConnectionPool("smtp.test", 25, smtp_factory=FakeSMTP)
+        pool.send("hr@company.com", "emp-1", "msg")
+        FakeSMTP.instances[0].sendmail = MagicMock(
+            side_effect=smtplib.SMTPServerDisconnected("gone")
+        )
+
+        with pytest.raises(smtplib.SMTPServerDisconnected):
+            pool.send("hr@company.com", "emp-2", "msg")
+        pool.send("hr@company.com", "emp-3", "msg")
+
+        assert pool.connections_opened == 2
+
+    def test_keeps_session_after_rejected_message(self):
+        """A refused recipient fails that message but the session stays pooled."""
+        import smtplib
+
+        pool = SMTPConnectionPool("smtp.test", 25, smtp_factory=FakeSMTP)
+        pool.send("hr@company.com", "emp-1", "msg")
+        session = FakeSMTP.instances[0]
+        session.sendmail = MagicMock(
+            side_effect=smtplib.SMTPRecipientsRefused({"emp-2": (550, b"no such user")})
+        )
+
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            pool.send("hr@company.com", "emp-2", "msg")
+
+        assert pool.connections_opened == 1
+        assert session.closed is False
+
+
+class TestRetry:
+    """Tests for retry with jittered backoff."""
+
+    @patch("src.core.notification_dispatcher.time.sleep")
+    def test_retries_transient_failures(self, mock_sleep):
+        """Transient errors are retried until success."""
+        dispatcher = NotificationDispatcher({"email": ChannelConfig(max_retries=3)})
+        attempts = MagicMock(side_effect=[OSError("reset"), OSError("reset"), "ok"])
+
+        assert dispatcher.call_with_retry("email", attempts) == "ok"
+        assert attempts.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert dispatcher.get_stats()["email"] == {"sent": 1, "failed": 0, "retried": 2}
+
+    @patch("src.core.notification_dispatcher.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """The last error is raised once retries are exhausted."""
+        dispatcher = NotificationDispatcher({"email": ChannelConfig(max_retries=2)})
+        failing = MagicMock(side_effect=OSError("down"))
+
+        with pytest.raises(OSError):
+            dispatcher.call_with_retry("email", failing)
+        assert failing.call_count == 3
+
+    @patch("src.core.notification_dispatcher.time.sleep")
+    def test_client_errors_are_not_retried(self, mock_sleep):
+        """HTTP 4xx (except 429) fails immediately."""
+        error = Exception("bad request")
+        error.response = MagicMock(status_code=400)
+        dispatcher = NotificationDispatcher()
+        failing = MagicMock(side_effect=error)
+
+        with pytest.raises(Exception):
+            dispatcher.call_with_retry("webhook", failing)
+        assert failing.call_count == 1
+
+    @pytest.mark.parametrize(
+        "error,attempts",
+        [
+            (smtplib.SMTPRecipientsRefused({"a@x": (550, b"unknown user")}), 1),
+            (smtplib.SMTPRecipientsRefused({"a@x": (451, b"try later")}), 3),
+            (smtplib.SMTPDataError(554, b"rejected as spam"), 1),
+            (smtplib.SMTPSenderRefused(421, b"busy", "hr@x"), 3),
+            (smtplib.SMTPAuthenticationError(535, b"bad credentials"), 1),
+            (smtplib.SMTPServerDisconnected("gone"), 3),
+        ],
+    )
+    @patch("src.core.notification_dispatcher.time.sleep")
+    def test_smtp_errors_classified_by_reply_code(self, mock_sleep, error, attempts):
+        """SMTP 5xx replies are permanent; 4xx replies and disconnects are retried."""
+        dispatcher = NotificationDispatcher({"email": ChannelConfig(max_retries=2)})
+        failing = MagicMock(side_effect=error)
+
+        with pytest.raises(type(error)):
+            dispatcher.call_with_retry("email", failing)
+        assert failing.call_count == attempts
+
+
+class TestThrottleAndPools:
+    """Tests for rate limiting and worker pools."""
+
+    def test_throttle_limits_rate(self):
+        """Acquisitions beyond the burst wait for refill."""
+        throttle = ChannelThrottle(rate_per_second=50, burst=1)
+        start = time.time()
+        for _ in range(6):
+            throttle.acquire()
+
+        assert time.time() - start >= 0.08
+
+    def test_unlimited_throttle_never_blocks(self):
+        """A throttle without a rate returns immediately."""
+        throttle = ChannelThrottle(rate_per_second=None, burst=1)
+        start = time.time()
+        for _ in range(1000):
+            throttle.acquire()
+
+        assert time.time() - start < 0.5
+
+    def test_submit_runs_in_parallel(self):
+        """Deliveries on one channel run concurrently up to the worker count."""
+        dispatcher = NotificationDispatcher({"email": ChannelConfig(workers=4)})
+        start = time.time()
+        futures = [dispatcher.submit("email", lambda: time.sleep(0.2) or True) for _ in range(4)]
+
+        assert all(f.result(timeout=2) for f in futures)
+        assert time.time() - start < 0.6
+        dispatcher.shutdown()
+
+    def test_http_session_is_shared(self):
+        """All HTTP deliveries reuse one keep-alive session."""
+        dispatcher = NotificationDispatcher()
+
+        assert dispatcher.http_session() is dispatcher.http_session()
+        dispatcher.shutdown()
@@ -317,7 +317,7 @@ class TestBulkNotifications:
             template_id="workflow_submitted",
             context={"entity_type": "Policy", "approver_role": "HR Manager"},
             priority=NotificationPriority.HIGH,
-        )
+        ).wait(timeout=5)
 
         assert len(notifications) == 3
         assert all(n.status == NotificationStatus.SENT for n in notifications)
@@ -334,7 +334,7 @@ class TestBulkNotifications:
             recipient_ids=[],
             template_id="workflow_submitted",
             context={"entity_type": "Test", "approver_role": "Manager"},
-        )
+        ).wait(timeout=5)
 
         assert notifications == []
 
@@ -347,7 +347,7 @@ class TestBulkNotifications:
             template_id="workflow_submitted",
             context={"entity_type": "Urgent", "approver_role": "CEO"},
             priority=NotificationPriority.URGENT,
-        )
+        ).wait(timeout=5)
 
         assert all(n.priority == NotificationPriority.URGENT for n in notifications)
 
@@ -360,10 +360,74 @@ class TestBulkNotifications:
             recipient_ids=recipients,
             template_id="policy_reminder",
             context={"policy_name": "Code of Conduct", "policy_url": "https://example.com"},
-        )
+        ).wait(timeout=5)
 
         assert len(notifications) == 100
 
+    def test_send_bulk_returns_job_handle_immediately(self):
+        """send_bulk returns a job handle before slow deliveries finish."""
+        import threading
+        import time
+
+        service = NotificationService()
+        release = threading.Event()
+        original = service._dispatch_notification
+
+        def slow_dispatch(notification):
+            release.wait(5)
+            return original(notification)
+
+        service._dispatch_notification = slow_dispatch
+        start = time.time()
+        job = service.send_bulk(
+            recipient_ids=["emp-020", "emp-021"],
+            template_id="workflow_submitted",
+            context={"entity_type": "Policy", "approver_role": "HR"},
+        )
+
+        assert time.time() - start < 1
+        assert not job.done()
+        assert service.get_job(job.job_id) is job
+        assert all(n.status == NotificationStatus.PENDING for n in job.notifications)
+
+        release.set()
+        job.wait(timeout=5)
+        progress = job.progress()
+        assert progress["done"] is True
+        assert progress["succeeded"] == 2
+        assert all(n.status == NotificationStatus.SENT for n in job.notifications)
+
+    def test_finished_jobs_are_evicted(self):
+        """Finished jobs expire after the TTL and the job table is bounded."""
+        from datetime import timedelta
+
+        service = NotificationService(max_jobs=3)
+        context = {"entity_type": "Policy", "approver_role": "HR"}
+        jobs = [service.send_bulk(["emp-030"], "workflow_submitted", context) for _ in range(5)]
+        for job in jobs:
+            job.wait(timeout=5)
+
+        assert list(service.jobs) == [job.job_id for job in jobs[2:]]
+
+        jobs[2].created_at -= timedelta(hours=2)
+        latest = service.send_bulk(["emp-031"], "workflow_submitted", context)
+        assert jobs[2].job_id not in service.jobs
+        assert service.get_job(latest.job_id) is latest
+
+    def test_send_bulk_invalid_template_raises(self):
+        """send_bulk validates the template before queueing anything."""
+        service = NotificationService()
+
+        with pytest.raises(ValueError, match="Template not found"):
+            service.send_bulk(["emp-022"], "missing_template", {})
+
+    def test_get_job_unknown_raises(self):
+        """get_job raises ValueError for unknown job IDs."""
+        service = NotificationService()
+
+        with pytest.raises(ValueError, match="job not found"):
+            service.get_job("nope")
+
 
 class TestMarkAsRead:
     """Tests for marking notifications as read."""
@@ -0,0 +1,146 @@
+"""Tests for the incremental org-chart index."""
+
+from datetime import datetime
+
+import pytest
+
+from src.connectors.hris_interface import Employee, EmployeeChangeSet, EmployeeStatus
+from src.connectors.org_index import OrgEntry, OrgIndex
+
+
+def _entry(emp_id, manager_id=None, department="Eng"):
+    return OrgEntry(emp_id, f"Name {emp_id}", "Title", department, manager_id)
+
+
+@pytest.fixture
+def index():
+    """CEO -> (VP-Eng -> (Lead -> Dev1, Dev2), VP-Sales -> Rep)."""
+    return OrgIndex(
+        [
+            _entry("ceo", department="Exec"),
+            _entry("vp-eng", "ceo"),
+            _entry("vp-sales", "ceo", department="Sales"),
+            _entry("lead", "vp-eng"),
+            _entry("dev1", "lead"),
+            _entry("dev2", "lead"),
+            _entry("rep", "vp-sales", department="Sales"),
+        ]
+    )
+
+
+class TestQueries:
+    """Tests for hierarchy queries."""
+
+    def test_is_in_chain(self, index):
+        assert index.is_in_chain("dev1", "ceo")
+        assert index.is_in_chain("dev1", "vp-eng")
+        assert not index.is_in_chain("dev1", "vp-sales")
+        assert not index.is_in_chain("ceo", "dev1")
+        assert not index.is_in_chain("dev1", "dev1")
+        assert not index.is_in_chain("dev1", "unknown")
+
+    def test_chain_of_command(self, index):
+        assert index.chain_of_command("dev2") == ["lead", "vp-eng", "ceo"]
+        assert index.chain_of_command("ceo") == []
+
+    def test_span_of_control(self, index):
+        assert index.span_of_control("ceo") == 2
+        assert index.span_of_control("ceo", include_indirect=True) == 6
+        assert index.span_of_control("dev1", include_indirect=True) == 0
+
+    def test_descendants_are_preorder_slice(self, index):
+        assert index.descendants("vp-eng") == ["lead", "dev1", "dev2"]
+        assert index.descendants("unknown") == []
+
+    def test_subtree_serializes_only_requested_nodes(self, index):
+        node = index.subtree("vp-eng", max_depth=1)
+
+        assert node.employee_id == "vp-eng"
+        assert [n.employee_id for n in node.direct_reports] == ["lead"]
+        assert node.direct_reports[0].direct_reports == []
+
+    def test_department_chart_is_rooted_at_heads(self, index):
+        roots = index.org_chart("Eng")
+
+        assert [r.employee_id for r in roots] == ["vp-eng"]
+        assert index.org_chart("sal", exact=False)[0].employee_id == "vp-sales"
+        assert index.org_chart("Missing") == []
+
+
+class TestIncrementalUpdates:
+    """Tests for upserts, removals and lazy relabelling."""
+
+    def test_attribute_update_keeps_labels(self, index):
+        index.is_in_chain("dev1", "ceo")
+        relabels = index.relabel_count
+
+        index.upsert(OrgEntry("dev1", "Renamed", "Senior", "Platform", "lead"))
+
+        assert index.is_in_chain("dev1", "ceo")
+        assert index.relabel_count == relabels
+        assert [r.employee_id for r in index.org_chart("Platform")] == ["dev1"]
+
+    def test_manager_change_moves_subtree(self, index):
+        index.upsert(_entry("lead", "vp-sales"))
+
+        assert index.is_in_chain("dev1", "vp-sales")
+        assert not index.is_in_chain("dev2", "vp-eng")
+        assert index.span_of_control("vp-sales", include_indirect=True) == 4
+
+    def test_many_updates_relabel_once(self, index):
+        index.is_in_chain("dev1", "ceo")
+        relabels = index.relabel_count
+        for i in range(20):
+            index.upsert(_entry(f"new-{i}", "lead"))
+
+        assert index.span_of_control("lead", include_indirect=True) == 22
+        assert index.relabel_count == relabels + 1
+
+    def test_remove_promotes_reports_to_roots(self, index):
+        assert index.remove("vp-eng")
+
+        assert {r.employee_id for r in index.org_chart()} == {"ceo", "lead"}
+        assert index.chain_of_command("dev1") == ["lead"]
+
+    def test_apply_changes(self, index):
+        moved = Employee(
+            id="rep",
+            hris_id="rep",
+            first_name="Sam",
+            last_name="Rep",
+            email="rep@company.com",
+            department="Sales",
+            job_title="AE",
+            manager_id="ceo",
+            hire_date=datetime(2022, 1, 1),
+            status=EmployeeStatus.ACTIVE,
+            location="Remote",
+        )
+
+        index.apply_changes(EmployeeChangeSet(updated=[moved], deleted_ids=["dev2"], cursor="c"))
+
+        assert index.manager_of("rep") == "ceo"
+        assert index.get("rep").name == "Sam Rep"
+        assert "dev2" not in index
+
+    def test_manager_cycle_does_not_hang(self):
+        index = OrgIndex([_entry("a", "b"), _entry("b", "a")])
+
+        assert len(index.org_chart()) == 1
+        assert index.chain_of_command("a") == ["b"]
+
+    def test_deep_hierarchy_serializes_without_recursion(self):
+        depth = 5000
+        index = OrgIndex([_entry("e0")] + [_entry(f"e{i}", f"e{i - 1}") for i in range(1, depth)])
+
+        (root,) = index.org_chart()
+        node, levels = root, 1
+        while node.direct_reports:
+            (node,) = node.direct_reports
+            levels += 1
+
+        assert levels == depth
+        assert (
+            index.subtree("e10", max_depth=2).direct_reports[0].direct_reports[0].employee_id
+            == "e12"
+        )
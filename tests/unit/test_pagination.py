@@ -0,0 +1,119 @@
+"""Tests for paginated iteration of vendor list endpoints."""
+
+import threading
+
+import pytest
+
+from src.connectors.pagination import iter_records, next_page_params
+
+
+class PagedAPI:
+    """Fake vendor list endpoint that records every page request."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, params):
+        with self.lock:
+            self.calls.append(dict(params))
+        return self.pages[params.get("cursor") or params.get("offset", 0)]
+
+
+class TestNextPageParams:
+    """Tests for cursor and offset detection."""
+
+    def test_cursor_field(self):
+        params = next_page_params({"data": [1], "nextPageToken": "abc"}, {"limit": 1}, 1)
+
+        assert params == {"limit": 1, "cursor": "abc"}
+
+    def test_nested_paging_cursor(self):
+        response = {"data": [1], "paging": {"next_cursor": "p2"}}
+
+        assert next_page_params(response, {}, 1, cursor_param="after") == {"after": "p2"}
+
+    def test_offset_until_total(self):
+        assert next_page_params({"data": [1, 2], "total": 5}, {"offset": 2}, 2) == {"offset": 4}
+        assert next_page_params({"data": [1], "total": 5}, {"offset": 4}, 1) is None
+
+    def test_single_page_responses(self):
+        assert next_page_params({"data": [1]}, {}, 1) is None
+        assert next_page_params([1, 2], {}, 2) is None
+        assert next_page_params({"data": [], "next_cursor": "x"}, {}, 0) is None
+
+    def test_repeated_cursor_stops(self):
+        assert next_page_params({"data": [1], "next_cursor": "x"}, {"cursor": "x"}, 1) is None
+
+
+class TestIterRecords:
+    """Tests for streaming records across pages."""
+
+    def test_follows_cursors(self):
+        api = PagedAPI(
+            {
+                0: {"data": [{"id": 1}, {"id": 2}], "next_cursor": "b"},
+                "b": {"data": [{"id": 3}], "next_cursor": "c"},
+                "c": {"data": [{"id": 4}]},
+            }
+        )
+
+        records = list(iter_records(api, {"q": "x"}, page_size=2))
+
+        assert [r["id"] for r in records] == [1, 2, 3, 4]
+        assert api.calls[0] == {"q": "x", "limit": 2}
+        assert api.calls[2] == {"q": "x", "limit": 2, "cursor": "c"}
+
+    def test_follows_offsets(self):
+        api = PagedAPI(
+            {
+                0: {"data": [{"id": 1}, {"id": 2}], "total": 3},
+                2: {"data": [{"id": 3}], "total": 3},
+            }
+        )
+
+        assert [r["id"] for r in iter_records(api, page_size=2, prefetch=False)] == [1, 2, 3]
+        assert len(api.calls) == 2
+
+    def test_prefetches_next_page_before_current_is_consumed(self):
+        second_requested = threading.Event()
+
+        def fetch(params):
+            if params.get("cursor") == "b":
+                second_requested.set()
+                return {"data": [{"id": 2}]}
+            return {"data": [{"id": 1}], "next_cursor": "b"}
+
+        records = iter_records(fetch)
+        first = next(records)
+
+        assert first == {"id": 1}
+        assert second_requested.wait(timeout=2)
+        assert list(records) == [{"id": 2}]
+
+    def test_early_stop_does_not_fetch_remaining_pages(self):
+        pages = {str(i): {"data": [{"id": i}], "next_cursor": str(i + 1)} for i in range(1, 50)}
+        pages[0] = {"data": [{"id": 0}], "next_cursor": "1"}
+        api = PagedAPI(pages)
+
+        records = iter_records(api, prefetch=False)
+        assert [next(records)["id"] for _ in range(3)] == [0, 1, 2]
+        records.close()
+
+        assert len(api.calls) == 3
+
+    def test_fetch_error_propagates(self):
+        def fetch(params):
+            if params.get("cursor"):
+                raise ValueError("page failed")
+            return {"data": [{"id": 1}], "next_cursor": "b"}
+
+        records = iter_records(fetch)
+        assert next(records) == {"id": 1}
+        with pytest.raises(ValueError, match="page failed"):
+            next(records)
+
+    def test_page_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            list(iter_records(lambda params: [], page_size=0))
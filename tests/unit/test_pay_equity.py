@@ -0,0 +1,146 @@
+"""Tests for the columnar pay-equity engine (PLAT-005)."""
+
+import random
+
+import pytest
+
+from src.core.bias_audit import BiasAuditor, ProtectedCategory
+from src.core.pay_equity import AGE_40_AND_OVER, UNDER_40, PayEquityEngine
+
+
+def _record(title, gender, race, age, salary, **extra):
+    return {
+        "job_title": title,
+        "level": "L2",
+        "gender": gender,
+        "race": race,
+        "age": age,
+        "base_salary": salary,
+        **extra,
+    }
+
+
+@pytest.fixture
+def records():
+    return [
+        _record("Engineer", "M", "white", 30, 120000),
+        _record("Engineer", "F", "asian", 45, 100000),
+        _record("Analyst", "F", "white", 50, 70000),
+        _record("Engineer", "M", "black", 28, 130000),
+        _record("Engineer", "F", "white", 41, 104000),
+        _record("Analyst", "M", "white", 35, 80000),
+    ]
+
+
+class TestPayEquityStats:
+    """Tests for per-group statistics."""
+
+    def test_groups_and_levels_in_order_of_appearance(self, records):
+        engine = PayEquityEngine(records)
+
+        stats = engine.stats("race")
+
+        assert engine.groups == ["Engineer_L2", "Analyst_L2"]
+        assert stats.levels == ["white", "asian", "black"]
+        assert stats.counts.tolist() == [[2, 1, 1], [2, 0, 0]]
+
+    def test_means_and_medians(self, records):
+        stats = PayEquityEngine(records).stats("gender")
+        male, female = stats.level("m"), stats.level("f")
+
+        assert stats.means[0, male] == 125000
+        assert stats.medians[0, female] == 102000
+        assert stats.medians[1, female] == 70000
+
+    def test_summary(self, records):
+        summary = PayEquityEngine(records).summary()
+
+        assert summary[1]["count"] == 2
+        assert summary[1]["mean_salary"] == 75000
+        assert summary[1]["age"]["levels"][AGE_40_AND_OVER] == {
+            "count": 1,
+            "mean": 70000,
+            "median": 70000,
+        }
+        assert summary[0]["gender"]["gaps_pct"] == {"f": 18.4}
+
+
+class TestPayEquityGaps:
+    """Tests for raw and adjusted gaps."""
+
+    def test_gaps_match_per_group_means(self):
+        rng = random.Random(7)
+        records = [
+            _record(
+                rng.choice("ABC"),
+                rng.choice("MF"),
+                rng.choice(["white", "asian", "black"]),
+                rng.randint(20, 65),
+                rng.randint(40000, 150000),
+            )
+            for _ in range(300)
+        ]
+        engine = PayEquityEngine(records)
+
+        for gap in [gap for group in engine.gaps("race") for gap in group]:
+            peers = [r for r in records if f"{r['job_title']}_L2" == gap.group]
+            reference = [r["base_salary"] for r in peers if r["race"] == "white"]
+            comparison = [r["base_salary"] for r in peers if r["race"] == gap.comparison]
+            expected = sum(comparison) / len(comparison) / (sum(reference) / len(reference))
+
+            assert gap.ratio == pytest.approx(expected)
+
+        age_gaps = [group[0] for group in engine.gaps("age")]
+        assert {(gap.reference, gap.comparison) for gap in age_gaps} == {
+            (UNDER_40, AGE_40_AND_OVER)
+        }
+
+    def test_adjusted_gap_recovers_pay_difference(self):
+        rng = random.Random(3)
+        records = []
+        for _ in range(2000):
+            title, female = rng.choice(["A", "B", "C"]), rng.random() < 0.5
+            tenure = rng.uniform(0, 20)
+            # women have less tenure on average; within tenure they earn 10% less
+            tenure = tenure * 0.5 if female else tenure
+            salary = {"A": 60000, "B": 90000, "C": 150000}[title] * (1 + 0.02 * tenure)
+            salary *= (0.9 if female else 1.0) * rng.uniform(0.97, 1.03)
+            records.append(
+                _record(title, "F" if female else "M", "white", 30, salary, tenure_years=tenure)
+            )
+
+        (gap,) = PayEquityEngine(records, controls=["tenure_years"]).adjusted_gaps("gender")
+
+        assert (gap.reference, gap.comparison) == ("m", "f")
+        assert gap.gap_pct == pytest.approx(10, abs=0.5)
+        assert gap.t_stat < -10
+
+    def test_adjusted_gap_needs_reference_in_same_group(self):
+        records = [
+            _record("A", "M", "white", 30, 100000),
+            _record("A", "M", "white", 31, 110000),
+            _record("B", "F", "asian", 30, 80000),
+            _record("B", "F", "asian", 31, 82000),
+        ]
+
+        assert PayEquityEngine(records).adjusted_gaps("race") == []
+
+
+class TestAuditorIntegration:
+    """Tests for BiasAuditor adjusted gap incidents."""
+
+    def test_adjusted_incidents_only_when_requested(self):
+        records = [
+            _record(title, gender, "white", 30, salary)
+            for title in ("A", "B", "C")
+            for gender, salary in [("M", 100000), ("M", 102000), ("F", 88000), ("F", 90000)]
+        ]
+
+        plain = BiasAuditor().check_compensation_equity(records)
+        adjusted = BiasAuditor().check_compensation_equity(records, adjust_for=[])
+
+        assert len(plain) == 3
+        assert len(adjusted) == 4
+        assert adjusted[-1].category == ProtectedCategory.GENDER
+        assert adjusted[-1].description.startswith("Adjusted gender pay gap: f vs m")
+        assert adjusted[-1].agent_type == "compensation"
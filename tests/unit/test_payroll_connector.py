@@ -354,7 +354,7 @@ class TestAuthenticate:
 class TestGetPayrollRecord:
     """Tests for PayrollConnector.get_payroll_record method."""
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_returns_record(self, mock_get, payroll_connector):
         """Test get_payroll_record returns PayrollRecord."""
         mock_response = Mock()
@@ -376,7 +376,7 @@ class TestGetPayrollRecord:
         assert isinstance(record, PayrollRecord)
         assert record.employee_id == "EMP001"
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_employee_not_found(self, mock_get, payroll_connector):
         """Test get_payroll_record returns None for missing employee."""
         mock_response = Mock()
@@ -391,7 +391,7 @@ class TestGetPayrollRecord:
         record = payroll_connector.get_payroll_record("NONEXISTENT", "2024-01")
         assert record is None
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_invalid_period(self, mock_get, payroll_connector):
         """Test get_payroll_record handles invalid period."""
         mock_response = Mock()
@@ -415,7 +415,35 @@ class TestGetPayrollRecord:
 class TestGetPayrollHistory:
     """Tests for PayrollConnector.get_payroll_history method."""
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    def test_iter_follows_next_cursor(self, payroll_connector):
+        """iter_payroll_history follows the provider's next cursor."""
+        record = {
+            "employee_id": "EMP001",
+            "pay_period_start": "2024-01-01",
+            "pay_period_end": "2024-01-15",
+            "gross_pay": 5000.00,
+            "net_pay": 4000.00,
+        }
+        pages = {
+            None: {"data": [record, record], "next_cursor": "page-2"},
+            "page-2": {"data": [record]},
+        }
+        with patch.object(
+            payroll_connector,
+            "_make_request",
+            side_effect=lambda endpoint, params: pages[params.get("cursor")],
+        ) as mock_request:
+            history = list(
+                payroll_connector.iter_payroll_history(
+                    "EMP001", datetime(2024, 1, 1), datetime(2024, 3, 31), page_size=2
+                )
+            )
+
+        assert len(history) == 3
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[1].args[1]["cursor"] == "page-2"
+
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_returns_history(self, mock_get, payroll_connector):
         """Test get_payroll_history returns list of records."""
         mock_response = Mock()
@@ -450,7 +478,7 @@ class TestGetPayrollHistory:
         assert len(history) == 2
         assert all(isinstance(r, PayrollRecord) for r in history)
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_date_range_filtering(self, mock_get, payroll_connector):
         """Test get_payroll_history respects date range."""
         mock_response = Mock()
@@ -467,7 +495,7 @@ class TestGetPayrollHistory:
         history = payroll_connector.get_payroll_history("EMP001", start, end)
         assert isinstance(history, list)
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_empty_results(self, mock_get, payroll_connector):
         """Test get_payroll_history handles empty results."""
         mock_response = Mock()
@@ -493,7 +521,7 @@ class TestGetPayrollHistory:
 class TestGetPayrollSummary:
     """Tests for PayrollConnector.get_payroll_summary method."""
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_returns_summary(self, mock_get, payroll_connector):
         """Test get_payroll_summary returns PayrollSummary."""
         mock_response = Mock()
@@ -515,7 +543,7 @@ class TestGetPayrollSummary:
         assert isinstance(summary, PayrollSummary)
         assert summary.total_gross == 50000.00
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_calculates_totals(self, mock_get, payroll_connector):
         """Test get_payroll_summary calculates totals correctly."""
         mock_response = Mock()
@@ -537,7 +565,7 @@ class TestGetPayrollSummary:
         assert summary.total_deductions == 10000.00
         assert summary.total_taxes == 10000.00
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_year_filtering(self, mock_get, payroll_connector):
         """Test get_payroll_summary filters by year."""
         mock_response = Mock()
@@ -561,7 +589,7 @@ class TestGetPayrollSummary:
 class TestGetDeductionBreakdown:
     """Tests for PayrollConnector.get_deduction_breakdown method."""
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_returns_breakdown(self, mock_get, payroll_connector):
         """Test get_deduction_breakdown returns dict."""
         mock_response = Mock()
@@ -580,7 +608,7 @@ class TestGetDeductionBreakdown:
         assert breakdown["401k"] == 300.00
         assert breakdown["insurance"] == 200.00
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_empty_deductions(self, mock_get, payroll_connector):
         """Test get_deduction_breakdown handles empty deductions."""
         mock_response = Mock()
@@ -595,7 +623,7 @@ class TestGetDeductionBreakdown:
         breakdown = payroll_connector.get_deduction_breakdown("EMP001", "2024-01")
         assert breakdown == {}
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_valid_structure(self, mock_get, payroll_connector):
         """Test get_deduction_breakdown returns valid structure."""
         mock_response = Mock()
@@ -611,6 +639,164 @@ class TestGetDeductionBreakdown:
         assert all(isinstance(v, float) for v in breakdown.values())
 
 
+# ============================================================================
+# Test Bulk Analytics
+# ============================================================================
+
+
+class FakeHistoryAPI:
+    """Serves per-employee history pages and records each pull's start date."""
+
+    def __init__(self, history):
+        self.history = history
+        self.pulls = []
+
+    def __call__(self, endpoint, params):
+        employee_id = endpoint.split("/")[2]
+        start = params["start_date"][:10]
+        self.pulls.append((employee_id, start))
+        return {
+            "data": [
+                record
+                for record in self.history.get(employee_id, [])
+                if record["pay_period_start"] >= start
+            ]
+        }
+
+
+def _history_record(employee_id, start, end, gross, taxes):
+    return {
+        "employee_id": employee_id,
+        "pay_period_start": start,
+        "pay_period_end": end,
+        "gross_pay": gross,
+        "net_pay": gross * 0.8,
+        "deductions": {"401k": 100.0},
+        "taxes": taxes,
+    }
+
+
+@pytest.fixture
+def history_api():
+    return FakeHistoryAPI(
+        {
+            "EMP001": [
+                _history_record("EMP001", "2023-01-01", "2023-01-15", 5000.0, {"federal": 700.0}),
+                _history_record("EMP001", "2023-01-16", "2023-01-31", 5000.0, {"federal": 700.0}),
+            ],
+            "EMP002": [
+                _history_record("EMP002", "2023-01-01", "2023-01-15", 4000.0, {"state": 90.0}),
+            ],
+        }
+    )
+
+
+class TestBulkAnalytics:
+    """Tests for store-backed bulk summaries."""
+
+    def test_summaries_for_many_employees_pull_once(self, payroll_connector, history_api):
+        with patch.object(payroll_connector, "_make_request", side_effect=history_api):
+            employee_ids = ["EMP001", "EMP002", "EMP003"]
+            summaries = payroll_connector.get_payroll_summaries(employee_ids, 2023)
+            taxes = payroll_connector.get_tax_summaries(["EMP001", "EMP002"], 2023)
+
+        assert sorted(summaries) == ["EMP001", "EMP002"]
+        assert summaries["EMP001"].total_gross == 10000.0
+        assert summaries["EMP001"].total_taxes == 1400.0
+        assert summaries["EMP001"].records_count == 2
+        assert taxes["EMP002"] == {
+            "employee_id": "EMP002",
+            "year": 2023,
+            "total_taxes": 90.0,
+            "taxes": {"state": 90.0},
+        }
+        # The tax call is served from the store pulled for the summaries
+        assert len(history_api.pulls) == 3
+
+    def test_single_employee_methods_use_fresh_store(self, payroll_connector, history_api):
+        with patch.object(payroll_connector, "_make_request", side_effect=history_api) as api:
+            payroll_connector.get_payroll_summaries(["EMP001"], 2023)
+            summary = payroll_connector.get_payroll_summary("EMP001", 2023)
+            breakdown = payroll_connector.get_deduction_breakdown("EMP001", "2023-01-16")
+
+        assert summary.total_net == 8000.0
+        assert breakdown == {"401k": 100.0}
+        assert api.call_count == 1
+
+    def test_tax_summary_shape_matches_store_and_provider(self, payroll_connector, history_api):
+        with patch.object(payroll_connector, "_make_request", side_effect=history_api):
+            payroll_connector.get_tax_summaries(["EMP001"], 2023)
+            from_store = payroll_connector.get_tax_summary("EMP001", 2023)
+
+        payroll_connector._store_refreshed["EMP001"] = 0.0
+        provider_response = {"taxes": {"federal": "1400.0"}, "totalTaxes": 1400}
+        with patch.object(
+            payroll_connector, "_make_request", return_value=provider_response
+        ) as api:
+            from_provider = payroll_connector.get_tax_summary("EMP001", 2023)
+
+        assert api.call_count == 1
+
+        assert (
+            from_store
+            == from_provider
+            == {
+                "employee_id": "EMP001",
+                "year": 2023,
+                "total_taxes": 1400.0,
+                "taxes": {"federal": 1400.0},
+            }
+        )
+
+    def test_tax_summary_reads_flat_provider_response(self, payroll_connector):
+        provider_response = {
+            "employee_id": "EMP001",
+            "year": 2023,
+            "federal": 1200,
+            "state": "200.50",
+            "currency": "USD",
+            "total_taxes": 1400.5,
+        }
+        with patch.object(payroll_connector, "_make_request", return_value=provider_response):
+            summary = payroll_connector.get_tax_summary("EMP001", 2023)
+
+        assert summary == {
+            "employee_id": "EMP001",
+            "year": 2023,
+            "total_taxes": 1400.5,
+            "taxes": {"federal": 1200.0, "state": 200.5},
+        }
+
+    def test_refresh_pulls_only_newest_periods(self, payroll_connector, history_api):
+        with patch.object(payroll_connector, "_make_request", side_effect=history_api):
+            payroll_connector.get_payroll_summaries(["EMP001"], 2024)
+            payroll_connector._store_refreshed["EMP001"] = 0.0
+            history_api.history["EMP001"].append(
+                _history_record("EMP001", "2023-02-01", "2023-02-15", 5000.0, {})
+            )
+            payroll_connector.refresh_payroll_store(["EMP001"], datetime(2023, 1, 1))
+
+        assert history_api.pulls[-1] == ("EMP001", "2023-01-01")
+
+        with patch.object(payroll_connector, "_make_request", side_effect=history_api):
+            payroll_connector._store_refreshed["EMP001"] = 0.0
+            written = payroll_connector.refresh_payroll_store(["EMP001"], datetime(2023, 1, 1))
+
+        assert history_api.pulls[-1] == ("EMP001", "2023-02-01")
+        assert written == 1
+        assert len(payroll_connector.store) == 3
+
+    def test_failed_pull_is_not_marked_covered(self, payroll_connector):
+        with patch.object(payroll_connector, "_make_request", side_effect=ValueError("down")):
+            assert payroll_connector.get_payroll_summaries(["EMP001"], 2023) == {}
+
+        assert payroll_connector.store.coverage("EMP001") is None
+
+    def test_deduction_breakdowns_require_date_period(self, payroll_connector):
+        with pytest.raises(ValueError):
+            payroll_connector.get_deduction_breakdowns(["EMP001"], "2023-Q1")
+
+
 # ============================================================================
 # Test Validate Connection
 # ============================================================================
@@ -619,7 +805,7 @@ class TestGetDeductionBreakdown:
 class TestValidateConnection:
     """Tests for PayrollConnector.validate_connection method."""
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_successful_validation(self, mock_get, payroll_connector):
         """Test validate_connection succeeds."""
         mock_response = Mock()
@@ -635,7 +821,7 @@ class TestValidateConnection:
         assert result["connected"] is True
         assert result["status"] == "connected"
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_failed_connection(self, mock_get, payroll_connector):
         """Test validate_connection handles failure."""
         mock_response = Mock()
@@ -651,7 +837,7 @@ class TestValidateConnection:
         assert result["connected"] is False
         assert result["status"] == "error"
 
-    @patch("src.connectors.payroll_connector.requests.Session.get")
+    @patch("src.connectors.payroll_connector.requests.Session.request")
     def test_returns_status_dict(self, mock_get, payroll_connector):
         """Test validate_connection returns status dictionary."""
         mock_response = Mock()
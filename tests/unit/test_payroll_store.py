@@ -0,0 +1,103 @@
+"""Tests for the columnar payroll analytics store."""
+
+from datetime import date, datetime
+
+import pytest
+
+from src.connectors.payroll_connector import PayrollRecord
+from src.connectors.payroll_store import PayrollColumnStore
+
+
+def _record(employee_id, start, end, gross=5000.0, net=4000.0, deductions=None, taxes=None):
+    return PayrollRecord(
+        employee_id=employee_id,
+        pay_period_start=start,
+        pay_period_end=end,
+        gross_pay=gross,
+        net_pay=net,
+        deductions=deductions if deductions is not None else {"401k": 300.0},
+        taxes=taxes if taxes is not None else {"federal": 600.0, "state": 100.0},
+    )
+
+
+@pytest.fixture
+def store():
+    store = PayrollColumnStore(initial_capacity=2)
+    store.upsert(
+        [
+            _record("E1", datetime(2023, 12, 16), datetime(2023, 12, 31)),
+            _record("E1", datetime(2024, 1, 1), datetime(2024, 1, 15)),
+            _record("E1", datetime(2024, 1, 16), datetime(2024, 1, 31), gross=6000.0),
+            _record(
+                "E2",
+                datetime(2024, 1, 1),
+                datetime(2024, 1, 15),
+                gross=3000.0,
+                net=2500.0,
+                deductions={"insurance": 150.0},
+                taxes={"federal": 350.0},
+            ),
+        ]
+    )
+    return store
+
+
+class TestAggregations:
+    """Tests for vectorized per-employee aggregations."""
+
+    def test_summaries_group_by_employee_within_range(self, store):
+        totals = store.summaries(datetime(2024, 1, 1), datetime(2024, 12, 31))
+
+        assert totals["E1"] == {
+            "total_gross": 11000.0,
+            "total_net": 8000.0,
+            "total_deductions": 600.0,
+            "total_taxes": 1400.0,
+            "records_count": 2,
+        }
+        assert totals["E2"]["total_taxes"] == 350.0
+        assert totals["E2"]["total_deductions"] == 150.0
+
+    def test_employee_filter(self, store):
+        totals = store.summaries(datetime(2024, 1, 1), datetime(2024, 12, 31), ["E2", "E9"])
+
+        assert list(totals) == ["E2"]
+
+    def test_tax_and_deduction_breakdowns_by_type(self, store):
+        taxes = store.tax_totals(datetime(2024, 1, 1), datetime(2024, 12, 31))
+        deductions = store.deduction_totals(datetime(2023, 1, 1), datetime(2023, 12, 31))
+
+        assert taxes["E1"] == {"federal": 1200.0, "state": 200.0}
+        assert taxes["E2"] == {"federal": 350.0}
+        assert deductions == {"E1": {"401k": 300.0}}
+
+    def test_period_deductions(self, store):
+        deductions = store.period_deductions(datetime(2024, 1, 1))
+
+        assert deductions == {"E1": {"401k": 300.0}, "E2": {"insurance": 150.0}}
+
+
+class TestLoading:
+    """Tests for upserts and coverage tracking."""
+
+    def test_repulled_period_replaces_row(self, store):
+        store.upsert([_record("E1", datetime(2024, 1, 16), datetime(2024, 1, 31), gross=1.0)])
+
+        assert len(store) == 4
+        totals = store.summaries(datetime(2024, 1, 1), datetime(2024, 12, 31), ["E1"])
+        assert totals["E1"]["total_gross"] == 5001.0
+
+    def test_latest_period_start(self, store):
+        assert store.latest_period_start("E1") == date(2024, 1, 16)
+        assert store.latest_period_start("E9") is None
+
+    def test_coverage_extends_or_replaces(self):
+        store = PayrollColumnStore()
+        store.mark_covered("E1", datetime(2024, 1, 1), datetime(2024, 3, 31))
+        store.mark_covered("E1", datetime(2024, 3, 15), datetime(2024, 6, 30))
+
+        assert store.covers("E1", datetime(2024, 1, 1), datetime(2024, 6, 30))
+
+        store.mark_covered("E1", datetime(2022, 1, 1), datetime(2022, 12, 31))
+        assert not store.covers("E1", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        assert store.coverage("E1") == (date(2022, 1, 1), date(2022, 12, 31))
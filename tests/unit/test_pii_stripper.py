@@ -308,3 +308,47 @@ class TestEdgeCases:
 
         # Second rehydration shouldn't change anything
         assert rehydrated1 == rehydrated2
+
+
+class TestNameDetection:
+    """Tests for roster-based name redaction."""
+
+    def test_longer_names_win_and_share_placeholder(self):
+        """Names are redacted longest first, one placeholder per name."""
+        stripper = PIIStripper()
+        text = "Ann Lee met Ann and Annabel"
+
+        result = stripper.strip(text, employee_context=["Ann", "Ann Lee"])
+
+        assert result.sanitized_text == "[PERSON_1] met [PERSON_2] and Annabel"
+        assert result.mapping == {"Ann Lee": "[PERSON_1]", "Ann": "[PERSON_2]"}
+        assert "NAME" in result.pii_types_found
+
+    def test_roster_automaton_cached_until_roster_changes(self):
+        """The name gazetteer is rebuilt only for a different roster."""
+        stripper = PIIStripper()
+        stripper.strip("Bob", employee_context=["Bob", "Eve"])
+        cached = stripper._roster
+
+        stripper.strip("Eve", employee_context=["Bob", "Eve"])
+        assert stripper._roster is cached
+
+        result = stripper.strip("Eve and Mallory", employee_context=["Mallory"])
+        assert stripper._roster is not cached
+        assert result.sanitized_text == "Eve and [PERSON_1]"
+
+    def test_name_detection_disabled(self):
+        """Names are left alone when name detection is off."""
+        stripper = PIIStripper(enable_name_detection=False)
+
+        result = stripper.strip("Bob", employee_context=["Bob"])
+
+        assert result.sanitized_text == "Bob"
+
+    def test_rehydrate_names_and_custom_placeholders(self):
+        """rehydrate() restores names and placeholders of any shape."""
+        stripper = PIIStripper()
+        result = stripper.strip("Bob (bob@corp.com)", employee_context=["Bob"])
+
+        assert stripper.rehydrate(result.sanitized_text, result.mapping) == "Bob (bob@corp.com)"
+        assert stripper.rehydrate("<x> and <x>", {"secret": "<x>"}) == "secret and secret"
@@ -309,6 +309,27 @@ class TestRBACEnforcer:
         user_ids = {item["user_id"] for item in filtered}
         assert user_ids == {"mgr-001", "emp-001", "emp-002"}
 
+    def test_apply_data_scope_filter_team_from_org_index(self):
+        """TEAM scope falls back to the reporting chain in the org index."""
+        from src.connectors.org_index import OrgEntry, OrgIndex
+
+        index = OrgIndex(
+            [
+                OrgEntry("mgr-001", "Manager"),
+                OrgEntry("lead-001", "Lead", manager_id="mgr-001"),
+                OrgEntry("emp-001", "Report", manager_id="lead-001"),
+                OrgEntry("emp-003", "Other"),
+            ]
+        )
+        enforcer = RBACEnforcer(org_index=index)
+        data_list = [{"user_id": uid} for uid in ("mgr-001", "lead-001", "emp-001", "emp-003")]
+
+        filtered = enforcer.apply_data_scope_filter(
+            data_list, "manager", "employee_info", "mgr-001", "Engineering"
+        )
+
+        assert [item["user_id"] for item in filtered] == ["mgr-001", "lead-001", "emp-001"]
+
     def test_apply_data_scope_filter_department(self):
         """apply_data_scope_filter respects DEPARTMENT scope."""
         enforcer = RBACEnforcer()
@@ -0,0 +1,183 @@
+"""Tests for scheduled, cached audit report execution (PLAT-008)."""
+
+import csv
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.api.admin_routes import AuditLogEntry
+from src.core.audit_log_store import InMemoryAuditLogStore
+from src.platform_services.audit_reports import (
+    AuditFinding,
+    AuditReportConfig,
+    AuditReportService,
+    ReportFormat,
+    ReportType,
+)
+from src.platform_services.report_engine import CronSchedule, ReportCache
+
+BASE = datetime(2024, 5, 1, 9, 0)
+
+
+def _entry(minutes, action="login_failure", user_id="u1", status="failure"):
+    return AuditLogEntry(
+        timestamp=BASE + timedelta(minutes=minutes),
+        user_id=user_id,
+        action=action,
+        resource="user:1",
+        status=status,
+    )
+
+
+@pytest.fixture
+def store():
+    store = InMemoryAuditLogStore()
+    for i in range(40):
+        store.append(_entry(i * 30, action=["login_failure", "user_updated"][i % 2]))
+    return store
+
+
+class TestCronSchedule:
+    """Tests for cron parsing and next fire times."""
+
+    @pytest.mark.parametrize(
+        "expression,after,expected",
+        [
+            ("0 2 * * *", datetime(2024, 5, 1, 2, 0), datetime(2024, 5, 2, 2, 0)),
+            ("*/15 9-17 * * 1-5", datetime(2024, 5, 3, 17, 50), datetime(2024, 5, 6, 9, 0)),
+            ("0 0 13 * 5", datetime(2024, 1, 1), datetime(2024, 1, 5)),
+            ("@monthly", datetime(2024, 1, 31, 12), datetime(2024, 2, 1)),
+            ("30 6 * * 7", datetime(2024, 5, 1), datetime(2024, 5, 5, 6, 30)),
+        ],
+    )
+    def test_next_after(self, expression, after, expected):
+        assert CronSchedule.parse(expression).next_after(after) == expected
+
+    @pytest.mark.parametrize("expression", ["* * *", "61 * * * *", "*/0 * * * *", "a * * * *"])
+    def test_invalid_expression(self, expression):
+        with pytest.raises(ValueError):
+            CronSchedule.parse(expression)
+
+    def test_never_fires(self):
+        with pytest.raises(ValueError):
+            CronSchedule.parse("0 0 30 2 *").next_after(BASE)
+
+
+def test_report_cache_evicts_least_recently_used():
+    cache = ReportCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == {"entries": 2, "hits": 3, "misses": 1}
+
+
+class TestReportCaching:
+    """Tests for cached reports, renders and shared aggregates."""
+
+    def test_reports_cached_until_period_data_changes(self, store):
+        service = AuditReportService(audit_store=store)
+        end = BASE + timedelta(days=1)
+
+        first = service.get_or_generate_report(ReportType.SECURITY, BASE, end)
+        again = service.get_or_generate_report(ReportType.SECURITY, BASE, end)
+        access = service.get_or_generate_report(ReportType.ACCESS, BASE, end)
+
+        assert again is first
+        assert len(service.reports) == 2
+        # Security and access reports share one set of period aggregates
+        assert service.get_cache_stats()["aggregates"] == {"entries": 1, "hits": 1, "misses": 1}
+        assert access.summary["audit_events"] == first.summary["audit_events"] == 40
+
+        store.append(_entry(90, action="config_changed"))
+        fresh = service.get_or_generate_report(ReportType.SECURITY, BASE, end)
+        assert fresh is not first
+        assert fresh.summary["audit_events"] == 41
+        # Activity outside the period keeps the cached report
+        store.append(_entry(3 * 1440))
+        assert service.get_or_generate_report(ReportType.SECURITY, BASE, end) is fresh
+
+    def test_render_cache_follows_finding_changes(self):
+        service = AuditReportService()
+        report = service.get_or_generate_report(
+            ReportType.COMPLIANCE, BASE, BASE + timedelta(days=30)
+        )
+
+        rendered = service.export_report(report.report_id, ReportFormat.JSON)
+        assert service.export_report(report.report_id, ReportFormat.JSON) is rendered
+
+        service.add_finding(
+            report.report_id,
+            AuditFinding(severity="info", category="x", description="y", recommendation="z"),
+        )
+        updated = service.export_report(report.report_id, ReportFormat.JSON)
+        assert len(updated["data"]["findings"]) == len(rendered["data"]["findings"]) + 1
+
+    def test_custom_reports_cannot_be_scheduled(self):
+        service = AuditReportService()
+        with pytest.raises(ValueError):
+            service.schedule_report(ReportType.CUSTOM, "0 2 * * *")
+        with pytest.raises(ValueError):
+            service.schedule_report(ReportType.SECURITY, "0 2 * *")
+        with pytest.raises(ValueError):
+            service.schedule_report(
+                ReportType.SECURITY, "0 2 * * *", export_format=ReportFormat.CSV
+            )
+
+
+class TestScheduledRuns:
+    """Tests for running due schedules in the worker pool."""
+
+    def test_due_reports_run_and_export(self, store, tmp_path):
+        service = AuditReportService(AuditReportConfig(export_dir=str(tmp_path)), audit_store=store)
+        security = service.schedule_report(
+            ReportType.SECURITY, "0 0 * * *", period_days=3, export_format=ReportFormat.JSON
+        )
+        access = service.schedule_report(
+            ReportType.ACCESS, "0 0 * * *", period_days=3, export_format=ReportFormat.CSV
+        )
+        service.schedule_report(ReportType.COMPLIANCE, "0 0 1 1 *")
+        fire_time = datetime.fromisoformat(security["next_run"])
+
+        assert service.run_due_reports(fire_time - timedelta(minutes=1)) == []
+        results = service.run_due_reports(fire_time + timedelta(minutes=5))
+
+        assert sorted(r["schedule_id"] for r in results) == sorted(
+            [security["schedule_id"], access["schedule_id"]]
+        )
+        assert all(r["status"] == "completed" for r in results)
+        by_type = {r["report_type"]: r for r in results}
+        exported = json.loads(open(by_type["security"]["export"]["path"]).read())
+        assert exported["data"]["type"] == "security"
+        assert len(exported["data"]["findings"]) == by_type["security"]["export"]["rows"]
+        with open(by_type["access"]["export"]["path"], newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        assert len(rows) == by_type["access"]["export"]["rows"] > 0
+
+        schedule = service.scheduled_reports[security["schedule_id"]]
+        assert schedule["last_report_id"] == by_type["security"]["report_id"]
+        assert datetime.fromisoformat(schedule["next_run"]) == fire_time + timedelta(days=1)
+        assert service.run_due_reports(fire_time + timedelta(minutes=10)) == []
+
+    def test_schedules_follow_utc(self):
+        class LocalClock(datetime):
+            """Local time 5 hours ahead of UTC."""
+
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2024, 5, 1, 14, 30)
+
+            @classmethod
+            def utcnow(cls):
+                return datetime(2024, 5, 1, 9, 30)
+
+        service = AuditReportService()
+        with patch("src.platform_services.audit_reports.datetime", LocalClock):
+            schedule = service.schedule_report(ReportType.SECURITY, "0 10 * * *")
+            assert schedule["next_run"] == "2024-05-01T10:00:00"
+            assert service.run_due_reports() == []
@@ -0,0 +1,363 @@
+"""Tests for retention enforcement and erasure (COMP-005)."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from src.core.ccpa import CCPAComplianceService
+from src.core.database import (
+    AuditLog,
+    Base,
+    BenefitsEnrollment,
+    ChatConversation,
+    ChatMessage,
+    Conversation,
+    ConversationMessage,
+    Employee,
+    LeaveRequest,
+    PerformanceReview,
+    QueryLog,
+)
+from src.core.gdpr import (
+    DataCategory,
+    GDPRComplianceService,
+    RetentionAction,
+    RetentionPolicy,
+)
+from src.core.retention import REDACTED, RetentionCheckpointStore, RetentionExecutor
+
+NOW = datetime(2024, 6, 1)
+OLD = NOW - timedelta(days=400)
+RECENT = NOW - timedelta(days=10)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """File-backed SQLite database with two employees and aged chat history."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Employee.__table__),
+            [
+                dict(
+                    id=emp_id,
+                    hris_id=f"emp_{emp_id:03d}",
+                    hris_source="workday",
+                    first_name="Ada" if emp_id == 1 else "Grace",
+                    last_name="Lovelace" if emp_id == 1 else "Hopper",
+                    email=f"user{emp_id}@example.com",
+                    department="Engineering",
+                    role_level="employee",
+                    hire_date=OLD,
+                    status="active",
+                    password_hash="hash",
+                    created_at=OLD,
+                    updated_at=OLD,
+                )
+                for emp_id in (1, 2)
+            ],
+        )
+        conn.execute(
+            insert(ChatConversation.__table__),
+            [
+                dict(id=f"c{emp_id}", employee_id=emp_id, title="t", created_at=OLD, updated_at=OLD)
+                for emp_id in (1, 2)
+            ],
+        )
+        conn.execute(
+            insert(ChatMessage.__table__),
+            [
+                dict(conversation_id=f"c{1 + i % 2}", role="user", content=f"m{i}", created_at=ts)
+                for i, ts in enumerate([OLD] * 25 + [RECENT] * 5)
+            ],
+        )
+        conn.execute(
+            insert(QueryLog.__table__),
+            [dict(employee_id=1, query="q", agent_type="a", created_at=OLD)],
+        )
+        conn.execute(
+            insert(Conversation.__table__),
+            [
+                dict(
+                    id=1,
+                    user_id=1,
+                    agent_type="leave",
+                    query="q",
+                    response_summary="r",
+                    confidence_score=0.9,
+                    tools_used=[],
+                    started_at=OLD,
+                    resolved=True,
+                    created_at=OLD,
+                    updated_at=OLD,
+                )
+            ],
+        )
+        conn.execute(
+            insert(ConversationMessage.__table__),
+            [
+                dict(
+                    conversation_id=1,
+                    role="assistant",
+                    content="c",
+                    tool_call={"name": "get_balance"},
+                    timestamp=OLD,
+                )
+            ],
+        )
+        conn.execute(
+            insert(PerformanceReview.__table__),
+            [
+                dict(
+                    employee_id=1,
+                    review_period="2023",
+                    rating=4,
+                    comments="needs coaching",
+                    status="final",
+                    created_at=OLD,
+                    updated_at=OLD,
+                )
+            ],
+        )
+        conn.execute(
+            insert(AuditLog.__table__),
+            [
+                dict(
+                    user_id=emp_id,
+                    action="read",
+                    resource_type="employee",
+                    resource_id="1",
+                    details={},
+                    ip_address="10.0.0.1",
+                    timestamp=OLD,
+                )
+                for emp_id in (1, 2)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def executor(db):
+    return RetentionExecutor(sessionmaker(bind=db), batch_size=10)
+
+
+def _policy(category, action, days=365):
+    return RetentionPolicy(data_category=category, retention_days=days, action=action)
+
+
+def _column(db, column, *where):
+    with db.connect() as conn:
+        return conn.execute(select(column).where(*where).order_by(column)).scalars().all()
+
+
+class TestRetentionEnforcement:
+    """Tests for policy enforcement."""
+
+    def test_delete_removes_expired_rows_and_anonymizes_parents(self, db, executor):
+        results = executor.enforce(_policy(DataCategory.PERSONAL, RetentionAction.DELETE), NOW)
+        by_table = {result.table: result for result in results}
+
+        assert by_table["chat_messages"].action == "delete"
+        assert by_table["chat_messages"].rows == 25
+        assert by_table["chat_messages"].batches == 3
+        assert by_table["chat_conversations"].action == "anonymize"
+        assert len(_column(db, ChatMessage.id)) == 5
+        assert _column(db, ChatConversation.title) == [REDACTED, REDACTED]
+        assert _column(db, QueryLog.id) == []
+
+    def test_archive_anonymizes_once(self, db, executor):
+        sensitive = _policy(DataCategory.SENSITIVE, RetentionAction.ARCHIVE)
+        personal = _policy(DataCategory.PERSONAL, RetentionAction.ARCHIVE)
+
+        first = {r.table: r.rows for r in executor.enforce(sensitive, NOW)}
+        first.update({r.table: r.rows for r in executor.enforce(personal, NOW)})
+        second = {r.table: r.rows for r in executor.enforce(sensitive, NOW)}
+        second.update({r.table: r.rows for r in executor.enforce(personal, NOW)})
+
+        assert first["performance_reviews"] == 1
+        assert first["conversation_messages"] == 1
+        assert first["chat_messages"] == 25
+        assert set(second.values()) == {0}
+        assert _column(db, PerformanceReview.rating) == [4]
+        assert _column(db, PerformanceReview.comments) == [None]
+        assert _column(db, ConversationMessage.tool_call) == [None]
+
+    def test_retention_period_respected(self, db, executor):
+        policy = _policy(DataCategory.PERSONAL, RetentionAction.DELETE, days=500)
+
+        results = executor.enforce(policy, NOW)
+
+        assert sum(result.rows for result in results) == 0
+        assert len(_column(db, ChatMessage.id)) == 30
+
+    def test_records_still_in_force_are_kept(self, db, executor):
+        with db.begin() as conn:
+            conn.execute(
+                insert(BenefitsEnrollment.__table__),
+                [
+                    dict(employee_id=1, plan_id=1, status=status, enrolled_at=OLD, updated_at=OLD)
+                    for status in ("active", "terminated")
+                ],
+            )
+            conn.execute(
+                insert(LeaveRequest.__table__),
+                [
+                    dict(
+                        employee_id=1,
+                        leave_type="sick",
+                        start_date="2023-01-02",
+                        end_date="2023-01-03",
+                        reason="flu",
+                        status=status,
+                        created_at=OLD,
+                        updated_at=OLD,
+                    )
+                    for status in ("pending", "approved")
+                ],
+            )
+
+        executor.enforce(_policy(DataCategory.FINANCIAL, RetentionAction.DELETE), NOW)
+        executor.enforce(_policy(DataCategory.HEALTH, RetentionAction.ARCHIVE), NOW)
+
+        assert _column(db, BenefitsEnrollment.status) == ["active"]
+        assert _column(db, LeaveRequest.reason, LeaveRequest.status == "pending") == ["flu"]
+        assert _column(db, LeaveRequest.reason, LeaveRequest.status == "approved") == [None]
+
+    def test_paused_run_resumes_from_checkpoint(self, db, tmp_path):
+        path = tmp_path / "checkpoints.json"
+        policy = _policy(DataCategory.PERSONAL, RetentionAction.DELETE)
+        first = RetentionExecutor(
+            sessionmaker(bind=db), batch_size=10, checkpoints=RetentionCheckpointStore(path)
+        )
+
+        paused, *_ = first.enforce(policy, NOW, max_batches=1)
+        restarted = RetentionExecutor(
+            sessionmaker(bind=db), batch_size=10, checkpoints=RetentionCheckpointStore(path)
+        )
+        resumed, *_ = restarted.enforce(policy, NOW)
+
+        assert (paused.rows, paused.completed) == (10, False)
+        assert resumed.resumed_from == 10
+        assert (resumed.rows, resumed.completed) == (15, True)
+        assert restarted.checkpoints.keys() == []
+
+
+class TestErasure:
+    """Tests for subject erasure."""
+
+    def test_erase_deletes_history_and_anonymizes_kept_records(self, db, executor):
+        report = executor.erase("emp_001")
+
+        assert report.completed
+        assert _column(db, ChatConversation.id) == ["c2"]
+        assert len(_column(db, ChatMessage.id)) == 15
+        assert _column(db, Employee.first_name, Employee.id == 1) == [REDACTED]
+        assert _column(db, Employee.first_name, Employee.id == 2) == ["Grace"]
+        assert _column(db, Employee.email, Employee.id == 1) == ["erased-1@erased.invalid"]
+        assert _column(db, AuditLog.ip_address, AuditLog.user_id == 1) == [REDACTED]
+        assert report.deleted_records == 15 + 1 + 1 + 1 + 1
+        assert executor.erase("emp_002").completed
+
+    def test_erase_anonymizes_audit_rows_logged_by_actor(self, db, executor):
+        with db.begin() as conn:
+            conn.execute(
+                insert(AuditLog.__table__),
+                [
+                    dict(
+                        actor=actor,
+                        action="login",
+                        resource_type="auth",
+                        resource_id="",
+                        details={},
+                        ip_address="10.0.0.2",
+                        timestamp=RECENT,
+                    )
+                    for actor in ("user1@example.com", "emp_002")
+                ],
+            )
+
+        executor.erase("emp_001")
+
+        assert _column(db, AuditLog.actor, AuditLog.actor == "user1@example.com") == []
+        # the login row plus the fixture row logged under user_id 1
+        assert _column(db, AuditLog.ip_address, AuditLog.actor.like("erased-%")) == [REDACTED] * 2
+        assert _column(db, AuditLog.ip_address, AuditLog.actor == "emp_002") == ["10.0.0.2"]
+
+    def test_erase_pseudonymizes_actor_on_rows_without_ip(self, db, executor):
+        with db.begin() as conn:
+            conn.execute(
+                insert(AuditLog.__table__),
+                [
+                    dict(
+                        actor=actor,
+                        action="config_changed",
+                        resource_type="config",
+                        resource_id="",
+                        details={},
+                        ip_address=None,
+                        timestamp=RECENT,
+                    )
+                    for actor in ("emp_001", "emp_002")
+                ],
+            )
+
+        report = executor.erase("emp_001")
+        rerun = executor.erase("emp_001")
+
+        actors = _column(db, AuditLog.actor, AuditLog.resource_type == "config")
+        assert actors[0] == "emp_002" and actors[1].startswith("erased-")
+        # the actor-only row plus the fixture's user_id row
+        assert next(t for t in report.tables if t.table == "audit_logs").rows == 2
+        assert next(t for t in rerun.tables if t.table == "audit_logs").rows == 0
+
+    def test_erase_removes_vector_chunks(self, db):
+        collection = MagicMock()
+        collection.get.side_effect = [
+            {"ids": ["tagged"]},
+            {"ids": ["mentions-email"]},
+            {"ids": []},
+        ]
+        executor = RetentionExecutor(sessionmaker(bind=db), collections={"policies": collection})
+
+        report = executor.erase("1")
+
+        filters = [call.kwargs for call in collection.get.call_args_list]
+        assert filters[0]["where"] == {"employee_id": "emp_001"}
+        assert filters[1]["where_document"] == {"$contains": "user1@example.com"}
+        assert filters[2]["where_document"] == {"$contains": "Ada Lovelace"}
+        assert report.vector_chunks == {"policies": 2}
+
+
+class TestServiceIntegration:
+    """Tests for GDPR and CCPA services backed by the executor."""
+
+    def test_gdpr_enforcement_reports_affected_records(self, executor):
+        service = GDPRComplianceService(retention_executor=executor)
+        service.add_retention_policy(DataCategory.HEALTH, 30, RetentionAction.ARCHIVE)
+        service.add_retention_policy(DataCategory.PERSONAL, 30, RetentionAction.DELETE)
+
+        result = service.enforce_retention_policies()
+
+        health, personal = result["policies_enforced"]
+        assert health["affected_records"] == 0
+        # every message is past 30 days; conversations are anonymized, not deleted
+        assert personal["affected_records"] == 30 + 2 + 1 + 1 + 1
+        assert personal["completed"] is True
+
+    def test_gdpr_erasure_and_ccpa_deletion(self, db, executor):
+        gdpr = GDPRComplianceService(retention_executor=executor)
+        ccpa = CCPAComplianceService(retention_executor=executor)
+
+        erased = gdpr.right_to_erasure("emp_001")
+        deleted = ccpa._process_deletion("emp_002")
+
+        assert erased["erasure_report"]["deleted_records"] == 19
+        assert (deleted["action"], deleted["status"]) == ("deleted", "completed")
+        assert deleted["deleted_records"] == 15 + 1
+        assert _column(db, ChatMessage.id) == []
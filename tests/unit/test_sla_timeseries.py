@@ -0,0 +1,126 @@
+"""Tests for time-partitioned SLA series (PLAT-007)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.platform_services.sla_monitor import SLAMetric, SLAMonitorService
+from src.platform_services.sla_timeseries import HOUR, MINUTE, RAW, MetricSeries
+
+BASE = datetime(2024, 3, 10, 0, 0)
+
+
+@pytest.fixture
+def points():
+    # Every 7 minutes for three days; every fifth point breaches
+    return [
+        (BASE + timedelta(minutes=7 * i), float(i % 50), i % 5 == 0) for i in range(3 * 1440 // 7)
+    ]
+
+
+def _series(points, **retention):
+    series = MetricSeries(**retention)
+    for ts, value, breached in points:
+        series.add(ts, value, breached)
+    return series
+
+
+class TestMetricSeries:
+    """Tests for window queries over raw partitions."""
+
+    def test_windows_match_raw_points(self, points):
+        series = _series(points)
+
+        windows = [
+            (BASE, BASE + timedelta(days=3)),
+            (BASE + timedelta(minutes=30), BASE + timedelta(days=2, minutes=50)),
+            (BASE + timedelta(hours=5, minutes=1), BASE + timedelta(hours=5, minutes=39)),
+            (BASE - timedelta(days=30), BASE - timedelta(days=1)),
+        ]
+        for start, end in windows:
+            inside = [(value, breached) for ts, value, breached in points if start <= ts <= end]
+            values = sorted(value for value, _ in inside)
+            aggregate = series.aggregate(start, end)
+
+            assert aggregate.count == len(inside)
+            assert aggregate.breaches == sum(breached for _, breached in inside)
+            assert aggregate.total == sum(values)
+            if values:
+                assert series.percentiles((0.5, 0.95), start, end) == [
+                    values[len(values) // 2],
+                    values[int(len(values) * 0.95)],
+                ]
+
+    def test_daily_and_minute_series_cover_window(self, points):
+        series = _series(points)
+        start, end = BASE + timedelta(hours=20, minutes=3), BASE + timedelta(days=2, hours=1)
+
+        daily = series.daily(start, end)
+        minutes = series.minute_series(start, end)
+
+        assert list(daily) == ["2024-03-10", "2024-03-11", "2024-03-12"]
+        assert sum(day.count for day in daily.values()) == series.aggregate(start, end).count
+        assert sum(period.count for _, period in minutes) == series.aggregate(start, end).count
+        assert all(start - timedelta(minutes=1) < minute <= end for minute, _ in minutes)
+
+    def test_late_measurements_are_ordered(self):
+        series = MetricSeries()
+        series.add(BASE + timedelta(minutes=10), 2.0, False)
+        series.add(BASE + timedelta(minutes=5), 1.0, True)
+        series.add(BASE + timedelta(minutes=10), 3.0, False)
+
+        assert list(series.partitions[0].values) == [1.0, 2.0, 3.0]
+        assert series.latest() == (3.0, False)
+        assert series.latest(end=BASE + timedelta(minutes=6)) == (1.0, True)
+
+
+class TestDownsampling:
+    """Tests for partition downsampling and eviction."""
+
+    def test_old_partitions_downsampled_and_evicted(self, points):
+        series = _series(
+            points, raw_retention_hours=12, minute_retention_hours=36, max_age_hours=60
+        )
+        resolutions = {p.hour: p.resolution for p in series.partitions}
+        newest = max(resolutions)
+
+        assert resolutions[newest - 12] == RAW
+        assert resolutions[newest - 13] == MINUTE
+        assert resolutions[newest - 37] == HOUR
+        assert min(resolutions) == newest - 60
+        assert series.partitions[-20].timestamps is None
+        # Whole-hour windows stay exact after downsampling
+        start = BASE + timedelta(hours=20)
+        end = BASE + timedelta(days=2, hours=10) - timedelta(microseconds=1)
+        inside = [value for ts, value, _ in points if start <= ts <= end]
+        assert series.aggregate(start, end).count == len(inside)
+        assert series.aggregate(start, end).total == sum(inside)
+
+    def test_percentiles_over_minute_aggregates(self):
+        series = MetricSeries(raw_retention_hours=1)
+        for minute in range(60):
+            for value in (minute, minute + 0.5):
+                series.add(BASE + timedelta(minutes=minute, seconds=value % 1 * 10), value, False)
+        series.add(BASE + timedelta(hours=5), 1000.0, False)
+
+        # Each minute's two values collapse to their mean, weighted by 2
+        assert series.partitions[0].resolution == MINUTE
+        assert series.percentiles((0.5,), BASE, BASE + timedelta(minutes=59)) == [30.25]
+
+
+class TestSLAMonitorSeries:
+    """Tests for SLAMonitorService backed by the series."""
+
+    def test_queries_include_measurements_trimmed_from_memory(self):
+        service = SLAMonitorService(max_measurements_in_memory=10)
+        for i in range(100):
+            service.record_measurement(SLAMetric.RESPONSE_TIME, float(i))
+
+        assert len(service.measurements) <= 10
+        percentiles = service.get_response_time_percentiles()
+        assert percentiles["measurement_count"] == 100
+        assert (percentiles["p50"], percentiles["p99"]) == (50.0, 99.0)
+
+        chart = service.get_metric_timeseries(SLAMetric.RESPONSE_TIME, interval_minutes=60)
+        assert sum(point["count"] for point in chart["points"]) == 100
+        assert chart["points"][-1]["max"] == 99.0
@@ -0,0 +1,164 @@
+"""Tests for the unified text-safety scanner."""
+
+import re
+
+import pytest
+
+from src.core.guardrails import PII_MASKS, PII_PATTERNS, Guardrails
+from src.core.text_scanner import (
+    Gazetteer,
+    ScanRule,
+    ScanSpan,
+    TextScanner,
+    replace_spans,
+    required_literals,
+    spans_by_rule,
+    spans_interact,
+)
+from src.middleware.pii_stripper import PIIStripper
+
+
+def _finditer(rules, text):
+    return sorted(
+        (m.start(), rule.category, rule.name, m.end())
+        for rule in rules
+        for m in re.compile(rule.pattern, rule.flags).finditer(text)
+    )
+
+
+def _spans(spans):
+    return sorted((s.start, s.category, s.rule, s.end) for s in spans)
+
+
+class TestTextScanner:
+    """Tests for TextScanner."""
+
+    def test_matches_per_rule_finditer(self):
+        rules = [
+            ScanRule("a", "digits", r"\d+"),
+            ScanRule("a", "pair", r"\d\d"),
+            ScanRule("b", "word", r"\b\w+\b"),
+            ScanRule("b", "greeting", r"hello", re.IGNORECASE),
+            ScanRule("b", "empty", r"x*"),
+        ]
+        scanner = TextScanner(rules)
+        text = "HELLO 12345 world 9 hello42"
+
+        assert _spans(scanner.scan(text)) == _finditer(rules, text)
+
+    def test_scans_only_requested_categories(self):
+        scanner = TextScanner(
+            [ScanRule("pii", "ssn", r"\b\d{3}-\d{2}-\d{4}\b"), ScanRule("html", "tag", r"<[^>]+>")]
+        )
+
+        spans = scanner.scan("<b>123-45-6789</b>", ["html"])
+
+        assert [s.text for s in spans] == ["<b>", "</b>"]
+        assert scanner.scan("", ["pii"]) == []
+        assert scanner.scan("text", ["unknown"]) == []
+
+    def test_register_recompiles_only_on_change(self):
+        scanner = TextScanner([ScanRule("a", "x", "x")])
+        first = scanner._plan(["a"])
+
+        scanner.register([ScanRule("a", "x", "x")])
+        assert scanner._plan(["a"]) is first
+
+        scanner.register([ScanRule("a", "x", "y")])
+        assert scanner._plan(["a"]) is not first
+        assert [s.text for s in scanner.scan("xy", ["a"])] == ["y"]
+        assert scanner.rules("a") == [ScanRule("a", "x", "y")]
+
+
+class TestRequiredLiterals:
+    """Tests for the literal prefilter."""
+
+    @pytest.mark.parametrize(
+        "pattern,flags,expected",
+        [
+            (r"(?:DROP|DELETE)\s+TABLE", re.IGNORECASE, ({"table"}, True)),
+            (r"\bEMP-\d+\b", 0, ({"EMP-"}, False)),
+            (r"(tattoo|piercing)s?\s+ban", 0, ({"tattoo", "piercing"}, False)),
+            (r"(generation\s+)?(millennial|boomer)", 0, ({"millennial", "boomer"}, False)),
+            (r"\b\d{3}-\d{2}-\d{4}\b", 0, ({"-"}, False)),
+            (r"\b\d{8,17}\b", 0, None),
+            (r"(?:a|b*)c?", 0, None),
+        ],
+    )
+    def test_extracts_required_literals(self, pattern, flags, expected):
+        result = required_literals(pattern, flags)
+
+        assert (result and (set(result[0]), result[1])) == (expected or None)
+
+    def test_skips_rules_without_literals_in_text(self):
+        scanner = TextScanner([ScanRule("c", "desk", r"drop\s+desk", re.IGNORECASE)])
+
+        assert scanner.scan("nothing to see", ["c"]) == []
+        assert [s.text for s in scanner.scan("DROP  Desk x", ["c"])] == ["DROP  Desk"]
+        # the Kelvin sign matches "k" case-insensitively, so non-ASCII text is not prefiltered
+        assert [s.text for s in scanner.scan("drop des\u212a", ["c"])] == ["drop des\u212a"]
+
+
+class TestGazetteer:
+    """Tests for the literal term automaton."""
+
+    def test_finds_overlapping_terms(self):
+        gazetteer = Gazetteer(["he", "she", "hers", "", "his"])
+
+        found = gazetteer.find_all("ushers")
+
+        assert sorted(found) == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+    def test_case_sensitive(self):
+        assert Gazetteer(["Ann"]).find_all("ann ANN Ann") == [(8, 11, 0)]
+
+
+class TestSpanHelpers:
+    """Tests for span replacement helpers."""
+
+    def test_replace_spans(self):
+        spans = [ScanSpan("c", "r", 0, 1, "a"), ScanSpan("c", "r", 4, 6, "de")]
+
+        assert replace_spans("abc de f", spans, lambda span: "#") == "#bc # f"
+
+    def test_spans_interact_only_across_rules(self):
+        same = [ScanSpan("c", "r", 0, 2, "ab"), ScanSpan("c", "r", 2, 4, "cd")]
+        touching = [ScanSpan("c", "r", 0, 2, "ab"), ScanSpan("c", "s", 2, 4, "cd")]
+        apart = [ScanSpan("c", "r", 0, 2, "ab"), ScanSpan("c", "s", 3, 4, "d")]
+
+        assert not spans_interact(same)
+        assert spans_interact(touching)
+        assert not spans_interact(apart)
+
+    def test_spans_by_rule(self):
+        spans = [ScanSpan("c", "r", 0, 1, "a"), ScanSpan("c", "s", 1, 2, "b")]
+
+        assert spans_by_rule(spans) == {("c", "r"): [spans[0]], ("c", "s"): [spans[1]]}
+
+
+class TestConsumers:
+    """Scanner-based consumers match applying each pattern in turn."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "SSN 123-45-6789, card 4111 1111 1111 1111, mail a.b@corp.io",
+            "123-45-67891234-5678-9012-3456789EMP-7@x.io",
+        ],
+    )
+    def test_mask_pii_matches_sequential_masking(self, text):
+        expected = text
+        for pii_type, pattern in PII_PATTERNS.items():
+            expected = pattern.sub(PII_MASKS[pii_type], expected)
+
+        assert Guardrails().mask_pii(text) == expected
+
+    def test_strip_falls_back_for_overlapping_types(self):
+        stripper = PIIStripper()
+
+        result = stripper.strip("pay a@b.com$1,000 to EMP-42 or 555-123-4567")
+
+        assert result.sanitized_text == (
+            "pay [EMAIL_REDACTED_1][SALARY_REDACTED] to [EMPLOYEE_ID_REDACTED] or [PHONE_REDACTED]"
+        )
+        assert result.mapping["$1,000"] == "[SALARY_REDACTED]"
@@ -0,0 +1,161 @@
+"""Tests for incremental usage rollups (PLAT-006)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.platform_services.cost_dashboard import (
+    BudgetConfig,
+    CostCategory,
+    CostDashboardService,
+    UsageRecord,
+)
+from src.platform_services.usage_rollups import (
+    InMemoryUsageStore,
+    JsonlUsageStore,
+    UsageRecordLog,
+    UsageRollups,
+)
+
+BASE = datetime(2024, 3, 10, 0, 0)
+
+
+def _record(ts, user="u1", department="eng", tokens=100, cost=1.0, query_id=None):
+    return UsageRecord(
+        user_id=user,
+        department=department,
+        category=CostCategory.LLM_QUERY,
+        tokens_used=tokens,
+        estimated_cost=cost,
+        model_name="gpt-4",
+        query_id=query_id,
+        timestamp=ts,
+    )
+
+
+@pytest.fixture
+def records():
+    # Every 20 minutes for three days, alternating users
+    return [
+        _record(BASE + timedelta(minutes=20 * i), user=f"u{i % 2}", tokens=i, query_id=f"q{i}")
+        for i in range(3 * 72)
+    ]
+
+
+class TestUsageRollups:
+    """Tests for bucket maintenance and window queries."""
+
+    def test_windows_match_raw_records(self, records):
+        rollups = UsageRollups()
+        for record in records:
+            rollups.add(record)
+
+        windows = [
+            (BASE, BASE + timedelta(days=3)),
+            (BASE + timedelta(minutes=30), BASE + timedelta(days=2, minutes=50)),
+            (BASE + timedelta(hours=5, minutes=1), BASE + timedelta(hours=5, minutes=39)),
+            (BASE + timedelta(hours=23), BASE + timedelta(days=1, hours=1)),
+            (BASE - timedelta(days=30), BASE - timedelta(days=1)),
+        ]
+        for start, end in windows:
+            inside = [r for r in records if start <= r.timestamp <= end]
+            usage = rollups.rollup(start, end)
+            user = rollups.rollup(start, end, "user", "u1")
+
+            assert usage.tokens == sum(r.tokens_used for r in inside)
+            assert usage.count == len(inside)
+            assert (user.query_ids or set()) == {r.query_id for r in inside if r.user_id == "u1"}
+
+    def test_boundary_hour_read_from_store_only_when_split(self, records):
+        class CountingStore(InMemoryUsageStore):
+            reads = 0
+
+            def read_hour(self, hour):
+                CountingStore.reads += 1
+                return super().read_hour(hour)
+
+        rollups = UsageRollups(CountingStore())
+        for record in records:
+            rollups.add(record)
+
+        rollups.rollup(BASE + timedelta(hours=2), BASE + timedelta(days=2, minutes=59))
+        assert CountingStore.reads == 0
+
+        rollups.rollup(BASE + timedelta(hours=2, minutes=10), BASE + timedelta(days=2, minutes=59))
+        assert CountingStore.reads == 1
+
+    def test_record_log_trims_memory_but_keeps_totals(self, records):
+        rollups = UsageRollups()
+        log = UsageRecordLog(rollups, max_records=50)
+
+        log.extend(records)
+
+        assert isinstance(log, list)
+        assert len(log) <= 50
+        assert log[-1] is records[-1]
+        assert rollups.lifetime.total.count == len(records)
+
+    def test_old_buckets_and_rows_are_evicted(self, records):
+        store = InMemoryUsageStore()
+        rollups = UsageRollups(store, retention_days=1)
+        for record in records:
+            rollups.add(record)
+
+        last_day = BASE + timedelta(days=2)
+        assert min(rollups.days) == min(rollups.hours) == last_day - timedelta(days=1)
+        assert len(store) == 2 * 72
+        assert rollups.rollup(BASE, BASE + timedelta(days=1, microseconds=-1)).count == 0
+        assert rollups.rollup(last_day, last_day + timedelta(days=1)).count == 72
+        # lifetime totals still cover every record, without per-key ID sets
+        assert rollups.lifetime.total.count == len(records)
+        assert rollups.lifetime.by_model["gpt-4"].count == len(records)
+        assert rollups.lifetime.by_user["u1"].query_ids is None
+        assert rollups.lifetime.by_department["eng"].users is None
+        assert rollups.days[last_day].by_user["u1"].query_ids
+
+    def test_jsonl_store_round_trip(self, tmp_path, records):
+        store = JsonlUsageStore(tmp_path)
+        rollups = UsageRollups(store)
+        for record in records:
+            rollups.add(record)
+
+        rows = store.read_hour(BASE + timedelta(hours=4))
+
+        assert [row[0] for row in rows] == [
+            BASE + timedelta(hours=4, minutes=m) for m in (0, 20, 40)
+        ]
+        assert rows[0][3] == "llm_query"
+        assert (
+            rollups.rollup(
+                BASE + timedelta(hours=4, minutes=10), BASE + timedelta(hours=4, minutes=30)
+            ).count
+            == 1
+        )
+
+
+class TestCostDashboardRollups:
+    """Tests for CostDashboardService backed by rollups."""
+
+    def test_summaries_include_records_trimmed_from_memory(self):
+        service = CostDashboardService(max_records_in_memory=10)
+        for i in range(100):
+            service.record_usage(f"u{i % 4}", "eng", CostCategory.EMBEDDING, 1000, "gpt-4")
+
+        assert len(service.usage_records) <= 10
+        assert service.get_cost_summary().total_tokens == 100000
+        assert service.get_department_usage("eng")["unique_users"] == 4
+        assert service.get_model_cost_comparison()["models"]["gpt-4"]["query_count"] == 100
+
+    def test_threshold_alerts_from_rollups(self):
+        config = BudgetConfig(user_daily_limit=1500, department_budgets={"eng": 0.05})
+        service = CostDashboardService(config=config)
+
+        service.record_usage("u1", "eng", CostCategory.LLM_QUERY, 1000, "gpt-4")
+        assert service.usage_alerts == []
+
+        service.record_usage("u1", "eng", CostCategory.LLM_QUERY, 1000, "gpt-4")
+        assert [alert["type"] for alert in service.usage_alerts] == [
+            "user_budget_exceeded",
+            "department_budget_exceeded",
+        ]
+        assert service.usage_alerts[1]["usage_percent"] == 120.0
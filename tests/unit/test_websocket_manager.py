@@ -5,6 +5,9 @@ Tests cover WebSocketManager and all related models with comprehensive
 coverage of connection management, message routing, and broadcasting.
 """
 
+import json
+import time
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -16,6 +19,8 @@ from src.core.websocket_manager import (
     ConnectionInfo,
     WebSocketConfig,
     WebSocketManager,
+    SlowConsumerPolicy,
+    TimingWheel,
 )
 
 # ============================================================================
@@ -473,6 +478,202 @@ class TestCleanupStale:
         assert isinstance(removed, int)
 
 
+class FakeWebSocketClient:
+    """Local stand-in for a client socket; records frames written to it."""
+
+    def __init__(self, fail: bool = False):
+        self.frames = []
+        self.fail = fail
+
+    def send(self, data):
+        if self.fail:
+            raise ConnectionResetError("socket closed")
+        self.frames.append(data)
+
+
+# ============================================================================
+# Test Delivery Engine
+# ============================================================================
+
+
+class TestDelivery:
+    """Tests for per-connection outboxes and frame delivery."""
+
+    def test_flush_writes_encoded_frame(self, ws_manager):
+        """Test flush writes queued JSON frames to the transport."""
+        client = FakeWebSocketClient()
+        conn = ws_manager.connect("user1", transport=client.send)
+        ws_manager.send_notification("user1", "Hello", "World")
+
+        assert ws_manager.flush() == 1
+        assert json.loads(client.frames[0])["payload"] == {"title": "Hello", "body": "World"}
+        assert ws_manager.get_stats()["pending_messages"] == 0
+        assert ws_manager.drain(conn.connection_id) == []
+
+    def test_broadcast_encodes_once(self, ws_manager):
+        """Test broadcast serializes a single frame shared by all outboxes."""
+        for i in range(5):
+            ws_manager.connect(f"user{i}")
+        message = WebSocketMessage(event_type=WebSocketEvent.SYSTEM_ALERT)
+
+        with patch.object(ws_manager, "_encode", wraps=ws_manager._encode) as encode:
+            assert ws_manager.broadcast(message) == 5
+        assert encode.call_count == 1
+        frames = {id(outbox[0]) for outbox in ws_manager.outboxes.values()}
+        assert len(frames) == 1
+
+    def test_drain_respects_max_frames(self, ws_manager):
+        """Test drain pops frames in FIFO order up to the cap."""
+        conn = ws_manager.connect("user1")
+        for i in range(3):
+            ws_manager.send_message(
+                conn.connection_id,
+                WebSocketMessage(event_type=WebSocketEvent.NOTIFICATION, payload={"n": i}),
+            )
+
+        first = ws_manager.drain(conn.connection_id, max_frames=2)
+        assert [json.loads(f)["payload"]["n"] for f in first] == [0, 1]
+        assert len(ws_manager.drain(conn.connection_id)) == 1
+
+    def test_oversized_message_rejected(self):
+        """Test messages over max_message_size are rejected."""
+        manager = WebSocketManager(WebSocketConfig(max_message_size=100))
+        conn = manager.connect("user1")
+        message = WebSocketMessage(event_type=WebSocketEvent.NOTIFICATION, payload={"x": "y" * 200})
+
+        with pytest.raises(ValueError, match="exceeds max size"):
+            manager.send_message(conn.connection_id, message)
+
+    def test_drop_oldest_policy(self):
+        """Test a full outbox evicts its oldest frame."""
+        manager = WebSocketManager(WebSocketConfig(outbox_size=2))
+        conn = manager.connect("user1")
+        for i in range(3):
+            manager.send_message(
+                conn.connection_id,
+                WebSocketMessage(event_type=WebSocketEvent.NOTIFICATION, payload={"n": i}),
+            )
+
+        frames = manager.drain(conn.connection_id)
+        assert [json.loads(f)["payload"]["n"] for f in frames] == [1, 2]
+        assert manager.get_stats()["messages_dropped"] == 1
+
+    def test_drop_newest_policy(self):
+        """Test a full outbox rejects the new frame."""
+        manager = WebSocketManager(
+            WebSocketConfig(outbox_size=1, slow_consumer_policy=SlowConsumerPolicy.DROP_NEWEST)
+        )
+        conn = manager.connect("user1")
+        message = WebSocketMessage(event_type=WebSocketEvent.NOTIFICATION)
+
+        assert manager.send_message(conn.connection_id, message) is True
+        assert manager.send_message(conn.connection_id, message) is False
+        assert len(manager.message_queue) == 1
+
+    def test_disconnect_policy(self):
+        """Test a slow consumer is disconnected under the DISCONNECT policy."""
+        manager = WebSocketManager(
+            WebSocketConfig(outbox_size=1, slow_consumer_policy=SlowConsumerPolicy.DISCONNECT)
+        )
+        slow = manager.connect("slow")
+        manager.connect("fast", transport=FakeWebSocketClient().send)
+        message = WebSocketMessage(event_type=WebSocketEvent.SYSTEM_ALERT)
+
+        manager.broadcast(message)
+        manager.flush()
+        assert manager.broadcast(message) == 1
+
+        assert slow.connection_id not in manager.connections
+        assert manager.get_stats()["slow_consumers_disconnected"] == 1
+        assert manager.get_stats()["pending_messages"] == 1
+
+    def test_transport_error_closes_connection(self, ws_manager):
+        """Test a failing transport is treated as a dead socket."""
+        conn = ws_manager.connect("user1", transport=FakeWebSocketClient(fail=True).send)
+        ws_manager.send_notification("user1", "Hi", "there")
+
+        assert ws_manager.flush() == 0
+        assert conn.connection_id not in ws_manager.connections
+
+
+class TestHeartbeats:
+    """Tests for timing-wheel driven stale cleanup."""
+
+    def test_wheel_pops_only_due_keys(self):
+        """Test advance returns keys whose deadline has passed."""
+        wheel = TimingWheel(tick_seconds=1.0, slots=8, start=100.0)
+        wheel.schedule("a", 102.0)
+        wheel.schedule("b", 120.0)  # wraps around the wheel
+
+        assert wheel.advance(101.0) == []
+        assert wheel.advance(103.0) == ["a"]
+        assert wheel.advance(119.0) == []
+        assert wheel.advance(121.0) == ["b"]
+        assert len(wheel) == 0
+
+    def test_wheel_reschedule_and_cancel(self):
+        """Test rescheduling moves a key and cancel removes it."""
+        wheel = TimingWheel(tick_seconds=1.0, slots=8, start=0.0)
+        wheel.schedule("a", 2.0)
+        wheel.schedule("a", 5.0)
+        wheel.schedule("b", 3.0)
+        wheel.cancel("b")
+
+        assert wheel.advance(4.0) == []
+        assert wheel.advance(5.0) == ["a"]
+
+    def test_heartbeat_keeps_connection_alive(self, ws_manager):
+        """Test heartbeat pushes the stale deadline forward."""
+        conn = ws_manager.connect("user1")
+        conn.last_ping = datetime.utcnow() - timedelta(seconds=20)
+        ws_manager.heartbeat(conn.connection_id)
+
+        assert ws_manager.cleanup_stale_connections() == 0
+        assert conn.connection_id in ws_manager.connections
+
+    def test_cleanup_skips_connections_not_due(self, ws_manager):
+        """Test cleanup only inspects connections whose deadline has passed."""
+        conns = [ws_manager.connect(f"user{i}") for i in range(50)]
+        conns[0].last_ping = datetime.utcnow() - timedelta(seconds=20)
+
+        with patch.object(ws_manager, "disconnect", wraps=ws_manager.disconnect) as disconnect:
+            assert ws_manager.cleanup_stale_connections() == 1
+        disconnect.assert_called_once_with(conns[0].connection_id)
+
+
+# ============================================================================
+# Load Test
+# ============================================================================
+
+
+class TestWebSocketLoad:
+    """Load test with 10k stand-in client connections."""
+
+    def test_broadcast_to_10k_connections(self):
+        """Test broadcast and flush fan out to 10k clients quickly."""
+        manager = WebSocketManager(WebSocketConfig(outbox_size=16))
+        clients = [FakeWebSocketClient() for _ in range(10_000)]
+        for i, client in enumerate(clients):
+            manager.connect(f"user{i}", transport=client.send)
+
+        start = time.perf_counter()
+        for n in range(5):
+            message = WebSocketMessage(event_type=WebSocketEvent.SYSTEM_ALERT, payload={"n": n})
+            assert manager.broadcast(message) == 10_000
+        assert manager.flush() == 50_000
+        elapsed = time.perf_counter() - start
+
+        assert all(len(client.frames) == 5 for client in clients)
+        assert clients[-1].frames[0] is clients[0].frames[0]  # same encoded frame
+        assert manager.get_stats()["pending_messages"] == 0
+        assert elapsed < 10.0
+
+        stale = manager.connections[next(iter(manager.connections))]
+        stale.last_ping = datetime.utcnow() - timedelta(seconds=60)
+        assert manager.cleanup_stale_connections() == 1
+        assert len(manager.connections) == 9_999
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -400,6 +400,50 @@ class TestLeaveOperations:
         assert requests[0].status == LeaveStatus.PENDING
         assert requests[0].reason == "Vacation"
 
+    @patch("src.connectors.workday.WorkdayConnector._make_request")
+    def test_iter_leave_requests_follows_offsets(self, mock_request, workday_connector):
+        """iter_leave_requests pages through limit/offset until total is reached."""
+        item = {
+            "leave_type": "pto",
+            "start_date": "2024-02-01",
+            "end_date": "2024-02-05",
+            "status": "approved",
+            "submitted_at": "2024-01-15T10:00:00",
+        }
+        mock_request.side_effect = lambda method, endpoint, params: {
+            "data": [{**item, "id": f"leave-{params.get('offset', 0) + i}"} for i in range(2)][
+                : 3 - params.get("offset", 0)
+            ],
+            "total": 3,
+        }
+
+        requests = list(workday_connector.iter_leave_requests("emp-010", page_size=2))
+
+        assert [r.id for r in requests] == ["leave-0", "leave-1", "leave-2"]
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[1].kwargs["params"] == {"limit": 2, "offset": 2}
+
+    @patch("src.connectors.workday.WorkdayConnector._make_request")
+    def test_get_leave_requests_limit(self, mock_request, workday_connector):
+        """get_leave_requests stops at limit without fetching further pages."""
+        mock_request.return_value = {
+            "data": [
+                {
+                    "id": f"leave-{i}",
+                    "leave_type": "sick",
+                    "start_date": "2024-02-01",
+                    "end_date": "2024-02-02",
+                    "status": "pending",
+                    "submitted_at": "2024-01-15T10:00:00",
+                }
+                for i in range(5)
+            ]
+        }
+
+        requests = workday_connector.get_leave_requests("emp-010", limit=2)
+
+        assert [r.id for r in requests] == ["leave-0", "leave-1"]
+
     @patch("src.connectors.workday.WorkdayConnector._make_request")
     def test_get_leave_requests_with_status_filter(self, mock_request, workday_connector):
         """get_leave_requests filters by status."""
@@ -902,3 +902,246 @@ class TestGetUserWorkflows:
 
         assert len(draft_workflows) == 1
         assert draft_workflows[0].workflow_id == workflow_id_2
+
+
+class TestWorkflowIndexes:
+    """Tests for secondary indexes backing pending/escalation queries."""
+
+    def _engine_with_template(self, steps_config):
+        engine = WorkflowEngine()
+        template = WorkflowTemplate(
+            name="Test", entity_type="compensation", steps_config=steps_config
+        )
+        return engine, engine.register_template(template)
+
+    @patch("src.core.workflow_engine.check_permission")
+    def test_pending_index_tracks_step_approver(self, mock_check_permission):
+        """Pending index follows the current step's assigned approver."""
+        mock_check_permission.return_value = True
+        engine, template_id = self._engine_with_template(
+            [
+                {"approver_role": "manager", "approver_id": "mgr_001"},
+                {"approver_role": "hr_admin", "approver_id": "hr_001"},
+            ]
+        )
+        workflow_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        engine.submit_for_approval(workflow_id)
+
+        assert [w.workflow_id for w in engine.get_pending_approvals("mgr_001")] == [workflow_id]
+        assert engine.get_pending_approvals("hr_001") == []
+
+        engine.approve_step(workflow_id, "mgr_001", "manager")
+
+        assert engine.get_pending_approvals("mgr_001") == []
+        assert [w.workflow_id for w in engine.get_pending_approvals("hr_001")] == [workflow_id]
+
+        engine.approve_step(workflow_id, "hr_001", "hr_admin")
+        assert engine.get_pending_approvals("hr_001") == []
+
+    def test_pending_approvals_preserve_creation_order(self):
+        """Open-approver workflows are returned in creation order."""
+        engine, template_id = self._engine_with_template([{"approver_role": "manager"}])
+        ids = [
+            engine.create_workflow(template_id, "compensation", f"emp_{i}", "user_001")
+            for i in range(5)
+        ]
+        for workflow_id in reversed(ids):
+            engine.submit_for_approval(workflow_id)
+
+        pending = engine.get_pending_approvals("anyone")
+        assert [w.workflow_id for w in pending] == ids
+
+    def test_history_is_isolated_per_workflow(self):
+        """get_workflow_history only returns events for the requested workflow."""
+        engine, template_id = self._engine_with_template([{"approver_role": "manager"}])
+        first = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        second = engine.create_workflow(template_id, "compensation", "emp_002", "user_001")
+        engine.submit_for_approval(first)
+
+        assert [e.event_type for e in engine.get_workflow_history(first)] == [
+            "workflow_created",
+            "workflow_submitted",
+        ]
+        assert [e.event_type for e in engine.get_workflow_history(second)] == ["workflow_created"]
+
+    def test_check_escalations_ignores_workflows_not_yet_due(self):
+        """Workflows whose deadline hasn't passed stay queued and are not escalated."""
+        engine, template_id = self._engine_with_template(
+            [{"approver_role": "manager", "escalate_after_hours": 1, "next_level_role": "director"}]
+        )
+        due_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        fresh_id = engine.create_workflow(template_id, "compensation", "emp_002", "user_001")
+        engine.submit_for_approval(due_id)
+        engine.submit_for_approval(fresh_id)
+        engine.get_workflow(due_id).updated_at = datetime.utcnow() - timedelta(hours=2)
+
+        assert engine.check_escalations() == [due_id]
+        # Escalation resets the deadline, so a second sweep finds nothing
+        assert engine.check_escalations() == []
+
+    def test_cancelled_workflow_leaves_escalation_queue(self):
+        """Cancelling a pending workflow removes it from escalation checks."""
+        engine, template_id = self._engine_with_template(
+            [{"approver_role": "manager", "escalate_after_hours": 1, "next_level_role": "director"}]
+        )
+        workflow_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        engine.submit_for_approval(workflow_id)
+        workflow = engine.get_workflow(workflow_id)
+        workflow.updated_at = datetime.utcnow() - timedelta(hours=2)
+        engine.cancel_workflow(workflow_id, "user_001")
+        workflow.updated_at = datetime.utcnow() - timedelta(hours=2)
+
+        assert engine.check_escalations() == []
+        assert engine.get_pending_approvals("mgr_001") == []
+
+
+@pytest.fixture
+def workflow_store():
+    """WorkflowInstanceRepository bound to an in-memory SQLite database."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from src.repositories.workflow_repository import (
+        WorkflowEventModel,
+        WorkflowInstanceModel,
+        WorkflowInstanceRepository,
+    )
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    WorkflowInstanceModel.__table__.create(engine)
+    WorkflowEventModel.__table__.create(engine)
+    with patch(
+        "src.repositories.base_repository.SessionLocal",
+        sessionmaker(bind=engine, expire_on_commit=False),
+    ):
+        yield WorkflowInstanceRepository()
+    engine.dispose()
+
+
+def _durable_engine(store, steps_config=None):
+    engine = WorkflowEngine(store=store)
+    template = WorkflowTemplate(
+        name="Test",
+        entity_type="compensation",
+        steps_config=steps_config or [{"approver_role": "manager"}],
+    )
+    return engine, engine.register_template(template)
+
+
+class TestDurableWorkflowEngine:
+    """Tests for the DB-backed WorkflowEngine store."""
+
+    @patch("src.core.workflow_engine.check_permission", return_value=True)
+    def test_state_survives_engine_restart(self, _perm, workflow_store):
+        """A new engine instance sees workflows and history written by another."""
+        engine, template_id = _durable_engine(
+            workflow_store, [{"approver_role": "manager"}, {"approver_role": "hr_admin"}]
+        )
+        workflow_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        engine.submit_for_approval(workflow_id)
+        engine.approve_step(workflow_id, "mgr_001", "manager", comments="ok")
+
+        restarted = WorkflowEngine(store=workflow_store)
+        workflow = restarted.get_workflow(workflow_id)
+
+        assert workflow.state == WorkflowState.PENDING_APPROVAL
+        assert workflow.current_step == 1
+        assert workflow.steps[0].status == "approved"
+        assert workflow.steps[0].decision_at is not None
+        assert [e.event_type for e in restarted.get_workflow_history(workflow_id)] == [
+            "workflow_created",
+            "workflow_submitted",
+            "step_approved",
+        ]
+
+    @patch("src.core.workflow_engine.check_permission", return_value=True)
+    def test_concurrent_workers_cannot_double_approve(self, _perm, workflow_store):
+        """The second worker acting on a stale copy gets a conflict."""
+        from src.core.workflow_engine import WorkflowConflictError
+
+        engine, template_id = _durable_engine(workflow_store)
+        workflow_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        engine.submit_for_approval(workflow_id)
+
+        worker_a = WorkflowEngine(store=workflow_store)
+        worker_b = WorkflowEngine(store=workflow_store)
+        workflow_a = worker_a.get_workflow(workflow_id)
+        workflow_b = worker_b.get_workflow(workflow_id)
+
+        worker_a._apply_approval(workflow_a, "mgr_001", "manager", "")
+        worker_b._apply_approval(workflow_b, "mgr_002", "manager", "")
+        worker_a._save(workflow_a)
+        with pytest.raises(WorkflowConflictError):
+            worker_b._save(workflow_b)
+
+        history = engine.get_workflow_history(workflow_id)
+        assert [e.actor for e in history if e.event_type == "step_approved"] == ["mgr_001"]
+
+    @patch("src.core.workflow_engine.check_permission", return_value=True)
+    def test_bulk_approve_reports_per_workflow(self, _perm, workflow_store):
+        """bulk_approve commits valid transitions and reports failures."""
+        engine, template_id = _durable_engine(workflow_store)
+        submitted = [
+            engine.create_workflow(template_id, "compensation", f"emp_{i}", "user_001")
+            for i in range(3)
+        ]
+        for workflow_id in submitted:
+            engine.submit_for_approval(workflow_id)
+        draft = engine.create_workflow(template_id, "compensation", "emp_x", "user_001")
+
+        results = engine.bulk_approve(submitted + [draft, "missing"], "mgr_001", "manager")
+
+        assert all(results[wid] == (True, "Workflow approved and completed") for wid in submitted)
+        assert results[draft][0] is False
+        assert results["missing"][0] is False
+
+        fresh = WorkflowEngine(store=workflow_store)
+        assert fresh.get_pending_approvals("mgr_001") == []
+        approved = fresh.get_user_workflows("user_001", state_filter=WorkflowState.APPROVED)
+        assert sorted(w.workflow_id for w in approved) == sorted(submitted)
+
+    def test_pending_and_escalation_queries_use_store(self, workflow_store):
+        """Pending approvals and due escalations are answered from the store."""
+        engine, template_id = _durable_engine(
+            workflow_store,
+            [
+                {
+                    "approver_role": "manager",
+                    "escalate_after_hours": 1,
+                    "next_level_role": "director",
+                }
+            ],
+        )
+        workflow_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        engine.submit_for_approval(workflow_id)
+
+        other = WorkflowEngine(store=workflow_store)
+        assert [w.workflow_id for w in other.get_pending_approvals("mgr_009")] == [workflow_id]
+        assert other.check_escalations() == []
+
+        workflow = engine.get_workflow(workflow_id)
+        workflow.updated_at = datetime.utcnow() - timedelta(hours=2)
+        engine._save(workflow)
+
+        assert other.check_escalations() == [workflow_id]
+        assert other.get_workflow(workflow_id).steps[0].approver_role == "director"
+
+    @patch("src.core.workflow_engine.check_permission", return_value=True)
+    def test_shared_engine_is_durable_once_database_initialized(self, _perm, workflow_store):
+        """get_workflow_engine switches to the DB-backed store after init_db."""
+        from src.core.workflow_engine import get_workflow_engine
+
+        with patch("src.core.workflow_engine._workflow_engine", None):
+            with patch("src.core.database.SessionLocal", None):
+                assert get_workflow_engine().store is None
+            with patch("src.core.database.SessionLocal", MagicMock()):
+                shared = get_workflow_engine()
+                assert shared.store is not None
+                assert get_workflow_engine() is shared
+
+        engine, template_id = _durable_engine(shared.store)
+        workflow_id = engine.create_workflow(template_id, "compensation", "emp_001", "user_001")
+        assert shared.get_workflow(workflow_id) is not None